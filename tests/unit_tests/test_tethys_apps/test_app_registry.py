@@ -0,0 +1,154 @@
+import time
+from unittest import mock
+
+from django.test import TestCase, override_settings
+
+from tethys_apps.app_registry import AppRegistry, app_registry
+from tethys_apps.models import TethysApp
+
+
+class AppRegistryTest(TestCase):
+    def setUp(self):
+        self.registry = AppRegistry()
+        self.app = TethysApp.objects.create(
+            name="Registry App", package="registry_app", root_url="registry-app"
+        )
+
+    def test_get_by_root_url(self):
+        with self.assertNumQueries(1):
+            app = self.registry.get_by_root_url("registry-app")
+            self.assertEqual(app, self.registry.get_by_root_url("registry-app"))
+
+        self.assertEqual(self.app.pk, app.pk)
+
+    def test_returns_copies(self):
+        app = self.registry.get_by_root_url("registry-app")
+        app.enabled = False
+
+        self.assertIsNot(app, self.registry.get_by_root_url("registry-app"))
+        self.assertTrue(self.registry.get_by_root_url("registry-app").enabled)
+        self.assertTrue(self.registry.get_by_package("registry_app").enabled)
+        self.assertTrue(self.registry.first().enabled)
+
+    def test_timeout(self):
+        self.registry.get_by_root_url("registry-app")
+        TethysApp.objects.filter(pk=self.app.pk).update(enabled=False)
+
+        with self.assertNumQueries(0):
+            self.assertTrue(self.registry.get_by_root_url("registry-app").enabled)
+
+        with mock.patch(
+            "tethys_apps.app_registry.time.monotonic",
+            return_value=time.monotonic() + 31,
+        ):
+            self.assertFalse(self.registry.get_by_root_url("registry-app").enabled)
+
+    @override_settings(APP_REGISTRY_TIMEOUT=0)
+    def test_timeout_disabled(self):
+        self.registry.get_by_root_url("registry-app")
+
+        with self.assertNumQueries(1):
+            self.registry.get_by_root_url("registry-app")
+
+    @override_settings(
+        APP_REGISTRY_CACHE_ALIAS="registry",
+        CACHES={
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+            "registry": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "test_app_registry",
+            },
+        },
+    )
+    def test_shared_generation(self):
+        other_registry = AppRegistry()
+        self.registry.get_by_root_url("registry-app")
+        other_registry.get_by_root_url("registry-app")
+
+        # The app is disabled in another process
+        TethysApp.objects.filter(pk=self.app.pk).update(enabled=False)
+        other_registry.invalidate()
+
+        with self.assertNumQueries(1):
+            self.assertFalse(self.registry.get_by_root_url("registry-app").enabled)
+        with self.assertNumQueries(0):
+            self.registry.get_by_root_url("registry-app")
+
+    @override_settings(APP_REGISTRY_CACHE_ALIAS="registry")
+    @mock.patch("tethys_apps.app_registry.tethys_log")
+    def test_shared_generation_errors(self, mock_log):
+        backend = mock.MagicMock()
+        backend.get.side_effect = Exception("down")
+        backend.set.side_effect = Exception("down")
+
+        with mock.patch("tethys_apps.app_registry.caches", {"registry": backend}):
+            # The apps are loaded from the database every time
+            with self.assertNumQueries(2):
+                self.registry.get_by_root_url("registry-app")
+                self.registry.get_by_root_url("registry-app")
+            self.registry.invalidate()
+
+        mock_log.warning.assert_called_once()
+
+    def test_get_by_root_url_not_found(self):
+        self.registry.get_by_root_url("registry-app")
+
+        with self.assertNumQueries(1):
+            with self.assertRaises(TethysApp.DoesNotExist):
+                self.registry.get_by_root_url("does-not-exist")
+
+    def test_get_by_root_url_installed_later(self):
+        self.registry.get_by_root_url("registry-app")
+        self.registry._by_root_url.pop("registry-app")
+
+        with self.assertNumQueries(1):
+            self.registry.get_by_root_url("registry-app")
+        with self.assertNumQueries(0):
+            self.registry.get_by_root_url("registry-app")
+
+    def test_get_by_root_url_multiple(self):
+        TethysApp.objects.create(
+            name="Other App", package="other_app", root_url="registry-app"
+        )
+
+        with self.assertRaises(TethysApp.MultipleObjectsReturned):
+            self.registry.get_by_root_url("registry-app")
+
+    def test_get_by_package(self):
+        with self.assertNumQueries(1):
+            app = self.registry.get_by_package("registry_app")
+            self.assertEqual(app, self.registry.get_by_package("registry_app"))
+
+        with self.assertRaises(TethysApp.DoesNotExist):
+            self.registry.get_by_package("does_not_exist")
+
+    def test_first(self):
+        self.assertEqual(
+            TethysApp.objects.order_by("pk").first(), self.registry.first()
+        )
+
+    def test_invalidated_by_signals(self):
+        app_registry.get_by_root_url("registry-app")
+
+        self.app.root_url = "new-root-url"
+        self.app.save()
+        self.assertEqual(self.app.pk, app_registry.get_by_root_url("new-root-url").pk)
+        with self.assertRaises(TethysApp.DoesNotExist):
+            app_registry.get_by_root_url("registry-app")
+
+        self.app.delete()
+        with self.assertRaises(TethysApp.DoesNotExist):
+            app_registry.get_by_package("registry_app")
+
+    @mock.patch("tethys_apps.app_registry.SingletonHarvester")
+    def test_get_app_class(self, mock_harvester):
+        app_class = mock.MagicMock(package="registry_app")
+        mock_harvester().apps = [app_class]
+
+        self.assertIs(app_class, self.registry.get_app_class("registry_app"))
+        self.assertIsNone(self.registry.get_app_class("other_app"))
+
+        # re-indexed when more apps are harvested
+        other_class = mock.MagicMock(package="other_app")
+        mock_harvester().apps.append(other_class)
+        self.assertIs(other_class, self.registry.get_app_class("other_app"))
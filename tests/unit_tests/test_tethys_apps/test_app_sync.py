@@ -0,0 +1,203 @@
+from unittest import mock
+
+from django.contrib.auth.models import Group, Permission
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from guardian.shortcuts import get_perms
+
+from tethys_apps.app_sync import plan_apps_sync, sync_apps
+from tethys_apps.base.permissions import (
+    Permission as TethysPermission,
+    PermissionGroup,
+)
+from tethys_apps.models import (
+    CustomSetting,
+    PersistentStoreDatabaseSetting,
+    TethysApp,
+    TethysAppSetting,
+)
+from tethys_sdk.testing import TethysTestCase
+from tethysapp.test_app.app import App
+
+WRITE_STATEMENTS = ("INSERT", "UPDATE", "DELETE")
+
+
+class SyncAppsTest(TethysTestCase):
+    def set_up(self):
+        view = TethysPermission(name="view_things", description="View things")
+        edit = TethysPermission(name="edit_things", description="Edit things")
+        self.permissions_patcher = mock.patch.object(
+            App,
+            "permissions",
+            return_value=[
+                view,
+                PermissionGroup(name="editors", permissions=[view, edit]),
+            ],
+        )
+        self.permissions_patcher.start()
+        self.app = App()
+        sync_apps([self.app])
+        self.db_app = TethysApp.objects.get(package="test_app")
+
+    def tear_down(self):
+        self.permissions_patcher.stop()
+
+    def get_writes(self, queries):
+        return [
+            q["sql"] for q in queries if q["sql"].lstrip().startswith(WRITE_STATEMENTS)
+        ]
+
+    def test_sync_apps_in_sync(self):
+        with CaptureQueriesContext(connection) as queries:
+            summary = sync_apps([self.app])
+
+        self.assertFalse(any(summary.values()))
+        self.assertEqual([], self.get_writes(queries.captured_queries))
+        self.assertLessEqual(len(queries.captured_queries), 6)
+
+    def test_sync_apps_permissions(self):
+        group = Group.objects.get(name="test_app:editors")
+
+        self.assertTrue(
+            Permission.objects.filter(
+                codename="test_app:view_things", name="test_app | View things"
+            ).exists()
+        )
+        self.assertTrue(
+            Permission.objects.filter(codename="test_app:access_app").exists()
+        )
+        self.assertCountEqual(
+            ["test_app:view_things", "test_app:edit_things"],
+            get_perms(group, self.db_app),
+        )
+
+    def test_sync_apps_changed_permissions(self):
+        Permission.objects.filter(codename="test_app:view_things").update(name="old")
+        Permission.objects.filter(codename="test_app:edit_things").delete()
+        Permission.objects.create(
+            codename="test_app:obsolete",
+            name="test_app | Obsolete",
+            content_type=TethysApp.get_content_type(),
+        )
+        Group.objects.create(name="test_app:obsolete_group")
+
+        summary = sync_apps([self.app])
+
+        self.assertEqual(1, summary["permissions_created"])
+        self.assertEqual(1, summary["permissions_updated"])
+        self.assertEqual(1, summary["permissions_deleted"])
+        self.assertEqual(1, summary["groups_deleted"])
+        self.assertEqual(1, summary["group_permissions_assigned"])
+        self.assertEqual(
+            "test_app | View things",
+            Permission.objects.get(codename="test_app:view_things").name,
+        )
+        self.assertFalse(
+            Permission.objects.filter(codename="test_app:obsolete").exists()
+        )
+        self.assertFalse(Group.objects.filter(name="test_app:obsolete_group").exists())
+        self.assertCountEqual(
+            ["test_app:view_things", "test_app:edit_things"],
+            get_perms(Group.objects.get(name="test_app:editors"), self.db_app),
+        )
+
+    def test_sync_apps_removed_group_permission(self):
+        with mock.patch.object(
+            App,
+            "permissions",
+            return_value=[
+                PermissionGroup(
+                    name="editors",
+                    permissions=[
+                        TethysPermission(name="view_things", description="View things")
+                    ],
+                )
+            ],
+        ):
+            summary = sync_apps([self.app])
+
+        self.assertEqual(1, summary["permissions_deleted"])
+        self.assertEqual(1, summary["group_permissions_removed"])
+        self.assertEqual(
+            ["test_app:view_things"],
+            get_perms(Group.objects.get(name="test_app:editors"), self.db_app),
+        )
+
+    def test_sync_apps_settings(self):
+        self.db_app.settings_set.filter(name="default_name").delete()
+        CustomSetting(
+            tethys_app=self.db_app,
+            name="obsolete_setting",
+            type=CustomSetting.TYPE_STRING,
+            required=False,
+        ).save()
+        PersistentStoreDatabaseSetting(
+            tethys_app=self.db_app,
+            name="dynamic_setting",
+            initializer="foo.bar",
+            dynamic=True,
+            required=False,
+        ).save()
+        TethysAppSetting(
+            tethys_app=self.db_app, name="untyped_setting", required=False
+        ).save()
+
+        summary = sync_apps([self.app])
+
+        self.assertEqual(1, summary["settings_created"])
+        self.assertEqual(1, summary["settings_deleted"])
+        names = set(self.db_app.settings_set.values_list("name", flat=True))
+        self.assertIn("default_name", names)
+        self.assertIn("dynamic_setting", names)
+        self.assertIn("untyped_setting", names)
+        self.assertNotIn("obsolete_setting", names)
+        self.assertEqual(
+            CustomSetting.TYPE_STRING,
+            self.db_app.custom_settings.get(name="default_name").type,
+        )
+
+    def test_sync_apps_new_app(self):
+        TethysApp.objects.filter(package="test_app").delete()
+
+        summary = sync_apps([self.app])
+
+        db_app = TethysApp.objects.get(package="test_app")
+        self.assertEqual(1, summary["apps_created"])
+        self.assertEqual("Test App", db_app.name)
+        self.assertEqual(21, len(db_app.settings))
+        self.assertCountEqual(
+            ["test_app:view_things", "test_app:edit_things"],
+            get_perms(Group.objects.get(name="test_app:editors"), db_app),
+        )
+
+    def test_sync_apps_changed_app(self):
+        TethysApp.objects.filter(package="test_app").update(
+            root_url="old-url", name="Old Name"
+        )
+
+        with override_settings(DEBUG=False):
+            summary = sync_apps([self.app])
+
+        db_app = TethysApp.objects.get(package="test_app")
+        self.assertEqual(1, summary["apps_updated"])
+        self.assertEqual("test-app", db_app.root_url)
+        self.assertEqual("Old Name", db_app.name)
+
+        with override_settings(DEBUG=True):
+            sync_apps([self.app])
+
+        self.assertEqual("Test App", TethysApp.objects.get(package="test_app").name)
+
+    def test_plan_apps_sync_no_apps(self):
+        with CaptureQueriesContext(connection) as queries:
+            plan = plan_apps_sync([])
+
+        self.assertFalse(plan)
+        self.assertEqual([], queries.captured_queries)
+
+    @mock.patch("tethys_apps.app_sync.apply_apps_sync")
+    def test_sync_apps_no_changes(self, mock_apply):
+        sync_apps([self.app])
+
+        mock_apply.assert_not_called()
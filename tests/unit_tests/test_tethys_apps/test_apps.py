@@ -1,7 +1,9 @@
 import unittest
 from unittest import mock
+from django.test import override_settings
 import tethys_apps
 from tethys_apps.apps import TethysAppsConfig
+from tethys_apps.lazy_controllers import warm_up_apps
 
 
 class TestApps(unittest.TestCase):
@@ -20,3 +22,19 @@ class TestApps(unittest.TestCase):
         tethys_app_config_obj = TethysAppsConfig("tethys_apps", tethys_apps)
         tethys_app_config_obj.ready()
         mock_singleton_harvester().harvest.assert_called()
+
+    @mock.patch("tethys_apps.apps.register_background_task")
+    @mock.patch("tethys_apps.apps.SingletonHarvester")
+    def test_ready_warmup(self, _, mock_register):
+        tethys_app_config_obj = TethysAppsConfig("tethys_apps", tethys_apps)
+
+        with override_settings(APP_LAZY_CONTROLLERS=True, APP_WARMUP=["test_app"]):
+            tethys_app_config_obj.ready()
+
+        mock_register.assert_called_once_with(warm_up_apps, delay=0)
+
+        mock_register.reset_mock()
+        with override_settings(APP_LAZY_CONTROLLERS=False, APP_WARMUP=["test_app"]):
+            tethys_app_config_obj.ready()
+
+        mock_register.assert_not_called()
@@ -15,6 +15,7 @@ import tethys_apps.base.app_base as tethys_app_base
 from tethys_apps.base.url_map import UrlMapBase
 from tethys_apps.base.paths import TethysPath
 from tethys_apps.base.permissions import Permission, PermissionGroup
+from tethys_apps.settings_cache import app_settings_cache
 from ... import UserFactory
 
 
@@ -541,9 +542,10 @@ class TestTethysAppBase(unittest.TestCase):
         self.user = UserFactory()
         self.request_factory = RequestFactory()
         self.fake_name = "fake_name"
+        app_settings_cache.invalidate()
 
     def tearDown(self):
-        pass
+        app_settings_cache.invalidate()
 
     def test__str__(self):
         result = tethys_app_base.TethysAppBase().__str__()
@@ -988,16 +990,16 @@ class TestTethysAppBase(unittest.TestCase):
     def test_get_web_processing_service(self, mock_ta):
         TethysAppChild.get_web_processing_service(name=self.fake_name)
         mock_ta.objects.get.assert_called_with(package=TethysAppChild.package)
-        mock_ta.objects.get().wps_services_settings.objects.get.assert_called_with(
+        mock_ta.objects.get().wps_services_settings.get.assert_called_with(
             name=self.fake_name
         )
-        mock_ta.objects.get().wps_services_settings.objects.get().get_value.assert_called_with(
+        mock_ta.objects.get().wps_services_settings.get().get_value.assert_called_with(
             as_public_endpoint=False, as_endpoint=False, as_engine=False
         )
 
     @mock.patch("tethys_apps.models.TethysApp")
     def test_get_web_processing_service_object_not_exist(self, mock_ta):
-        mock_wss = mock_ta.objects.get().wps_services_settings.objects.get
+        mock_wss = mock_ta.objects.get().wps_services_settings.get
         mock_wss.side_effect = ObjectDoesNotExist
 
         with self.assertRaises(TethysAppSettingDoesNotExist) as cm:
@@ -201,11 +201,26 @@ class TestTethysPath(unittest.TestCase):
 
             # Check size in bites (b)
             size = tethys_path.get_size()
-            self.assertEqual(size, 14.0)
+            self.assertEqual(size, 146.0)
 
             # Check size in kilobytes (kb)
             size = tethys_path.get_size("kb")
-            self.assertEqual(size, 0.013671875)
+            self.assertEqual(size, 0.142578125)
+
+            # Removing items updates the size without rescanning
+            with mock.patch(
+                "tethys_apps.base.usage_index.DiskUsageIndex.rescan"
+            ) as mock_rescan:
+                tethys_path.remove(temp_dir / "file1.txt")
+                self.assertEqual(tethys_path.get_size(), 132.0)
+
+                tethys_path.remove(temp_dir / "dir1" / "file1.txt")
+                self.assertEqual(tethys_path.get_size(), 110.0)
+
+                tethys_path.clear(exclude=["dir3"])
+                self.assertEqual(tethys_path.get_size(), 44.0)
+
+            mock_rescan.assert_not_called()
 
 
 class TestTethysPathHelpers(unittest.TestCase):
@@ -0,0 +1,199 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from django.test import override_settings
+
+from tethys_apps.base.usage_index import (
+    DiskUsageIndex,
+    scan_directory,
+    scan_item,
+)
+
+
+class TestUsageIndex(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name).resolve()
+        self.workspace = self.root / "test_app" / "app_workspace"
+        (self.workspace / "nested" / "deeper").mkdir(parents=True)
+        (self.workspace / "file1.txt").write_text("12345")
+        (self.workspace / "nested" / "file2.txt").write_text("1234567890")
+        (self.workspace / "nested" / "deeper" / "file3.txt").write_text("123")
+        self.index = DiskUsageIndex()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_scan_directory(self):
+        self.assertEqual((18, 3), scan_directory(self.workspace))
+
+    def test_scan_directory_missing(self):
+        self.assertEqual((0, 0), scan_directory(self.root / "does_not_exist"))
+
+    def test_scan_item(self):
+        self.assertEqual((5, 1), scan_item(self.workspace / "file1.txt"))
+        self.assertEqual((13, 2), scan_item(self.workspace / "nested"))
+        self.assertEqual((0, 0), scan_item(self.workspace / "missing.txt"))
+
+    def test_get_scans_once(self):
+        with mock.patch(
+            "tethys_apps.base.usage_index.scan_directory", return_value=(18, 3)
+        ) as mock_scan:
+            first = self.index.get(self.workspace)
+            second = self.index.get(self.workspace)
+
+        mock_scan.assert_called_once_with(self.workspace)
+        self.assertEqual(18, first["size"])
+        self.assertEqual(3, first["files"])
+        self.assertEqual(first, second)
+
+    def test_get_stale_entry_rescans(self):
+        self.index.get(self.workspace)
+        (self.workspace / "file4.txt").write_text("1234")
+
+        self.assertEqual(18, self.index.get(self.workspace)["size"])
+        self.assertEqual(22, self.index.get(self.workspace, max_age=0)["size"])
+
+    def test_adjust_updates_ancestors(self):
+        self.index.get(self.workspace)
+        self.index.get(self.workspace / "nested")
+
+        self.index.adjust(self.workspace / "nested" / "deeper", -3, -1)
+
+        self.assertEqual(15, self.index.get(self.workspace)["size"])
+        self.assertEqual(2, self.index.get(self.workspace)["files"])
+        self.assertEqual(10, self.index.get(self.workspace / "nested")["size"])
+
+    def test_adjust_never_negative(self):
+        self.index.get(self.workspace)
+        self.index.adjust(self.workspace, -100, -10)
+        entry = self.index.get(self.workspace)
+        self.assertEqual(0, entry["size"])
+        self.assertEqual(0, entry["files"])
+
+    def test_invalidate(self):
+        self.index.get(self.workspace)
+        self.index.get(self.workspace / "nested")
+        self.index.get(self.root)
+
+        self.index.invalidate(self.workspace)
+        self.assertEqual([str(self.root)], list(self.index._entries))
+
+        self.index.invalidate()
+        self.assertEqual({}, self.index._entries)
+
+    def test_reconcile(self):
+        self.index.get(self.workspace)
+        self.index.get(self.workspace / "nested" / "deeper")
+        (self.workspace / "file4.txt").write_text("1234")
+
+        self.assertEqual(0, self.index.reconcile(max_age=60))
+        self.assertEqual(2, self.index.reconcile())
+        self.assertEqual(22, self.index.get(self.workspace)["size"])
+
+        (self.workspace / "nested" / "deeper" / "file3.txt").unlink()
+        (self.workspace / "nested" / "deeper").rmdir()
+
+        self.assertEqual(1, self.index.reconcile())
+        self.assertEqual([str(self.workspace)], list(self.index._entries))
+
+    @override_settings(
+        TETHYS_PATH_USAGE_CACHE_ALIAS="usage",
+        CACHES={
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+            "usage": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "test_usage_index",
+            },
+        },
+    )
+    def test_shared_backend(self):
+        self.index.get(self.workspace)
+        self.index.get(self.workspace / "nested")
+
+        # another process sees the shared entry without scanning
+        other_index = DiskUsageIndex()
+        with mock.patch("tethys_apps.base.usage_index.scan_directory") as mock_scan:
+            self.assertEqual(18, other_index.get(self.workspace)["size"])
+        mock_scan.assert_not_called()
+
+        # and picks up incremental updates made by the other process
+        self.index.adjust(self.workspace / "nested", -10, -1)
+        self.assertEqual(8, other_index.get(self.workspace)["size"])
+        self.assertEqual(2, other_index.get(self.workspace)["files"])
+
+        # nothing is written to the indexed directories
+        self.assertEqual(
+            ["app_workspace"], [p.name for p in self.workspace.parent.iterdir()]
+        )
+
+        self.index.invalidate(self.workspace)
+        with mock.patch(
+            "tethys_apps.base.usage_index.scan_directory", return_value=(1, 1)
+        ) as mock_scan:
+            self.assertEqual(1, other_index.get(self.workspace)["size"])
+            self.assertEqual(1, other_index.get(self.workspace / "nested")["size"])
+        self.assertEqual(2, mock_scan.call_count)
+
+    @override_settings(TETHYS_PATH_USAGE_CACHE_ALIAS="usage")
+    def test_shared_backend_errors(self):
+        backend = mock.MagicMock()
+        backend.get_many.side_effect = Exception("error")
+        backend.set_many.side_effect = Exception("error")
+        backend.incr.side_effect = Exception("error")
+        backend.delete_many.side_effect = Exception("error")
+
+        with mock.patch(
+            "tethys_apps.base.usage_index.caches", {"usage": backend}
+        ), mock.patch("tethys_apps.base.usage_index.log") as mock_log:
+            # the index of the process is still used
+            self.assertEqual(18, self.index.get(self.workspace)["size"])
+            self.index.adjust(self.workspace, -5, -1)
+            self.assertEqual(13, self.index.get(self.workspace)["size"])
+            self.index.invalidate(self.workspace)
+
+        self.assertEqual({}, self.index._entries)
+        mock_log.warning.assert_called_once()
+
+    @override_settings(TETHYS_PATH_USAGE_CACHE_ALIAS="usage")
+    def test_shared_backend_missing_or_invalid_entry(self):
+        backend = mock.MagicMock()
+        backend.get_many.return_value = {}
+        backend.incr.side_effect = ValueError("missing")
+
+        with mock.patch(
+            "tethys_apps.base.usage_index.caches", {"usage": backend}
+        ), mock.patch(
+            "tethys_apps.base.usage_index.scan_directory", return_value=(18, 3)
+        ) as mock_scan:
+            self.assertEqual(18, self.index.get(self.workspace)["size"])
+            # entries missing from the backend (e.g. evicted) are scanned again
+            self.index.adjust(self.workspace, -5, -1)
+            self.assertEqual(18, self.index.get(self.workspace)["size"])
+
+            backend.get_many.side_effect = lambda keys: {key: "x" for key in keys}
+            self.assertEqual(18, self.index.get(self.workspace)["size"])
+
+        self.assertEqual(3, mock_scan.call_count)
+
+    def test_get_many(self):
+        missing = self.root / "missing"
+        entries = self.index.get_many(
+            [self.workspace, self.workspace / "nested", missing], max_workers=2
+        )
+
+        self.assertEqual(18, entries[self.workspace]["size"])
+        self.assertEqual(2, entries[self.workspace / "nested"]["files"])
+        self.assertEqual(0, entries[missing]["size"])
+        self.assertFalse(missing.exists())
+
+        (self.workspace / "file4.txt").write_text("1234")
+        self.assertEqual(
+            18, self.index.get_many([self.workspace])[self.workspace]["size"]
+        )
+        self.assertEqual(
+            22,
+            self.index.get_many([self.workspace], max_age=0)[self.workspace]["size"],
+        )
@@ -283,14 +283,14 @@ class HarvesterTest(unittest.TestCase):
 
     @mock.patch("sys.stdout", new_callable=io.StringIO)
     @mock.patch("tethys_apps.harvester.tethys_log.warning")
-    @mock.patch("tethysapp.test_app.app.App.register_app_permissions")
+    @mock.patch("tethys_apps.harvester.sync_apps")
     def test_harvest_app_instances_programming_error(
         self, mock_permissions, mock_logwarning, mock_stdout
     ):
         """
         Test for SingletonHarvester._harvest_app_instances
-        For the app permissions exception (ProgrammingError)
-        With an exception mocked up for register_app_permissions
+        For the app sync exception (ProgrammingError)
+        With an exception mocked up for sync_apps
         :param mock_permissions:  mock for throwing a ProgrammingError exception
         :param mock_logerror:  mock for the tethys_log error
         :param mock_stdout:  mock for the text output
@@ -313,14 +313,14 @@ class HarvesterTest(unittest.TestCase):
 
     @mock.patch("sys.stdout", new_callable=io.StringIO)
     @mock.patch("tethys_apps.harvester.tethys_log.warning")
-    @mock.patch("tethysapp.test_app.app.App.register_app_permissions")
+    @mock.patch("tethys_apps.harvester.sync_apps")
     def test_harvest_app_instances_object_does_not_exist(
         self, mock_permissions, mock_logwarning, mock_stdout
     ):
         """
         Test for SingletonHarvester._harvest_app_instances
-        For the app permissions exception (ObjectDoesNotExist)
-        With an exception mocked up for register_app_permissions
+        For the app sync exception (ObjectDoesNotExist)
+        With an exception mocked up for sync_apps
         :param mock_permissions:  mock for throwing a ObjectDoesNotExist exception
         :param mock_logerror:  mock for the tethys_log error
         :param mock_stdout:  mock for the text output
@@ -337,3 +337,24 @@ class HarvesterTest(unittest.TestCase):
         mock_permissions.assert_called()
         self.assertIn("Tethys Apps Loaded:", mock_stdout.getvalue())
         self.assertIn("test_app", mock_stdout.getvalue())
+
+    @mock.patch("sys.stdout", new_callable=io.StringIO)
+    @mock.patch("tethys_apps.harvester.tethys_log.error")
+    @mock.patch("tethys_apps.harvester.sync_apps")
+    def test_harvest_app_instances_sync_error(
+        self, mock_sync, mock_logerror, mock_stdout
+    ):
+        """
+        Test for SingletonHarvester._harvest_app_instances
+        For an unexpected exception when syncing the apps
+        """
+        list_apps = {"test_app": "tethysapp.test_app"}
+
+        mock_sync.side_effect = ValueError("bad")
+
+        shv = SingletonHarvester()
+        shv._harvest_app_instances(list_apps)
+
+        mock_logerror.assert_called()
+        self.assertEqual(["test_app"], [a.package for a in mock_sync.call_args[0][0]])
+        self.assertIn("test_app", mock_stdout.getvalue())
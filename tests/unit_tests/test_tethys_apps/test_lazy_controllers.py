@@ -0,0 +1,219 @@
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.http import Http404, HttpResponse
+from django.test import RequestFactory, override_settings
+from django.views.decorators.csrf import csrf_exempt
+
+from tethys_apps.lazy_controllers import (
+    LazyConsumer,
+    LazyController,
+    get_warmup_apps,
+    load_controllers,
+    warm_up_apps,
+)
+from tethys_apps.manifest import AppManifest
+from tethys_sdk.testing import TethysTestCase
+from tethysapp.test_app.app import App
+
+
+def get_lazy_app(url_maps=None):
+    app = App()
+    if url_maps is None:
+        url_maps = AppManifest.make_entry("tethysapp.test_app", App, App(), {})[
+            "url_maps"
+        ]
+    app._lazy_url_maps = url_maps
+    return app
+
+
+HTTP_URL_MAP = {
+    "name": "home",
+    "url": r"^test-app/$",
+    "protocol": "http",
+    "controller": "tethysapp.test_app.controllers.home_controller",
+    "handler": None,
+    "handler_type": None,
+}
+
+
+@override_settings(APP_LAZY_CONTROLLERS=True)
+class LazyUrlPatternsTest(TethysTestCase):
+    def test_lazy(self):
+        self.assertTrue(get_lazy_app().lazy)
+        self.assertFalse(App().lazy)
+
+        with override_settings(APP_LAZY_CONTROLLERS=False):
+            self.assertFalse(get_lazy_app().lazy)
+
+    def test_url_patterns(self):
+        app = get_lazy_app()
+
+        with mock.patch.object(App, "_build_url_patterns") as mock_build:
+            url_patterns = app.url_patterns
+
+        mock_build.assert_not_called()
+        http_patterns = url_patterns["http"]["test_app"]
+        ws_patterns = url_patterns["websocket"]["test_app"]
+        self.assertIn("home", [p.name for p in http_patterns])
+        self.assertIsInstance(http_patterns[0].callback, LazyController)
+        self.assertEqual(["ws"], [p.name for p in ws_patterns])
+        self.assertIsInstance(ws_patterns[0].callback, LazyConsumer)
+        self.assertTrue(http_patterns[0].lookup_str.endswith(".home"))
+
+    def test_url_patterns_not_lazy(self):
+        with override_settings(APP_LAZY_CONTROLLERS=False):
+            url_patterns = get_lazy_app().url_patterns
+
+        self.assertNotIsInstance(
+            url_patterns["http"]["test_app"][0].callback, LazyController
+        )
+
+    def test_handler_patterns_without_handlers(self):
+        app = get_lazy_app([HTTP_URL_MAP])
+
+        with mock.patch.object(
+            App, "registered_url_maps", new_callable=mock.PropertyMock
+        ) as mock_url_maps:
+            handler_patterns = app.handler_patterns
+
+        mock_url_maps.assert_not_called()
+        self.assertEqual({"http": {}, "websocket": {}}, handler_patterns)
+
+    def test_handler_patterns_with_handlers(self):
+        app = get_lazy_app()
+
+        with mock.patch.object(
+            App,
+            "registered_url_maps",
+            new_callable=mock.PropertyMock,
+            return_value=[],
+        ) as mock_url_maps:
+            app.handler_patterns
+
+        mock_url_maps.assert_called()
+
+    def test_load_controllers(self):
+        app = get_lazy_app()
+
+        controllers = app.load_controllers()
+
+        self.assertIs(controllers, load_controllers(app))
+        self.assertEqual(
+            "tethysapp.test_app.controllers", controllers["home"].__module__
+        )
+        self.assertIn("ws", controllers)
+
+
+@override_settings(APP_LAZY_CONTROLLERS=True)
+class LazyControllerTest(TethysTestCase):
+    def set_up(self):
+        self.app = get_lazy_app([HTTP_URL_MAP])
+        self.factory = RequestFactory()
+        self.view = mock.MagicMock(return_value=HttpResponse("ok"), csrf_exempt=False)
+
+    def test_call(self):
+        self.app._controllers = {"home": self.view}
+        request = self.factory.get("/apps/test-app/")
+
+        response = LazyController(self.app, "home")(request, 1, foo="bar")
+
+        self.assertEqual(b"ok", response.content)
+        self.view.assert_called_once_with(request, 1, foo="bar")
+
+    def test_call_loads_controllers(self):
+        with mock.patch.object(
+            App,
+            "_build_url_patterns",
+            return_value={"http": {"test_app": [mock.MagicMock(callback=self.view)]}},
+        ) as mock_build:
+            mock_build.return_value["http"]["test_app"][0].name = "home"
+            controller = LazyController(self.app, "home")
+            controller(self.factory.get("/"))
+            controller(self.factory.get("/"))
+
+        mock_build.assert_called_once()
+        self.assertEqual(2, self.view.call_count)
+
+    def test_call_csrf(self):
+        self.app._controllers = {"home": self.view, "exempt": csrf_exempt(self.view)}
+        request = self.factory.post("/apps/test-app/")
+
+        response = LazyController(self.app, "home")(request)
+
+        self.assertEqual(403, response.status_code)
+        self.view.assert_not_called()
+
+        response = LazyController(self.app, "exempt")(self.factory.post("/"))
+
+        self.assertEqual(b"ok", response.content)
+
+    def test_call_async(self):
+        async def view(request):
+            return HttpResponse("async")
+
+        self.app._controllers = {"home": view}
+
+        response = LazyController(self.app, "home")(self.factory.get("/"))
+
+        self.assertEqual(b"async", response.content)
+
+    @mock.patch("tethys_apps.lazy_controllers.tethys_log")
+    def test_call_missing(self, mock_log):
+        self.app._controllers = {}
+
+        with self.assertRaises(Http404):
+            LazyController(self.app, "home")(self.factory.get("/"))
+
+        mock_log.error.assert_called_once()
+
+    def test_consumer(self):
+        consumer = mock.AsyncMock()
+        self.app._controllers = {"ws": consumer}
+
+        async_to_sync(LazyConsumer(self.app, "ws"))("scope", "receive", "send")
+
+        consumer.assert_awaited_once_with("scope", "receive", "send")
+
+        with self.assertRaises(ValueError):
+            async_to_sync(LazyConsumer(self.app, "missing"))("scope", "receive", "send")
+
+
+class WarmUpTest(TethysTestCase):
+    def set_up(self):
+        self.app = get_lazy_app()
+        self.other_app = mock.MagicMock(package="other_app", _controllers=None)
+
+    def test_get_warmup_apps(self):
+        apps = [self.app, self.other_app]
+
+        with override_settings(APP_WARMUP=["test_app"]):
+            self.assertEqual([self.app], get_warmup_apps(apps))
+
+        with override_settings(APP_WARMUP="*"):
+            self.assertEqual(apps, get_warmup_apps(apps))
+
+        with override_settings(APP_WARMUP=[]):
+            self.assertEqual([], get_warmup_apps(apps))
+
+    @override_settings(APP_WARMUP="*")
+    @mock.patch("tethys_apps.lazy_controllers.tethys_log")
+    @mock.patch("tethys_apps.lazy_controllers.load_controllers")
+    def test_warm_up_apps(self, mock_load, mock_log):
+        mock_load.side_effect = [{}, ImportError]
+
+        async_to_sync(warm_up_apps)([self.app, self.other_app])
+
+        mock_load.assert_has_calls([mock.call(self.app), mock.call(self.other_app)])
+        mock_log.exception.assert_called_once()
+
+    @override_settings(APP_WARMUP="*")
+    @mock.patch("tethys_apps.lazy_controllers.load_controllers")
+    def test_warm_up_apps_harvested(self, mock_load):
+        self.app._controllers = {}
+
+        with mock.patch("tethys_apps.harvester.SingletonHarvester") as mock_harvester:
+            mock_harvester().apps = [self.app]
+            async_to_sync(warm_up_apps)()
+
+        mock_load.assert_not_called()
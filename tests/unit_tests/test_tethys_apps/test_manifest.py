@@ -0,0 +1,295 @@
+import io
+import json
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from django.test import override_settings
+
+from tethys_apps import manifest
+from tethys_apps.app_sync import sync_apps
+from tethys_apps.harvester import SingletonHarvester
+from tethys_apps.manifest import AppManifest, get_app_fingerprint
+from tethys_apps.models import TethysApp
+from tethys_sdk.testing import TethysTestCase
+
+TEST_APP_PACKAGES = {"test_app": "tethysapp.test_app"}
+
+
+class GetAppFingerprintTest(TethysTestCase):
+    def set_up(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        (self.root / "app.py").write_text("class App: pass\n")
+        (self.root / "controllers.py").write_text("")
+        (self.root / "__pycache__").mkdir()
+        (self.root / "__pycache__" / "app.cpython.pyc").write_text("")
+        self.spec = mock.MagicMock(submodule_search_locations=[str(self.root)])
+
+    def tear_down(self):
+        self.temp_dir.cleanup()
+
+    def test_get_app_fingerprint(self):
+        with mock.patch.object(manifest.importlib.util, "find_spec") as mock_spec:
+            mock_spec.return_value = self.spec
+            fingerprint = get_app_fingerprint("tethysapp.foo")
+            self.assertDictEqual(fingerprint, get_app_fingerprint("tethysapp.foo"))
+
+            # compiled files and other files are ignored
+            (self.root / "__pycache__" / "app.cpython.pyc").write_text("changed")
+            (self.root / "README.md").write_text("changed")
+            self.assertDictEqual(fingerprint, get_app_fingerprint("tethysapp.foo"))
+
+            (self.root / "controllers.py").write_text("changed = True\n")
+            changed = get_app_fingerprint("tethysapp.foo")
+            self.assertNotEqual(fingerprint["source"], changed["source"])
+            self.assertEqual(fingerprint["app_py"], changed["app_py"])
+
+            (self.root / "app.py").write_text("class App: name = 'foo'\n")
+            self.assertNotEqual(
+                changed["app_py"], get_app_fingerprint("tethysapp.foo")["app_py"]
+            )
+
+    def test_get_app_fingerprint_not_found(self):
+        with self.assertRaises(ImportError):
+            get_app_fingerprint("tethysapp.does_not_exist")
+
+
+class AppManifestTest(TethysTestCase):
+    def set_up(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "app_manifest.json"
+        self.manifest = AppManifest(path=self.path)
+        self.fingerprint = get_app_fingerprint("tethysapp.test_app")
+        self.entry = {"module": "tethysapp.test_app.app", "class": "App"}
+        self.entry.update(self.fingerprint)
+
+    def tear_down(self):
+        self.temp_dir.cleanup()
+
+    def test_path(self):
+        self.assertEqual(self.path, self.manifest.path)
+
+        with override_settings(APP_MANIFEST_PATH="/foo/manifest.json"):
+            self.assertEqual(Path("/foo/manifest.json"), AppManifest().path)
+
+        with mock.patch(
+            "tethys_apps.utilities.get_tethys_home_dir", return_value="/tethys"
+        ):
+            self.assertEqual(Path("/tethys/app_manifest.json"), AppManifest().path)
+
+    def test_load_missing_or_invalid(self):
+        self.assertDictEqual({}, self.manifest.load())
+
+        self.path.write_text("{")
+        self.assertDictEqual({}, self.manifest.load())
+
+    def test_save_load(self):
+        self.manifest.save({"test_app": self.entry})
+
+        self.assertDictEqual({"test_app": self.entry}, self.manifest.load())
+        self.assertEqual([self.path], list(self.path.parent.iterdir()))
+
+    def test_load_other_version(self):
+        self.manifest.save({"test_app": self.entry})
+        data = json.loads(self.path.read_text())
+        data["header"]["tethys_version"] = "0.0.0"
+        self.path.write_text(json.dumps(data))
+
+        self.assertDictEqual({}, self.manifest.load())
+
+    @override_settings(
+        DATABASES={"default": {"ENGINE": "django.db.backends.sqlite3", "NAME": "x"}}
+    )
+    def test_load_other_database(self):
+        AppManifest(path=self.path).save({"test_app": self.entry})
+
+        with override_settings(
+            DATABASES={"default": {"ENGINE": "django.db.backends.sqlite3", "NAME": "y"}}
+        ):
+            self.assertDictEqual({}, self.manifest.load())
+
+    @mock.patch("tethys_apps.manifest.tethys_log")
+    def test_save_error(self, mock_log):
+        manifest = AppManifest(path=Path(self.temp_dir.name) / "file" / "manifest")
+        (Path(self.temp_dir.name) / "file").write_text("")
+
+        manifest.save({})
+
+        mock_log.warning.assert_called_once()
+
+    def test_update(self):
+        self.manifest.save({"test_app": self.entry, "removed_app": self.entry})
+
+        with mock.patch.object(self.manifest, "save") as mock_save:
+            self.manifest.update({}, installed=["test_app", "removed_app"])
+            mock_save.assert_not_called()
+
+        self.manifest.update({"new_app": self.entry}, installed=["test_app"])
+
+        self.assertDictEqual(
+            {"test_app": self.entry, "new_app": self.entry}, self.manifest.load()
+        )
+
+    def test_clear(self):
+        self.manifest.save({})
+        self.manifest.clear()
+        self.manifest.clear()
+
+        self.assertFalse(self.path.exists())
+
+    def test_matches(self):
+        self.assertTrue(AppManifest.matches(self.entry, self.fingerprint))
+        self.assertFalse(AppManifest.matches(None, self.fingerprint))
+        self.assertFalse(AppManifest.matches(self.entry, None))
+        self.assertFalse(
+            AppManifest.matches(self.entry, {**self.fingerprint, "source": "changed"})
+        )
+
+    def test_validate(self):
+        packages = {
+            "test_app": "tethysapp.test_app",
+            "stale_app": "tethysapp.test_app",
+            "unregistered_app": "tethysapp.test_app",
+            "missing_app": "tethysapp.test_app",
+        }
+        self.manifest.save(
+            {
+                "test_app": self.entry,
+                "stale_app": {**self.entry, "app_py": "changed"},
+                "unregistered_app": self.entry,
+            }
+        )
+
+        self.assertDictEqual(
+            {
+                "missing_app": manifest.MISSING,
+                "stale_app": manifest.STALE,
+                "test_app": manifest.VALID,
+                "unregistered_app": manifest.UNREGISTERED,
+            },
+            self.manifest.validate(packages),
+        )
+
+
+@mock.patch("sys.stdout", new_callable=io.StringIO)
+class HarvesterManifestTest(TethysTestCase):
+    def set_up(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "app_manifest.json"
+        self.settings = override_settings(
+            APP_MANIFEST_CACHE=True, APP_MANIFEST_PATH=str(self.path)
+        )
+        self.settings.enable()
+        self.harvester = SingletonHarvester()
+
+    def tear_down(self):
+        self.settings.disable()
+        self.temp_dir.cleanup()
+        self.harvester.harvest()
+
+    def harvest(self, **kwargs):
+        with mock.patch(
+            "tethys_apps.harvester.sync_apps", side_effect=sync_apps
+        ) as mock_sync:
+            self.harvester._harvest_app_instances(TEST_APP_PACKAGES, **kwargs)
+
+        return [app.package for app in mock_sync.call_args[0][0]]
+
+    def test_harvest_builds_manifest(self, _):
+        self.assertEqual(["test_app"], self.harvest())
+
+        entry = AppManifest(path=self.path).load()["test_app"]
+        self.assertEqual("tethysapp.test_app.app", entry["module"])
+        self.assertEqual("App", entry["class"])
+        self.assertIn(
+            {
+                "name": "ws",
+                "url": r"^test-app-ws/ws/$",
+                "protocol": "websocket",
+                "controller": "tethysapp.test_app.controllers.TestWS",
+                "handler": None,
+                "handler_type": None,
+            },
+            entry["url_maps"],
+        )
+
+    def test_harvest_from_manifest(self, _):
+        self.harvest()
+
+        with mock.patch(
+            "tethysapp.test_app.app.App.url_patterns",
+            new_callable=mock.PropertyMock,
+        ) as mock_url_patterns:
+            synced = self.harvest()
+
+        self.assertEqual([], synced)
+        mock_url_patterns.assert_not_called()
+        self.assertEqual(["test_app"], [app.package for app in self.harvester.apps])
+        self.assertEqual(TEST_APP_PACKAGES, self.harvester.app_modules)
+
+    def test_harvest_rebuild(self, _):
+        self.harvest()
+
+        self.assertEqual(["test_app"], self.harvest(rebuild=True))
+
+    def test_harvest_stale(self, _):
+        self.harvest()
+
+        with mock.patch(
+            "tethys_apps.harvester.get_app_fingerprint",
+            return_value={"source": "changed", "app_py": "changed"},
+        ):
+            self.assertEqual(["test_app"], self.harvest())
+
+        self.assertEqual(
+            "changed", AppManifest(path=self.path).load()["test_app"]["source"]
+        )
+
+    def test_harvest_unregistered(self, _):
+        self.harvest()
+        TethysApp.objects.filter(package="test_app").delete()
+
+        self.assertEqual(["test_app"], self.harvest())
+        self.assertTrue(TethysApp.objects.filter(package="test_app").exists())
+
+    @mock.patch("tethys_apps.harvester.tethys_log")
+    def test_harvest_invalid_class(self, mock_log, _):
+        self.harvest()
+        manifest = AppManifest(path=self.path)
+        entries = manifest.load()
+        entries["test_app"]["class"] = "TethysAppBase"
+        manifest.save(entries)
+
+        synced = self.harvest()
+
+        mock_log.warning.assert_called_once()
+        self.assertEqual(["test_app"], synced)
+        self.assertEqual("App", manifest.load()["test_app"]["class"])
+
+    @override_settings(APP_MANIFEST_CACHE=False)
+    def test_harvest_disabled(self, _):
+        self.harvest()
+
+        self.assertFalse(self.path.exists())
+
+    @mock.patch("tethys_apps.harvester.tethys_log")
+    def test_get_url_patterns_error(self, mock_log, _):
+        self.harvest()
+        self.harvest()
+
+        with mock.patch(
+            "tethysapp.test_app.app.App.url_patterns",
+            new_callable=mock.PropertyMock,
+            side_effect=ImportError,
+        ), mock.patch(
+            "tethysapp.test_app.app.App.handler_patterns",
+            new_callable=mock.PropertyMock,
+            side_effect=ImportError,
+        ):
+            url_patterns = self.harvester.get_url_patterns()
+            handler_patterns = self.harvester.get_handler_patterns()
+
+        self.assertNotIn("test_app", url_patterns["app_url_patterns"])
+        self.assertNotIn("test_app", handler_patterns["http_handler_patterns"])
+        self.assertEqual(2, mock_log.exception.call_count)
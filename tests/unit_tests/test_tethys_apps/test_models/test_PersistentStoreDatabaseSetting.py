@@ -168,6 +168,32 @@ class PersistentStoreDatabaseSettingTests(TethysTestCase):
         self.assertIsInstance(ret, PersistentStoreService)
         self.assertEqual("test_database", ret.database)
 
+    def test_get_value_with_db_does_not_modify_service(self):
+        ps_ds_setting = self.test_app.settings_set.select_subclasses().get(
+            name="spatial_db"
+        )
+        ps_ds_setting.persistent_store_service = self.pss
+        ps_ds_setting.save()
+
+        engine = ps_ds_setting.get_value(with_db=True, as_engine=True)
+
+        self.assertEqual(
+            ps_ds_setting.get_namespaced_persistent_store_name(), engine.url.database
+        )
+        self.assertIsNone(ps_ds_setting.persistent_store_service.database)
+        self.assertIsNone(ps_ds_setting.get_value(as_engine=True).url.database)
+
+    @mock.patch("tethys_apps.models.engine_registry")
+    def test_save_disposes_engines(self, mock_registry):
+        ps_ds_setting = self.test_app.settings_set.select_subclasses().get(
+            name="spatial_db"
+        )
+        ps_ds_setting.save()
+
+        mock_registry.dispose.assert_called_with(
+            database=ps_ds_setting.get_namespaced_persistent_store_name()
+        )
+
     def test_get_value_as_engine(self):
         ps_ds_setting = self.test_app.settings_set.select_subclasses().get(
             name="spatial_db"
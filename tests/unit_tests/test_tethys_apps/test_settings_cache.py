@@ -0,0 +1,142 @@
+from unittest import mock
+
+from django.test import override_settings
+from tethysapp.test_app.app import App
+
+from tethys_apps.models import TethysApp
+from tethys_apps.settings_cache import AppSettingsCache, app_settings_cache
+from tethys_sdk.testing import TethysTestCase
+
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "settings": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "tethys-settings-cache",
+    },
+}
+
+
+class AppSettingsCacheTest(TethysTestCase):
+    def set_up(self):
+        self.cache = AppSettingsCache()
+        self.func = mock.MagicMock(side_effect=lambda: object())
+
+    def test_get_or_set(self):
+        value = self.cache.get_or_set("app", "key", self.func)
+
+        self.assertIs(value, self.cache.get_or_set("app", "key", self.func))
+        self.func.assert_called_once()
+
+    def test_get_or_set_exception_not_cached(self):
+        self.func.side_effect = [ValueError, "value"]
+
+        with self.assertRaises(ValueError):
+            self.cache.get_or_set("app", "key", self.func)
+
+        self.assertEqual("value", self.cache.get_or_set("app", "key", self.func))
+
+    @override_settings(APP_SETTINGS_CACHE_TIMEOUT=0)
+    def test_get_or_set_disabled(self):
+        self.cache.get_or_set("app", "key", self.func)
+        self.cache.get_or_set("app", "key", self.func)
+
+        self.assertEqual(2, self.func.call_count)
+
+    @mock.patch("tethys_apps.settings_cache.time")
+    def test_get_or_set_expired(self, mock_time):
+        mock_time.monotonic.side_effect = [0, 100, 301, 301]
+
+        self.cache.get_or_set("app", "key", self.func)
+        self.cache.get_or_set("app", "key", self.func)
+        self.cache.get_or_set("app", "key", self.func)
+
+        self.assertEqual(2, self.func.call_count)
+
+    def test_invalidate(self):
+        self.cache.get_or_set("app1", "key", self.func)
+        self.cache.get_or_set("app2", "key", self.func)
+
+        self.cache.invalidate("app1")
+        self.cache.get_or_set("app1", "key", self.func)
+        self.cache.get_or_set("app2", "key", self.func)
+        self.assertEqual(3, self.func.call_count)
+
+        self.cache.invalidate()
+        self.cache.get_or_set("app2", "key", self.func)
+        self.assertEqual(4, self.func.call_count)
+
+    @override_settings(CACHES=LOCMEM_CACHES, APP_SETTINGS_CACHE_ALIAS="settings")
+    def test_invalidate_shared(self):
+        other = AppSettingsCache()
+        self.cache.get_or_set("app1", "key", self.func)
+        self.cache.get_or_set("app2", "key", self.func)
+        other.get_or_set("app1", "key", self.func)
+        self.assertEqual(3, self.func.call_count)
+
+        # Invalidating in one process invalidates the others
+        other.invalidate("app1")
+        self.cache.get_or_set("app1", "key", self.func)
+        self.cache.get_or_set("app2", "key", self.func)
+        self.assertEqual(4, self.func.call_count)
+
+        other.invalidate()
+        self.cache.get_or_set("app2", "key", self.func)
+        self.assertEqual(5, self.func.call_count)
+
+    @override_settings(CACHES=LOCMEM_CACHES, APP_SETTINGS_CACHE_ALIAS="settings")
+    @mock.patch("tethys_apps.settings_cache.caches")
+    def test_get_or_set_backend_unavailable(self, mock_caches):
+        mock_caches["settings"].get_many.side_effect = ConnectionError
+
+        self.cache.get_or_set("app", "key", self.func)
+        self.cache.get_or_set("app", "key", self.func)
+
+        self.assertEqual(2, self.func.call_count)
+
+
+class AppSettingsInvalidationTest(TethysTestCase):
+    def set_up(self):
+        app_settings_cache.invalidate()
+        self.db_app = TethysApp.objects.get(package="test_app")
+        self.setting = self.db_app.custom_settings.get(name="default_name")
+        self.setting.value = "foo"
+        self.setting.save()
+
+    def test_get_custom_setting_cached(self):
+        self.assertEqual("foo", App.get_custom_setting("default_name"))
+
+        with self.assertNumQueries(0):
+            self.assertEqual("foo", App.get_custom_setting("default_name"))
+
+    def test_get_custom_setting_returns_copy(self):
+        setting = self.db_app.custom_settings.get(
+            name="JSON_setting_default_value_required"
+        )
+        value = App.get_custom_setting(setting.name)
+        value["extra"] = True
+
+        self.assertNotIn("extra", App.get_custom_setting(setting.name))
+
+    def test_setting_saved(self):
+        App.get_custom_setting("default_name")
+        self.setting.value = "bar"
+        self.setting.save()
+
+        self.assertEqual("bar", App.get_custom_setting("default_name"))
+
+    def test_app_saved(self):
+        App.get_custom_setting("default_name")
+        self.db_app.save()
+
+        with self.assertNumQueries(2):
+            App.get_custom_setting("default_name")
+
+    @mock.patch("tethys_apps.models.app_settings_cache")
+    def test_service_saved(self, mock_cache):
+        from tethys_services.models import SpatialDatasetService
+
+        SpatialDatasetService.objects.create(
+            name="geoserver", endpoint="http://localhost:8181/geoserver/rest/"
+        )
+
+        mock_cache.invalidate.assert_called_with()
@@ -0,0 +1,159 @@
+import json
+import os
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from django.contrib.auth.models import Group
+from django.test import override_settings
+
+from tethys_apps.harvester import SingletonHarvester
+from tethys_apps.startup_profiler import StartupProfiler
+from tethys_sdk.testing import TethysTestCase
+
+
+class StartupProfilerTest(TethysTestCase):
+    def set_up(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "profile" / "startup_profile.json"
+        self.profiler = StartupProfiler()
+
+    def tear_down(self):
+        self.temp_dir.cleanup()
+
+    @mock.patch.dict(os.environ, {"TETHYS_PROFILE_STARTUP": ""})
+    def test_enabled(self):
+        self.assertFalse(self.profiler.enabled)
+
+        with override_settings(TETHYS_PROFILE_STARTUP=True):
+            self.assertTrue(self.profiler.enabled)
+
+        with mock.patch.dict(os.environ, {"TETHYS_PROFILE_STARTUP": "True"}):
+            self.assertTrue(self.profiler.enabled)
+
+    def test_path(self):
+        with override_settings(TETHYS_PROFILE_STARTUP_PATH=str(self.path)):
+            self.assertEqual(self.path, self.profiler.path)
+
+        with mock.patch(
+            "tethys_apps.utilities.get_tethys_home_dir", return_value="/tethys"
+        ):
+            self.assertEqual(Path("/tethys/startup_profile.json"), self.profiler.path)
+
+    @override_settings(TETHYS_PROFILE_STARTUP=False)
+    @mock.patch.dict(os.environ, {"TETHYS_PROFILE_STARTUP": ""})
+    def test_measure_disabled(self):
+        with self.profiler.measure("import", app="foo"):
+            list(Group.objects.all())
+
+        self.assertEqual({}, self.profiler.apps)
+
+    @override_settings(TETHYS_PROFILE_STARTUP=True)
+    def test_measure(self):
+        with self.profiler.measure("import", app="foo"):
+            list(Group.objects.all())
+            list(Group.objects.all())
+
+        with self.profiler.measure("import", extension="bar"):
+            pass
+
+        with self.profiler.measure("sync_apps"):
+            pass
+
+        record = self.profiler.apps["foo"]["import"]
+        self.assertEqual(2, record["queries"])
+        self.assertGreater(record["seconds"], 0)
+        self.assertEqual(0, self.profiler.extensions["bar"]["import"]["queries"])
+        self.assertIn("sync_apps", self.profiler.phases)
+
+    @override_settings(TETHYS_PROFILE_STARTUP=True)
+    def test_measure_error(self):
+        with self.assertRaises(ValueError):
+            with self.profiler.measure("import", app="foo"):
+                raise ValueError
+
+        self.assertIn("import", self.profiler.apps["foo"])
+
+    def test_record(self):
+        self.profiler.record("url_patterns", 0.5, 2, app="foo")
+        self.profiler.record("url_patterns", 0.25, 1, app="foo")
+        self.profiler.record("import", 1.0, 0, app="foo")
+
+        report = self.profiler.as_dict()
+
+        self.assertEqual(
+            {"seconds": 0.75, "queries": 3},
+            report["apps"]["foo"]["steps"]["url_patterns"],
+        )
+        self.assertEqual(
+            {"seconds": 1.75, "queries": 3}, report["apps"]["foo"]["total"]
+        )
+        self.assertEqual({}, report["extensions"])
+        self.assertEqual(os.getpid(), report["pid"])
+
+    def test_reset(self):
+        self.profiler.record("import", 1.0, 0, app="foo")
+
+        self.profiler.reset()
+
+        self.assertEqual({}, self.profiler.apps)
+
+    def test_format(self):
+        self.profiler.record("harvest_apps", 2.0, 10)
+        self.profiler.record("import", 0.1, 0, app="fast_app")
+        self.profiler.record("import", 1.5, 4, app="slow_app")
+        self.profiler.record("import", 0.2, 0, extension="ext")
+
+        report = self.profiler.format()
+
+        self.assertIn("Phases:", report)
+        self.assertIn("Extensions:", report)
+        self.assertLess(report.index("slow_app"), report.index("fast_app"))
+        self.assertIn("1500.0 ms", report)
+
+    @override_settings(TETHYS_PROFILE_STARTUP=False)
+    @mock.patch.dict(os.environ, {"TETHYS_PROFILE_STARTUP": ""})
+    @mock.patch("tethys_apps.startup_profiler.print")
+    def test_write_disabled(self, mock_print):
+        with override_settings(TETHYS_PROFILE_STARTUP_PATH=str(self.path)):
+            self.profiler.write()
+
+        mock_print.assert_not_called()
+        self.assertFalse(self.path.exists())
+
+    @override_settings(TETHYS_PROFILE_STARTUP=True)
+    @mock.patch("tethys_apps.startup_profiler.print")
+    def test_write(self, mock_print):
+        self.profiler.record("import", 1.0, 3, app="foo")
+
+        with override_settings(TETHYS_PROFILE_STARTUP_PATH=str(self.path)):
+            self.profiler.write()
+
+        report = json.loads(self.path.read_text())
+        self.assertEqual(3, report["apps"]["foo"]["total"]["queries"])
+        self.assertIn("foo", mock_print.call_args_list[0][0][0])
+
+    @override_settings(TETHYS_PROFILE_STARTUP=True)
+    @mock.patch("tethys_apps.startup_profiler.tethys_log")
+    @mock.patch("tethys_apps.startup_profiler.print")
+    def test_write_error(self, _, mock_log):
+        self.path.parent.write_text("not a directory")
+
+        with override_settings(TETHYS_PROFILE_STARTUP_PATH=str(self.path)):
+            self.profiler.write()
+
+        mock_log.warning.assert_called_once()
+
+    @override_settings(TETHYS_PROFILE_STARTUP=True)
+    def test_harvest(self):
+        harvester = SingletonHarvester()
+
+        with mock.patch("tethys_apps.harvester.startup_profiler", self.profiler):
+            harvester._harvest_app_instances({"test_app": "tethysapp.test_app"})
+            harvester.get_url_patterns()
+
+        steps = self.profiler.apps["test_app"]
+        self.assertIn("import", steps)
+        self.assertIn("url_patterns", steps)
+        self.assertIn("handler_patterns", steps)
+        self.assertIn("sync_apps", self.profiler.phases)
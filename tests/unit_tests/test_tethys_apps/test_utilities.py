@@ -1,9 +1,11 @@
+import tempfile
 import unittest
 from pathlib import Path
 from unittest import mock
 from guardian.shortcuts import assign_perm
 from tethys_sdk.testing import TethysTestCase
 from tethys_apps import utilities
+from tethys_apps.app_registry import app_registry
 from django.core.signing import Signer
 from django.test import override_settings
 from channels.generic.websocket import AsyncWebsocketConsumer, WebsocketConsumer
@@ -171,16 +173,33 @@ class TethysAppsUtilitiesTests(unittest.TestCase):
         self.assertEqual(None, result)
 
     @override_settings(MULTIPLE_APP_MODE=True)
-    @mock.patch("tethys_apps.models.TethysApp")
-    def test_get_active_app_request(self, mock_app):
-        # Mock up for TethysApp, and request
-        mock_app.objects.get.return_value = mock.MagicMock()
+    @mock.patch("tethys_apps.utilities.app_registry")
+    def test_get_active_app_request(self, mock_registry):
+        # Mock up for the app registry, and request
         mock_request = mock.MagicMock()
         mock_request.path = "/apps/foo/bar"
 
-        # Result should be mock for mock_app.objects.get.return_value
+        # Result should be the app with root url "foo" in the registry
         result = utilities.get_active_app(request=mock_request)
-        self.assertEqual(mock_app.objects.get(), result)
+        self.assertEqual(mock_registry.get_by_root_url.return_value, result)
+        mock_registry.get_by_root_url.assert_called_once_with("foo")
+
+        # The app is attached to the request and resolved only once
+        self.assertEqual(result, mock_request.tethys_app)
+        self.assertEqual(result, utilities.get_active_app(request=mock_request))
+        mock_registry.get_by_root_url.assert_called_once()
+
+    @override_settings(MULTIPLE_APP_MODE=True)
+    @mock.patch("tethys_apps.utilities.app_registry")
+    def test_get_active_app_request_cached_none(self, mock_registry):
+        mock_request = mock.MagicMock()
+        mock_request.path = "/foo/bar"
+
+        self.assertIsNone(utilities.get_active_app(request=mock_request))
+        mock_request.path = "/apps/foo/bar"
+        self.assertIsNone(utilities.get_active_app(request=mock_request))
+
+        mock_registry.get_by_root_url.assert_not_called()
 
     @override_settings(MULTIPLE_APP_MODE=False)
     @mock.patch("tethys_apps.utilities.get_configured_standalone_app")
@@ -195,14 +214,12 @@ class TethysAppsUtilitiesTests(unittest.TestCase):
         self.assertEqual(mock_tethysapp, result)
 
     @override_settings(MULTIPLE_APP_MODE=True)
-    @mock.patch("tethys_apps.models.TethysApp")
-    def test_get_active_app_url(self, mock_app):
-        # Mock up for TethysApp
-        mock_app.objects.get.return_value = mock.MagicMock()
-
-        # Result should be mock for mock_app.objects.get.return_value
+    @mock.patch("tethys_apps.utilities.app_registry")
+    def test_get_active_app_url(self, mock_registry):
+        # Result should be the app with root url "foo" in the registry
         result = utilities.get_active_app(url="/apps/foo/bar")
-        self.assertEqual(mock_app.objects.get(), result)
+        self.assertEqual(mock_registry.get_by_root_url.return_value, result)
+        mock_registry.get_by_root_url.assert_called_once_with("foo")
 
     @override_settings(MULTIPLE_APP_MODE=True)
     def test_get_active_app_no_app(self):
@@ -214,24 +231,19 @@ class TethysAppsUtilitiesTests(unittest.TestCase):
         self.assertEqual(None, result)
 
     @override_settings(MULTIPLE_APP_MODE=True)
-    @mock.patch("tethys_apps.utilities.SingletonHarvester")
-    @mock.patch("tethys_apps.models.TethysApp")
-    def test_get_active_app_class(self, mock_app, mock_harvester):
-        # Mock up for TethysApp
-        app = mock.MagicMock()
-        mock_app.objects.get.return_value = app
+    @mock.patch("tethys_apps.utilities.app_registry")
+    def test_get_active_app_class(self, mock_registry):
+        app = mock.MagicMock(package="foo")
+        mock_registry.get_by_root_url.return_value = app
 
-        mock_harvester().apps = [app]
-
-        # Result should be mock for mock_app.objects.get.return_value
+        # Result should be the app class of the app with root url "foo"
         result = utilities.get_active_app(url="/apps/foo/bar", get_class=True)
-        self.assertEqual(mock_app.objects.get(), result)
+        self.assertEqual(mock_registry.get_app_class.return_value, result)
+        mock_registry.get_app_class.assert_called_once_with("foo")
 
     @override_settings(MULTIPLE_APP_MODE=True)
-    @mock.patch("tethys_apps.models.TethysApp")
-    def test_get_active_app_request_bad_path(self, mock_app):
-        # Mock up for TethysApp
-        mock_app.objects.get.return_value = mock.MagicMock()
+    @mock.patch("tethys_apps.utilities.app_registry")
+    def test_get_active_app_request_bad_path(self, mock_registry):
         mock_request = mock.MagicMock()
         # Path does not contain apps
         mock_request.path = "/foo/bar"
@@ -242,12 +254,12 @@ class TethysAppsUtilitiesTests(unittest.TestCase):
 
     @override_settings(MULTIPLE_APP_MODE=True)
     @mock.patch("tethys_apps.utilities.tethys_log.warning")
-    @mock.patch("tethys_apps.models.TethysApp")
-    def test_get_active_app_request_exception1(self, mock_app, mock_log_warning):
+    @mock.patch("tethys_apps.utilities.app_registry")
+    def test_get_active_app_request_exception1(self, mock_registry, mock_log_warning):
         from django.core.exceptions import ObjectDoesNotExist
 
-        # Mock up for TethysApp to raise exception, and request
-        mock_app.objects.get.side_effect = ObjectDoesNotExist
+        # Mock up for the app registry to raise exception, and request
+        mock_registry.get_by_root_url.side_effect = ObjectDoesNotExist
         mock_request = mock.MagicMock()
         mock_request.path = "/apps/foo/bar"
 
@@ -260,12 +272,12 @@ class TethysAppsUtilitiesTests(unittest.TestCase):
 
     @override_settings(MULTIPLE_APP_MODE=True)
     @mock.patch("tethys_apps.utilities.tethys_log.warning")
-    @mock.patch("tethys_apps.models.TethysApp")
-    def test_get_active_app_request_exception2(self, mock_app, mock_log_warning):
+    @mock.patch("tethys_apps.utilities.app_registry")
+    def test_get_active_app_request_exception2(self, mock_registry, mock_log_warning):
         from django.core.exceptions import MultipleObjectsReturned
 
-        # Mock up for TethysApp to raise exception, and request
-        mock_app.objects.get.side_effect = MultipleObjectsReturned
+        # Mock up for the app registry to raise exception, and request
+        mock_registry.get_by_root_url.side_effect = MultipleObjectsReturned
         mock_request = mock.MagicMock()
         mock_request.path = "/apps/foo/bar"
 
@@ -806,7 +818,7 @@ class TethysAppsUtilitiesTests(unittest.TestCase):
         # Returns default tethys home environment path
         self.assertEqual(str(Path(expand_user_path) / ".tethys"), ret)
 
-    @mock.patch("tethys_apps.utilities.SingletonHarvester")
+    @mock.patch("tethys_apps.app_registry.SingletonHarvester")
     def test_get_app_class(self, mock_harvester):
         """"""
         from tethysapp.test_app.app import App
@@ -823,7 +835,7 @@ class TethysAppsUtilitiesTests(unittest.TestCase):
         # Should work because package is used to find the class, not the name
         self.assertTrue(ret is test_app)
 
-    @mock.patch("tethys_apps.utilities.SingletonHarvester")
+    @mock.patch("tethys_apps.app_registry.SingletonHarvester")
     def test_get_app_class__different_name(self, mock_harvester):
         """Test case when user changes name of app in DB (from app settings)."""
         from tethysapp.test_app.app import App
@@ -840,7 +852,7 @@ class TethysAppsUtilitiesTests(unittest.TestCase):
         # Should work because package is used to find the class, not the name
         self.assertTrue(ret is test_app)
 
-    @mock.patch("tethys_apps.utilities.SingletonHarvester")
+    @mock.patch("tethys_apps.app_registry.SingletonHarvester")
     def test_get_app_class__no_matching_class(self, mock_harvester):
         """Test case when no app class can be found for the app."""
         from tethysapp.test_app.app import App
@@ -858,6 +870,9 @@ class TethysAppsUtilitiesTests(unittest.TestCase):
         # Should not work because package is used to find the class
         self.assertIsNone(ret)
 
+    def test_get_app_class__no_app(self):
+        self.assertIsNone(utilities.get_app_class(None))
+
 
 class TestTethysAppsUtilitiesTethysTestCase(TethysTestCase):
     def set_up(self):
@@ -1097,58 +1112,80 @@ class TestTethysAppsUtilitiesTethysTestCase(TethysTestCase):
         )
         self.assertEqual(unsigned_secret, mock_val)
 
+    def test_load_secrets_yaml(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            secrets_path = Path(temp_dir) / "secrets.yml"
+            secrets_path.write_text("secrets:\n  version: '1.0'\n")
+
+            with mock.patch.object(
+                Path, "read_text", autospec=True, side_effect=Path.read_text
+            ) as mock_read_text:
+                content = utilities._load_secrets_yaml(secrets_path)
+                self.assertIs(content, utilities._load_secrets_yaml(secrets_path))
+                mock_read_text.assert_called_once()
+
+            secrets_path.write_text("secrets:\n  version: '2.0'\n")
+            self.assertDictEqual(
+                {"secrets": {"version": "2.0"}},
+                utilities._load_secrets_yaml(secrets_path),
+            )
+
+    @mock.patch("tethys_apps.utilities.get_tethys_home_dir")
+    def test_get_secrets_version(self, mock_home):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            mock_home.return_value = temp_dir
+            self.assertIsNone(utilities.get_secrets_version())
+
+            (Path(temp_dir) / "secrets.yml").write_text("secrets: {}\n")
+            version = utilities.get_secrets_version()
+            self.assertEqual(str(Path(temp_dir) / "secrets.yml"), version[0])
+
     @override_settings(MULTIPLE_APP_MODE=False)
     def test_get_configured_standalone_app_no_app_name(self):
-        from tethys_apps.models import TethysApp
-
         with mock.patch(
-            "tethys_apps.models.TethysApp", wraps=TethysApp
-        ) as mock_tethysapp:
+            "tethys_apps.utilities.app_registry", wraps=app_registry
+        ) as mock_registry:
             result = utilities.get_configured_standalone_app()
 
             self.assertEqual(result.package, "test_app")
-            mock_tethysapp.objects.first.assert_called_once()
+            mock_registry.first.assert_called_once()
 
     @override_settings(MULTIPLE_APP_MODE=False, STANDALONE_APP="test_app")
     def test_get_configured_standalone_app_given_app_name(self):
-        from tethys_apps.models import TethysApp
-
         with mock.patch(
-            "tethys_apps.models.TethysApp", wraps=TethysApp
-        ) as mock_tethysapp:
+            "tethys_apps.utilities.app_registry", wraps=app_registry
+        ) as mock_registry:
             result = utilities.get_configured_standalone_app()
 
             self.assertEqual(result.package, "test_app")
-            mock_tethysapp.objects.get.assert_called_with(package="test_app")
+            mock_registry.get_by_package.assert_called_with("test_app")
 
     @override_settings(MULTIPLE_APP_MODE=False)
-    def test_get_configured_standalone_app_no_app_name_no_installed(self):
-        from tethys_apps.models import TethysApp
+    @mock.patch("tethys_apps.utilities.app_registry")
+    def test_get_configured_standalone_app_no_app_name_no_installed(
+        self, mock_registry
+    ):
+        mock_registry.first.return_value = None
+        app = utilities.get_configured_standalone_app()
 
-        with mock.patch(
-            "tethys_apps.models.TethysApp", wraps=TethysApp
-        ) as mock_tethysapp:
-            mock_tethysapp.objects.first.return_value = []
-            app = utilities.get_configured_standalone_app()
+        self.assertIsNone(app)
+        mock_registry.first.assert_called_once()
 
-            self.assertTrue(app == [])
-            mock_tethysapp.objects.first.assert_called_once()
+    @override_settings(MULTIPLE_APP_MODE=False, STANDALONE_APP="not_installed")
+    def test_get_configured_standalone_app_not_installed(self):
+        self.assertIsNone(utilities.get_configured_standalone_app())
 
     @override_settings(MULTIPLE_APP_MODE=False)
-    def test_get_configured_standalone_app_db_not_ready(self):
-        from tethys_apps.models import TethysApp
+    @mock.patch("tethys_apps.utilities.app_registry")
+    def test_get_configured_standalone_app_db_not_ready(self, mock_registry):
         from django.db.utils import ProgrammingError
 
-        with mock.patch(
-            "tethys_apps.models.TethysApp", wraps=TethysApp
-        ) as mock_tethysapp:
-            mock_tethysapp.DoesNotExist = TethysApp.DoesNotExist
-            mock_tethysapp.objects.first.side_effect = [ProgrammingError]
-            app = utilities.get_configured_standalone_app()
+        mock_registry.first.side_effect = [ProgrammingError]
+        app = utilities.get_configured_standalone_app()
 
-            self.assertIsNone(app)
+        self.assertIsNone(app)
 
-            mock_tethysapp.objects.first.assert_called_once()
+        mock_registry.first.assert_called_once()
 
     def test_update_decorated_websocket_consumer_class(self):
         class TestConsumer(WebsocketConsumer):
@@ -0,0 +1,175 @@
+import datetime
+import unittest
+from unittest import mock
+
+from django.test import override_settings
+
+from tethys_cli import tethys_command_parser
+from tethys_cli.jobs_commands import jobs_poll_command, jobs_purge_command
+
+
+class JobsCommandsTest(unittest.TestCase):
+    def setUp(self):
+        setup_django_patcher = mock.patch("tethys_cli.jobs_commands.setup_django")
+        setup_django_patcher.start()
+        self.addCleanup(setup_django_patcher.stop)
+
+    def get_args(self, *args):
+        return tethys_command_parser().parse_args(["jobs", "poll", *args])
+
+    def test_parser(self):
+        args = self.get_args("-i", "10", "--once", "-b", "50", "-c", "2")
+
+        self.assertEqual(jobs_poll_command, args.func)
+        self.assertEqual(10, args.interval)
+        self.assertTrue(args.once)
+        self.assertEqual(50, args.batch_size)
+        self.assertEqual(2, args.concurrency)
+
+    @mock.patch("tethys_cli.jobs_commands.pretty_output")
+    @mock.patch("tethys_compute.job_poller.JobStatusPoller")
+    def test_poll_once(self, mock_poller, mock_pretty_output):
+        mock_poller().poll = mock.AsyncMock(return_value=3)
+
+        jobs_poll_command(self.get_args("--once", "-b", "50"))
+
+        mock_poller.assert_called_with(batch_size=50, concurrency=None)
+        mock_poller().poll.assert_awaited_once()
+        po_call_args = mock_pretty_output().__enter__().write.call_args_list
+        self.assertEqual(
+            "Successfully updated the statuses of 3 jobs.", po_call_args[0][0][0]
+        )
+
+    @mock.patch("tethys_cli.jobs_commands.pretty_output")
+    @mock.patch("tethys_compute.job_poller.JobStatusPoller")
+    def test_poll(self, mock_poller, _):
+        mock_poller().run = mock.AsyncMock()
+
+        with override_settings(JOB_STATUS_POLL_INTERVAL=0):
+            jobs_poll_command(self.get_args())
+
+        mock_poller().run.assert_awaited_once_with(30)
+
+        with override_settings(JOB_STATUS_POLL_INTERVAL=15):
+            jobs_poll_command(self.get_args())
+
+        mock_poller().run.assert_awaited_with(15)
+
+        mock_poller().run.side_effect = KeyboardInterrupt
+        jobs_poll_command(self.get_args("-i", "5"))
+
+        mock_poller().run.assert_awaited_with(5)
+
+    @mock.patch("tethys_cli.jobs_commands.exit", side_effect=SystemExit)
+    @mock.patch("tethys_cli.jobs_commands.pretty_output")
+    @mock.patch("tethys_compute.job_poller.JobStatusPoller")
+    def test_poll_invalid_args(self, mock_poller, mock_pretty_output, mock_exit):
+        self.assertRaises(SystemExit, jobs_poll_command, self.get_args("-b", "0"))
+
+        mock_poller.assert_not_called()
+        mock_exit.assert_called_with(1)
+        po_call_args = mock_pretty_output().__enter__().write.call_args_list
+        self.assertEqual("The batch size must be at least 1.", po_call_args[0][0][0])
+
+
+class JobsPurgeCommandTest(unittest.TestCase):
+    def setUp(self):
+        setup_django_patcher = mock.patch("tethys_cli.jobs_commands.setup_django")
+        setup_django_patcher.start()
+        self.addCleanup(setup_django_patcher.stop)
+
+    def get_args(self, *args):
+        return tethys_command_parser().parse_args(["jobs", "purge", *args])
+
+    def test_parser(self):
+        args = self.get_args(
+            "--older-than",
+            "30d",
+            "-a",
+            "test_app",
+            "-b",
+            "50",
+            "--archive-path",
+            "/archives",
+            "--no-archive",
+            "--dry-run",
+        )
+
+        self.assertEqual(jobs_purge_command, args.func)
+        self.assertEqual("30d", args.older_than)
+        self.assertEqual("test_app", args.app)
+        self.assertEqual(50, args.batch_size)
+        self.assertEqual("/archives", args.archive_path)
+        self.assertTrue(args.no_archive)
+        self.assertTrue(args.dry_run)
+
+    @mock.patch("tethys_cli.jobs_commands.pretty_output")
+    @mock.patch("tethys_compute.job_cleanup.job_cleanup_queue")
+    @mock.patch("tethys_compute.job_retention.JobPurger")
+    @mock.patch("tethys_compute.job_retention.get_expired_jobs")
+    def test_purge(self, mock_get_jobs, mock_purger, mock_queue, mock_pretty_output):
+        mock_purger().purge.return_value = 3
+        mock_purger().archive = True
+        mock_purger().archive_file = "/archives/tethys_jobs.jsonl.gz"
+
+        jobs_purge_command(self.get_args("--older-than", "2w", "-a", "test_app"))
+
+        mock_get_jobs.assert_called_with(
+            older_than=datetime.timedelta(weeks=2), label="test_app"
+        )
+        mock_purger.assert_called_with(batch_size=None, archive_path=None, archive=True)
+        mock_purger().purge.assert_called_with(mock_get_jobs())
+        mock_queue.join.assert_called_once()
+        po_call_args = mock_pretty_output().__enter__().write.call_args_list
+        self.assertEqual("Successfully purged 3 jobs.", po_call_args[0][0][0])
+        self.assertEqual(
+            "The jobs were archived to /archives/tethys_jobs.jsonl.gz.",
+            po_call_args[1][0][0],
+        )
+
+    @mock.patch("tethys_cli.jobs_commands.pretty_output")
+    @mock.patch("tethys_compute.job_cleanup.job_cleanup_queue")
+    @mock.patch("tethys_compute.job_retention.JobPurger")
+    @mock.patch("tethys_compute.job_retention.get_expired_jobs")
+    def test_purge_no_archive(self, mock_get_jobs, mock_purger, _, mock_pretty_output):
+        mock_purger().purge.return_value = 3
+        mock_purger().archive = False
+
+        jobs_purge_command(
+            self.get_args("-b", "10", "--archive-path", "/archives", "--no-archive")
+        )
+
+        mock_get_jobs.assert_called_with(older_than=None, label=None)
+        mock_purger.assert_called_with(
+            batch_size=10, archive_path="/archives", archive=False
+        )
+        po_call_args = mock_pretty_output().__enter__().write.call_args_list
+        self.assertEqual(1, len(po_call_args))
+        self.assertEqual("Successfully purged 3 jobs.", po_call_args[0][0][0])
+
+    @mock.patch("tethys_cli.jobs_commands.pretty_output")
+    @mock.patch("tethys_compute.job_retention.JobPurger")
+    @mock.patch("tethys_compute.job_retention.get_expired_jobs")
+    def test_purge_dry_run(self, mock_get_jobs, mock_purger, mock_pretty_output):
+        mock_get_jobs().count.return_value = 5
+
+        jobs_purge_command(self.get_args("--dry-run"))
+
+        mock_purger.assert_not_called()
+        po_call_args = mock_pretty_output().__enter__().write.call_args_list
+        self.assertEqual("5 jobs would be purged.", po_call_args[0][0][0])
+
+    @mock.patch("tethys_cli.jobs_commands.exit", side_effect=SystemExit)
+    @mock.patch("tethys_cli.jobs_commands.pretty_output")
+    @mock.patch("tethys_compute.job_retention.JobPurger")
+    def test_purge_invalid_args(self, mock_purger, mock_pretty_output, mock_exit):
+        self.assertRaises(SystemExit, jobs_purge_command, self.get_args("-b", "0"))
+        self.assertRaises(
+            SystemExit, jobs_purge_command, self.get_args("--older-than", "1y")
+        )
+
+        mock_purger.assert_not_called()
+        mock_exit.assert_called_with(1)
+        po_call_args = mock_pretty_output().__enter__().write.call_args_list
+        self.assertEqual("The batch size must be at least 1.", po_call_args[0][0][0])
+        self.assertIn('Invalid age "1y"', po_call_args[1][0][0])
@@ -21,7 +21,9 @@ class TestManageCommands(unittest.TestCase):
     @mock.patch("tethys_cli.manage_commands.run_process")
     def test_manage_command_manage_start(self, mock_run_process):
         # mock the input args
-        args = mock.MagicMock(manage="", command=MANAGE_START, port="8080")
+        args = mock.MagicMock(
+            manage="", command=MANAGE_START, port="8080", profile_startup=False
+        )
 
         # call the testing method with the mock args
         manage_commands.manage_command(args)
@@ -38,7 +40,9 @@ class TestManageCommands(unittest.TestCase):
     @mock.patch("tethys_cli.manage_commands.run_process")
     def test_manage_command_manage_start_with_no_port(self, mock_run_process):
         # mock the input args
-        args = mock.MagicMock(manage="", command=MANAGE_START, port="")
+        args = mock.MagicMock(
+            manage="", command=MANAGE_START, port="", profile_startup=False
+        )
 
         # call the testing method with the mock args
         manage_commands.manage_command(args)
@@ -51,6 +55,20 @@ class TestManageCommands(unittest.TestCase):
         self.assertIn("manage.py", process_call_args[0][0][0][1])
         self.assertEqual("runserver", process_call_args[0][0][0][2])
 
+    @mock.patch.dict("tethys_cli.manage_commands.os.environ", clear=True)
+    @mock.patch("tethys_cli.manage_commands.run_process")
+    def test_manage_command_manage_start_profile_startup(self, mock_run_process):
+        args = mock.MagicMock(
+            manage="", command=MANAGE_START, port="", profile_startup=True
+        )
+
+        manage_commands.manage_command(args)
+
+        self.assertEqual(
+            "true", manage_commands.os.environ.get("TETHYS_PROFILE_STARTUP")
+        )
+        self.assertEqual("runserver", mock_run_process.call_args[0][0][2])
+
     @mock.patch("tethys_cli.manage_commands.run_process")
     def test_manage_command_manage_manage_collectstatic(self, mock_run_process):
         # mock the input args
@@ -0,0 +1,75 @@
+import unittest
+from unittest import mock
+
+from tethys_cli.manifest_commands import get_app_packages, manifest_command
+
+
+class ManifestCommandsTest(unittest.TestCase):
+    def setUp(self):
+        setup_django_patcher = mock.patch("tethys_cli.manifest_commands.setup_django")
+        setup_django_patcher.start()
+        self.addCleanup(setup_django_patcher.stop)
+
+        packages_patcher = mock.patch(
+            "tethys_cli.manifest_commands.get_app_packages",
+            return_value={"app1": "tethysapp.app1", "app2": "tethysapp.app2"},
+        )
+        packages_patcher.start()
+        self.addCleanup(packages_patcher.stop)
+
+    def get_args(self, rebuild=False, validate=False):
+        return mock.MagicMock(rebuild=rebuild, validate=validate)
+
+    def test_get_app_packages(self):
+        self.assertEqual("tethysapp.test_app", get_app_packages()["test_app"])
+
+    @mock.patch("tethys_cli.manifest_commands.write_warning")
+    @mock.patch("tethys_cli.manifest_commands.write_success")
+    @mock.patch("tethys_apps.manifest.app_manifest")
+    @mock.patch("tethys_apps.harvester.SingletonHarvester")
+    def test_manifest_rebuild(
+        self, mock_harvester, mock_manifest, mock_success, mock_warning
+    ):
+        mock_manifest.enabled = True
+        mock_manifest.validate.return_value = {"app1": "valid", "app2": "valid"}
+
+        manifest_command(self.get_args(rebuild=True))
+
+        mock_harvester().harvest.assert_called_once_with(rebuild=True)
+        mock_manifest.validate.assert_called_once_with(
+            {"app1": "tethysapp.app1", "app2": "tethysapp.app2"}
+        )
+        mock_success.assert_any_call("  app1: valid")
+        mock_success.assert_any_call("  app2: valid")
+        mock_warning.assert_not_called()
+
+    @mock.patch("tethys_cli.manifest_commands.exit", side_effect=SystemExit)
+    @mock.patch("tethys_cli.manifest_commands.write_error")
+    @mock.patch("tethys_cli.manifest_commands.write_warning")
+    @mock.patch("tethys_apps.manifest.app_manifest")
+    @mock.patch("tethys_apps.harvester.SingletonHarvester")
+    def test_manifest_validate_invalid(
+        self, mock_harvester, mock_manifest, mock_warning, mock_error, mock_exit
+    ):
+        mock_manifest.enabled = False
+        mock_manifest.validate.return_value = {"app1": "valid", "app2": "stale"}
+
+        self.assertRaises(SystemExit, manifest_command, self.get_args(validate=True))
+
+        mock_harvester().harvest.assert_not_called()
+        mock_warning.assert_any_call("  app2: stale")
+        self.assertIn("APP_MANIFEST_CACHE", mock_warning.call_args_list[0][0][0])
+        self.assertIn("app2", mock_error.call_args[0][0])
+        mock_exit.assert_called_once_with(1)
+
+    @mock.patch("tethys_cli.manifest_commands.exit")
+    @mock.patch("tethys_cli.manifest_commands.write_warning")
+    @mock.patch("tethys_apps.manifest.app_manifest")
+    def test_manifest_show_invalid(self, mock_manifest, mock_warning, mock_exit):
+        mock_manifest.enabled = True
+        mock_manifest.validate.return_value = {"app1": "missing"}
+
+        manifest_command(self.get_args())
+
+        mock_warning.assert_called_once_with("  app1: missing")
+        mock_exit.assert_not_called()
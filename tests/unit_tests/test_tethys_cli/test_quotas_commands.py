@@ -0,0 +1,56 @@
+import unittest
+from unittest import mock
+
+from tethys_cli.quotas_commands import quotas_recompute_command
+
+
+class QuotasCommandsTest(unittest.TestCase):
+    def setUp(self):
+        setup_django_patcher = mock.patch("tethys_cli.quotas_commands.setup_django")
+        setup_django_patcher.start()
+        self.addCleanup(setup_django_patcher.stop)
+
+    def get_args(self, users=None, apps=None, all=False, jobs=None):
+        return mock.MagicMock(users=users, apps=apps, all=all, jobs=jobs)
+
+    @mock.patch("tethys_cli.quotas_commands.pretty_output")
+    @mock.patch("tethys_quotas.storage.recompute_storage_usage", return_value=5)
+    def test_recompute_all(self, mock_recompute, mock_pretty_output):
+        quotas_recompute_command(self.get_args(all=True, jobs=4))
+
+        mock_recompute.assert_called_once_with(jobs=4)
+        po_call_args = mock_pretty_output().__enter__().write.call_args_list
+        self.assertEqual(
+            "Successfully recomputed 5 storage usage records.", po_call_args[0][0][0]
+        )
+
+    @mock.patch("tethys_cli.quotas_commands.pretty_output")
+    @mock.patch("tethys_quotas.storage.recompute_storage_usage", return_value=2)
+    def test_recompute_user_and_app(self, mock_recompute, _):
+        quotas_recompute_command(self.get_args(users=["john"], apps=["app1"]))
+
+        mock_recompute.assert_called_once_with(users=["john"], apps=["app1"], jobs=None)
+
+    @mock.patch("tethys_cli.quotas_commands.exit", side_effect=SystemExit)
+    @mock.patch("tethys_cli.quotas_commands.pretty_output")
+    @mock.patch("tethys_quotas.storage.recompute_storage_usage")
+    def test_recompute_invalid_args(
+        self, mock_recompute, mock_pretty_output, mock_exit
+    ):
+        for args in (
+            self.get_args(),
+            self.get_args(users=["john"], all=True),
+            self.get_args(all=True, jobs=0),
+        ):
+            self.assertRaises(SystemExit, quotas_recompute_command, args)
+
+        mock_recompute.assert_not_called()
+        mock_exit.assert_called_with(1)
+        po_call_args = mock_pretty_output().__enter__().write.call_args_list
+        self.assertEqual(
+            "Please specify either --all or at least one --user or --app.",
+            po_call_args[0][0][0],
+        )
+        self.assertEqual(
+            "The number of jobs must be at least 1.", po_call_args[2][0][0]
+        )
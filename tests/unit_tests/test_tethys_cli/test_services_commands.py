@@ -2,6 +2,7 @@ try:
     from StringIO import StringIO
 except ImportError:
     from io import StringIO  # noqa: F401
+import argparse
 import unittest
 from unittest import mock
 
@@ -64,6 +65,32 @@ class ServicesCommandsTest(unittest.TestCase):
             "Successfully created new Persistent Store Service!", po_call_args[0][0][0]
         )
 
+    @mock.patch("tethys_cli.services_commands.pretty_output")
+    @mock.patch("tethys_services.models.PersistentStoreService")
+    def test_services_create_persistent_command_pool_options(
+        self, mock_service, mock_pretty_output
+    ):
+        mock_args = argparse.Namespace(
+            name="foo",
+            connection="user:pass@localhost:5432",
+            pool_size=20,
+            max_overflow=None,
+            pool_recycle=3600,
+            pool_pre_ping=True,
+        )
+        services_create_persistent_command(mock_args)
+
+        mock_service.assert_called_with(
+            name="foo",
+            host="localhost",
+            port="5432",
+            username="user",
+            password="pass",
+            pool_size=20,
+            pool_recycle=3600,
+            pool_pre_ping=True,
+        )
+
     @mock.patch("tethys_cli.services_commands.pretty_output")
     @mock.patch("tethys_services.models.PersistentStoreService")
     def test_services_create_persistent_command_exception_attributeerror(
@@ -1,6 +1,8 @@
 import unittest
+from unittest import mock
 
 from django.apps import apps
+from django.test import override_settings
 from tethys_compute.apps import TethysComputeConfig
 
 
@@ -19,3 +21,41 @@ class TethysComputeConfigAppsTest(unittest.TestCase):
         self.assertEqual("tethys_compute", name)
         self.assertEqual("Tethys Compute", verbose_name)
         self.assertTrue(isinstance(app_config, TethysComputeConfig))
+
+    @override_settings(CONDOR_SSH_POOL_IDLE_TIMEOUT=0)
+    @mock.patch("tethys_compute.apps.register_background_task")
+    def test_ready_job_status_poller(self, mock_register):
+        from tethys_compute.job_poller import poll_job_statuses
+
+        app_config = apps.get_app_config("tethys_compute")
+
+        with override_settings(JOB_STATUS_POLL_INTERVAL=0):
+            app_config.ready()
+
+        mock_register.assert_not_called()
+
+        with override_settings(JOB_STATUS_POLL_INTERVAL=30):
+            app_config.ready()
+
+        mock_register.assert_called_once_with(
+            poll_job_statuses, delay=30, periodic=True
+        )
+
+    @override_settings(JOB_STATUS_POLL_INTERVAL=0)
+    @mock.patch("tethys_compute.apps.register_background_task")
+    def test_ready_prune_ssh_connections(self, mock_register):
+        from tethys_compute.condor_ssh_pool import prune_ssh_connections
+
+        app_config = apps.get_app_config("tethys_compute")
+
+        with override_settings(CONDOR_SSH_POOL_IDLE_TIMEOUT=0):
+            app_config.ready()
+
+        mock_register.assert_not_called()
+
+        with override_settings(CONDOR_SSH_POOL_IDLE_TIMEOUT=120):
+            app_config.ready()
+
+        mock_register.assert_called_once_with(
+            prune_ssh_connections, delay=120, periodic=True
+        )
@@ -0,0 +1,333 @@
+import socket
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest import mock
+
+import paramiko
+from django.contrib.auth.models import User
+from django.test import override_settings
+
+from tethys_compute.condor_ssh_pool import (
+    SSHConnectionPool,
+    SSHSessionTimeout,
+    prune_ssh_connections,
+)
+from tethys_compute.models import CondorJob, CondorScheduler
+from tethys_sdk.testing import TethysTestCase
+
+
+PRIVATE_KEY = Path(__file__).parent / "files" / "keys" / "testkey"
+PRIVATE_KEY_PASS = "password"
+
+
+class StubServerInterface(paramiko.ServerInterface):
+    def __init__(self, server):
+        self.server = server
+
+    def get_allowed_auths(self, username):
+        return "publickey"
+
+    def check_auth_publickey(self, username, key):
+        if username == "tethys" and key == self.server.client_key:
+            return paramiko.AUTH_SUCCESSFUL
+        return paramiko.AUTH_FAILED
+
+    def check_channel_request(self, kind, chanid):
+        if kind == "session":
+            return paramiko.OPEN_SUCCEEDED
+        return paramiko.OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED
+
+    def check_channel_exec_request(self, channel, command):
+        command = command.decode()
+        self.server.commands.append(command)
+        threading.Thread(
+            target=self.server.run_command, args=(channel, command), daemon=True
+        ).start()
+        return True
+
+
+class StubSSHServer:
+    """
+    Paramiko SSH server that echoes the commands it runs, standing in for a remote Condor scheduler.
+    """  # noqa: E501
+
+    host_key = paramiko.RSAKey.generate(1024)
+    client_key = paramiko.RSAKey.from_private_key_file(
+        str(PRIVATE_KEY), password=PRIVATE_KEY_PASS
+    )
+
+    def __init__(self):
+        self.commands = []
+        self.transports = []
+        self.release = threading.Event()
+        self.release.set()
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.socket.bind(("127.0.0.1", 0))
+        self.socket.listen()
+        self.port = self.socket.getsockname()[1]
+        threading.Thread(target=self.accept, daemon=True).start()
+
+    def accept(self):
+        while True:
+            try:
+                conn, _ = self.socket.accept()
+            except OSError:
+                return
+            transport = paramiko.Transport(conn)
+            transport.add_server_key(self.host_key)
+            transport.start_server(server=StubServerInterface(self))
+            self.transports.append(transport)
+
+    def run_command(self, channel, command):
+        # Let the server reply to the exec request before closing the channel
+        time.sleep(0.05)
+        self.release.wait(5)
+        channel.sendall(f"ran {command}\n".encode())
+        channel.send_exit_status(0)
+        channel.close()
+
+    def drop_connections(self):
+        for transport in self.transports:
+            transport.close()
+
+    def close(self):
+        self.socket.close()
+        self.drop_connections()
+
+
+def wait_for(condition, timeout=5):
+    end = time.monotonic() + timeout
+    while not condition() and time.monotonic() < end:
+        time.sleep(0.01)
+    return condition()
+
+
+class SSHConnectionPoolTest(TethysTestCase):
+    def set_up(self):
+        self.server = StubSSHServer()
+        self.scheduler = CondorScheduler.objects.create(
+            name="test_scheduler",
+            host="127.0.0.1",
+            port=self.server.port,
+            username="tethys",
+            private_key_path=str(PRIVATE_KEY),
+            private_key_pass=PRIVATE_KEY_PASS,
+        )
+        self.pool = SSHConnectionPool(
+            max_sessions=2, idle_timeout=300, health_check_interval=60
+        )
+
+    def tear_down(self):
+        self.pool.close_all()
+        self.server.close()
+
+    @override_settings(
+        CONDOR_SSH_POOL_MAX_SESSIONS=4,
+        CONDOR_SSH_POOL_IDLE_TIMEOUT=0,
+        CONDOR_SSH_POOL_HEALTH_CHECK_INTERVAL=30,
+        CONDOR_SSH_POOL_SESSION_TIMEOUT=10,
+    )
+    def test_init(self):
+        pool = SSHConnectionPool()
+
+        self.assertEqual(4, pool.max_sessions)
+        self.assertEqual(0, pool.idle_timeout)
+        self.assertEqual(30, pool.health_check_interval)
+        self.assertEqual(10, pool.session_timeout)
+
+    def test_get_client(self):
+        client = self.pool.get_client(self.scheduler)
+
+        stdout, _ = client.execute("condor_q")
+        stdout2, _ = self.pool.get_client(self.scheduler).execute("condor_history")
+
+        self.assertIs(client, self.pool.get_client(self.scheduler))
+        self.assertEqual("ran condor_q\n", stdout)
+        self.assertEqual("ran condor_history\n", stdout2)
+        self.assertEqual(1, len(self.server.transports))
+        self.assertEqual(
+            {
+                "requests": 3,
+                "reused": 2,
+                "connections_opened": 1,
+                "connections_closed": 0,
+                "health_check_failures": 0,
+                "sessions": 2,
+                "session_timeouts": 0,
+                "connections": 1,
+                "active_sessions": 0,
+            },
+            self.pool.metrics(),
+        )
+
+    def test_get_client_scheduler_changed(self):
+        client = self.pool.get_client(self.scheduler)
+        client.execute("condor_q")
+
+        self.scheduler.username = "other"
+        new_client = self.pool.get_client(self.scheduler)
+
+        self.assertIsNot(client, new_client)
+        self.assertFalse(client.is_connected)
+        self.assertEqual(1, self.pool.metrics()["connections_closed"])
+
+    def test_close(self):
+        client = self.pool.get_client(self.scheduler)
+        client.execute("condor_q")
+
+        # Closing the client of a job does not close the shared connection
+        client.close()
+
+        self.assertTrue(client.is_connected)
+
+    def test_prune(self):
+        client = self.pool.get_client(self.scheduler)
+        client.execute("condor_q")
+
+        self.assertEqual(0, self.pool.prune())
+
+        client.last_used -= 300
+
+        self.assertEqual(1, self.pool.prune())
+        self.assertFalse(client.is_connected)
+        self.assertEqual(0, self.pool.metrics()["connections"])
+
+    def test_prune_disabled(self):
+        self.pool.idle_timeout = 0
+        client = self.pool.get_client(self.scheduler)
+        client.last_used -= 300
+
+        self.assertEqual(0, self.pool.prune())
+
+    def test_health_check(self):
+        self.pool.health_check_interval = 0
+        client = self.pool.get_client(self.scheduler)
+        client.execute("condor_q")
+
+        self.assertTrue(client.check_health())
+
+        self.server.drop_connections()
+        self.assertTrue(wait_for(lambda: not client.is_connected))
+
+        self.assertIs(client, self.pool.get_client(self.scheduler))
+        stdout, _ = client.execute("condor_q")
+
+        self.assertEqual("ran condor_q\n", stdout)
+        self.assertEqual(2, len(self.server.transports))
+        self.assertEqual(1, self.pool.metrics()["health_check_failures"])
+        self.assertEqual(2, self.pool.metrics()["connections_opened"])
+
+    def test_check_health_not_connected(self):
+        client = self.pool.get_client(self.scheduler)
+
+        self.assertTrue(client.check_health())
+        self.assertEqual(0, len(self.server.transports))
+
+    def test_max_sessions(self):
+        pool = SSHConnectionPool(max_sessions=1, session_timeout=0.1)
+        client = pool.get_client(self.scheduler)
+        self.server.release.clear()
+        thread = threading.Thread(target=client.execute, args=("condor_q",))
+        thread.start()
+
+        try:
+            self.assertTrue(wait_for(lambda: self.server.commands))
+            self.assertEqual(1, pool.metrics()["active_sessions"])
+
+            with self.assertRaises(SSHSessionTimeout):
+                client.execute("condor_history")
+        finally:
+            self.server.release.set()
+            thread.join()
+            pool.close_all()
+
+        self.assertEqual(["condor_q"], self.server.commands)
+        self.assertEqual(1, pool.metrics()["session_timeouts"])
+
+    @mock.patch("tethys_compute.condor_ssh_pool.SCPClient")
+    def test_put_concurrent(self, mock_scp_client):
+        client = self.pool.get_client(self.scheduler)
+        # Both transfers are running at the same time
+        barrier = threading.Barrier(2, timeout=5)
+        scp_clients = []
+
+        def new_scp_client(transport):
+            scp_client = mock.MagicMock(transport=transport)
+            scp_client.__enter__.return_value = scp_client
+            scp_client.put.side_effect = lambda **kwargs: barrier.wait()
+            scp_clients.append(scp_client)
+            return scp_client
+
+        mock_scp_client.side_effect = new_scp_client
+        threads = [
+            threading.Thread(target=client.put, args=([f"input_{i}.txt"], "remote_dir"))
+            for i in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Each transfer has its own SCP client on the shared transport
+        self.assertEqual(2, len(scp_clients))
+        self.assertFalse(barrier.broken)
+        self.assertIs(scp_clients[0].transport, scp_clients[1].transport)
+        self.assertEqual(
+            [["input_0.txt"], ["input_1.txt"]],
+            sorted(
+                scp_client.put.call_args.kwargs["files"] for scp_client in scp_clients
+            ),
+        )
+        for scp_client in scp_clients:
+            scp_client.__exit__.assert_called_once()
+        self.assertEqual(1, len(self.server.transports))
+
+    @mock.patch("tethys_compute.condor_ssh_pool.SCPClient")
+    def test_get(self, mock_scp_client):
+        client = self.pool.get_client(self.scheduler)
+        scp_client = mock_scp_client.return_value.__enter__.return_value
+
+        client.get(["output.txt"], "local_dir")
+
+        mock_scp_client.assert_called_once_with(client.client.transport)
+        scp_client.get.assert_called_once_with(
+            ["output.txt"], "local_dir", recursive=True
+        )
+        self.assertEqual(0, self.pool.metrics()["active_sessions"])
+
+    def test_condor_object(self):
+        user = User.objects.create_user("tethys_super", "user@example.com", "pass")
+        workspace = tempfile.TemporaryDirectory()
+        self.addCleanup(workspace.cleanup)
+        job = CondorJob.objects.create(
+            name="test_job",
+            user=user,
+            label="test_label",
+            workspace=workspace.name,
+            remote_id="remote_dir",
+            scheduler=self.scheduler,
+        )
+
+        with mock.patch(
+            "tethys_compute.models.condor.condor_base.condor_ssh_pool", self.pool
+        ):
+            # Different instances of the job share one connection
+            for _ in range(2):
+                job = CondorJob.objects.get(pk=job.pk)
+                job.get_remote_log_content("job.log")
+
+        self.assertEqual(
+            ["cd remote_dir && cat job.log"] * 2,
+            self.server.commands,
+        )
+        self.assertEqual(1, len(self.server.transports))
+
+    @mock.patch("tethys_compute.condor_ssh_pool.condor_ssh_pool")
+    def test_prune_ssh_connections(self, mock_pool):
+        mock_pool.prune.return_value = 1
+
+        prune_ssh_connections()
+
+        mock_pool.prune.assert_called_once_with()
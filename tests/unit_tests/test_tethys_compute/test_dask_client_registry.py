@@ -0,0 +1,182 @@
+import gc
+import threading
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from dask.distributed import LocalCluster
+
+from tethys_compute.dask_client_registry import DaskClientRegistry
+from tethys_sdk.testing import TethysTestCase
+
+
+class Owner:
+    pass
+
+
+class DaskClientRegistryTest(TethysTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.cluster = LocalCluster(
+            processes=False,
+            n_workers=1,
+            threads_per_worker=1,
+            dashboard_address=None,
+        )
+        cls.address = cls.cluster.scheduler_address
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.cluster.close()
+        super().tearDownClass()
+
+    def set_up(self):
+        self.registry = DaskClientRegistry()
+
+    def tear_down(self):
+        self.registry.close_all()
+
+    def test_get_client(self):
+        client = self.registry.get_client(self.address, timeout=10)
+
+        self.assertIs(client, self.registry.get_client(self.address, timeout=10))
+        self.assertEqual(2, self.registry.reference_count(client))
+        self.assertEqual(3, client.submit(lambda x: x + 1, 2).result())
+
+        # Clients with different options are not shared
+        other = self.registry.get_client(self.address, timeout=20)
+        self.assertIsNot(client, other)
+        self.assertEqual(1, self.registry.reference_count(other))
+
+    def test_get_client_threads(self):
+        clients = []
+
+        def get_client():
+            clients.append(self.registry.get_client(self.address))
+
+        threads = [threading.Thread(target=get_client) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(4, len(clients))
+        self.assertEqual(1, len({id(client) for client in clients}))
+        self.assertEqual(4, self.registry.reference_count(clients[0]))
+
+    @mock.patch("tethys_compute.dask_client_registry.logger")
+    def test_get_client_reconnect(self, mock_log):
+        client = self.registry.get_client(self.address)
+        client.close()
+
+        new_client = self.registry.get_client(self.address)
+
+        self.assertIsNot(client, new_client)
+        self.assertEqual("running", new_client.status)
+        self.assertEqual(1, self.registry.reference_count(new_client))
+        self.assertEqual(3, new_client.submit(lambda x: x + 1, 2).result())
+        mock_log.warning.assert_called_once()
+
+        # The failed client is forgotten when its holder releases it
+        self.registry.release(client)
+        self.assertEqual(0, self.registry.reference_count(client))
+
+    @mock.patch("tethys_compute.dask_client_registry.logger")
+    def test_release_replaced(self, _):
+        client = self.registry.get_client(self.address)
+        registered = self.registry.clients[DaskClientRegistry.get_key(self.address)]
+
+        # Replace the client while it is still held
+        with mock.patch.object(self.registry, "is_connected", return_value=False):
+            new_client = self.registry.get_client(self.address)
+
+        self.assertIsNot(client, new_client)
+        self.assertIs(new_client, registered.client)
+        self.assertEqual("running", client.status)
+
+        self.registry.release(client)
+
+        self.assertEqual("closed", client.status)
+        self.assertEqual("running", new_client.status)
+
+    def test_release(self):
+        client = self.registry.get_client(self.address)
+        self.registry.get_client(self.address)
+
+        self.registry.release(client)
+        self.registry.release(client)
+        self.registry.release(client)
+
+        # Unused clients stay open to be reused
+        self.assertEqual(0, self.registry.reference_count(client))
+        self.assertEqual("running", client.status)
+        self.assertIs(client, self.registry.get_client(self.address))
+
+    def test_close_unused(self):
+        client = self.registry.get_client(self.address)
+        other = self.registry.get_client(self.address, timeout=20)
+        self.registry.release(other)
+
+        self.assertEqual(1, self.registry.close_unused())
+
+        self.assertEqual("running", client.status)
+        self.assertEqual("closed", other.status)
+        self.assertEqual(0, self.registry.close_unused())
+
+    def test_close_all(self):
+        client = self.registry.get_client(self.address)
+        other = self.registry.get_client(self.address, timeout=20)
+
+        self.registry.close_all()
+
+        self.assertEqual("closed", client.status)
+        self.assertEqual("closed", other.status)
+        self.assertEqual({}, self.registry.clients)
+
+    def test_get_client_for(self):
+        owner = Owner()
+        other_owner = Owner()
+
+        client = self.registry.get_client_for(owner, self.address)
+
+        self.assertIs(client, self.registry.get_client_for(owner, self.address))
+        self.assertIs(client, self.registry.get_client_for(other_owner, self.address))
+        self.assertEqual(2, self.registry.reference_count(client))
+
+        # The reference of an owner is released when it is garbage collected
+        del owner
+        gc.collect()
+
+        self.assertEqual(1, self.registry.reference_count(client))
+
+    @mock.patch("tethys_compute.dask_client_registry.logger")
+    def test_get_client_for_reconnect(self, _):
+        owner = Owner()
+        client = self.registry.get_client_for(owner, self.address)
+        client.close()
+
+        new_client = self.registry.get_client_for(owner, self.address)
+
+        self.assertIsNot(client, new_client)
+        self.assertEqual(0, self.registry.reference_count(client))
+        self.assertEqual(1, self.registry.reference_count(new_client))
+
+    def test_get_async_client(self):
+        async def run():
+            client = await self.registry.get_async_client(self.address)
+            same_client = await self.registry.get_async_client(self.address)
+            future = client.submit(lambda x: x + 1, 2)
+            result = await future
+            status = client.status
+            self.registry.release(client)
+            self.registry.release(same_client)
+            self.registry.close_unused()
+            return client, same_client, result, status
+
+        client, same_client, result, status = async_to_sync(run)()
+
+        self.assertIs(client, same_client)
+        self.assertTrue(client.asynchronous)
+        self.assertEqual(3, result)
+        self.assertEqual("running", status)
+        self.assertEqual({}, self.registry.clients)
@@ -0,0 +1,92 @@
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from django.test import override_settings
+
+from tethys_compute.dask_result_store import DaskResultStore
+from tethys_sdk.testing import TethysTestCase
+
+
+class DaskResultStoreTest(TethysTestCase):
+    def set_up(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.store = DaskResultStore(inline_max_size=1024)
+
+    def tear_down(self):
+        self.directory.cleanup()
+
+    @override_settings(
+        DASK_RESULT_STORAGE_PATH="/results", DASK_RESULT_INLINE_MAX_SIZE=10
+    )
+    def test_init(self):
+        store = DaskResultStore()
+        self.assertEqual("/results", store.storage_path)
+        self.assertEqual(10, store.inline_max_size)
+
+        store = DaskResultStore(storage_path="", inline_max_size=0)
+        self.assertEqual("", store.storage_path)
+        self.assertEqual(0, store.inline_max_size)
+
+    def test_dump_load(self):
+        value = {"values": list(range(10000))}
+
+        blob = self.store.dump(value)
+
+        self.assertIsInstance(blob, bytes)
+        # The result is compressed
+        self.assertLess(len(blob), len(str(value)))
+        self.assertEqual(value, self.store.load(blob))
+
+    def test_save_inline(self):
+        blob = self.store.dump("foo")
+
+        ret = self.store.save(blob, self.directory.name)
+
+        self.assertEqual((blob, ""), ret)
+        self.assertEqual([], list(Path(self.directory.name).iterdir()))
+
+    def test_save_file(self):
+        blob = self.store.dump(list(range(10000)))
+
+        data, path = self.store.save(blob, self.directory.name)
+
+        self.assertIsNone(data)
+        self.assertEqual(self.directory.name, str(Path(path).parent))
+        self.assertEqual([Path(path)], list(Path(self.directory.name).iterdir()))
+        self.assertEqual(blob, self.store.read(path))
+
+    def test_save_storage_path(self):
+        storage_path = Path(self.directory.name) / "results"
+        store = DaskResultStore(storage_path=str(storage_path), inline_max_size=0)
+
+        _, path = store.save(b"foo", "/workspace")
+
+        self.assertEqual(storage_path, Path(path).parent)
+        self.assertEqual(b"foo", store.read(path))
+
+    def test_save_no_directory(self):
+        blob = self.store.dump(list(range(10000)))
+
+        # Large results are kept in the database when there is nowhere to write them
+        self.assertEqual((blob, ""), self.store.save(blob, ""))
+
+    def test_delete(self):
+        _, path = DaskResultStore(inline_max_size=0).save(b"foo", self.directory.name)
+
+        self.store.delete(path)
+        self.store.delete(path)
+        self.store.delete("")
+
+        self.assertFalse(Path(path).exists())
+
+    @mock.patch("tethys_compute.dask_result_store.logger")
+    @mock.patch("tethys_compute.dask_result_store.os.remove")
+    def test_delete_error(self, mock_remove, mock_log):
+        mock_remove.side_effect = PermissionError
+
+        self.store.delete("result.zlib")
+
+        mock_log.exception.assert_called_once_with(
+            'Unable to delete Dask result "result.zlib":'
+        )
@@ -0,0 +1,71 @@
+import threading
+from unittest import mock
+
+from tethys_compute.job_cleanup import JobCleanupQueue
+from tethys_sdk.testing import TethysTestCase
+
+
+class JobCleanupQueueTest(TethysTestCase):
+    def set_up(self):
+        self.queue = JobCleanupQueue()
+
+    def test_enqueue(self):
+        cleanup = mock.MagicMock()
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            self.queue.enqueue(cleanup, "job_1", "workspace")
+            # Nothing is cleaned up before the transaction is committed
+            cleanup.assert_not_called()
+
+        self.assertEqual(1, len(callbacks))
+        self.assertTrue(self.queue.join(5))
+        cleanup.assert_called_once_with("job_1", "workspace")
+
+    def test_enqueue_rollback(self):
+        cleanup = mock.MagicMock()
+
+        with self.captureOnCommitCallbacks(execute=False):
+            self.queue.enqueue(cleanup, "job_1")
+
+        self.assertTrue(self.queue.join(5))
+        cleanup.assert_not_called()
+
+    def test_put(self):
+        thread_names = []
+
+        def cleanup(*args):
+            thread_names.append(threading.current_thread().name)
+
+        self.queue.put(cleanup, "job_1")
+        self.queue.put(cleanup, "job_2")
+
+        self.assertTrue(self.queue.join(5))
+        # The tasks run one after another in a background thread
+        self.assertEqual(["tethys_job_cleanup"] * 2, thread_names)
+        self.assertIsNot(threading.current_thread(), self.queue.thread)
+
+    @mock.patch("tethys_compute.job_cleanup.logger")
+    def test_put_error(self, mock_logger):
+        cleanup = mock.MagicMock(side_effect=[Exception("error"), None])
+
+        self.queue.put(cleanup, "job_1")
+        self.queue.put(cleanup, "job_2")
+
+        self.assertTrue(self.queue.join(5))
+        mock_logger.exception.assert_called_once_with(
+            "Unable to clean up a deleted job:"
+        )
+        # The following tasks still run
+        cleanup.assert_called_with("job_2")
+
+    def test_join_timeout(self):
+        event = threading.Event()
+
+        self.queue.put(event.wait, 5)
+
+        self.assertFalse(self.queue.join(0.01))
+        event.set()
+        self.assertTrue(self.queue.join(5))
+
+    def test_join_empty(self):
+        self.assertTrue(self.queue.join())
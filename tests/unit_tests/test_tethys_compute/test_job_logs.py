@@ -0,0 +1,89 @@
+import io
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from django.test import override_settings
+
+from tethys_compute import job_logs
+from tethys_sdk.testing import TethysTestCase
+
+
+class JobLogsTest(TethysTestCase):
+    def set_up(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "job.log"
+        self.path.write_bytes(b"0123456789")
+
+    def tear_down(self):
+        self.directory.cleanup()
+
+    @override_settings(JOB_LOG_CHUNK_SIZE=4)
+    def test_get_range(self):
+        # The end of the log is read by default
+        self.assertEqual((6, 10), job_logs.get_range(10))
+        self.assertEqual((0, 3), job_logs.get_range(3))
+        self.assertEqual((2, 6), job_logs.get_range(10, offset=2))
+        self.assertEqual((8, 10), job_logs.get_range(10, offset=8))
+        self.assertEqual((10, 10), job_logs.get_range(10, offset=20))
+        self.assertEqual((0, 4), job_logs.get_range(10, offset=-5))
+        self.assertEqual((2, 3), job_logs.get_range(10, offset="2", length="1"))
+        self.assertEqual((8, 10), job_logs.get_range(10, length=2))
+
+    def test_read_range(self):
+        with job_logs.open_log(self.path) as f:
+            self.assertEqual(
+                {"content": "789", "offset": 7, "end": 10, "size": 10},
+                job_logs.read_range(f, length=3),
+            )
+            self.assertEqual(
+                {"content": "23", "offset": 2, "end": 4, "size": 10},
+                job_logs.read_range(f, offset=2, length=2),
+            )
+            self.assertEqual(
+                {"content": "", "offset": 10, "end": 10, "size": 10},
+                job_logs.read_range(f, offset=10),
+            )
+
+    def test_read_range_unicode(self):
+        with job_logs.open_text("é1") as f:
+            # Characters split between chunks are replaced
+            self.assertEqual("�", job_logs.read_range(f, offset=0, length=1)["content"])
+            self.assertEqual("é1", job_logs.read_range(f)["content"])
+
+    def test_iter_range(self):
+        with job_logs.open_log(self.path) as f:
+            self.assertEqual(
+                [b"0123", b"4567", b"89"], list(job_logs.iter_range(f, chunk_size=4))
+            )
+            self.assertEqual([b"789"], list(job_logs.iter_range(f, 7)))
+
+    def test_open_log_remote(self):
+        remote_file = io.BytesIO(b"log")
+        remote = mock.MagicMock()
+        remote.remote_file.return_value = remote_file
+
+        with job_logs.open_log("job/job.log", remote) as f:
+            self.assertEqual(b"log", f.read())
+
+        remote.remote_file.assert_called_with("job/job.log", "rb")
+        self.assertTrue(remote_file.closed)
+
+    def test_open_text(self):
+        with job_logs.open_text(None) as f:
+            self.assertEqual(b"", f.read())
+
+    def test_find_remote_file(self):
+        remote = mock.MagicMock()
+        remote.sftp.listdir.return_value = ["job.err", "job_2.log", "job_1.log"]
+
+        self.assertEqual(
+            "remote_id/logs/job_1.log",
+            job_logs.find_remote_file(remote, "remote_id/logs/*.log"),
+        )
+        remote.sftp.listdir.assert_called_with("remote_id/logs")
+        self.assertIsNone(job_logs.find_remote_file(remote, "remote_id/logs/*.out"))
+
+        remote.sftp.listdir.side_effect = IOError
+        self.assertIsNone(job_logs.find_remote_file(remote, "job.log"))
+        remote.sftp.listdir.assert_called_with(".")
@@ -2,10 +2,18 @@ import unittest
 from unittest import mock
 
 from django.contrib.auth.models import User, Group
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from tethys_compute.job_manager import JobManager, JOB_TYPES
 from tethys_compute.models.tethys_job import TethysJob
+from tethys_compute.models.basic_job import BasicJob
+from tethys_compute.models.dask.dask_job import DaskJob
 from tethys_compute.models.condor.condor_scheduler import CondorScheduler
+from tethys_compute.models.condor.condor_base import CondorBase
+from tethys_compute.models.condor.condor_job import CondorJob
+from tethys_compute.models.condor.condor_workflow import CondorWorkflow
 from tethys_apps.models import TethysApp
+from tethys_sdk.testing import TethysTestCase
 
 
 class TestJobManager(unittest.TestCase):
@@ -198,3 +206,213 @@ class TestJobManager(unittest.TestCase):
         mock_request.build_absolute_uri.assert_called_once_with(
             "/update-job-status/foo/"
         )
+
+
+class TestJobManagerListJobsPage(TethysTestCase):
+    def set_up(self):
+        self.app_model = TethysApp(name="test_app_page", package="test_app_page")
+        self.app_model.save()
+        self.user = User.objects.create_user("test_user_page", "user@example.com")
+        self.other_user = User.objects.create_user("other_user_page", "o@example.com")
+        self.mgr = JobManager(self.app_model)
+        self.jobs = [
+            job_class.objects.create(
+                name=f"job_{i}", user=self.user, label="test_app_page"
+            )
+            for i, job_class in enumerate([BasicJob, BasicJob, DaskJob, BasicJob])
+        ]
+        BasicJob.objects.create(
+            name="other", user=self.other_user, label="test_app_page"
+        )
+
+    def test_list_jobs_page(self):
+        page = self.mgr.list_jobs(user=self.user, page_size=2)
+
+        self.assertEqual(self.jobs[:2], list(page))
+
+        page = self.mgr.list_jobs(user=self.user, page_size=2, after=page[1].id)
+
+        self.assertEqual(self.jobs[2:], list(page))
+        self.assertIsInstance(page[0], DaskJob)
+        self.assertIsInstance(page[1], BasicJob)
+
+        page = self.mgr.list_jobs(user=self.user, page_size=2, after=page[1].id)
+
+        self.assertEqual([], list(page))
+
+    def test_list_jobs_page_order_by(self):
+        # Jobs with the same name are ordered by id
+        TethysJob.objects.filter(id=self.jobs[3].id).update(name="job_0")
+
+        page = self.mgr.list_jobs(user=self.user, order_by="-name", page_size=2)
+        next_page = self.mgr.list_jobs(
+            user=self.user, order_by="-name", page_size=2, after=page[1].id
+        )
+
+        self.assertEqual([self.jobs[2], self.jobs[1]], list(page))
+        self.assertEqual([self.jobs[3], self.jobs[0]], list(next_page))
+
+    def test_list_jobs_page_subclasses(self):
+        page = self.mgr.list_jobs(user=self.user, page_size=2)
+        dask_page = self.mgr.list_jobs(
+            user=self.user, page_size=2, after=self.jobs[1].id
+        )
+
+        # Only the tables of the job types on the page are joined
+        self.assertEqual(["basicjob"], page.subclasses)
+        self.assertEqual(["basicjob", "daskjob"], dask_page.subclasses)
+        self.assertNotIn("condor", str(dask_page.query))
+
+    def test_list_jobs_page_empty(self):
+        page = self.mgr.list_jobs(
+            user=self.other_user, filters={"name": "foo"}, page_size=2
+        )
+
+        self.assertEqual([], list(page))
+
+    def test_list_jobs_after_value_error(self):
+        self.assertRaises(ValueError, self.mgr.list_jobs, after=self.jobs[0].id)
+
+    def test_list_jobs_page_order_by_nullable(self):
+        for order_by in ("-execute_time", "completion_time", "user", "status", "foo"):
+            with self.assertRaises(ValueError):
+                self.mgr.list_jobs(user=self.user, order_by=order_by, page_size=2)
+
+        page = self.mgr.list_jobs(user=self.user, order_by="-pk", page_size=2)
+
+        self.assertEqual([self.jobs[3], self.jobs[2]], list(page))
+
+    def test_list_jobs_page_after_deleted(self):
+        page = list(self.mgr.list_jobs(user=self.user, order_by="name", page_size=2))
+        page[1].delete()
+
+        next_page = self.mgr.list_jobs(
+            user=self.user, order_by="name", page_size=2, after=page[1].id
+        )
+        previous_page = self.mgr.list_jobs(
+            user=self.user, order_by="-name", page_size=2, after=page[1].id
+        )
+
+        # The jobs after the deleted job in id order are listed
+        self.assertEqual(self.jobs[2:], list(next_page))
+        self.assertEqual([self.jobs[0]], list(previous_page))
+
+
+class TestJobManagerCreateJobs(TethysTestCase):
+    def set_up(self):
+        self.app_model = TethysApp(name="test_app_bulk", package="test_app_bulk")
+        self.app_model.save()
+        self.user = User.objects.create_user("test_user_bulk", "user@example.com")
+        self.other_user = User.objects.create_user("other_user_bulk", "o@example.com")
+        self.group = Group.objects.create(name="test_group_bulk")
+        self.other_group = Group.objects.create(name="other_group_bulk")
+        self.scheduler = CondorScheduler.objects.create(
+            name="test_scheduler_bulk", host="localhost"
+        )
+        self.mgr = JobManager(self.app_model)
+
+    @mock.patch("tethys_compute.job_manager.get_user_workspace")
+    def test_create_jobs(self, mock_guw):
+        mock_guw.side_effect = lambda app, user: mock.MagicMock(
+            path=f"workspaces/{user.username}"
+        )
+
+        jobs = self.mgr.create_jobs(
+            [
+                {"name": "job_0"},
+                {"name": "job_1", "user": self.other_user, "groups": []},
+                {
+                    "name": "job_{id}",
+                    "job_type": DaskJob,
+                    "groups": [self.group, self.other_group],
+                    "key": "dask_key",
+                },
+            ],
+            user=self.user,
+            groups=self.group,
+            job_type="BASIC",
+        )
+
+        # The workspace of each user is only looked up once
+        self.assertEqual(2, mock_guw.call_count)
+        saved = list(
+            TethysJob.objects.filter(label="test_app_bulk")
+            .order_by("id")
+            .select_subclasses()
+        )
+        self.assertEqual(jobs, saved)
+        self.assertEqual([BasicJob, BasicJob, DaskJob], [type(job) for job in saved])
+        self.assertEqual(
+            ["job_0", "job_1", f"job_{jobs[2].id}"], [j.name for j in saved]
+        )
+        self.assertEqual(
+            [self.user, self.other_user, self.user], [job.user for job in saved]
+        )
+        self.assertEqual("workspaces/other_user_bulk", saved[1].workspace)
+        self.assertEqual("dask_key", saved[2].key)
+        self.assertEqual([self.group], list(saved[0].groups.all()))
+        self.assertEqual([], list(saved[1].groups.all()))
+        self.assertEqual({self.group, self.other_group}, set(saved[2].groups.all()))
+
+    @mock.patch("tethys_compute.job_manager.get_user_workspace")
+    def test_create_jobs_queries(self, mock_guw):
+        mock_guw().path = "test_user_workspace"
+
+        def count_queries(count):
+            specs = [{"name": f"job_{i}"} for i in range(count)]
+            with CaptureQueriesContext(connection) as queries:
+                self.mgr.create_jobs(
+                    specs, user=self.user, groups=self.group, job_type="BASIC"
+                )
+            return len(queries)
+
+        # The number of queries does not depend on the number of jobs
+        self.assertEqual(count_queries(2), count_queries(20))
+        self.assertEqual(22, TethysJob.objects.filter(groups=self.group).count())
+
+    def test_submit_many(self):
+        basic_jobs = [BasicJob(name="basic"), BasicJob(name="basic")]
+        condor_job = CondorJob(name="condor", scheduler=self.scheduler)
+        condor_workflow = CondorWorkflow(name="workflow", scheduler=self.scheduler)
+        local_condor_job = CondorJob(name="local")
+        jobs = [basic_jobs[0], condor_job, local_condor_job, condor_workflow]
+        jobs.append(basic_jobs[1])
+
+        with mock.patch.object(
+            BasicJob, "execute_many"
+        ) as mock_basic, mock.patch.object(CondorBase, "execute_many") as mock_condor:
+            ret = self.mgr.submit_many(
+                jobs, args=[(i,) for i in range(5)], max_workers=2
+            )
+
+        self.assertEqual(jobs, ret)
+        mock_basic.assert_called_once_with(
+            [(basic_jobs[0], (0,), {}), (basic_jobs[1], (4,), {})], max_workers=2
+        )
+        # Condor jobs and workflows are grouped by scheduler
+        self.assertEqual(
+            [
+                mock.call(
+                    [(condor_job, (1,), {}), (condor_workflow, (3,), {})],
+                    max_workers=2,
+                ),
+                mock.call([(local_condor_job, (2,), {})], max_workers=2),
+            ],
+            mock_condor.call_args_list,
+        )
+
+    @mock.patch("tethys_compute.models.basic_job.BasicJob.execute")
+    def test_submit_many_execute(self, mock_execute):
+        jobs = [BasicJob(name="basic")]
+
+        self.mgr.submit_many(jobs, kwargs=[{"a": 1}])
+
+        mock_execute.assert_called_once_with(a=1)
+
+    def test_submit_many_value_error(self):
+        self.assertRaises(
+            ValueError, self.mgr.submit_many, [BasicJob(name="basic")], args=[]
+        )
+        self.assertRaises(
+            ValueError, self.mgr.submit_many, [BasicJob(name="basic")], args=[(), ()]
+        )
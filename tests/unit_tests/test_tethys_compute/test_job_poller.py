@@ -0,0 +1,161 @@
+import threading
+import time
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.test import override_settings
+from django.utils import timezone
+
+from tethys_compute.job_poller import JobStatusPoller, poll_job_statuses
+from tethys_compute.models import (
+    BasicJob,
+    CondorBase,
+    CondorJob,
+    CondorScheduler,
+    CondorWorkflow,
+    DaskJob,
+    DaskScheduler,
+)
+from tethys_sdk.testing import TethysTestCase
+
+
+class JobStatusPollerTest(TethysTestCase):
+    def set_up(self):
+        self.user = User.objects.create_user("tethys_super", "user@example.com", "pass")
+        self.scheduler = DaskScheduler.objects.create(
+            name="test_dask_scheduler", host="127.0.0.1:8000"
+        )
+        self.other_scheduler = DaskScheduler.objects.create(
+            name="other_dask_scheduler", host="127.0.0.1:8001"
+        )
+
+    def create_job(self, job_class=BasicJob, executed=True, **kwargs):
+        return job_class.objects.create(
+            name="test_job",
+            user=self.user,
+            label="test_label",
+            execute_time=timezone.now() if executed else None,
+            **kwargs,
+        )
+
+    @override_settings(JOB_STATUS_POLL_BATCH_SIZE=10, JOB_STATUS_POLL_CONCURRENCY=2)
+    def test_init(self):
+        poller = JobStatusPoller()
+        self.assertEqual(10, poller.batch_size)
+        self.assertEqual(2, poller.concurrency)
+
+        poller = JobStatusPoller(batch_size=5, concurrency=1)
+        self.assertEqual(5, poller.batch_size)
+        self.assertEqual(1, poller.concurrency)
+
+    def test_get_job_groups(self):
+        basic_jobs = [self.create_job(_status=s) for s in ("SUB", "RUN", "PAS")]
+        dask_job = self.create_job(DaskJob, scheduler=self.scheduler, _status="RUN")
+        other_dask_job = self.create_job(
+            DaskJob, scheduler=self.other_scheduler, _status="VAR"
+        )
+        custom_job = self.create_job()
+        custom_job.update_status(status="Custom Terminal Status")
+        self.create_job(_status="COM")
+        self.create_job(executed=False)
+
+        groups = JobStatusPoller().get_job_groups()
+
+        self.assertEqual(
+            {
+                (BasicJob, None): [j.id for j in basic_jobs],
+                (DaskJob, self.scheduler.id): [dask_job.id],
+                (DaskJob, self.other_scheduler.id): [other_dask_job.id],
+            },
+            {key: [job.id for job in jobs] for key, jobs in groups.items()},
+        )
+        self.assertIsInstance(groups[(BasicJob, None)][0], BasicJob)
+
+    def test_get_job_groups_condor(self):
+        scheduler = CondorScheduler.objects.create(
+            name="test_condor_scheduler", host="localhost"
+        )
+        condor_job = self.create_job(CondorJob, scheduler=scheduler, _status="RUN")
+        condor_workflow = self.create_job(
+            CondorWorkflow, scheduler=scheduler, _status="RUN"
+        )
+
+        groups = JobStatusPoller().get_job_groups()
+
+        # Condor jobs and workflows of the same scheduler are updated together
+        self.assertEqual(
+            {(CondorBase, scheduler.id): [condor_job.id, condor_workflow.id]},
+            {key: [job.id for job in jobs] for key, jobs in groups.items()},
+        )
+
+    def test_update_jobs(self):
+        jobs = [mock.MagicMock(id=i) for i in range(5)]
+        job_class = mock.MagicMock(__name__="MockJob")
+        job_class.update_statuses.side_effect = lambda batch: batch[:1]
+
+        updated = JobStatusPoller(batch_size=2).update_jobs(job_class, jobs)
+
+        self.assertEqual(3, updated)
+        self.assertEqual(
+            [mock.call(jobs[0:2]), mock.call(jobs[2:4]), mock.call(jobs[4:5])],
+            job_class.update_statuses.call_args_list,
+        )
+
+    @mock.patch("tethys_compute.job_poller.logger")
+    def test_update_jobs_error(self, mock_log):
+        jobs = [mock.MagicMock(id=i) for i in range(3)]
+        job_class = mock.MagicMock(__name__="MockJob")
+        job_class.update_statuses.side_effect = [Exception("error"), jobs[2:]]
+
+        updated = JobStatusPoller(batch_size=2).update_jobs(job_class, jobs)
+
+        self.assertEqual(1, updated)
+        mock_log.exception.assert_called_once_with(
+            "Unable to update the statuses of MockJob jobs 0, 1:"
+        )
+
+    def test_poll(self):
+        groups = {(BasicJob, i): [mock.MagicMock()] for i in range(4)}
+        lock = threading.Lock()
+        running = []
+        max_running = []
+
+        def update_jobs(job_class, jobs):
+            with lock:
+                running.append(job_class)
+                max_running.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.pop()
+            return len(jobs)
+
+        poller = JobStatusPoller(concurrency=2)
+        with mock.patch.object(
+            poller, "get_job_groups", return_value=groups
+        ), mock.patch.object(poller, "update_jobs", side_effect=update_jobs):
+            updated = async_to_sync(poller.poll)()
+
+        self.assertEqual(4, updated)
+        self.assertEqual(4, len(max_running))
+        self.assertLessEqual(max(max_running), 2)
+
+    @mock.patch("tethys_compute.job_poller.logger")
+    @mock.patch("tethys_compute.job_poller.asyncio.sleep", new_callable=mock.AsyncMock)
+    def test_run(self, mock_sleep, mock_log):
+        poller = JobStatusPoller()
+        with mock.patch.object(
+            poller, "poll", new_callable=mock.AsyncMock
+        ) as mock_poll:
+            mock_poll.side_effect = [1, Exception("error"), 0]
+            async_to_sync(poller.run)(5, count=3)
+
+        self.assertEqual(3, mock_poll.await_count)
+        self.assertEqual([mock.call(5), mock.call(5)], mock_sleep.await_args_list)
+        mock_log.exception.assert_called_once()
+
+    @mock.patch("tethys_compute.job_poller.JobStatusPoller.poll")
+    def test_poll_job_statuses(self, mock_poll):
+        async_to_sync(poll_job_statuses)()
+
+        mock_poll.assert_called_once()
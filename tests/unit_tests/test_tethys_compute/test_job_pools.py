@@ -0,0 +1,195 @@
+import io
+import pickle
+import sys
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+from django.test import override_settings
+
+from tethys_compute import job_pools
+from tethys_compute.job_pools import JobPoolRegistry
+from tethys_sdk.testing import TethysTestCase
+
+
+def greet(name, punctuation="!"):
+    print(f"Hello, {name}{punctuation}")
+    print("Warning", file=sys.stderr)
+    return {"name": name}
+
+
+def fail():
+    print("Failing")
+    raise ValueError("Invalid input")
+
+
+def unpicklable():
+    return lambda: None
+
+
+class RunJobTest(TethysTestCase):
+    def set_up(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.run_directory = Path(self.directory.name)
+
+    def tear_down(self):
+        self.directory.cleanup()
+
+    def read(self, name):
+        return (self.run_directory / name).read_text()
+
+    def run_job(self, function, *args, **kwargs):
+        return job_pools.run_job(
+            f"{__name__}.{function.__name__}", args, kwargs, str(self.run_directory)
+        )
+
+    def test_run_job(self):
+        self.assertTrue(self.run_job(greet, "World", punctuation="?"))
+
+        self.assertEqual("Hello, World?\n", self.read(job_pools.STDOUT_FILE))
+        self.assertEqual("Warning\n", self.read(job_pools.STDERR_FILE))
+        result = (self.run_directory / job_pools.RESULT_FILE).read_bytes()
+        self.assertEqual({"name": "World"}, pickle.loads(result))
+        self.assertFalse((self.run_directory / job_pools.ERROR_FILE).exists())
+
+    def test_run_job_error(self):
+        self.assertFalse(self.run_job(fail))
+
+        self.assertEqual("Failing\n", self.read(job_pools.STDOUT_FILE))
+        self.assertIn("ValueError: Invalid input", self.read(job_pools.ERROR_FILE))
+        self.assertFalse((self.run_directory / job_pools.RESULT_FILE).exists())
+
+    def test_run_job_not_found(self):
+        self.assertFalse(
+            job_pools.run_job(f"{__name__}.not_found", [], {}, self.run_directory)
+        )
+        self.assertIn("AttributeError", self.read(job_pools.ERROR_FILE))
+
+    def test_run_job_unpicklable(self):
+        self.assertFalse(self.run_job(unpicklable))
+        self.assertIn("Error", self.read(job_pools.ERROR_FILE))
+
+    def test_run_job_cancelled(self):
+        (self.run_directory / job_pools.CANCELLED_FILE).touch()
+
+        self.assertFalse(self.run_job(greet, "World"))
+        self.assertFalse((self.run_directory / job_pools.RESULT_FILE).exists())
+
+    def test_capture_output_threads(self):
+        stdout = io.StringIO()
+        original = io.StringIO()
+
+        def print_other():
+            print("other")
+
+        with mock.patch.object(sys, "stdout", original):
+            with job_pools.capture_output(stdout, sys.stderr):
+                print("captured")
+                thread = threading.Thread(target=print_other)
+                thread.start()
+                thread.join()
+            print("not captured")
+
+        self.assertEqual("captured\n", stdout.getvalue())
+        # Other threads write to the original stream
+        self.assertEqual("other\nnot captured\n", original.getvalue())
+
+    @mock.patch.dict("os.environ", {"DJANGO_SETTINGS_MODULE": "settings"})
+    @mock.patch("django.setup")
+    def test_init_worker(self, mock_setup):
+        job_pools.init_worker(setup_django=False)
+        mock_setup.assert_not_called()
+
+        job_pools.init_worker()
+        mock_setup.assert_called_once_with()
+
+
+class JobPoolRegistryTest(TethysTestCase):
+    def set_up(self):
+        self.registry = JobPoolRegistry()
+
+    def tear_down(self):
+        self.registry.shutdown(wait=True)
+
+    @override_settings(JOB_POOL_MAX_WORKERS=4, JOB_POOL_APP_MAX_WORKERS={"app": 1})
+    def test_get_max_workers(self):
+        self.assertEqual(1, self.registry.get_max_workers("app"))
+        self.assertEqual(4, self.registry.get_max_workers("other_app"))
+
+    @override_settings(JOB_POOL_APP_MAX_WORKERS={"app": 2})
+    def test_get_pool(self):
+        pool = self.registry.get_pool(job_pools.THREAD, "app")
+
+        self.assertIsInstance(pool, ThreadPoolExecutor)
+        self.assertEqual(2, pool._max_workers)
+        self.assertIs(pool, self.registry.get_pool(job_pools.THREAD, "app"))
+        self.assertIsNot(pool, self.registry.get_pool(job_pools.THREAD, "other_app"))
+
+        process_pool = self.registry.get_pool(job_pools.PROCESS, "app")
+        self.assertIsInstance(process_pool, ProcessPoolExecutor)
+        self.assertIsNot(pool, process_pool)
+
+        # Pools whose process died are replaced
+        process_pool._broken = "A process in the process pool was terminated"
+        self.assertIsNot(process_pool, self.registry.get_pool(job_pools.PROCESS, "app"))
+
+    def test_submit(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def wait():
+            started.set()
+            release.wait(5)
+            return 1
+
+        with override_settings(JOB_POOL_APP_MAX_WORKERS={"app": 1}):
+            future = self.registry.submit(job_pools.THREAD, "app", 1, wait)
+            pending = self.registry.submit(job_pools.THREAD, "app", 2, wait)
+
+        started.wait(5)
+        self.assertIs(future, self.registry.get_future(1))
+        # Only one job of the app runs at once
+        self.assertFalse(self.registry.cancel(1))
+        self.assertTrue(self.registry.cancel(2))
+        self.assertTrue(pending.cancelled())
+        self.assertIsNone(self.registry.get_future(2))
+
+        release.set()
+        self.assertEqual(1, future.result(5))
+        self.assertIsNone(self.registry.get_future(1))
+        self.assertFalse(self.registry.cancel(1))
+
+    @override_settings(JOB_PROCESS_POOL_SETUP_DJANGO=False)
+    def test_submit_process(self):
+        with tempfile.TemporaryDirectory() as run_directory:
+            future = self.registry.submit(
+                job_pools.PROCESS,
+                "app",
+                1,
+                job_pools.run_job,
+                "platform.python_version",
+                [],
+                {},
+                run_directory,
+            )
+
+            self.assertTrue(future.result(60))
+            result = (Path(run_directory) / job_pools.RESULT_FILE).read_bytes()
+
+        import platform
+
+        self.assertEqual(platform.python_version(), pickle.loads(result))
+
+    @mock.patch("tethys_compute.job_pools.logger")
+    def test_shutdown(self, mock_log):
+        pool = self.registry.get_pool(job_pools.THREAD, "app")
+        broken = self.registry.get_pool(job_pools.THREAD, "other_app")
+        broken.shutdown = mock.MagicMock(side_effect=RuntimeError("error"))
+
+        self.registry.shutdown(wait=True)
+
+        self.assertEqual({}, self.registry.pools)
+        self.assertTrue(pool._shutdown)
+        mock_log.warning.assert_called_once()
@@ -0,0 +1,209 @@
+import datetime
+import gzip
+import json
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from django.contrib.auth.models import Group, User
+from django.test import override_settings
+from django.utils import timezone
+
+from tethys_compute import job_retention
+from tethys_compute.models import BasicJob, DaskJob, TethysJob
+from tethys_sdk.testing import TethysTestCase
+
+
+class JobRetentionTest(TethysTestCase):
+    def set_up(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.user = User.objects.create_user("test_user_retention", "u@example.com")
+        self.group = Group.objects.create(name="test_group_retention")
+        now = timezone.now()
+        self.old_time = now - datetime.timedelta(days=40)
+        self.recent_time = now - datetime.timedelta(days=5)
+
+    def tear_down(self):
+        self.directory.cleanup()
+
+    def create_job(
+        self, name, label="app_a", status="COM", completion_time=None, job_class=None
+    ):
+        job = (job_class or BasicJob).objects.create(
+            name=name, user=self.user, label=label, _status=status
+        )
+        # creation_time is set when the job is created, so it is updated afterwards
+        TethysJob.objects.filter(id=job.id).update(
+            creation_time=self.old_time, completion_time=completion_time
+        )
+        return job
+
+    def get_names(self, jobs):
+        return sorted(jobs.values_list("name", flat=True))
+
+    def test_parse_age(self):
+        self.assertEqual(datetime.timedelta(days=30), job_retention.parse_age("30"))
+        self.assertEqual(datetime.timedelta(days=30), job_retention.parse_age(30))
+        self.assertEqual(datetime.timedelta(days=2), job_retention.parse_age("2d"))
+        self.assertEqual(datetime.timedelta(hours=12), job_retention.parse_age("12H"))
+        self.assertEqual(datetime.timedelta(weeks=2), job_retention.parse_age(" 2w "))
+        self.assertEqual(datetime.timedelta(minutes=5), job_retention.parse_age("5m"))
+        self.assertEqual(datetime.timedelta(seconds=5), job_retention.parse_age("5s"))
+
+        for value in ("", "d", "1y", "-1d", "1.5d"):
+            self.assertRaises(ValueError, job_retention.parse_age, value)
+
+    def test_get_expired_jobs_older_than(self):
+        self.create_job("old")
+        self.create_job("recent", completion_time=self.recent_time)
+        self.create_job("running", status="RUN")
+        self.create_job("error", status="ERR", label="app_b")
+
+        ret = job_retention.get_expired_jobs(older_than=datetime.timedelta(days=30))
+
+        # Jobs without a completion time expire from their creation time
+        self.assertEqual(["error", "old"], self.get_names(ret))
+
+        ret = job_retention.get_expired_jobs(
+            older_than=datetime.timedelta(days=1), label="app_a"
+        )
+
+        self.assertEqual(["old", "recent"], self.get_names(ret))
+
+    @override_settings(
+        JOB_RETENTION_DAYS=30,
+        JOB_RETENTION_APP_DAYS={"app_b": 1, "app_c": None},
+    )
+    def test_get_expired_jobs_settings(self):
+        self.create_job("a_old")
+        self.create_job("a_recent", completion_time=self.recent_time)
+        self.create_job("b_recent", label="app_b", completion_time=self.recent_time)
+        self.create_job("b_running", label="app_b", status="SUB")
+        self.create_job("c_old", label="app_c")
+
+        ret = job_retention.get_expired_jobs()
+
+        self.assertEqual(["a_old", "b_recent"], self.get_names(ret))
+
+        ret = job_retention.get_expired_jobs(label="app_b")
+
+        self.assertEqual(["b_recent"], self.get_names(ret))
+
+    @override_settings(JOB_RETENTION_DAYS=None, JOB_RETENTION_APP_DAYS={"app_b": 1})
+    def test_get_expired_jobs_app_settings(self):
+        self.create_job("a_old")
+        self.create_job("b_old", label="app_b")
+
+        ret = job_retention.get_expired_jobs()
+
+        # The jobs of the other apps are kept
+        self.assertEqual(["b_old"], self.get_names(ret))
+
+    @override_settings(JOB_RETENTION_DAYS=None, JOB_RETENTION_APP_DAYS={})
+    def test_get_expired_jobs_no_policies(self):
+        self.create_job("a_old")
+
+        ret = job_retention.get_expired_jobs()
+
+        self.assertFalse(ret.exists())
+
+    def test_serialize_job(self):
+        job = self.create_job("job", completion_time=self.recent_time)
+        job.groups.add(self.group)
+        job = TethysJob.objects.get_subclass(id=job.id)
+
+        ret = job_retention.serialize_job(job)
+
+        self.assertEqual("BasicJob", ret["type"])
+        self.assertEqual("test_user_retention", ret["username"])
+        self.assertEqual(["test_group_retention"], ret["groups"])
+        self.assertEqual(job.id, ret["id"])
+        self.assertEqual("job", ret["name"])
+        self.assertEqual("COM", ret["_status"])
+        self.assertEqual(self.user.id, ret["user_id"])
+        self.assertNotIn("tethysjob_ptr_id", ret)
+        # The values can be encoded
+        json.dumps(ret, cls=job_retention.JobArchiveEncoder)
+
+    def test_serialize_job_binary_field(self):
+        job = self.create_job("job", job_class=DaskJob)
+        job.result = [1, 2]
+        job.save()
+
+        ret = job_retention.serialize_job(TethysJob.objects.get_subclass(id=job.id))
+
+        self.assertEqual("DaskJob", ret["type"])
+        self.assertNotIn("result_data", ret)
+        self.assertIn("result_size", ret)
+
+    @override_settings(JOB_PURGE_BATCH_SIZE=10, JOB_ARCHIVE_PATH="/archives")
+    def test_purger_init(self):
+        purger = job_retention.JobPurger()
+
+        self.assertEqual(10, purger.batch_size)
+        self.assertEqual("/archives", purger.archive_path)
+        self.assertTrue(purger.archive)
+        self.assertEqual(Path("/archives"), purger.get_archive_file().parent)
+        # The archive of a purge does not change
+        self.assertEqual(purger.get_archive_file(), purger.get_archive_file())
+
+        purger = job_retention.JobPurger(
+            batch_size=5, archive_path=self.directory.name, archive=False
+        )
+
+        self.assertEqual(5, purger.batch_size)
+        self.assertEqual(self.directory.name, purger.archive_path)
+        self.assertFalse(purger.archive)
+
+    @mock.patch("tethys_compute.job_retention.logger")
+    def test_purge(self, mock_logger):
+        jobs = [self.create_job(f"old_{i}") for i in range(4)]
+        jobs.append(self.create_job("dask", job_class=DaskJob, status="ERR"))
+        jobs[0].groups.add(self.group)
+        self.create_job("running", status="RUN")
+        archive_path = Path(self.directory.name) / "archives"
+        purger = job_retention.JobPurger(batch_size=2, archive_path=archive_path)
+
+        ret = purger.purge(
+            job_retention.get_expired_jobs(older_than=datetime.timedelta(days=1))
+        )
+
+        self.assertEqual(5, ret)
+        self.assertEqual(["running"], self.get_names(TethysJob.objects.all()))
+        self.assertFalse(DaskJob.objects.exists())
+        # One transaction per batch
+        self.assertEqual(
+            [mock.call(f"Purged {i} jobs.") for i in (2, 4, 5)],
+            mock_logger.info.call_args_list,
+        )
+
+        # The archive has one gzip member per batch, read as a single file
+        self.assertEqual([purger.archive_file], list(archive_path.iterdir()))
+        with gzip.open(purger.archive_file, "rt", encoding="utf-8") as f:
+            archived = [json.loads(line) for line in f]
+        self.assertEqual([job.id for job in jobs], [job["id"] for job in archived])
+        self.assertEqual(["test_group_retention"], archived[0]["groups"])
+        self.assertEqual("DaskJob", archived[-1]["type"])
+
+    def test_purge_no_archive(self):
+        self.create_job("old")
+        purger = job_retention.JobPurger(
+            archive_path=self.directory.name, archive=False
+        )
+
+        ret = purger.purge(
+            job_retention.get_expired_jobs(older_than=datetime.timedelta(days=1))
+        )
+
+        self.assertEqual(1, ret)
+        self.assertFalse(TethysJob.objects.exists())
+        self.assertIsNone(purger.archive_file)
+        self.assertEqual([], list(Path(self.directory.name).iterdir()))
+
+    def test_purge_nothing(self):
+        purger = job_retention.JobPurger(archive_path=self.directory.name)
+
+        ret = purger.purge(TethysJob.objects.none())
+
+        self.assertEqual(0, ret)
+        self.assertEqual([], list(Path(self.directory.name).iterdir()))
@@ -0,0 +1,205 @@
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.db import transaction
+
+from tethys_compute import job_status_push
+from tethys_compute.models import TethysJob
+from tethys_sdk.testing import TethysTestCase
+
+
+class JobStatusPushTest(TethysTestCase):
+    def set_up(self):
+        self.user = User.objects.create_user("tethys_super", "user@example.com", "pass")
+        self.job = TethysJob(name="job", user=self.user, label="label")
+        self.job.save()
+        self.other_job = TethysJob(name="other_job", user=self.user, label="label")
+        self.other_job.save()
+
+    def tear_down(self):
+        self.user.delete()
+
+    def get_messages(self, mock_layer):
+        return {
+            c.args[0]: c.args[1]["jobs"] for c in mock_layer.group_send.call_args_list
+        }
+
+    def test_get_status_data(self):
+        self.job._status = "OTH"
+        self.job.extended_properties[TethysJob.OTHER_STATUS_KEY] = "Custom"
+
+        self.assertEqual(
+            {"job_id": self.job.id, "status": "Custom", "status_code": "OTH"},
+            job_status_push.get_status_data(self.job),
+        )
+
+    @mock.patch("tethys_compute.job_status_push.get_channel_layer")
+    def test_publish_status_change(self, mock_get_layer):
+        mock_layer = mock_get_layer.return_value = mock.AsyncMock()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.job._status = "SUB"
+            self.job.save()
+            self.job.update_status(status="RUN")
+            self.other_job.update_status(status="Custom")
+
+        user_group = job_status_push.get_user_group(self.user.id)
+        job_group = job_status_push.get_job_group(self.job.id)
+        running = {"job_id": self.job.id, "status": "Running", "status_code": "RUN"}
+        custom = {"job_id": self.other_job.id, "status": "Custom", "status_code": "OTH"}
+
+        # Only the last status of each job is sent, once per group
+        self.assertEqual(
+            {
+                user_group: [running, custom],
+                job_group: [running],
+                job_status_push.get_job_group(self.other_job.id): [custom],
+            },
+            self.get_messages(mock_layer),
+        )
+        mock_layer.group_send.assert_any_call(
+            user_group, {"type": "job.statuses", "jobs": [running, custom]}
+        )
+
+    @mock.patch("tethys_compute.job_status_push.get_channel_layer")
+    def test_publish_status_not_changed(self, mock_get_layer):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.job.description = "changed"
+            self.job.save()
+            self.job._status = "RUN"
+            self.job.save(update_fields=["description"])
+            TethysJob(name="new", user=self.user, label="label").save()
+
+        mock_get_layer.return_value.group_send.assert_not_called()
+
+    @mock.patch("tethys_compute.job_status_push.get_channel_layer")
+    def test_batch(self, mock_get_layer):
+        mock_layer = mock_get_layer.return_value = mock.AsyncMock()
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with job_status_push.batch():
+                with job_status_push.batch():
+                    self.job.update_status(status="RUN")
+                self.other_job.update_status(status="RUN")
+
+        self.assertEqual(1, len(callbacks))
+        mock_layer.group_send.assert_called()
+
+        # Both jobs are sent in a single message to their user
+        self.assertEqual(
+            [self.job.id, self.other_job.id],
+            [
+                data["job_id"]
+                for data in self.get_messages(mock_layer)[
+                    job_status_push.get_user_group(self.user.id)
+                ]
+            ],
+        )
+
+    @mock.patch("tethys_compute.job_status_push.get_channel_layer")
+    def test_batch_autocommit(self, mock_get_layer):
+        mock_layer = mock_get_layer.return_value = mock.AsyncMock()
+        connection = mock.MagicMock(in_atomic_block=False)
+
+        with mock.patch(
+            "tethys_compute.job_status_push.transaction.get_connection",
+            return_value=connection,
+        ), mock.patch(
+            "tethys_compute.job_status_push.transaction.on_commit",
+            side_effect=lambda callback: callback(),
+        ):
+            with job_status_push.batch():
+                job_status_push.publish_status_change(self.job)
+                job_status_push.publish_status_change(self.other_job)
+                # The committed changes are held until the end of the batch
+                mock_layer.group_send.assert_not_called()
+
+            self.assertEqual(
+                2,
+                len(self.get_messages(mock_layer)[f"tethys_jobs_user_{self.user.id}"]),
+            )
+
+            mock_layer.reset_mock()
+            job_status_push.publish_status_change(self.job)
+
+        # Changes are sent right away outside of a transaction and batch
+        self.assertEqual(2, mock_layer.group_send.call_count)
+
+    @mock.patch("tethys_compute.job_status_push.get_channel_layer")
+    def test_publish_status_change_rollback(self, mock_get_layer):
+        mock_layer = mock_get_layer.return_value = mock.AsyncMock()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    self.job.update_status(status="RUN")
+                    raise ValueError("rollback")
+            except ValueError:
+                pass
+
+            with job_status_push.batch():
+                try:
+                    with transaction.atomic():
+                        self.job.update_status(status="COM")
+                        raise ValueError("rollback")
+                except ValueError:
+                    pass
+                self.other_job.update_status(status="RUN")
+
+        # The changes of the rolled back savepoints are not sent
+        self.assertEqual(
+            {
+                job_status_push.get_user_group(self.user.id): [
+                    {
+                        "job_id": self.other_job.id,
+                        "status": "Running",
+                        "status_code": "RUN",
+                    }
+                ],
+                job_status_push.get_job_group(self.other_job.id): [
+                    {
+                        "job_id": self.other_job.id,
+                        "status": "Running",
+                        "status_code": "RUN",
+                    }
+                ],
+            },
+            self.get_messages(mock_layer),
+        )
+
+    @mock.patch("tethys_compute.job_status_push.get_channel_layer")
+    def test_publish_status_change_rollback_discarded(self, mock_get_layer):
+        self.job.update_status(status="RUN")
+        # The callbacks are discarded when the transaction is rolled back
+        transaction.get_connection().run_on_commit.clear()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.other_job.update_status(status="RUN")
+
+        messages = self.get_messages(mock_get_layer.return_value)
+        self.assertNotIn(job_status_push.get_job_group(self.job.id), messages)
+        self.assertIn(job_status_push.get_job_group(self.other_job.id), messages)
+
+    @mock.patch("tethys_compute.job_status_push.get_channel_layer")
+    def test_send_no_channel_layer(self, mock_get_layer):
+        mock_get_layer.return_value = None
+        with self.captureOnCommitCallbacks(execute=True):
+            self.job.update_status(status="RUN")
+        mock_get_layer.assert_called_once_with()
+
+        # Nothing to send
+        mock_get_layer.reset_mock()
+        job_status_push.send({})
+        mock_get_layer.assert_not_called()
+
+    @mock.patch("tethys_compute.job_status_push.logger")
+    @mock.patch("tethys_compute.job_status_push.get_channel_layer")
+    def test_send_error(self, mock_get_layer, mock_log):
+        mock_layer = mock_get_layer.return_value = mock.AsyncMock()
+        mock_layer.group_send.side_effect = Exception("error")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.job.update_status(status="RUN")
+
+        self.assertEqual(2, mock_layer.group_send.call_count)
+        self.assertEqual(2, mock_log.warning.call_count)
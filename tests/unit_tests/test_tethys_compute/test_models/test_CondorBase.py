@@ -1,10 +1,19 @@
 from tethys_sdk.testing import TethysTestCase
 from tethys_compute.models.condor.condor_scheduler import CondorScheduler
 from tethys_compute.models.condor.condor_base import CondorBase
+from tethys_compute.models.condor.condor_job import CondorJob
+from tethys_compute.models.condor.condor_workflow import CondorWorkflow
+from tethys_compute.models.condor.condor_workflow_job_node import CondorWorkflowJobNode
 from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from datetime import timedelta
 from django.utils import timezone
+from pathlib import Path
 from unittest import mock
+import io
+import os
+import tempfile
 
 
 class CondorBaseTest(TethysTestCase):
@@ -49,8 +58,9 @@ class CondorBaseTest(TethysTestCase):
         self.condorbase.delete()
         self.condorbase_exe.delete()
 
+    @mock.patch("tethys_compute.models.condor.condor_base.condor_ssh_pool")
     @mock.patch("tethys_compute.models.condor.condor_base.CondorBase._condor_object")
-    def test_condor_object_pro(self, mock_co):
+    def test_condor_object_pro(self, mock_co, mock_pool):
         ret = CondorBase.objects.get(name="test_condorbase")
         mock_co.return_value = ret
 
@@ -60,6 +70,8 @@ class CondorBaseTest(TethysTestCase):
         self.assertEqual(mock_co, ret.condor_object)
         self.assertEqual(1, ret.condor_object._cluster_id)
         self.assertEqual("test_machine", ret.condor_object._remote_id)
+        self.assertEqual(mock_pool.get_client(), ret.condor_object._remote)
+        mock_pool.get_client.assert_called_with(ret.scheduler)
         mock_co.set_scheduler.assert_called_with(
             host="localhost",
             port=22,
@@ -123,23 +135,23 @@ class CondorBaseTest(TethysTestCase):
     def test_update_status(self, mock_co):
         mock_co.status = "Various"
         mock_co.statuses = {"Unexpanded": "", "Idle": "", "Running": ""}
-        CondorBase.objects.get(name="test_condorbase_exe")._update_status()
-
-        ret = CondorBase.objects.get(name="test_condorbase_exe")._status
+        condorbase = CondorBase.objects.get(name="test_condorbase_exe")
+        condorbase._update_status()
 
         # Check result
-        self.assertEqual("VCP", ret)
+        self.assertEqual("VCP", condorbase._status)
+        # The status is saved by update_status
+        self.assertEqual(["_status"], condorbase.get_dirty_fields())
 
     @mock.patch("tethys_compute.models.condor.condor_base.CondorBase.condor_object")
     def test_update_status_exception(self, mock_co):
         mock_co.status = "Various"
         mock_co.statuses = {}
-        CondorBase.objects.get(name="test_condorbase_exe")._update_status()
-
-        ret = CondorBase.objects.get(name="test_condorbase_exe")._status
+        condorbase = CondorBase.objects.get(name="test_condorbase_exe")
+        condorbase._update_status()
 
         # Check result
-        self.assertEqual("ERR", ret)
+        self.assertEqual("ERR", condorbase._status)
 
     @mock.patch("tethys_compute.models.condor.condor_base.CondorBase.condor_object")
     def test_process_results(self, mock_co):
@@ -304,6 +316,63 @@ class CondorBaseTest(TethysTestCase):
 
         self.assertTrue(exists)
 
+    @mock.patch("tethys_compute.models.condor.condor_base.CondorBase._log_files")
+    def test_read_log_local(self, mock_log_files):
+        mock_log_files.return_value = {"test_job": {"log": "test_job/logs/*.log"}}
+        workspace = tempfile.TemporaryDirectory()
+        self.addCleanup(workspace.cleanup)
+        log_dir = Path(workspace.name) / "test_machine" / "test_job" / "logs"
+        log_dir.mkdir(parents=True)
+        (log_dir / "job.log").write_text("0123456789")
+        job = CondorBase.objects.get(name="test_condorbase")
+        job.workspace = workspace.name
+
+        self.assertEqual(
+            {"content": "6789", "offset": 6, "end": 10, "size": 10},
+            job.read_log("test_job", "log", length=4),
+        )
+        self.assertEqual(
+            [b"01234", b"56789"],
+            list(job.iter_log("test_job", "log", chunk_size=5)),
+        )
+
+    @mock.patch("tethys_compute.models.condor.condor_base.condor_ssh_pool")
+    @mock.patch("tethys_compute.models.condor.condor_base.CondorBase._log_files")
+    def test_read_log_remote(self, mock_log_files, mock_pool):
+        mock_log_files.return_value = {"test_job": {"log": "test_job/logs/*.log"}}
+        remote = mock_pool.get_client.return_value
+        remote.sftp.listdir.return_value = ["job.log"]
+        remote.remote_file.side_effect = lambda path, mode: io.BytesIO(b"0123456789")
+        job = CondorBase.objects.get(name="test_condorbase")
+        job.workspace = tempfile.gettempdir()
+
+        self.assertEqual(
+            {"content": "23", "offset": 2, "end": 4, "size": 10},
+            job.read_log("test_job", "log", offset=2, length=2),
+        )
+        self.assertEqual(
+            [b"0123456789"], list(job.iter_log("test_job", "log", chunk_size=20))
+        )
+        mock_pool.get_client.assert_called_with(self.scheduler)
+        remote.sftp.listdir.assert_called_with("test_machine/test_job/logs")
+        remote.remote_file.assert_called_with(
+            "test_machine/test_job/logs/job.log", "rb"
+        )
+
+    @mock.patch("tethys_compute.models.condor.condor_base.condor_ssh_pool")
+    @mock.patch("tethys_compute.models.condor.condor_base.CondorBase._log_files")
+    def test_read_log_not_found(self, mock_log_files, mock_pool):
+        mock_log_files.return_value = {"test_job": {"log": "test_job/logs/*.log"}}
+        mock_pool.get_client.return_value.sftp.listdir.return_value = []
+        job = CondorBase.objects.get(name="test_condorbase")
+        job.workspace = tempfile.gettempdir()
+
+        self.assertRaises(FileNotFoundError, job.read_log, "test_job", "log")
+
+        job.scheduler = None
+        self.assertRaises(FileNotFoundError, job.read_log, "test_job", "log")
+        self.assertRaises(KeyError, job.read_log, "test_job", "error")
+
     def test_pause(self):
         ret = CondorBase.objects.get(name="test_condorbase_exe").pause()
 
@@ -341,3 +410,227 @@ class CondorBaseTest(TethysTestCase):
         mock_co._execute.return_value = ("test_out", "test_err")
         self.condorbase.get_remote_log_content("log_file")
         mock_co._execute.assert_called_with(["cat", "log_file"])
+
+    def test_get_status_update_class(self):
+        self.assertIs(CondorBase, CondorJob.get_status_update_class())
+        self.assertIs(CondorBase, CondorWorkflow.get_status_update_class())
+
+    @mock.patch("tethys_compute.models.condor.condor_base.condor_ssh_pool")
+    @mock.patch("tethys_compute.models.tethys_job.TethysJob.execute_many")
+    def test_execute_many(self, mock_execute_many, mock_pool):
+        mock_pool.max_sessions = 3
+        executions = [(self.condorbase, (), {}), (self.condorbase_exe, (), {})]
+
+        # No more jobs are submitted at once than the SSH connection has sessions
+        with self.settings(JOB_SUBMIT_MAX_WORKERS=4):
+            CondorBase.execute_many(executions)
+        mock_execute_many.assert_called_with(executions, 3)
+
+        CondorBase.execute_many(executions, max_workers=2)
+        mock_execute_many.assert_called_with(executions, 2)
+
+    @mock.patch("tethys_compute.models.tethys_job.TethysJob.execute_many")
+    def test_execute_many_local(self, mock_execute_many):
+        self.condorbase.scheduler = None
+        executions = [(self.condorbase, (), {})]
+
+        CondorBase.execute_many(executions, max_workers=10)
+
+        mock_execute_many.assert_called_with(executions, 10)
+
+    def test_get_queried_condor_status_abs(self):
+        with self.assertRaises(NotImplementedError):
+            self.condorbase._get_queried_condor_status({}, {})
+
+
+class FakeCondorCommands:
+    """
+    Stand-in condor_q and condor_history commands that print canned output and record how they were called.
+    """  # noqa: E501
+
+    def __init__(self, condor_q="", condor_history=""):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.bin_dir = Path(self.temp_dir.name)
+        self.calls_path = self.bin_dir / "calls.log"
+        for command, output in (
+            ("condor_q", condor_q),
+            ("condor_history", condor_history),
+        ):
+            (self.bin_dir / f"{command}.out").write_text(output)
+            script = self.bin_dir / command
+            script.write_text(
+                "#!/bin/sh\n"
+                f'echo "{command} $*" >> "{self.calls_path}"\n'
+                f'cat "{self.bin_dir / command}.out"\n'
+            )
+            script.chmod(0o755)
+
+    @property
+    def calls(self):
+        if not self.calls_path.exists():
+            return []
+        return self.calls_path.read_text().splitlines()
+
+    def __enter__(self):
+        self.env = mock.patch.dict(
+            os.environ, {"PATH": f"{self.bin_dir}{os.pathsep}{os.environ['PATH']}"}
+        )
+        self.env.start()
+        return self
+
+    def __exit__(self, *args):
+        self.env.stop()
+        self.temp_dir.cleanup()
+
+
+class CondorBaseUpdateStatusesTest(TethysTestCase):
+    def set_up(self):
+        self.user = User.objects.create_user("tethys_super", "user@example.com", "pass")
+        self.workspace = tempfile.TemporaryDirectory()
+
+    def tear_down(self):
+        self.workspace.cleanup()
+
+    def create_job(self, job_class, cluster_id, **kwargs):
+        return job_class.objects.create(
+            name=f"job_{cluster_id}",
+            user=self.user,
+            label="test_label",
+            workspace=self.workspace.name,
+            execute_time=timezone.now() - timedelta(minutes=1),
+            cluster_id=cluster_id,
+            _status="RUN",
+            **kwargs,
+        )
+
+    def test_query_condor_statuses(self):
+        condor_q = "10 0 2 undefined\n10 1 1 undefined\n20 0 2 undefined\n21 0 2 20\n"
+        condor_history = "21 0 4 20\n22 0 4 20\n22 1 5 20\nnot a record\n"
+
+        with FakeCondorCommands(condor_q, condor_history) as fake:
+            procs, nodes = CondorBase.query_condor_statuses(None, [10, 20])
+            calls = fake.calls
+
+        self.assertEqual(
+            {
+                10: {0: "Running", 1: "Idle"},
+                20: {0: "Running"},
+                21: {0: "Completed"},
+                22: {0: "Completed", 1: "Held"},
+            },
+            procs,
+        )
+        self.assertEqual({20: {21: "Completed", 22: "Various"}}, nodes)
+        self.assertEqual(2, len(calls))
+        self.assertTrue(calls[0].startswith("condor_q -constraint"))
+        self.assertIn(
+            "ClusterId == 10 || ClusterId == 20 || DAGManJobId == 10 || "
+            "DAGManJobId == 20",
+            calls[0],
+        )
+        self.assertTrue(calls[1].startswith("condor_history -constraint"))
+
+    @mock.patch("tethys_compute.models.condor.condor_base.condor_ssh_pool")
+    @mock.patch("tethys_compute.models.condor.condor_base.HTCondorObjectBase")
+    def test_query_condor_statuses_remote(self, mock_condor_object, mock_pool):
+        scheduler = CondorScheduler.objects.create(
+            name="test_scheduler", host="localhost", username="tethys_super"
+        )
+        mock_condor_object()._execute.return_value = ("11 0 4 undefined", "")
+
+        procs, nodes = CondorBase.query_condor_statuses(scheduler, [11])
+
+        self.assertEqual({11: {0: "Completed"}}, procs)
+        self.assertEqual({}, nodes)
+        mock_pool.get_client.assert_called_once_with(scheduler)
+        self.assertEqual(mock_pool.get_client(), mock_condor_object()._remote)
+        mock_condor_object()._execute.assert_called_once()
+
+    @mock.patch("tethys_compute.models.condor.condor_base.HTCondorObjectBase")
+    def test_query_condor_statuses_error(self, mock_condor_object):
+        mock_condor_object()._execute.return_value = ("", "schedd unavailable")
+
+        with self.assertRaises(RuntimeError):
+            CondorBase.query_condor_statuses(None, [11])
+
+    def test_update_statuses(self):
+        various_job = self.create_job(CondorJob, 10, _num_jobs=2)
+        missing_job = self.create_job(CondorJob, 11)
+        unexpanded_job = self.create_job(CondorJob, 0)
+        workflow = self.create_job(CondorWorkflow, 20)
+        for name in ("node_1", "node_2"):
+            CondorWorkflowJobNode.objects.create(name=name, workflow=workflow)
+        condor_q = "10 0 2 undefined\n10 1 4 undefined\n20 0 2 undefined\n21 0 2 20\n"
+        condor_history = "21 0 4 20\n22 0 4 20\n"
+        jobs = list(
+            CondorBase.objects.filter(
+                pk__in=[various_job.pk, missing_job.pk, unexpanded_job.pk, workflow.pk]
+            )
+            .order_by("pk")
+            .select_subclasses()
+        )
+
+        with FakeCondorCommands(condor_q, condor_history) as fake:
+            updated = CondorBase.update_statuses(jobs)
+            calls = fake.calls
+
+        # One query for all of the jobs and workflows of the scheduler
+        self.assertEqual(2, len(calls))
+        self.assertEqual(4, len(updated))
+        self.assertEqual(
+            {
+                various_job.pk: "VAR",
+                missing_job.pk: "ERR",
+                unexpanded_job.pk: "SUB",
+                workflow.pk: "COM",
+            },
+            dict(
+                CondorBase.objects.filter(pk__in=[job.pk for job in jobs]).values_list(
+                    "pk", "_status"
+                )
+            ),
+        )
+        self.assertEqual(1, jobs[0].statuses["Running"])
+        self.assertEqual(2, jobs[3].statuses["Completed"])
+
+    @mock.patch("tethys_compute.models.condor.condor_base.log")
+    def test_update_statuses_query_error(self, mock_log):
+        job = self.create_job(CondorJob, 10)
+
+        with mock.patch.object(
+            CondorBase, "query_condor_statuses", side_effect=Exception("error")
+        ):
+            CondorBase.update_statuses([job])
+
+        mock_log.exception.assert_called_once_with(
+            "Unable to query the statuses of condor clusters 10:"
+        )
+        self.assertEqual("RUN", CondorBase.objects.get(pk=job.pk)._status)
+
+    def test_update_statuses_node_counts(self):
+        workflows = [self.create_job(CondorWorkflow, 20 + i) for i in range(3)]
+        for i, workflow in enumerate(workflows):
+            for j in range(i):
+                CondorWorkflowJobNode.objects.create(
+                    name=f"node_{j}", workflow=workflow
+                )
+        condor_q = "20 0 2 undefined\n21 0 2 undefined\n22 0 2 undefined\n"
+        jobs = list(
+            CondorBase.objects.filter(pk__in=[workflow.pk for workflow in workflows])
+            .order_by("pk")
+            .select_subclasses()
+        )
+
+        with FakeCondorCommands(condor_q, ""), CaptureQueriesContext(
+            connection
+        ) as queries:
+            CondorBase._update_statuses(jobs)
+
+        # The nodes of all of the workflows are counted with one query
+        node_queries = [
+            query
+            for query in queries.captured_queries
+            if "condorworkflownode" in query["sql"]
+        ]
+        self.assertEqual(1, len(node_queries))
+        self.assertEqual([0, 1, 2], [job._statuses["Unexpanded"] for job in jobs])
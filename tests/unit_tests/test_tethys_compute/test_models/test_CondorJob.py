@@ -1,5 +1,6 @@
 from tethys_sdk.testing import TethysTestCase
 from tethys_compute.models.tethys_job import TethysJob
+from tethys_compute.job_cleanup import job_cleanup_queue
 from tethys_compute.models.condor.condor_job import CondorJob
 from tethys_compute.models.condor.condor_scheduler import CondorScheduler
 from tethys_compute.models.condor.condor_base import CondorBase
@@ -97,26 +98,80 @@ class CondorJobTest(TethysTestCase):
         # Check if CondorPyJob is updated
         self.assertIsInstance(CondorPyJob.objects.get(condorpyjob_id=99), CondorPyJob)
 
-    @mock.patch("tethys_compute.models.condor.condor_job.CondorBase.condor_object")
-    def test_condor_job_pre_delete(self, mock_co):
+    @mock.patch(
+        "tethys_compute.models.condor.condor_job.CondorBase.condor_object",
+        new_callable=mock.PropertyMock,
+    )
+    @mock.patch(
+        "tethys_compute.models.condor.condor_job.CondorBase.connect_condor_object"
+    )
+    def test_condor_job_pre_delete(self, mock_connect, mock_co):
+        mock_connect.return_value.initial_dir = "."
         if not self.workspace_dir.exists():
             self.workspace_dir.mkdir(parents=True)
             file_path = self.workspace_dir / "test_file.txt"
             file_path.touch()
 
-        self.condorjob.delete()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.condorjob.delete()
+        job_cleanup_queue.join()
+
+        # The condorpy job is only created by the cleanup
+        mock_co.assert_not_called()
+        mock_connect.assert_called_once_with(
+            mock.ANY, "1", str(self.workspace_dir), self.scheduler, "test_machine"
+        )
+        condorpy_job = mock_connect.call_args.args[0]
+        self.assertEqual("test_condorbase", condorpy_job.name)
+        self.assertEqual("bar", condorpy_job.get("foo"))
 
         # Check if close_remote is called
-        mock_co.close_remote.assert_called()
+        mock_connect.return_value.close_remote.assert_called()
 
         # Check if file has been removed
         self.assertFalse(file_path.is_file())
 
     @mock.patch("tethys_compute.models.condor.condor_job.log")
-    @mock.patch("tethys_compute.models.condor.condor_job.CondorBase.condor_object")
-    def test_condor_job_pre_delete_exception(self, mock_co, mock_log):
-        mock_co.close_remote.side_effect = Exception("test error")
-        self.condorjob.delete()
+    @mock.patch(
+        "tethys_compute.models.condor.condor_job.CondorBase.connect_condor_object"
+    )
+    def test_condor_job_pre_delete_exception(self, mock_connect, mock_log):
+        mock_connect.return_value.initial_dir = "."
+        mock_connect.return_value.close_remote.side_effect = Exception("test error")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.condorjob.delete()
+        job_cleanup_queue.join()
 
         # Check if close_remote is called
         mock_log.exception.assert_called_with("test error")
+
+    def test_get_queried_condor_status(self):
+        self.condorjob.cluster_id = 1
+        self.condorjob.num_jobs = 2
+        procs = {1: {1: "Running", 0: "Running", 2: "Idle"}}
+
+        ret = self.condorjob._get_queried_condor_status(procs, {})
+
+        self.assertEqual("Running", ret[0])
+        self.assertEqual(2, ret[1]["Running"])
+        self.assertEqual(0, ret[1]["Idle"])
+
+        procs = {1: {0: "Running", 1: "Completed"}}
+        ret = self.condorjob._get_queried_condor_status(procs, {})
+
+        self.assertEqual("Various", ret[0])
+
+    def test_get_queried_condor_status_not_found(self):
+        self.condorjob.cluster_id = 1
+        self.condorjob.num_jobs = 2
+
+        with self.assertRaises(ValueError):
+            self.condorjob._get_queried_condor_status({}, {})
+
+        with self.assertRaises(ValueError):
+            self.condorjob._get_queried_condor_status({1: {0: "Running"}}, {})
+
+        self.condorjob.cluster_id = 0
+        ret = self.condorjob._get_queried_condor_status({}, {})
+
+        self.assertEqual("Unexpanded", ret[0])
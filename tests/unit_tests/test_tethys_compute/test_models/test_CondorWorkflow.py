@@ -3,6 +3,7 @@ from tethys_compute.models.condor.condor_scheduler import CondorScheduler
 from tethys_compute.models.condor.condor_py_workflow import CondorPyWorkflow
 from tethys_compute.models.condor.condor_workflow_job_node import CondorWorkflowJobNode
 from tethys_compute.models.condor.condor_workflow import CondorWorkflow
+from tethys_compute.job_cleanup import job_cleanup_queue
 from django.contrib.auth.models import User
 from django.utils import timezone as tz
 from unittest import mock
@@ -195,29 +196,47 @@ class CondorWorkflowTest(TethysTestCase):
         mock_update.assert_called()
 
     @mock.patch(
-        "tethys_compute.models.condor.condor_workflow.CondorWorkflow.condor_object"
+        "tethys_compute.models.condor.condor_workflow.CondorWorkflow.condor_object",
+        new_callable=mock.PropertyMock,
     )
-    def test_condor_job_pre_delete(self, mock_co):
+    @mock.patch(
+        "tethys_compute.models.condor.condor_workflow.CondorBase.connect_condor_object"
+    )
+    def test_condor_job_pre_delete(self, mock_connect, mock_co):
         if not self.workspace_dir.exists():
             self.workspace_dir.mkdir(parents=True)
             file_path = self.workspace_dir / "test_file.txt"
             file_path.touch()
 
-        self.condorworkflow.delete()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.condorworkflow.delete()
+        job_cleanup_queue.join()
+
+        # The condorpy workflow is only created by the cleanup
+        mock_co.assert_not_called()
+        mock_connect.assert_called_once_with(
+            mock.ANY,
+            self.condorworkflow.cluster_id,
+            str(self.workspace_dir),
+            self.scheduler,
+            self.condorworkflow.remote_id,
+        )
 
         # Check if close_remote is called
-        mock_co.close_remote.assert_called()
+        mock_connect.return_value.close_remote.assert_called()
 
         # Check if file has been removed
         self.assertFalse(file_path.is_file())
 
     @mock.patch("tethys_compute.models.condor.condor_workflow.log")
     @mock.patch(
-        "tethys_compute.models.condor.condor_workflow.CondorWorkflow.condor_object"
+        "tethys_compute.models.condor.condor_workflow.CondorBase.connect_condor_object"
     )
-    def test_condor_job_pre_delete_exception(self, mock_co, mock_log):
-        mock_co.close_remote.side_effect = Exception("test error")
-        self.condorworkflow.delete()
+    def test_condor_job_pre_delete_exception(self, mock_connect, mock_log):
+        mock_connect.return_value.close_remote.side_effect = Exception("test error")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.condorworkflow.delete()
+        job_cleanup_queue.join()
 
         # Check if close_remote is called
         mock_log.exception.assert_called_with("test error")
@@ -264,3 +283,33 @@ class CondorWorkflowTest(TethysTestCase):
         self.condorworkflow._update_status()
 
         self.assertEqual("ERR", self.condorworkflow._status)
+
+    def test_get_queried_condor_status(self):
+        self.condorworkflow.cluster_id = 20
+        procs = {20: {0: "Running"}, 21: {0: "Completed"}}
+
+        ret = self.condorworkflow._get_queried_condor_status(
+            procs, {20: {21: "Completed"}}
+        )
+
+        # The node that has not been submitted yet is unexpanded
+        self.assertEqual("Running", ret[0])
+        self.assertEqual(1, ret[1]["Completed"])
+        self.assertEqual(1, ret[1]["Unexpanded"])
+
+        ret = self.condorworkflow._get_queried_condor_status(
+            procs, {20: {21: "Completed", 22: "Various"}}
+        )
+
+        self.assertEqual(1, ret[1]["Unexpanded"])
+
+    def test_get_queried_condor_status_not_found(self):
+        self.condorworkflow.cluster_id = 20
+
+        with self.assertRaises(ValueError):
+            self.condorworkflow._get_queried_condor_status({}, {})
+
+        self.condorworkflow.cluster_id = 0
+        ret = self.condorworkflow._get_queried_condor_status({}, {})
+
+        self.assertEqual("Unexpanded", ret[0])
@@ -0,0 +1,305 @@
+import tempfile
+from concurrent.futures import Executor, Future
+from pathlib import Path
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.utils import timezone
+
+from tethys_compute import job_pools
+from tethys_compute.job_cleanup import job_cleanup_queue
+from tethys_compute.job_manager import JOB_TYPES
+from tethys_compute.models import ProcessPoolJob, TethysJob, ThreadPoolJob
+from tethys_compute.models.pool.pool_job import job_done
+from tethys_sdk.testing import TethysTestCase
+
+
+def add(a, b=0):
+    print(f"Adding {a} and {b}")
+    return a + b
+
+
+def fail():
+    raise ValueError("Invalid input")
+
+
+def double(result):
+    return result * 2
+
+
+class InlineExecutor(Executor):
+    """
+    Runs the jobs as soon as they are submitted.
+    """
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+class PoolJobTest(TethysTestCase):
+    def set_up(self):
+        self.user = User.objects.create_user("tethys_super", "user@example.com", "pass")
+        self.directory = tempfile.TemporaryDirectory()
+        self.pool = InlineExecutor()
+        patcher = mock.patch(
+            "tethys_compute.job_pools.JobPoolRegistry.get_pool", return_value=self.pool
+        )
+        self.mock_get_pool = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tear_down(self):
+        self.directory.cleanup()
+        self.user.delete()
+
+    def create_job(self, job_type=ThreadPoolJob, **kwargs):
+        return job_type(
+            name="pool_job",
+            user=self.user,
+            label="test_app",
+            workspace=self.directory.name,
+            **kwargs,
+        )
+
+    def test_job_types(self):
+        self.assertIs(ProcessPoolJob, JOB_TYPES["PROCESS_POOL"])
+        self.assertIs(ThreadPoolJob, JOB_TYPES["THREAD_POOL"])
+        self.assertEqual(job_pools.PROCESS, ProcessPoolJob.pool_kind)
+        self.assertEqual(job_pools.THREAD, ThreadPoolJob.pool_kind)
+
+    def test_function(self):
+        job = self.create_job(function=add)
+
+        self.assertEqual(f"{__name__}.add", job._function)
+        self.assertIs(add, job.function)
+
+        job.function = "not.a_function"
+        self.assertIsNone(job.function)
+
+    def test_execute(self):
+        job = self.create_job(function=add, args=[1], kwargs={"b": 2})
+
+        job.execute()
+
+        self.mock_get_pool.assert_called_with(job_pools.THREAD, "test_app")
+        saved = TethysJob.objects.get_subclass(pk=job.pk)
+        self.assertIsInstance(saved, ThreadPoolJob)
+        self.assertEqual("Complete", saved.cached_status)
+        self.assertIsNotNone(saved.execute_time)
+        self.assertIsNotNone(saved.completion_time)
+        self.assertEqual(3, saved.result)
+        self.assertEqual(
+            Path(self.directory.name) / f"job_{job.id}", saved.run_directory
+        )
+
+        # The status of the job itself is up to date
+        self.assertEqual("Complete", job.status)
+
+    def test_execute_arguments(self):
+        job = self.create_job(job_type=ProcessPoolJob, function=add)
+
+        job.execute(2, b=3)
+
+        self.mock_get_pool.assert_called_with(job_pools.PROCESS, "test_app")
+        self.assertEqual([2], job.args)
+        self.assertEqual({"b": 3}, job.kwargs)
+        self.assertEqual(5, job.result)
+
+    def test_execute_no_function(self):
+        job = self.create_job()
+
+        job.execute()
+
+        self.assertEqual("Error", job.cached_status)
+        self.mock_get_pool.assert_not_called()
+
+    @mock.patch("tethys_compute.job_pools.JobPoolRegistry.get_future")
+    def test_execute_running(self, mock_get_future):
+        job = self.create_job(function=add, args=[1])
+        job.save()
+
+        job.execute()
+
+        mock_get_future.assert_called_with(job.id)
+        self.assertEqual("Error", job.cached_status)
+
+    def test_execute_error(self):
+        job = self.create_job(function=fail)
+
+        job.execute()
+
+        job = TethysJob.objects.get_subclass(pk=job.pk)
+        self.assertEqual("Error", job.cached_status)
+        self.assertEqual("ValueError: Invalid input", job.status_message)
+        self.assertIsNone(job.result)
+        self.assertEqual(["stdout", "stderr", "error"], list(job.get_logs()))
+        self.assertIn("Traceback", job.get_logs()["error"]())
+
+    def test_process_results_function(self):
+        job = self.create_job(function=add, args=[2], process_results_function=double)
+
+        job.execute()
+
+        self.assertEqual(4, job.result)
+
+    @mock.patch("tethys_compute.models.pool.pool_job.log")
+    def test_process_results_function_error(self, mock_log):
+        job = self.create_job(function=add, args=[1], process_results_function=fail)
+
+        job.execute()
+
+        self.assertEqual(1, job.result)
+        mock_log.exception.assert_called_once()
+
+    def test_update_status(self):
+        job = self.create_job(function=add)
+        job.save()
+        job.run_directory.mkdir()
+
+        job._update_status()
+        self.assertEqual("PEN", job._status)
+
+        (job.run_directory / job_pools.STDOUT_FILE).touch()
+        job._update_status()
+        self.assertEqual("RUN", job._status)
+
+        (job.run_directory / job_pools.RESULT_FILE).touch()
+        job._update_status()
+        self.assertEqual("RES", job._status)
+
+        (job.run_directory / job_pools.ERROR_FILE).touch()
+        job._update_status()
+        self.assertEqual("ERR", job._status)
+        self.assertIsNone(job.status_message)
+
+        (job.run_directory / job_pools.CANCELLED_FILE).touch()
+        job._update_status()
+        self.assertEqual("ABT", job._status)
+
+    def test_logs(self):
+        job = self.create_job(function=add, args=[1, 2])
+        job.execute()
+
+        logs = job.get_logs()
+        self.assertEqual(["stdout", "stderr"], list(logs))
+        self.assertEqual("Adding 1 and 2\n", logs["stdout"]())
+        self.assertEqual("", logs["stderr"]())
+
+        self.assertEqual(
+            {"content": "and 2\n", "offset": 9, "end": 15, "size": 15},
+            job.read_log("stdout", length=6),
+        )
+        self.assertEqual(
+            [b"Adding", b" 1 and", b" 2\n"], list(job.iter_log("stdout", chunk_size=6))
+        )
+        self.assertRaises(FileNotFoundError, job.read_log, "error")
+        self.assertRaises(KeyError, job.read_log, "other")
+        self.assertRaises(KeyError, job.read_log, "stdout", "other")
+
+    def test_logs_not_started(self):
+        job = self.create_job(function=add)
+        job.save()
+
+        self.assertEqual("", job.get_logs()["stdout"]())
+
+    @mock.patch("tethys_compute.job_pools.JobPoolRegistry.cancel")
+    def test_stop(self, mock_cancel):
+        job = self.create_job(function=add)
+        job.save()
+
+        job.stop()
+
+        mock_cancel.assert_called_with(job.id)
+        self.assertEqual("Aborted", job.cached_status)
+        self.assertIsNotNone(job.completion_time)
+
+    def test_stop_running(self):
+        job = self.create_job(function=add, args=[1])
+        job.save()
+        job.run_directory.mkdir()
+        job._status = "RUN"
+
+        job.stop()
+
+        self.assertTrue((job.run_directory / job_pools.CANCELLED_FILE).exists())
+        self.assertEqual("ABT", TethysJob.objects.get(pk=job.pk)._status)
+
+    @mock.patch("tethys_compute.models.tethys_job.TethysJob.execute_many")
+    def test_execute_many(self, mock_execute_many):
+        executions = [(self.create_job(function=add), (1,), {})]
+
+        ThreadPoolJob.execute_many(executions, max_workers=4)
+
+        mock_execute_many.assert_called_with(executions, max_workers=1)
+
+    def test_pause_resume(self):
+        job = self.create_job()
+        self.assertRaises(NotImplementedError, job.pause)
+        self.assertRaises(NotImplementedError, job.resume)
+
+    def test_resubmit(self):
+        job = self.create_job(function=fail)
+        job.execute()
+        self.assertEqual("Error", job.status)
+
+        job.function = add
+        job.args = [1]
+        job.resubmit()
+
+        job = TethysJob.objects.get_subclass(pk=job.pk)
+        self.assertEqual("Complete", job.cached_status)
+        self.assertIsNone(job.status_message)
+        self.assertEqual(1, job.result)
+
+    def test_job_done_error(self):
+        job = self.create_job(function=add)
+        job.execute_time = timezone.now()
+        job._status = "SUB"
+        job.save()
+        job.run_directory.mkdir()
+        future = Future()
+        future.set_exception(RuntimeError("A process of the pool died"))
+
+        job_done(job.id, job.run_directory, future)
+
+        job = TethysJob.objects.get_subclass(pk=job.pk)
+        self.assertEqual("Error", job.cached_status)
+        self.assertEqual(
+            "RuntimeError('A process of the pool died')", job.status_message
+        )
+
+    @mock.patch("tethys_compute.models.pool.pool_job.log")
+    def test_job_done_deleted(self, mock_log):
+        future = Future()
+        future.set_result(True)
+
+        job_done(1000, self.directory.name, future)
+
+        mock_log.exception.assert_not_called()
+
+    @mock.patch("tethys_compute.models.pool.pool_job.log")
+    def test_job_done_exception(self, mock_log):
+        future = mock.MagicMock()
+        future.cancelled.side_effect = Exception("error")
+
+        job_done(1000, self.directory.name, future)
+
+        mock_log.exception.assert_called_once()
+
+    @mock.patch("tethys_compute.job_pools.JobPoolRegistry.cancel")
+    def test_delete(self, mock_cancel):
+        job = self.create_job(function=add, args=[1])
+        job.execute()
+        run_directory = job.run_directory
+        job_id = job.id
+
+        with self.captureOnCommitCallbacks(execute=True):
+            TethysJob.objects.filter(pk=job_id).delete()
+        job_cleanup_queue.join()
+
+        mock_cancel.assert_called_with(job_id)
+        self.assertFalse(run_directory.exists())
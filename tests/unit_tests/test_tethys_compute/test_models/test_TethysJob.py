@@ -2,11 +2,14 @@ from tethys_sdk.testing import TethysTestCase
 from tethys_compute.models.tethys_job import TethysJob
 from tethys_compute.models.condor.condor_base import CondorBase
 from tethys_compute.models.condor.condor_scheduler import CondorScheduler
+from tethys_compute.models import BasicJob, CondorJob, DaskJob, ThreadPoolJob
 from django.contrib.auth.models import User
+from django.db import connection
 from datetime import datetime, timedelta
 from pytz import timezone as pytz_timezone
 from django.utils import timezone as django_timezone
 from unittest import mock, IsolatedAsyncioTestCase
+import threading
 
 
 def test_function():
@@ -200,11 +203,110 @@ class TethysJobTest(TethysTestCase):
         self.assertIsNotNone(tethysjob.start_time)
         self.assertIsInstance(tethysjob.start_time, datetime)
 
-    @mock.patch("django.db.models.base.Model.save")
-    def test_update_valid_status(self, mock_save):
+    def test_update_valid_status(self):
         tethys_job = TethysJob.objects.get(name="test_tethysjob")
-        tethys_job.update_status(status="PEN")
-        mock_save.assert_called()
+        with mock.patch("django.db.models.base.Model.save") as mock_save:
+            # Nothing changed
+            tethys_job.update_status(status="PEN")
+            mock_save.assert_not_called()
+
+        tethys_job.update_status(status="RUN")
+        self.assertEqual("RUN", TethysJob.objects.get(pk=tethys_job.pk)._status)
+
+    def test_get_dirty_fields(self):
+        self.assertIsNone(TethysJob(name="new", user=self.user).get_dirty_fields())
+
+        tethys_job = TethysJob.objects.get(name="test_tethysjob")
+        self.assertEqual([], tethys_job.get_dirty_fields())
+
+        tethys_job.description = "changed"
+        tethys_job.extended_properties["key"] = "value"
+        self.assertEqual(
+            ["description", "extended_properties"], tethys_job.get_dirty_fields()
+        )
+
+        tethys_job.save(update_fields=["description"])
+        self.assertEqual(["extended_properties"], tethys_job.get_dirty_fields())
+
+        tethys_job.refresh_from_db()
+        self.assertEqual([], tethys_job.get_dirty_fields())
+        self.assertEqual({}, tethys_job.extended_properties)
+
+    def test_get_dirty_fields_subclass(self):
+        CondorBase(
+            name="test_condorbase", user=self.user, scheduler=self.scheduler
+        ).save()
+        job = TethysJob.objects.select_subclasses().get(name="test_condorbase")
+        self.assertIsInstance(job, CondorBase)
+        self.assertEqual([], job.get_dirty_fields())
+
+        job._status = "RUN"
+        job.remote_id = "changed"
+        self.assertEqual(["_status", "remote_id"], job.get_dirty_fields())
+
+    def test_save_changes(self):
+        tethys_job = TethysJob.objects.get(name="test_tethysjob")
+        # Changed by another process in the meantime
+        TethysJob.objects.filter(pk=tethys_job.pk).update(description="other")
+
+        tethys_job.status_message = "message"
+        self.assertEqual(["status_message"], tethys_job.save_changes())
+        self.assertEqual([], tethys_job.save_changes())
+
+        saved = TethysJob.objects.get(pk=tethys_job.pk)
+        self.assertEqual("message", saved.status_message)
+        self.assertEqual("other", saved.description)
+
+        new_job = TethysJob(name="new", user=self.user, label="label")
+        self.assertIsNone(new_job.save_changes())
+        self.assertIsNotNone(new_job.pk)
+
+    @mock.patch("tethys_compute.models.tethys_job.TethysJob.process_results")
+    @mock.patch(
+        "tethys_compute.models.tethys_job.TethysJob._update_status", autospec=True
+    )
+    def test_update_status_claimed(self, mock_us, mock_pr):
+        job = TethysJob.objects.get(name="test_tethysjob_execute_time")
+        other = TethysJob.objects.get(pk=job.pk)
+
+        def update_status(self):
+            self._status = "COM"
+
+        mock_us.side_effect = update_status
+
+        with mock.patch.object(
+            TethysJob, "is_time_to_update", return_value=True
+        ), mock.patch(
+            "tethys_compute.models.tethys_job.publish_status_change"
+        ) as mock_publish:
+            job.update_status()
+            # The status was already updated by the first process
+            other.update_status()
+
+        mock_pr.assert_called_once_with()
+        mock_publish.assert_called_once_with(job)
+        self.assertEqual("COM", other._status)
+        self.assertEqual([], other.get_dirty_fields())
+        self.assertEqual("COM", TethysJob.objects.get(pk=job.pk)._status)
+
+    @mock.patch("tethys_compute.models.tethys_job.TethysJob.process_results")
+    @mock.patch("tethys_compute.models.tethys_job.TethysJob._update_status")
+    def test_update_statuses_claimed(self, mock_us, mock_pr):
+        job = TethysJob.objects.get(name="test_tethysjob_execute_time")
+        # Completed by another process in the meantime
+        TethysJob.objects.filter(pk=job.pk).update(_status="COM")
+
+        def update_status():
+            job._status = "ERR"
+
+        mock_us.side_effect = update_status
+
+        with mock.patch.object(TethysJob, "is_time_to_update", return_value=True):
+            self.assertEqual([job], TethysJob.update_statuses([job]))
+
+        mock_pr.assert_not_called()
+        self.assertEqual("COM", job._status)
+        self.assertEqual("COM", TethysJob.objects.get(pk=job.pk)._status)
 
     @mock.patch("tethys_compute.models.tethys_job.TethysJob.is_time_to_update")
     @mock.patch("tethys_compute.models.condor.condor_base.CondorBase.condor_object")
@@ -293,6 +395,196 @@ class TethysJobTest(TethysTestCase):
         self.assertIsNotNone(tethysjob.completion_time)
         self.assertIsInstance(tethysjob.completion_time, datetime)
 
+    @mock.patch("tethys_compute.models.tethys_job.TethysJob.process_results")
+    @mock.patch("tethys_compute.models.tethys_job.TethysJob._update_status")
+    def test_update_statuses(self, mock_us, mock_pr):
+        running = TethysJob.objects.get(name="test_tethysjob_execute_time")
+        complete = TethysJob.objects.get(name="test_tethysjob")
+        complete._status = "COM"
+        statuses = iter(["RUN", "COM"])
+
+        def update_status():
+            running._status = next(statuses)
+
+        mock_us.side_effect = update_status
+
+        updated = TethysJob.update_statuses([running, complete])
+
+        self.assertEqual([running], updated)
+        mock_us.assert_called_once_with()
+        self.assertEqual("RUN", TethysJob.objects.get(pk=running.pk)._status)
+        mock_pr.assert_not_called()
+
+        # Not time to update again yet
+        self.assertEqual([], TethysJob.update_statuses([running]))
+
+        with mock.patch.object(TethysJob, "is_time_to_update", return_value=True):
+            TethysJob.update_statuses([running])
+
+        mock_pr.assert_called_once()
+
+    @mock.patch("tethys_compute.models.tethys_job.log")
+    @mock.patch("tethys_compute.models.tethys_job.TethysJob.process_results")
+    @mock.patch("tethys_compute.models.tethys_job.TethysJob._update_status")
+    def test_update_statuses_errors(self, mock_us, mock_pr, mock_log):
+        job = TethysJob.objects.get(name="test_tethysjob_execute_time")
+        job._status = "COM"
+        mock_us.side_effect = Exception("error")
+        mock_pr.side_effect = Exception("error")
+
+        with mock.patch.object(TethysJob, "is_update_needed", return_value=True):
+            updated = TethysJob.update_statuses([job])
+
+        self.assertEqual([job], updated)
+        self.assertEqual(2, mock_log.exception.call_count)
+
+    def test_update_statuses_subclass_fields(self):
+        condor_job = CondorJob.objects.create(
+            name="condor", user=self.user, label="test_label", _status="SUB"
+        )
+        dask_job = DaskJob.objects.create(
+            name="dask", user=self.user, label="test_label", _status="RUN"
+        )
+
+        def update_condor_status():
+            # e.g. the remote id is set when the condor object is created
+            condor_job._status = "RUN"
+            condor_job.remote_id = "remote_id"
+
+        def update_dask_status():
+            dask_job._status = "COM"
+            dask_job.forget = True
+
+        with mock.patch.object(
+            condor_job, "_update_status", side_effect=update_condor_status
+        ), mock.patch.object(
+            dask_job, "_update_status", side_effect=update_dask_status
+        ), mock.patch.object(
+            DaskJob, "process_results"
+        ), mock.patch.object(
+            TethysJob, "is_time_to_update", return_value=True
+        ):
+            updated = TethysJob.update_statuses([condor_job, dask_job])
+
+        self.assertEqual([condor_job, dask_job], updated)
+        condor_job = CondorJob.objects.get(pk=condor_job.pk)
+        self.assertEqual("RUN", condor_job._status)
+        self.assertEqual("remote_id", condor_job.remote_id)
+        dask_job = DaskJob.objects.get(pk=dask_job.pk)
+        self.assertEqual("COM", dask_job._status)
+        self.assertTrue(dask_job.forget)
+
+    def test_get_status_update_class(self):
+        self.assertIs(TethysJob, TethysJob.get_status_update_class())
+
+    def test_create_many(self):
+        jobs = [
+            BasicJob(name=f"basic_{i}", user=self.user, label="test_label")
+            for i in range(3)
+        ]
+
+        # One insert per table, whatever the number of jobs
+        with self.assertNumQueries(2):
+            self.assertEqual(jobs, TethysJob.create_many(jobs))
+
+        for job in jobs:
+            self.assertFalse(job._state.adding)
+            self.assertEqual([], job.get_dirty_fields())
+        saved = TethysJob.objects.filter(label="test_label", name__startswith="basic")
+        self.assertEqual(jobs, list(saved.order_by("id").select_subclasses()))
+
+    def test_create_many_job_types(self):
+        jobs = [
+            CondorJob(
+                name="condor_{id}",
+                user=self.user,
+                label="test_label",
+                scheduler=self.scheduler,
+            ),
+            DaskJob(name="dask", user=self.user, label="test_label", key="dask_key"),
+            ThreadPoolJob(name="pool", user=self.user, label="test_label", args=[1]),
+            BasicJob(name="basic_{id}", user=self.user, label="test_label"),
+        ]
+
+        with mock.patch.object(CondorJob, "update_database_fields") as mock_udf:
+            TethysJob.create_many(jobs, batch_size=1)
+
+        # The pre_save signal of each job is sent
+        mock_udf.assert_called_once_with()
+        saved = {
+            job.id: job
+            for job in TethysJob.objects.filter(
+                id__in=[job.id for job in jobs]
+            ).select_subclasses()
+        }
+        for job in jobs:
+            self.assertIsInstance(saved[job.id], type(job))
+        self.assertEqual(f"condor_{jobs[0].id}", saved[jobs[0].id].name)
+        self.assertEqual(self.scheduler, saved[jobs[0].id].scheduler)
+        self.assertIsNotNone(saved[jobs[0].id].condorpyjob_ptr_id)
+        self.assertEqual("dask_key", saved[jobs[1].id].key)
+        self.assertEqual([1], saved[jobs[2].id].args)
+        self.assertEqual(f"basic_{jobs[3].id}", saved[jobs[3].id].name)
+        self.assertEqual(f"basic_{jobs[3].id}", jobs[3].name)
+
+    def test_create_many_no_bulk_return(self):
+        jobs = [BasicJob(name="basic_{id}", user=self.user, label="test_label")]
+
+        with mock.patch.object(
+            type(connection.features),
+            "can_return_rows_from_bulk_insert",
+            new_callable=mock.PropertyMock,
+            return_value=False,
+        ):
+            TethysJob.create_many(jobs)
+
+        self.assertEqual(
+            f"basic_{jobs[0].id}", TethysJob.objects.get(pk=jobs[0].pk).name
+        )
+
+    def test_execute_many(self):
+        jobs = [mock.MagicMock(), mock.MagicMock()]
+        executions = [(jobs[0], (1,), {"a": 2}), (jobs[1], (), {})]
+
+        self.assertEqual(jobs, TethysJob.execute_many(executions, max_workers=1))
+
+        jobs[0].execute.assert_called_once_with(1, a=2)
+        jobs[1].execute.assert_called_once_with()
+
+    @mock.patch("tethys_compute.models.tethys_job.connection")
+    def test_execute_many_threads(self, mock_connection):
+        jobs = [mock.MagicMock() for _ in range(3)]
+        threads = set()
+        for job in jobs:
+            job.execute.side_effect = lambda: threads.add(threading.get_ident())
+
+        TethysJob.execute_many([(job, (), {}) for job in jobs], max_workers=2)
+
+        for job in jobs:
+            job.execute.assert_called_once_with()
+        self.assertNotIn(threading.get_ident(), threads)
+        self.assertEqual(3, mock_connection.close.call_count)
+
+    @mock.patch("tethys_compute.models.tethys_job.log")
+    def test_execute_many_error(self, mock_log):
+        jobs = [mock.MagicMock(id=1), mock.MagicMock(id=2)]
+        jobs[0].execute.side_effect = Exception("error")
+
+        TethysJob.execute_many([(job, (), {}) for job in jobs], max_workers=1)
+
+        jobs[1].execute.assert_called_once_with()
+        mock_log.exception.assert_called_once_with("Unable to execute job 1:")
+
+    def test_is_update_needed(self):
+        job = TethysJob.objects.get(name="test_tethysjob")
+        self.assertTrue(job.is_update_needed())
+
+        job._status = "COM"
+        self.assertFalse(job.is_update_needed())
+
+        job.update_status(status="Custom Terminal Status")
+        self.assertFalse(job.is_update_needed())
+
     @mock.patch("tethys_compute.models.tethys_job.TethysFunctionExtractor")
     def test_process_results_function(self, mock_tfe):
         mock_tfe().valid = True
@@ -364,6 +656,37 @@ class TethysJobTest(TethysTestCase):
         # Check result
         mock__get_logs.assert_called()
 
+    @mock.patch("tethys_compute.models.tethys_job.TethysJob._get_logs")
+    def test_read_log(self, mock__get_logs):
+        mock__get_logs.return_value = {
+            "log": "0123456789",
+            "group": {"sub_log": lambda: "abcdef", "empty": None},
+        }
+        job = TethysJob.objects.get(name="test_tethysjob")
+
+        self.assertEqual(
+            {"content": "789", "offset": 7, "end": 10, "size": 10},
+            job.read_log("log", length=3),
+        )
+        self.assertEqual(
+            {"content": "bc", "offset": 1, "end": 3, "size": 6},
+            job.read_log("group", "sub_log", offset=1, length=2),
+        )
+        self.assertEqual(
+            {"content": "", "offset": 0, "end": 0, "size": 0},
+            job.read_log("group", "empty"),
+        )
+        self.assertRaises(KeyError, job.read_log, "not_a_log")
+
+    @mock.patch("tethys_compute.models.tethys_job.TethysJob._get_logs")
+    def test_iter_log(self, mock__get_logs):
+        mock__get_logs.return_value = {"group": {"sub_log": lambda: "abcdef"}}
+        job = TethysJob.objects.get(name="test_tethysjob")
+
+        self.assertEqual(
+            [b"bcd", b"ef"], list(job.iter_log("group", "sub_log", 1, chunk_size=3))
+        )
+
     def test_abs_method(self):
         # Resubmit
         ret = TethysJob.objects.get(name="test_tethysjob")._resubmit()
@@ -1,9 +1,15 @@
 from tethys_sdk.testing import TethysTestCase
 from tethys_compute.models.dask.dask_scheduler import Scheduler, DaskScheduler
 from tethys_compute.models.dask.dask_job import DaskJob
+from tethys_compute.dask_client_registry import dask_client_registry
+from tethys_compute.job_cleanup import job_cleanup_queue
 from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.test import override_settings
 import dask
 from unittest import mock
+import os
+import tempfile
 import time
 
 
@@ -38,10 +44,11 @@ class DaskJobTest(TethysTestCase):
 
     def tear_down(self):
         self.scheduler.delete()
+        dask_client_registry.close_all()
 
-    @mock.patch("tethys_compute.models.dask.dask_job.Client")
+    @mock.patch("tethys_compute.dask_client_registry.Client")
     def test_client_prop_with_invalid_scheduler(self, mock_client):
-        mock_client.return_value = "test_client"
+        mock_client.return_value = mock.MagicMock(status="running")
 
         djob = DaskJob(
             name="test_dj",
@@ -55,12 +62,12 @@ class DaskJobTest(TethysTestCase):
         ret = djob.client
 
         # Check result
-        self.assertEqual("test_client", ret)
+        self.assertEqual(mock_client.return_value, ret)
         mock_client.assert_called()
 
-    @mock.patch("tethys_compute.models.dask.dask_scheduler.Client")
+    @mock.patch("tethys_compute.dask_client_registry.Client")
     def test_client_prop_with_valid_scheduler(self, mock_client):
-        mock_client.return_value = "test_client"
+        mock_client.return_value = mock.MagicMock(status="running")
         dask_scheduler = Scheduler.objects.get_subclass(name="test_dask_scheduler")
 
         djob = DaskJob(
@@ -75,14 +82,14 @@ class DaskJobTest(TethysTestCase):
         ret = djob.client
 
         # Check result
-        self.assertEqual("test_client", ret)
+        self.assertEqual(mock_client.return_value, ret)
         mock_client.assert_called_with(
             address="127.0.0.1:8000", heartbeat_interval=5, timeout=10
         )
 
-    @mock.patch("tethys_compute.models.dask.dask_job.Client")
+    @mock.patch("tethys_compute.dask_client_registry.Client")
     def test_client_no_scheduler_prop(self, mock_client):
-        mock_client.return_value = "test_default_client"
+        mock_client.return_value = mock.MagicMock(status="running")
         # Create DaskJob
         djob = DaskJob(name="test_dj", user=self.user, label="label")
 
@@ -90,10 +97,10 @@ class DaskJobTest(TethysTestCase):
         ret = djob.client
 
         # Check result
-        self.assertEqual("test_default_client", ret)
-        mock_client.assert_called_with()
+        self.assertEqual(mock_client.return_value, ret)
+        mock_client.assert_called_with(address=None)
 
-    @mock.patch("tethys_compute.models.dask.dask_scheduler.Client")
+    @mock.patch("tethys_compute.dask_client_registry.Client")
     @mock.patch("tethys_compute.models.dask.dask_job.Future")
     def test_future_prop(self, mock_future, mock_client):
         mock_client_ret = mock.MagicMock()
@@ -123,7 +130,7 @@ class DaskJobTest(TethysTestCase):
         mock_future.assert_called_with(key="test_key", client=mock_client_ret)
         self.assertEqual(mock_future(), ret)
 
-    @mock.patch("tethys_compute.models.dask.dask_scheduler.Client")
+    @mock.patch("tethys_compute.dask_client_registry.Client")
     def test_future_prop_no_key(self, mock_client):
         mock_client_ret = mock.MagicMock()
 
@@ -149,7 +156,7 @@ class DaskJobTest(TethysTestCase):
         self.assertIsNone(ret)
 
     @mock.patch("tethys_compute.models.dask.dask_job.log")
-    @mock.patch("tethys_compute.models.dask.dask_scheduler.Client")
+    @mock.patch("tethys_compute.dask_client_registry.Client")
     @mock.patch("tethys_compute.models.dask.dask_job.Future")
     def test_future_prop_exception(self, mock_future, mock_client, mock_log):
         mock_client_ret = mock.MagicMock()
@@ -183,7 +190,7 @@ class DaskJobTest(TethysTestCase):
 
     @mock.patch("tethys_compute.models.dask.dask_job.fire_and_forget")
     @mock.patch("django.db.models.base.Model.save")
-    @mock.patch("tethys_compute.models.dask.dask_scheduler.Client")
+    @mock.patch("tethys_compute.dask_client_registry.Client")
     def test_execute_delayed(self, mock_client, mock_save, mock_ff):
         mock_client_ret = mock.MagicMock()
 
@@ -212,7 +219,7 @@ class DaskJobTest(TethysTestCase):
     @mock.patch("tethys_compute.models.dask.dask_job.isinstance")
     @mock.patch("tethys_compute.models.dask.dask_job.fire_and_forget")
     @mock.patch("django.db.models.base.Model.save")
-    @mock.patch("tethys_compute.models.dask.dask_scheduler.Client")
+    @mock.patch("tethys_compute.dask_client_registry.Client")
     def test_execute_future(self, mock_client, mock_save, mock_ff, mock_isinstance):
         mock_client.return_value = mock.MagicMock()
 
@@ -246,6 +253,48 @@ class DaskJobTest(TethysTestCase):
         # _Execute
         self.assertRaises(ValueError, djob._execute, 1)
 
+    @mock.patch("tethys_compute.models.tethys_job.TethysJob.execute_many")
+    @mock.patch("tethys_compute.models.dask.dask_job.DaskJob.client")
+    def test_execute_many(self, mock_client, mock_execute_many):
+        futures = [mock.MagicMock(key="key1"), mock.MagicMock(key="key2")]
+        mock_client.compute.return_value = futures
+        jobs = [
+            DaskJob(name=f"test_dj{i}", user=self.user, label="label") for i in range(3)
+        ]
+        delayed = [inc(1), inc(2)]
+        future = mock.MagicMock()
+        executions = [
+            (jobs[0], (delayed[0], "arg"), {"kwarg": 1}),
+            (jobs[1], (future,), {}),
+            (jobs[2], (delayed[1],), {}),
+        ]
+
+        DaskJob.execute_many(executions, max_workers=2)
+
+        # The Delayed objects are computed with one call
+        mock_client.compute.assert_called_once_with(delayed)
+        mock_execute_many.assert_called_once_with(
+            [
+                (jobs[0], (futures[0], "arg"), {"kwarg": 1}),
+                (jobs[1], (future,), {}),
+                (jobs[2], (futures[1],), {}),
+            ],
+            2,
+        )
+
+    @mock.patch("tethys_compute.models.dask.dask_job.log")
+    @mock.patch("tethys_compute.models.tethys_job.TethysJob.execute_many")
+    @mock.patch("tethys_compute.models.dask.dask_job.DaskJob.client")
+    def test_execute_many_compute_error(self, mock_client, mock_execute_many, mock_log):
+        mock_client.compute.side_effect = Exception("error")
+        job = DaskJob(name="test_dj", user=self.user, label="label")
+        executions = [(job, (inc(1),), {})]
+
+        DaskJob.execute_many(executions)
+
+        mock_log.exception.assert_called_once()
+        mock_execute_many.assert_called_once_with(executions, None)
+
     @mock.patch("tethys_compute.models.dask.dask_job.DaskJob.client")
     @mock.patch("django.db.models.base.Model.save")
     @mock.patch("tethys_compute.models.dask.dask_job.DaskJob.future")
@@ -260,8 +309,10 @@ class DaskJobTest(TethysTestCase):
         djob._update_status()
 
         # check the results
-        mock_client.close.assert_called()
-        mock_save.assert_called()
+        mock_client.close.assert_not_called()
+        self.assertEqual("COM", djob._status)
+        # The status is saved by update_status
+        mock_save.assert_not_called()
 
     def test_update_status_with_no_future(self):
         # Create DaskJob
@@ -290,6 +341,50 @@ class DaskJobTest(TethysTestCase):
         # check the results
         mock_log.error.assert_called_with('Unknown Dask Status: "foo"')
 
+    @mock.patch("tethys_compute.models.dask.dask_job.log")
+    @mock.patch("tethys_compute.models.dask.dask_job.Future")
+    @mock.patch("tethys_compute.models.dask.dask_job.DaskJob.client")
+    def test_update_statuses(self, mock_client, mock_future, mock_log):
+        statuses = {
+            "key1": mock.MagicMock(status="finished"),
+            "key2": mock.MagicMock(status="foo"),
+        }
+
+        def get_future(key, client):
+            if key not in statuses:
+                raise ValueError(key)
+            return statuses[key]
+
+        mock_future.side_effect = get_future
+        jobs = [
+            DaskJob(
+                name=f"test_dj_{key}",
+                user=self.user,
+                label="label",
+                scheduler=self.scheduler,
+                key=key,
+                _status="RUN",
+            )
+            for key in ("key1", "key2", "key3", None)
+        ]
+
+        DaskJob._update_statuses(jobs)
+
+        self.assertEqual(["COM", "RUN", "RUN", "RUN"], [job._status for job in jobs])
+        self.assertEqual(3, mock_future.call_count)
+        mock_future.assert_any_call(key="key1", client=mock_client)
+        mock_client.close.assert_not_called()
+        mock_log.error.assert_called_with('Unknown Dask Status: "foo"')
+        mock_log.exception.assert_called_once()
+
+    @mock.patch("tethys_compute.models.dask.dask_job.DaskJob.client")
+    def test_update_statuses_no_keys(self, mock_client):
+        job = DaskJob(name="test_dj", user=self.user, label="label")
+
+        DaskJob._update_statuses([job])
+
+        mock_client.close.assert_not_called()
+
     @mock.patch("tethys_compute.models.dask.dask_job.DaskJob._acquire_pr_lock")
     @mock.patch("tethys_compute.models.dask.dask_job.DaskJob._release_pr_lock")
     def test_process_result_with_failed_lock(self, mock_re_lock, mock_apl):
@@ -349,7 +444,7 @@ class DaskJobTest(TethysTestCase):
         ret = djob._process_results()
 
         # check the result
-        mock_client.close.assert_called()
+        mock_client.close.assert_not_called()
         self.assertIsNone(ret)
 
     @mock.patch("tethys_compute.models.tethys_job.TethysFunctionExtractor")
@@ -382,7 +477,7 @@ class DaskJobTest(TethysTestCase):
         djob._process_results()
 
         # check the result
-        mock_client.close.assert_called()
+        mock_client.close.assert_not_called()
         mock_client.gather.assert_called_with(mock_future)
         mock_function.assert_called_with(mock_client.gather())
         mock_client.set_metadata.assert_called_with(fake_key, False)
@@ -525,6 +620,70 @@ class DaskJobTest(TethysTestCase):
         # Check result
         self.assertIsNone(ret)
 
+    def test_result_saved_inline(self):
+        djob = DaskJob.objects.create(
+            name="test_dj", user=self.user, label="label", result={"foo": [1, 2]}
+        )
+
+        djob = DaskJob.objects.get(pk=djob.pk)
+
+        self.assertEqual({"foo": [1, 2]}, djob.result)
+        self.assertEqual("", djob.result_path)
+        self.assertEqual(len(djob.result_data), djob.result_size)
+
+    @override_settings(DASK_RESULT_INLINE_MAX_SIZE=0)
+    def test_result_saved_in_workspace(self):
+        workspace = tempfile.TemporaryDirectory()
+        self.addCleanup(workspace.cleanup)
+        djob = DaskJob.objects.create(
+            name="test_dj", user=self.user, label="label", workspace=workspace.name
+        )
+        djob.result = list(range(1000))
+        djob.save()
+
+        djob = DaskJob.objects.get(pk=djob.pk)
+
+        self.assertIsNone(djob.result_data)
+        self.assertEqual(workspace.name, os.path.dirname(djob.result_path))
+        self.assertEqual(os.path.getsize(djob.result_path), djob.result_size)
+        self.assertEqual(list(range(1000)), djob.result)
+
+        # The previous result is deleted when the new one is committed
+        old_path = djob.result_path
+        with self.captureOnCommitCallbacks(execute=True):
+            djob.result = None
+            djob.save()
+
+        self.assertFalse(os.path.exists(old_path))
+        self.assertEqual(("", 0), (djob.result_path, djob.result_size))
+        self.assertIsNone(DaskJob.objects.get(pk=djob.pk).result)
+
+        # The result is deleted with the job
+        djob.result = list(range(1000))
+        djob.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            djob.delete()
+        job_cleanup_queue.join()
+
+        self.assertEqual([], os.listdir(workspace.name))
+
+    def test_result_serialize_error(self):
+        djob = DaskJob(name="test_dj", user=self.user, label="label")
+
+        with mock.patch(
+            "tethys_compute.models.dask.dask_job.DaskResultStore.dump",
+            side_effect=Exception,
+        ), self.assertRaises(ValidationError):
+            djob.result = "foo"
+
+    def test_result_load_error(self):
+        djob = DaskJob(
+            name="test_dj", user=self.user, label="label", result_path="/missing.zlib"
+        )
+
+        with self.assertRaises(ValidationError):
+            djob.result
+
     @mock.patch("tethys_compute.models.dask.dask_job.DaskJob.future")
     def test_done(self, mock_future):
         # Create DaskJob
@@ -598,7 +757,7 @@ class DaskJobTest(TethysTestCase):
         # Check result
         mock_future.retry.assert_called()
 
-    @mock.patch("tethys_compute.models.dask.dask_scheduler.Client")
+    @mock.patch("tethys_compute.dask_client_registry.Client")
     def test_get_logs(self, mock_client):
         mock_get_log = mock.MagicMock()
         mock_get_log.get_scheduler_logs.return_value = (
@@ -633,8 +792,7 @@ class DaskJobTest(TethysTestCase):
             "Unable to aquire lock. Processing results already occurring. Skipping..."
         )
 
-    @mock.patch("django.db.models.base.Model.save")
-    def test_fail_release_pr_lock(self, mock_save):
+    def test_fail_release_pr_lock(self):
         # Create DaskJob
         djob = DaskJob(
             name="test_dj", user=self.user, label="label", scheduler=self.scheduler
@@ -642,4 +800,59 @@ class DaskJobTest(TethysTestCase):
         djob.extended_properties["processing_results"] = True
         djob._release_pr_lock()
         self.assertFalse(djob.extended_properties["processing_results"])
-        mock_save.assert_called()
+
+    @mock.patch("tethys_compute.models.dask.dask_job.log")
+    def test_pr_lock_saved_job(self, mock_log):
+        djob = DaskJob(
+            name="test_dj", user=self.user, label="label", scheduler=self.scheduler
+        )
+        djob.save()
+        # Another process holds a copy of the same job
+        other = DaskJob.objects.get(pk=djob.pk)
+        djob.extended_properties["other"] = "unsaved"
+
+        self.assertTrue(djob._acquire_pr_lock())
+        self.assertFalse(other._acquire_pr_lock())
+        mock_log.warning.assert_called_once()
+
+        ep = DaskJob.objects.get(pk=djob.pk).extended_properties
+        self.assertEqual({"processing_results": True}, ep)
+        # Unsaved changes are kept, but the lock is not dirty
+        self.assertEqual("unsaved", djob.extended_properties["other"])
+        self.assertTrue(djob.extended_properties["processing_results"])
+        self.assertEqual(["extended_properties"], djob.get_dirty_fields())
+
+        djob._release_pr_lock()
+        self.assertFalse(
+            DaskJob.objects.get(pk=djob.pk).extended_properties["processing_results"]
+        )
+        self.assertTrue(other._acquire_pr_lock())
+
+    @mock.patch("tethys_compute.models.dask.dask_job.DaskJob.client")
+    @mock.patch("tethys_compute.models.dask.dask_job.DaskJob.future")
+    def test_process_results_releases_lock_on_error(self, _, mock_client):
+        mock_client.gather.side_effect = ValueError
+        mock_client.set_metadata.side_effect = RuntimeError("error")
+        djob = DaskJob(
+            name="test_dj", user=self.user, label="label", scheduler=self.scheduler
+        )
+        djob.save()
+
+        self.assertRaises(RuntimeError, djob._process_results)
+
+        ep = DaskJob.objects.get(pk=djob.pk).extended_properties
+        self.assertFalse(ep["processing_results"])
+
+    def test_get_dirty_fields_result(self):
+        djob = DaskJob(
+            name="test_dj", user=self.user, label="label", scheduler=self.scheduler
+        )
+        djob.save()
+
+        djob.result = {"a": 1}
+
+        self.assertEqual(
+            ["result_data", "result_size"], sorted(djob.get_dirty_fields())
+        )
+        djob.save_changes()
+        self.assertEqual({"a": 1}, DaskJob.objects.get(pk=djob.pk).result)
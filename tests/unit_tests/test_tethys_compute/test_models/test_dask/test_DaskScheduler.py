@@ -9,6 +9,7 @@
 
 from tethys_apps.base.testing.testing import TethysTestCase
 from tethys_compute.models import Scheduler, DaskScheduler
+from tethys_compute.dask_client_registry import dask_client_registry
 from unittest import mock
 
 
@@ -36,6 +37,7 @@ class DaskSchedulerTest(TethysTestCase):
     def tear_down(self):
         self.scheduler.delete()
         self.scheduler1.delete()
+        dask_client_registry.close_all()
 
     def test_DaskScheduler(self):
         ret = DaskScheduler.objects.get(name="test_dask_scheduler")
@@ -61,9 +63,9 @@ class DaskSchedulerTest(TethysTestCase):
         self.assertEqual(5, ret.heartbeat_interval)
         self.assertEqual("test_dashboard", ret.dashboard)
 
-    @mock.patch("tethys_compute.models.dask.dask_scheduler.Client")
+    @mock.patch("tethys_compute.dask_client_registry.Client")
     def test_client_prop(self, mock_client):
-        mock_client.return_value = "test_client"
+        mock_client.return_value = mock.MagicMock(status="running")
 
         dask_scheduler = Scheduler.objects.get_subclass(name="test_dask_scheduler")
 
@@ -71,17 +73,17 @@ class DaskSchedulerTest(TethysTestCase):
         ret = dask_scheduler.client
 
         # Check result
-        self.assertEqual("test_client", ret)
+        self.assertEqual(mock_client.return_value, ret)
 
         # Check result
-        self.assertEqual("test_client", ret)
+        self.assertEqual(mock_client.return_value, ret)
         mock_client.assert_called_with(
             address="localhost", heartbeat_interval=5, timeout=10
         )
 
-    @mock.patch("tethys_compute.models.dask.dask_scheduler.Client")
+    @mock.patch("tethys_compute.dask_client_registry.Client")
     def test_client_prop_no_heartbeat_and_timeout(self, mock_client):
-        mock_client.return_value = "test_client"
+        mock_client.return_value = mock.MagicMock(status="running")
 
         dask_scheduler = Scheduler.objects.get_subclass(name="test_dask_scheduler_2")
 
@@ -89,17 +91,17 @@ class DaskSchedulerTest(TethysTestCase):
         ret = dask_scheduler.client
 
         # Check result
-        self.assertEqual("test_client", ret)
+        self.assertEqual(mock_client.return_value, ret)
 
         # Check result
-        self.assertEqual("test_client", ret)
+        self.assertEqual(mock_client.return_value, ret)
 
         mock_client.assert_called_with(
             address="localhost", heartbeat_interval=None, timeout="__no_default__"
         )
 
     @mock.patch("tethys_compute.models.dask.dask_scheduler.log")
-    @mock.patch("tethys_compute.models.dask.dask_scheduler.Client")
+    @mock.patch("tethys_compute.dask_client_registry.Client")
     def test_client_error_prop(self, mock_client, mock_log):
         mock_client.side_effect = Exception("test error message")
 
@@ -116,3 +118,15 @@ class DaskSchedulerTest(TethysTestCase):
         # Check result
         self.assertTrue(raised_dask_job_exception)
         mock_log.exception.assert_called_with("Dask Client Init Error")
+
+    @mock.patch("tethys_compute.dask_client_registry.Client")
+    def test_client_prop_shared(self, mock_client):
+        mock_client.return_value = mock.MagicMock(status="running")
+
+        # Different instances of the scheduler share one client
+        ret = Scheduler.objects.get_subclass(name="test_dask_scheduler").client
+        ret2 = Scheduler.objects.get_subclass(name="test_dask_scheduler").client
+
+        self.assertIs(ret, ret2)
+        mock_client.assert_called_once()
+        ret.close.assert_not_called()
@@ -53,3 +53,38 @@ class TestTasks(unittest.IsolatedAsyncioTestCase):
             raise_error, delay=0, periodic=False, count=None
         )
         self.assertEqual(mock_log.info.call_count, 2)
+
+
+class TestBackgroundTasks(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        tasks_patcher = mock.patch.object(tethys_compute_tasks, "_background_tasks", [])
+        tasks_patcher.start()
+        self.addCleanup(tasks_patcher.stop)
+        started_patcher = mock.patch.object(
+            tethys_compute_tasks, "_background_tasks_started", False
+        )
+        started_patcher.start()
+        self.addCleanup(started_patcher.stop)
+
+    @mock.patch("tethys_compute.tasks.create_task")
+    def test_start_background_tasks_once(self, mock_create_task):
+        tethys_compute_tasks.register_background_task(
+            noop, 1, delay=60, periodic=True, key="value"
+        )
+
+        tethys_compute_tasks.start_background_tasks()
+        tethys_compute_tasks.start_background_tasks()
+
+        mock_create_task.assert_called_once_with(
+            noop, 1, delay=60, periodic=True, count=None, key="value"
+        )
+
+    @mock.patch("tethys_compute.tasks.start_background_tasks")
+    async def test_background_tasks_middleware(self, mock_start):
+        inner = mock.AsyncMock()
+        middleware = tethys_compute_tasks.BackgroundTasksMiddleware(inner)
+
+        await middleware("scope", "receive", "send")
+
+        mock_start.assert_called_once()
+        inner.assert_awaited_once_with("scope", "receive", "send")
@@ -44,6 +44,47 @@ class TestUpdateStatus(unittest.IsolatedAsyncioTestCase):
         mock_get_anonymous_user.assert_called_once()
         mock_tj.assert_called_with(id="job_id", user=mock_anonymous_user)
 
+    @mock.patch("tethys_compute.views.update_status.TethysJob")
+    async def test_get_jobs(self, mock_tethysjob):
+        mock_user = mock.MagicMock(is_staff=False, is_anonymous=False)
+        mock_user.has_perm.return_value = False
+        mock_jobs = mock_tethysjob.objects.filter.return_value.filter.return_value
+        mock_jobs.select_subclasses.return_value = [
+            mock.MagicMock(id=1),
+            mock.MagicMock(id=2),
+        ]
+
+        ret = await tethys_compute_update_status.get_jobs(["1", "2"], mock_user)
+
+        mock_tethysjob.objects.filter.assert_called_with(id__in=["1", "2"])
+        mock_tethysjob.objects.filter().filter.assert_called_with(user=mock_user)
+        self.assertEqual([1, 2], list(ret))
+
+    @mock.patch("tethys_compute.views.update_status.TethysJob")
+    async def test_get_jobs_staff(self, mock_tethysjob):
+        mock_user = mock.MagicMock(is_staff=True, is_anonymous=False)
+        mock_jobs = mock_tethysjob.objects.filter.return_value
+        mock_jobs.select_subclasses.return_value = [mock.MagicMock(id=1)]
+
+        ret = await tethys_compute_update_status.get_jobs(["1"], mock_user)
+
+        mock_jobs.filter.assert_not_called()
+        self.assertEqual([1], list(ret))
+
+    async def test_do_job_action_thread_sensitive(self):
+        mock_job = mock.MagicMock()
+
+        with mock.patch(
+            "tethys_compute.views.update_status.database_sync_to_async"
+        ) as mock_dsta:
+            mock_dsta.return_value = mock.AsyncMock(return_value="done")
+            ret = await tethys_compute_update_status.do_job_action(
+                mock_job, "update_status", thread_sensitive=False
+            )
+
+        self.assertEqual("done", ret)
+        mock_dsta.assert_called_with(mock_job.update_status, thread_sensitive=False)
+
     @mock.patch("tethys_compute.views.update_status.logger")
     @mock.patch("tethys_compute.views.update_status.JsonResponse")
     @mock.patch("tethys_compute.views.update_status.TethysJob")
@@ -0,0 +1,215 @@
+import unittest
+from unittest import mock
+
+from channels.layers import get_channel_layer
+from channels.testing import WebsocketCommunicator
+from django.test import override_settings
+
+from tethys_compute.job_status_push import get_job_group, get_user_group
+from tethys_compute.models import TethysJob
+from tethys_gizmos.consumers import JobLogConsumer, JobStatusConsumer
+
+
+def chunk(content, offset, size):
+    return {
+        "content": content,
+        "offset": offset,
+        "end": offset + len(content),
+        "size": size,
+    }
+
+
+class TestJobLogConsumer(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        settings = override_settings(JOB_LOG_FOLLOW_INTERVAL=0)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def get_communicator(self, user=None, key2="log"):
+        communicator = WebsocketCommunicator(
+            JobLogConsumer.as_asgi(), "/developer/gizmos/ajax/1/follow-log/job/log"
+        )
+        communicator.scope["user"] = user or mock.MagicMock(is_authenticated=True)
+        communicator.scope["url_route"] = {
+            "kwargs": {"job_id": "1", "key1": "job", "key2": key2}
+        }
+        return communicator
+
+    @mock.patch("tethys_gizmos.consumers.JobLogConsumer.is_complete")
+    @mock.patch("tethys_gizmos.consumers._read_log")
+    @mock.patch("tethys_gizmos.consumers.get_job")
+    async def test_follow(self, mock_get_job, mock_read_log, mock_complete):
+        mock_complete.side_effect = [False, False, True]
+        mock_read_log.side_effect = [
+            # Content written before following
+            chunk("45", 4, 8),
+            chunk("67", 6, 8),
+            # Nothing new
+            chunk("", 8, 8),
+            # Content written before the job finished
+            chunk("89", 8, 10),
+        ]
+        communicator = self.get_communicator()
+
+        connected, _ = await communicator.connect()
+        self.assertTrue(connected)
+        await communicator.send_json_to({"offset": 4})
+
+        self.assertEqual(chunk("45", 4, 8), await communicator.receive_json_from())
+        self.assertEqual(chunk("67", 6, 8), await communicator.receive_json_from())
+        self.assertEqual(chunk("89", 8, 10), await communicator.receive_json_from())
+        self.assertEqual({"complete": True}, await communicator.receive_json_from())
+        self.assertEqual(
+            "websocket.close", (await communicator.receive_output())["type"]
+        )
+
+        job = mock_get_job.return_value
+        mock_read_log.assert_has_calls(
+            [
+                mock.call(job, "job", "log", 4),
+                mock.call(job, "job", "log", 6),
+                mock.call(job, "job", "log", 8),
+                mock.call(job, "job", "log", 8),
+            ]
+        )
+
+    @mock.patch("tethys_gizmos.consumers.JobLogConsumer.is_complete")
+    @mock.patch("tethys_gizmos.consumers._read_log")
+    @mock.patch("tethys_gizmos.consumers.get_job")
+    async def test_follow_not_written(self, _, mock_read_log, mock_complete):
+        mock_complete.side_effect = [False, True]
+        mock_read_log.side_effect = [FileNotFoundError, chunk("01", 0, 2)]
+        communicator = self.get_communicator(key2=None)
+
+        await communicator.connect()
+        await communicator.send_json_to({})
+
+        self.assertEqual(chunk("01", 0, 2), await communicator.receive_json_from())
+        self.assertEqual({"complete": True}, await communicator.receive_json_from())
+        mock_read_log.assert_called_with(mock.ANY, "job", None, None)
+
+    @mock.patch("tethys_gizmos.consumers.logger")
+    @mock.patch("tethys_gizmos.consumers.JobLogConsumer.is_complete")
+    @mock.patch("tethys_gizmos.consumers._read_log")
+    @mock.patch("tethys_gizmos.consumers.get_job")
+    async def test_follow_error(
+        self, mock_get_job, mock_read_log, mock_complete, mock_log
+    ):
+        mock_get_job.return_value = mock.MagicMock(id=1)
+        mock_complete.return_value = False
+        mock_read_log.side_effect = KeyError("log")
+        communicator = self.get_communicator()
+
+        await communicator.connect()
+        await communicator.send_json_to({"offset": 0})
+
+        self.assertIn("error_message", await communicator.receive_json_from())
+        self.assertEqual(
+            "websocket.close", (await communicator.receive_output())["type"]
+        )
+        mock_log.warning.assert_called_once()
+
+    @mock.patch("tethys_gizmos.consumers.get_job")
+    async def test_connect_anonymous(self, mock_get_job):
+        communicator = self.get_communicator(
+            user=mock.MagicMock(is_authenticated=False)
+        )
+
+        connected, _ = await communicator.connect()
+
+        self.assertFalse(connected)
+        mock_get_job.assert_not_called()
+
+    @mock.patch("tethys_gizmos.consumers.get_job")
+    async def test_connect_not_allowed(self, mock_get_job):
+        mock_get_job.side_effect = TethysJob.DoesNotExist
+        communicator = self.get_communicator()
+
+        connected, _ = await communicator.connect()
+
+        self.assertFalse(connected)
+
+
+class TestJobStatusConsumer(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        settings = override_settings(
+            JOB_STATUS_PUSH_INTERVAL=0.05,
+            CHANNEL_LAYERS={
+                "default": {"BACKEND": "channels.layers.InMemoryChannelLayer"}
+            },
+        )
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def get_communicator(self, user=None):
+        communicator = WebsocketCommunicator(
+            JobStatusConsumer.as_asgi(), "/developer/gizmos/ajax/job-status/"
+        )
+        communicator.scope["user"] = user or mock.MagicMock(id=1, is_authenticated=True)
+        return communicator
+
+    async def publish(self, group, *job_ids):
+        await get_channel_layer().group_send(
+            group,
+            {
+                "type": "job.statuses",
+                "jobs": [
+                    {"job_id": job_id, "status": status, "status_code": status}
+                    for job_id, status in job_ids
+                ],
+            },
+        )
+
+    @mock.patch("tethys_gizmos.consumers.get_jobs")
+    async def test_job_statuses(self, mock_get_jobs):
+        mock_get_jobs.return_value = {2: mock.MagicMock()}
+        communicator = self.get_communicator()
+
+        connected, _ = await communicator.connect()
+        self.assertTrue(connected)
+        await communicator.send_json_to({"job_ids": [2, 3]})
+        await communicator.receive_nothing()
+        mock_get_jobs.assert_called_with(["2", "3"], communicator.scope["user"])
+
+        # A burst of changes of the jobs of the user and of the subscribed jobs
+        await self.publish(get_user_group(1), (1, "SUB"))
+        await self.publish(get_user_group(1), (1, "RUN"), (4, "RUN"))
+        await self.publish(get_job_group(2), (2, "COM"))
+        await self.publish(get_job_group(3), (3, "COM"))
+
+        # Only the last status of each job is sent
+        self.assertEqual(
+            {
+                "jobs": [
+                    {"job_id": 1, "status": "RUN", "status_code": "RUN"},
+                    {"job_id": 4, "status": "RUN", "status_code": "RUN"},
+                    {"job_id": 2, "status": "COM", "status_code": "COM"},
+                ]
+            },
+            await communicator.receive_json_from(),
+        )
+        self.assertTrue(await communicator.receive_nothing(0.1))
+
+        await communicator.disconnect()
+        await self.publish(get_user_group(1), (1, "COM"))
+        self.assertEqual({}, get_channel_layer().groups)
+
+    @mock.patch("tethys_gizmos.consumers.get_jobs")
+    async def test_receive_no_job_ids(self, mock_get_jobs):
+        communicator = self.get_communicator()
+        await communicator.connect()
+
+        await communicator.send_json_to({"job_ids": "1"})
+        await communicator.receive_nothing()
+
+        mock_get_jobs.assert_not_called()
+        await communicator.disconnect()
+
+    async def test_connect_anonymous(self):
+        communicator = self.get_communicator(
+            user=mock.MagicMock(is_authenticated=False)
+        )
+
+        connected, _ = await communicator.connect()
+
+        self.assertFalse(connected)
@@ -49,6 +49,7 @@ class TestJobsTable(unittest.TestCase):
         self.assertFalse(ret.attributes)
         self.assertEqual("", ret.classes)
         self.assertEqual(5000, ret.refresh_interval)
+        self.assertFalse(ret.live_updates)
         self.assertFalse(ret.show_detailed_status)
         self.assertEqual(7, ret.num_cols)
 
@@ -158,6 +159,51 @@ class TestJobsTable(unittest.TestCase):
             column_name,
         )
 
+    def test_JobsTable_init_page_size(self):
+        jobs = mock.MagicMock(label="test_label")
+        column_fields = ["id", "name", "execute_time", "run_time", "not_exist"]
+
+        ret = gizmo_jobs_table.JobsTable(
+            jobs=jobs,
+            column_fields=column_fields,
+            page_size=10,
+            enable_data_table=True,
+        )
+
+        self.assertEqual(10, ret.page_size)
+        self.assertEqual("test_label", ret.label)
+        self.assertEqual("creation_time", ret.order_by)
+        self.assertEqual([], ret.jobs)
+        self.assertEqual([], ret.rows)
+        self.assertFalse(ret.enable_data_table)
+        self.assertIn(("PEN", "Pending"), ret.statuses)
+        self.assertEqual(["id", "name", "execute_time", "run_time"], ret.column_fields)
+        self.assertEqual(["id", "name", None, None], ret.sort_fields)
+        jobs.__iter__.assert_not_called()
+
+    def test_get_sort_field(self):
+        get_sort_field = gizmo_jobs_table.JobsTable.get_sort_field
+        self.assertEqual("id", get_sort_field("id"))
+        self.assertEqual("name", get_sort_field("name"))
+        self.assertEqual("creation_time", get_sort_field("creation_time"))
+        self.assertIsNone(get_sort_field("execute_time"))
+        self.assertIsNone(get_sort_field("user"))
+        self.assertIsNone(get_sort_field("status"))
+        self.assertIsNone(get_sort_field("extended_properties.level1"))
+
+    def test_get_row_actions_not_modified(self):
+        job = JobObject(1, "name1", "des1", 1, 1)
+        job.custom_action_Delete_enabled = lambda status: False
+        actions = {"Delete": {"callback": "delete"}, "Run": {"callback": "run"}}
+
+        row = gizmo_jobs_table.JobsTable.get_row(job, ["id"], actions)
+
+        self.assertEqual(
+            {"Delete": {"callback": "delete"}, "Run": {"callback": "run"}}, actions
+        )
+        self.assertFalse(row.actions["Delete"]["enabled"])
+        self.assertTrue(row.actions["Run"]["enabled"])
+
     def test_get_gizmo_css(self):
         gizmo_css = gizmo_jobs_table.JobsTable.get_gizmo_css()
         self.assertEqual(2, len(gizmo_css))
@@ -47,6 +47,24 @@ class TestUrls(TethysTestCase):
         )
         self.assertEqual("gizmos", resolver.namespaces[0])
 
+    def test_ajax_urls_read_log(self):
+        url = reverse(
+            "gizmos:read_log", kwargs={"job_id": "123", "key1": "job", "key2": "log"}
+        )
+        resolver = resolve(url)
+        self.assertEqual("/developer/gizmos/ajax/123/read-log/job/log", url)
+        self.assertEqual(
+            "tethys_gizmos.views.gizmos.jobs_table.read_log", resolver._func_path
+        )
+
+    def test_ajax_urls_download_log(self):
+        url = reverse("gizmos:download_log", kwargs={"job_id": "123", "key1": "log"})
+        resolver = resolve(url)
+        self.assertEqual("/developer/gizmos/ajax/123/download-log/log", url)
+        self.assertEqual(
+            "tethys_gizmos.views.gizmos.jobs_table.download_log", resolver._func_path
+        )
+
 
 # we need to test for the JS that is calling the jobs directly
 @override_settings(PREFIX_URL="test/prefix")
@@ -1,19 +1,23 @@
 from unittest import mock
+import asyncio
 import unittest
 import json
 from functools import partial
-from django.test import RequestFactory
+from django.test import RequestFactory, override_settings
 import django.http
 import tethys_gizmos.views.gizmos.jobs_table as gizmo_jobs_table
 from condorpy.workflow import Workflow, Node
 from tethys_compute.models import (
+    BasicJob,
     CondorWorkflow,
     TethysJob,
     CondorWorkflowJobNode,
     DaskJob,
 )
-from django.contrib.auth.models import Permission
+from django.contrib.auth.models import Permission, User
+from django.utils import timezone
 from tethys_gizmos.views.gizmos.jobs_table import bokeh_row
+from tethys_sdk.testing import TethysTestCase
 
 
 async def mock_async_func(return_value=None):
@@ -265,6 +269,135 @@ class TestJobsTable(unittest.IsolatedAsyncioTestCase):
             "error",
         )
 
+    @override_settings(JOB_LOG_CHUNK_SIZE=4)
+    @mock.patch("tethys_gizmos.views.gizmos.jobs_table.get_job")
+    async def test_read_log(self, mock_tj):
+        mock_job = mock.MagicMock(get_logs=lambda: {"log": "0123456789"})
+        mock_job.read_log.return_value = {
+            "content": "23",
+            "offset": 2,
+            "end": 4,
+            "size": 10,
+        }
+        mock_tj.return_value = mock_job
+        request = RequestFactory().get("/jobs", {"offset": 2, "length": 100})
+        request.user = mock.MagicMock(is_authenticated=True)
+
+        result = await gizmo_jobs_table.read_log(
+            request=request, job_id="1", key1="job", key2="log"
+        )
+
+        self.assertEqual(
+            {"success": True, "content": "23", "offset": 2, "end": 4, "size": 10},
+            json.loads(result.content),
+        )
+        # The length is limited to the chunk size
+        mock_job.read_log.assert_called_with("job", "log", 2, 4)
+
+    @override_settings(JOB_LOG_CHUNK_SIZE=4)
+    @mock.patch("tethys_gizmos.views.gizmos.jobs_table.get_job")
+    async def test_read_log_async(self, mock_tj):
+        mock_tj.return_value = mock.MagicMock(
+            get_logs=partial(mock_async_func, {"log": "0123456789"}),
+            safe_close=mock_async_func,
+        )
+        request = RequestFactory().get("/jobs")
+        request.user = mock.MagicMock(is_authenticated=True)
+
+        result = await gizmo_jobs_table.read_log(
+            request=request, job_id="1", key1="log"
+        )
+
+        self.assertEqual(
+            {"success": True, "content": "6789", "offset": 6, "end": 10, "size": 10},
+            json.loads(result.content),
+        )
+
+    @mock.patch("tethys_gizmos.views.gizmos.jobs_table.logger")
+    @mock.patch("tethys_gizmos.views.gizmos.jobs_table.get_job")
+    async def test_read_log_exception(self, mock_tj, mock_log):
+        mock_job = mock.MagicMock(get_logs=lambda: {})
+        mock_job.read_log.side_effect = FileNotFoundError("job.log does not exist")
+        mock_tj.return_value = mock_job
+        request = RequestFactory().get("/jobs")
+        request.user = mock.MagicMock(is_authenticated=True)
+
+        result = await gizmo_jobs_table.read_log(
+            request=request, job_id="1", key1="log"
+        )
+
+        self.assertFalse(json.loads(result.content)["success"])
+        mock_log.error.assert_called_with(
+            "The following error occurred when reading log %s of job %s: %s",
+            "log ",
+            "1",
+            "job.log does not exist",
+        )
+
+    @mock.patch("tethys_gizmos.views.gizmos.jobs_table.get_job")
+    async def test_download_log(self, mock_tj):
+        chunks = (chunk for chunk in [b"0123", b"4567", b"89"])
+        mock_job = mock.MagicMock(get_logs=lambda: {})
+        mock_job.iter_log.return_value = chunks
+        mock_tj.return_value = mock_job
+        request = RequestFactory().get("/jobs")
+        request.user = mock.MagicMock(is_authenticated=True)
+
+        result = await gizmo_jobs_table.download_log(
+            request=request, job_id="1", key1="job 1", key2="logs/out"
+        )
+
+        self.assertIsInstance(result, django.http.StreamingHttpResponse)
+        self.assertEqual(
+            'attachment; filename="job_1_job_1_logs_out.log"',
+            result["Content-Disposition"],
+        )
+        self.assertEqual(b"0123456789", b"".join([chunk async for chunk in result]))
+        mock_job.iter_log.assert_called_with("job 1", "logs/out")
+
+    @mock.patch("tethys_gizmos.views.gizmos.jobs_table.get_job")
+    async def test_download_log_async(self, mock_tj):
+        mock_tj.return_value = mock.MagicMock(
+            get_logs=partial(mock_async_func, {"log": {"out": "log content"}}),
+            safe_close=mock_async_func,
+        )
+        request = RequestFactory().get("/jobs")
+        request.user = mock.MagicMock(is_authenticated=True)
+
+        result = await gizmo_jobs_table.download_log(
+            request=request, job_id="1", key1="log", key2="out"
+        )
+
+        self.assertEqual(b"log content", b"".join([chunk async for chunk in result]))
+
+    @mock.patch("tethys_gizmos.views.gizmos.jobs_table.get_job")
+    async def test_download_log_empty(self, mock_tj):
+        mock_job = mock.MagicMock(get_logs=lambda: {})
+        mock_job.iter_log.return_value = (chunk for chunk in [])
+        mock_tj.return_value = mock_job
+        request = RequestFactory().get("/jobs")
+        request.user = mock.MagicMock(is_authenticated=True)
+
+        result = await gizmo_jobs_table.download_log(
+            request=request, job_id="1", key1="log"
+        )
+
+        self.assertEqual(b"", b"".join([chunk async for chunk in result]))
+
+    @mock.patch("tethys_gizmos.views.gizmos.jobs_table.logger")
+    @mock.patch("tethys_gizmos.views.gizmos.jobs_table.get_job")
+    async def test_download_log_not_found(self, mock_tj, mock_log):
+        mock_job = mock.MagicMock(get_logs=lambda: {})
+        mock_job.iter_log.side_effect = FileNotFoundError("job.log does not exist")
+        mock_tj.return_value = mock_job
+        request = RequestFactory().get("/jobs")
+        request.user = mock.MagicMock(is_authenticated=True)
+
+        with self.assertRaises(django.http.Http404):
+            await gizmo_jobs_table.download_log(request=request, job_id="1", key1="log")
+
+        mock_log.error.assert_called_once()
+
     @mock.patch("tethys_gizmos.views.gizmos.jobs_table.render_to_string")
     @mock.patch("tethys_gizmos.views.gizmos.jobs_table.get_job")
     async def test_update_row_showcase(self, mock_tj, mock_rts):
@@ -446,6 +579,121 @@ class TestJobsTable(unittest.IsolatedAsyncioTestCase):
         # Check Result
         mock_log.warning.assert_called_with("Updating row for job 1 failed: error")
 
+    def get_update_rows_request(self, job_ids):
+        request = RequestFactory().post(
+            "/jobs", {"column_fields": self.column_names, "job_ids": job_ids}
+        )
+        request.user = mock.MagicMock(is_authenticated=True)
+        return request
+
+    @mock.patch("tethys_gizmos.views.gizmos.jobs_table.render_to_string")
+    @mock.patch("tethys_gizmos.views.gizmos.jobs_table.get_jobs")
+    async def test_update_rows(self, mock_gj, mock_rts):
+        mock_rts.side_effect = lambda template, context: context.get(
+            "job_status", "error"
+        )
+        running = 0
+        max_running = 0
+
+        async def update_status():
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        jobs = {
+            i: mock.MagicMock(
+                spec=TethysJob,
+                id=i,
+                cached_status="Running",
+                label="test_label",
+                update_status=update_status,
+                safe_close=mock_async_func,
+            )
+            for i in range(1, 6)
+        }
+        mock_gj.return_value = jobs
+
+        with override_settings(JOBS_TABLE_MAX_CONCURRENT_UPDATES=2):
+            result = await gizmo_jobs_table.update_rows(
+                self.get_update_rows_request("1,2,3,4,5")
+            )
+
+        rows = json.loads(result.content)["rows"]
+        self.assertEqual(["1", "2", "3", "4", "5"], list(rows))
+        self.assertEqual(
+            {"success": True, "status": "Running", "html": "Running"}, rows["1"]
+        )
+        self.assertEqual(2, max_running)
+        mock_gj.assert_called_once()
+        self.assertEqual(["1", "2", "3", "4", "5"], mock_gj.call_args[0][0])
+
+    @mock.patch("tethys_gizmos.views.gizmos.jobs_table.logger")
+    @mock.patch("tethys_gizmos.views.gizmos.jobs_table.render_to_string")
+    @mock.patch("tethys_gizmos.views.gizmos.jobs_table.get_jobs")
+    async def test_update_rows_errors(self, mock_gj, mock_rts, mock_log):
+        mock_rts.side_effect = lambda template, context: template
+        mock_job = mock.MagicMock(spec=TethysJob, id=1, cached_status="Running")
+        mock_job.update_status.side_effect = Exception("error")
+        mock_gj.return_value = {1: mock_job}
+
+        result = await gizmo_jobs_table.update_rows(self.get_update_rows_request("1,2"))
+
+        rows = json.loads(result.content)["rows"]
+        self.assertFalse(rows["1"]["success"])
+        self.assertFalse(rows["2"]["success"])
+        self.assertEqual("tethys_gizmos/gizmos/job_row_error.html", rows["2"]["html"])
+        mock_log.warning.assert_any_call("Updating row for job 1 failed: error")
+        mock_log.warning.assert_any_call("Updating row for job 2 failed: job not found")
+
+    @mock.patch("tethys_gizmos.views.gizmos.jobs_table.logger")
+    @mock.patch("tethys_gizmos.views.gizmos.jobs_table.get_jobs")
+    async def test_update_rows_exception(self, mock_gj, mock_log):
+        mock_gj.side_effect = Exception("error")
+
+        result = await gizmo_jobs_table.update_rows(self.get_update_rows_request("1"))
+
+        self.assertEqual({"success": False, "rows": {}}, json.loads(result.content))
+        mock_log.warning.assert_called_with("Updating rows for jobs 1 failed: error")
+
+    @mock.patch("tethys_gizmos.views.gizmos.jobs_table._render_page")
+    async def test_list_rows(self, mock_rp):
+        mock_rp.return_value = ("rows", 5)
+        request = RequestFactory().post(
+            "/jobs",
+            {"column_fields": self.column_names, "label": "test_label", "page_size": 2},
+        )
+        request.user = mock.MagicMock(is_authenticated=True)
+
+        result = await gizmo_jobs_table.list_rows(request)
+
+        self.assertEqual(
+            {"success": True, "html": "rows", "next": 5}, json.loads(result.content)
+        )
+        mock_rp.assert_called_once_with(
+            request.user,
+            {
+                "column_fields": ["id", "creation_time"],
+                "label": "test_label",
+                "page_size": "2",
+            },
+        )
+
+    @mock.patch("tethys_gizmos.views.gizmos.jobs_table.logger")
+    @mock.patch("tethys_gizmos.views.gizmos.jobs_table._render_page")
+    async def test_list_rows_exception(self, mock_rp, mock_log):
+        mock_rp.side_effect = Exception("error")
+        request = RequestFactory().post("/jobs", {"label": "test_label"})
+        request.user = mock.MagicMock(is_authenticated=True)
+
+        result = await gizmo_jobs_table.list_rows(request)
+
+        self.assertFalse(json.loads(result.content)["success"])
+        mock_log.warning.assert_called_with(
+            "Listing the jobs of the jobs table failed: error"
+        )
+
     def test_parse_value(self):
         result = gizmo_jobs_table._parse_value("True")
         self.assertTrue(result)
@@ -669,3 +917,84 @@ class TestJobsTable(unittest.IsolatedAsyncioTestCase):
 
     def test_permission_exists(self):
         Permission.objects.get(codename="jobs_table_actions")
+
+
+class TestJobsTableRenderPage(TethysTestCase):
+    def set_up(self):
+        self.user = User.objects.create_user("test_user", "user@example.com")
+        self.other_user = User.objects.create_user("other_user", "o@example.com")
+        self.jobs = [
+            BasicJob.objects.create(
+                name=f"job_{i}", user=self.user, label="test_label", _status=status
+            )
+            for i, status in enumerate(["PEN", "COM", "RUN", "COM"])
+        ]
+        self.other_job = BasicJob.objects.create(
+            name="other_job", user=self.other_user, label="test_label"
+        )
+        BasicJob.objects.create(name="other_app", user=self.user, label="other_label")
+
+    def render_page(self, user=None, **data):
+        data = {
+            "column_fields": ["id", "name"],
+            "actions": {"Delete": {"callback": "delete"}},
+            "show_status": True,
+            "show_actions": True,
+            "label": "test_label",
+            "page_size": 2,
+            **data,
+        }
+        with mock.patch(
+            "tethys_gizmos.views.gizmos.jobs_table.render_to_string"
+        ) as mock_rts:
+            ret = gizmo_jobs_table._render_page(user or self.user, data)
+        return ret, mock_rts.call_args[0][1]
+
+    def test_render_page(self):
+        (_, next_after), context = self.render_page()
+
+        self.assertEqual(self.jobs[:2], context["jobs"])
+        self.assertEqual([self.jobs[0].id, "job_0"], context["rows"][0].columns)
+        self.assertIsNone(context["rows"][0].job_status)
+        self.assertEqual(
+            {"callback": "delete", "enabled": True},
+            context["rows"][0].actions["Delete"],
+        )
+        self.assertEqual(self.jobs[1].id, next_after)
+
+        (_, next_after), context = self.render_page(after=next_after)
+
+        self.assertEqual(self.jobs[2:], context["jobs"])
+
+        (_, next_after), context = self.render_page(after=next_after)
+
+        self.assertEqual([], context["jobs"])
+        self.assertIsNone(next_after)
+
+    def test_render_page_order_and_filters(self):
+        (_, next_after), context = self.render_page(
+            order_by="-name", status="COM", page_size=5
+        )
+
+        self.assertEqual([self.jobs[3], self.jobs[1]], context["jobs"])
+        self.assertIsNone(next_after)
+
+        today = timezone.now().date().isoformat()
+        _, context = self.render_page(created_after=today, created_before=today)
+        self.assertEqual(self.jobs[:2], context["jobs"])
+
+        _, context = self.render_page(created_before="2000-01-01")
+        self.assertEqual([], context["jobs"])
+
+    def test_render_page_owner(self):
+        # Users can only list their own jobs
+        _, context = self.render_page(owner="other_user")
+        self.assertEqual(self.jobs[:2], context["jobs"])
+
+        staff = User.objects.create_user("staff", "s@example.com", is_staff=True)
+        _, context = self.render_page(user=staff, owner="other_user")
+        self.assertEqual([self.other_job], context["jobs"])
+
+    def test_render_page_invalid_order_by(self):
+        with self.assertRaises(ValueError):
+            self.render_page(order_by="execute_time")
@@ -17,6 +17,17 @@ class TestAsgiApplication(TethysTestCase):
         self.assertIn("websocket", application.application_mapping)
         self.assertIn("http", application.application_mapping)
 
+    def test_gizmos_websocket_path(self):
+        url_router = asgi.application.application_mapping["websocket"].inner.inner.inner
+
+        self.assertTrue(
+            any(
+                isinstance(url_pattern, URLPattern)
+                and str(url_pattern.pattern) == r"^developer/gizmos/"
+                for url_pattern in url_router.routes
+            )
+        )
+
 
 @override_settings(PREFIX_URL="test/prefix", MULTIPLE_APP_MODE=True)
 class TestAsgiApplicationWithURLPrefix(TethysTestCase):
@@ -484,18 +484,21 @@ class TethysPortalUserTests(unittest.TestCase):
         )
 
     @mock.patch("tethys_quotas.utilities.log")
-    @mock.patch("tethys_portal.views.user.get_user_workspace")
+    @mock.patch("tethys_portal.views.user.WorkspaceQuotaHandler")
     @mock.patch("tethys_portal.views.user._convert_storage_units")
     @mock.patch("tethys_portal.views.user.SingletonHarvester")
     @mock.patch("tethys_portal.views.user.render")
     def test_manage_storage_successful(
-        self, mock_render, mock_harvester, mock_convert_storage, _, __
+        self, mock_render, mock_harvester, mock_convert_storage, mock_rqh, _
     ):
         mock_request = mock.MagicMock()
         mock_request.user.username = "ThisIsMe"
-        app = TethysApp(name="app_name")
-        mock_harvester().apps = [app]
+        app = TethysApp(name="app_name", package="app_name")
+        other_app = TethysApp(name="other_app", package="other_app")
+        mock_harvester().apps = [app, other_app]
         mock_convert_storage.return_value = "0 bytes"
+        breakdown = {"app_name": {"workspace": 1024**3, "media": 1024**3}}
+        mock_rqh().get_storage_breakdown.return_value = breakdown
 
         expected_context = {
             "apps": mock_harvester().apps,
@@ -508,6 +511,10 @@ class TethysPortalUserTests(unittest.TestCase):
         mock_render.assert_called_once_with(
             mock_request, "tethys_portal/user/manage_storage.html", expected_context
         )
+        mock_rqh().get_storage_breakdown.assert_called_once()
+        mock_rqh().get_current_use.assert_called_once_with(breakdown)
+        mock_convert_storage.assert_any_call("gb", 2.0)
+        mock_convert_storage.assert_any_call("gb", 0.0)
 
     @mock.patch("tethys_quotas.utilities.log")
     @mock.patch("tethys_portal.views.user.TethysApp")
@@ -524,6 +531,8 @@ class TethysPortalUserTests(unittest.TestCase):
             mock_request, "tethys_portal/user/clear_workspace.html", expected_context
         )
 
+    @mock.patch("tethys_portal.views.user.quota_cache")
+    @mock.patch("tethys_portal.views.user.recompute_storage_usage")
     @mock.patch("tethys_portal.views.user.get_user_media")
     @mock.patch("tethys_portal.views.user.get_user_workspace")
     @mock.patch("tethys_portal.views.user.get_app_class")
@@ -538,6 +547,8 @@ class TethysPortalUserTests(unittest.TestCase):
         mock_get_app_class,
         _,
         __,
+        mock_recompute,
+        mock_quota_cache,
     ):  # noqa: E501
         mock_request = mock.MagicMock(method="POST", POST="clear-workspace-submit")
         mock_request.user.username = "ThisIsMe"
@@ -548,6 +559,13 @@ class TethysPortalUserTests(unittest.TestCase):
 
         clear_workspace(mock_request, "root_url")
 
+        # The storage usage of the user for the app is rescanned
+        mock_recompute.assert_called_once_with(
+            users=[mock_request.user], apps=[app], include_apps=False
+        )
+        mock_quota_cache.invalidate_owner.assert_called_once_with(
+            app.package, "ThisIsMe"
+        )
         mock_message.assert_called_once_with(
             mock_request,
             "Your workspace and media directory have been successfully cleared.",
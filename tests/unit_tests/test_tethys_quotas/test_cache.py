@@ -0,0 +1,208 @@
+from pathlib import Path
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.exceptions import PermissionDenied
+from django.test import TestCase, override_settings
+
+from tethys_apps.models import TethysApp
+from tethys_quotas import utilities
+from tethys_quotas.cache import MISSING, QuotaDecisionCache, _entity_key, quota_cache
+from tethys_quotas.models import ResourceQuota, UserQuota
+from tethys_quotas.storage import adjust_storage_usage
+
+
+class TestEntityKey(TestCase):
+    def test_user(self):
+        self.assertIsNone(_entity_key(User()))
+        self.assertEqual("user.5", _entity_key(User(pk=5)))
+
+    def test_app(self):
+        self.assertIsNone(_entity_key(TethysApp()))
+        self.assertEqual("app.3", _entity_key(TethysApp(pk=3)))
+
+    def test_app_class(self):
+        app_class = mock.MagicMock(package="test_app")
+        self.assertEqual("appclass.test_app", _entity_key(app_class))
+
+    def test_other(self):
+        self.assertIsNone(_entity_key(object()))
+        self.assertIsNone(_entity_key(UserQuota))
+
+
+class TestQuotaDecisionCache(TestCase):
+    def setUp(self):
+        self.cache = QuotaDecisionCache()
+        self.cache.invalidate()
+        self.user = User(pk=1)
+
+    def tearDown(self):
+        self.cache.end_request()
+
+    def test_miss_then_hit(self):
+        self.assertIs(MISSING, self.cache.get("kind", self.user, "codename"))
+        self.cache.set("kind", self.user, "codename", (True, None))
+        self.assertEqual((True, None), self.cache.get("kind", self.user, "codename"))
+
+        stats = self.cache.stats()
+        self.assertEqual(1, stats["misses"])
+        self.assertEqual(1, stats["cache_hits"])
+        self.assertEqual(0, stats["request_hits"])
+        self.assertEqual(0.5, stats["hit_rate"])
+
+    def test_request_memo(self):
+        self.cache.start_request()
+        self.cache.set("kind", self.user, "codename", 1)
+        self.assertEqual(1, self.cache.get("kind", self.user, "codename"))
+        self.assertEqual(1, self.cache.stats()["request_hits"])
+
+        self.cache.end_request()
+        self.assertEqual(1, self.cache.get("kind", self.user, "codename"))
+        self.assertEqual(1, self.cache.stats()["cache_hits"])
+
+    @override_settings(QUOTA_CACHE_TIMEOUT=0)
+    def test_timeout_disabled(self):
+        self.cache.set("kind", self.user, "codename", 1)
+        self.assertIs(MISSING, self.cache.get("kind", self.user, "codename"))
+
+        # still memoized within a request
+        self.cache.start_request()
+        self.cache.set("kind", self.user, "codename", 1)
+        self.assertEqual(1, self.cache.get("kind", self.user, "codename"))
+
+    def test_invalidate(self):
+        self.cache.start_request()
+        self.cache.set("kind", self.user, "codename", 1)
+        self.cache.invalidate()
+        self.assertIs(MISSING, self.cache.get("kind", self.user, "codename"))
+
+    def test_invalidate_owner(self):
+        user = User(pk=1, username="john")
+        other_user = User(pk=2, username="jane")
+        app = TethysApp(pk=3, package="test_app")
+        app_class = mock.MagicMock(package="test_app")
+        for entity in (user, other_user, app, app_class):
+            self.cache.set("kind", entity, "codename", 1)
+
+        self.cache.invalidate_owner("test_app", "john")
+
+        self.assertIs(MISSING, self.cache.get("kind", user, "codename"))
+        self.assertEqual(1, self.cache.get("kind", other_user, "codename"))
+        self.assertEqual(1, self.cache.get("kind", app, "codename"))
+
+        self.cache.invalidate_owner("test_app")
+
+        self.assertIs(MISSING, self.cache.get("kind", app, "codename"))
+        self.assertIs(MISSING, self.cache.get("kind", app_class, "codename"))
+        self.assertEqual(1, self.cache.get("kind", other_user, "codename"))
+
+    def test_invalidate_owner_request_memo(self):
+        self.cache.start_request()
+        self.cache.set("kind", self.user, "codename", 1)
+        self.cache.invalidate_owner("test_app", self.user.username)
+        self.assertIs(MISSING, self.cache.get("kind", self.user, "codename"))
+
+    @mock.patch("tethys_quotas.cache.log")
+    def test_invalidate_owner_error(self, mock_log):
+        with mock.patch.object(
+            QuotaDecisionCache, "backend", new_callable=mock.PropertyMock
+        ) as mock_backend:
+            mock_backend().set.side_effect = Exception("down")
+            self.cache.invalidate_owner("test_app")
+        mock_log.warning.assert_called_once()
+
+    def test_uncacheable_entity(self):
+        self.cache.set("kind", User(), "codename", 1)
+        self.assertIs(MISSING, self.cache.get("kind", User(), "codename"))
+        self.assertEqual(0, self.cache.stats()["misses"])
+
+    def test_reset_stats(self):
+        self.cache.get("kind", self.user, "codename")
+        self.cache.reset_stats()
+        self.assertEqual(0, self.cache.stats()["misses"])
+        self.assertEqual(0.0, self.cache.stats()["hit_rate"])
+
+    @mock.patch("tethys_quotas.cache.log")
+    def test_backend_errors(self, mock_log):
+        with mock.patch.object(
+            QuotaDecisionCache, "backend", new_callable=mock.PropertyMock
+        ) as mock_backend:
+            mock_backend.return_value.get_many.side_effect = Exception("down")
+            mock_backend.return_value.get.side_effect = Exception("down")
+            mock_backend.return_value.set.side_effect = Exception("down")
+
+            self.cache.set("kind", self.user, "codename", 1)
+            self.assertIs(MISSING, self.cache.get("kind", self.user, "codename"))
+            self.cache.invalidate()
+
+        mock_log.warning.assert_called_once()
+
+
+class TestQuotaCacheIntegration(TestCase):
+    def setUp(self):
+        quota_cache.invalidate()
+        self.user = User.objects.create_user(username="quota_user", password="pass")
+        self.rq = ResourceQuota.objects.create(
+            codename="user_test_quota",
+            name="Test Quota",
+            default=1,
+            units="GB",
+            applies_to="django.contrib.auth.models.User",
+            active=True,
+            help="Over quota",
+            _handler="tethys_quotas.handlers.workspace.WorkspaceQuotaHandler",
+        )
+
+    def test_passes_quota_cached(self):
+        with mock.patch.object(
+            ResourceQuota, "check_quota", autospec=True, return_value=False
+        ) as mock_check:
+            self.assertFalse(
+                utilities.passes_quota(self.user, "user_test_quota", False)
+            )
+            with self.assertRaises(PermissionDenied) as context:
+                utilities.passes_quota(self.user, "user_test_quota")
+
+        mock_check.assert_called_once()
+        self.assertEqual("Over quota", str(context.exception))
+
+    @override_settings(TETHYS_WORKSPACES_ROOT="/workspaces")
+    def test_passes_quota_invalidated_when_files_removed(self):
+        with mock.patch.object(
+            ResourceQuota, "check_quota", autospec=True, side_effect=[False, True]
+        ) as mock_check:
+            self.assertFalse(
+                utilities.passes_quota(self.user, "user_test_quota", False)
+            )
+
+            # The user frees space in one of their workspaces
+            adjust_storage_usage(
+                Path("/workspaces/test_app/user_workspaces/quota_user"), -1024, -1
+            )
+
+            self.assertTrue(utilities.passes_quota(self.user, "user_test_quota"))
+
+        self.assertEqual(2, mock_check.call_count)
+
+    def test_get_quota_invalidated_on_save(self):
+        self.assertEqual(1, utilities.get_quota(self.user, "user_test_quota")["quota"])
+
+        UserQuota.objects.create(resource_quota=self.rq, entity=self.user, value=5)
+        self.assertEqual(5, utilities.get_quota(self.user, "user_test_quota")["quota"])
+
+        self.rq.active = False
+        self.rq.save()
+        self.assertIsNone(utilities.get_quota(self.user, "user_test_quota")["quota"])
+
+    def test_get_resource_available_cached(self):
+        with mock.patch(
+            "tethys_quotas.handlers.workspace.WorkspaceQuotaHandler.get_current_use",
+            return_value=0.25,
+        ) as mock_current_use:
+            first = utilities.get_resource_available(self.user, "user_test_quota")
+            first["resource_available"] = 100
+            second = utilities.get_resource_available(self.user, "user_test_quota")
+
+        mock_current_use.assert_called_once()
+        self.assertEqual(0.75, second["resource_available"])
+        self.assertEqual("GB", second["units"])
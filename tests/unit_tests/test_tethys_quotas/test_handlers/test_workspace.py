@@ -0,0 +1,111 @@
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+
+from tethys_apps.models import TethysApp
+from tethys_quotas.handlers.workspace import WorkspaceQuotaHandler
+
+
+class WorkspaceQuotaHandlerTest(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name).resolve()
+        self.workspaces_root = self.root / "workspaces"
+        self.media_root = self.root / "media"
+
+        app1 = mock.MagicMock(package="app1")
+        app1.name = "App 1"
+        app2 = mock.MagicMock(package="app2")
+        app2.name = "App 2"
+        self.apps = [app1, app2]
+
+        self.user = User(username="john")
+
+        self.settings = override_settings(
+            TETHYS_WORKSPACES_ROOT=str(self.workspaces_root),
+            MEDIA_ROOT=str(self.media_root),
+        )
+        self.settings.enable()
+
+        harvester_patcher = mock.patch(
+            "tethys_quotas.handlers.workspace.SingletonHarvester"
+        )
+        self.mock_harvester = harvester_patcher.start()
+        self.mock_harvester().apps = self.apps
+        self.addCleanup(harvester_patcher.stop)
+
+    def tearDown(self):
+        self.settings.disable()
+        self.temp_dir.cleanup()
+
+    def write(self, path, size):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"0" * size)
+
+    def test_get_storage_breakdown_user(self):
+        self.write(self.workspaces_root / "app1" / "user_workspaces" / "john" / "a", 10)
+        self.write(
+            self.workspaces_root / "app1" / "user_workspaces" / "john" / "b" / "c", 5
+        )
+        self.write(self.media_root / "app2" / "user" / "john" / "d", 7)
+        self.write(self.workspaces_root / "app1" / "user_workspaces" / "jane" / "e", 3)
+
+        breakdown = WorkspaceQuotaHandler(self.user).get_storage_breakdown()
+
+        self.assertDictEqual(
+            {
+                "app1": {"workspace": 15, "media": 0, "files": 2},
+                "app2": {"workspace": 0, "media": 7, "files": 1},
+            },
+            breakdown,
+        )
+
+    def test_get_storage_breakdown_does_not_create_directories(self):
+        WorkspaceQuotaHandler(self.user).get_storage_breakdown()
+        self.assertFalse(self.workspaces_root.exists())
+        self.assertFalse(self.media_root.exists())
+
+    def test_get_storage_breakdown_app(self):
+        self.write(self.workspaces_root / "app2" / "app_workspace" / "a", 4)
+        self.write(self.media_root / "app2" / "app" / "b", 6)
+        self.write(self.media_root / "app2" / "user" / "john" / "c", 100)
+
+        breakdown = WorkspaceQuotaHandler(
+            TethysApp(name="App 2")
+        ).get_storage_breakdown()
+
+        self.assertDictEqual(
+            {"app2": {"workspace": 4, "media": 6, "files": 2}}, breakdown
+        )
+
+    def test_get_storage_breakdown_app_not_installed(self):
+        breakdown = WorkspaceQuotaHandler(
+            TethysApp(name="Other App")
+        ).get_storage_breakdown()
+        self.assertDictEqual({}, breakdown)
+
+    def test_get_current_use(self):
+        self.write(
+            self.workspaces_root / "app1" / "user_workspaces" / "john" / "a", 512
+        )
+        self.write(self.media_root / "app1" / "user" / "john" / "b", 512)
+
+        handler = WorkspaceQuotaHandler(self.user)
+        handler.units = "KB"
+
+        self.assertEqual(1.0, handler.get_current_use())
+
+    def test_get_current_use_breakdown(self):
+        handler = WorkspaceQuotaHandler(self.user)
+        breakdown = {
+            "app1": {"workspace": 1024**3, "media": 0},
+            "app2": {"workspace": 0, "media": 1024**3},
+        }
+
+        with mock.patch.object(handler, "get_storage_breakdown") as mock_breakdown:
+            self.assertEqual(2.0, handler.get_current_use(breakdown))
+
+        mock_breakdown.assert_not_called()
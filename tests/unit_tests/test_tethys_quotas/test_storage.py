@@ -0,0 +1,283 @@
+import tempfile
+from datetime import timedelta
+from pathlib import Path
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from tethys_apps.base.usage_index import usage_index
+from tethys_apps.models import TethysApp
+from tethys_quotas import storage
+from tethys_quotas.handlers.workspace import WorkspaceQuotaHandler
+from tethys_quotas.models import StorageUsage
+
+
+class StorageUsageTest(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name).resolve()
+        self.workspaces_root = self.root / "workspaces"
+        self.media_root = self.root / "media"
+
+        self.settings = override_settings(
+            TETHYS_WORKSPACES_ROOT=str(self.workspaces_root),
+            MEDIA_ROOT=str(self.media_root),
+        )
+        self.settings.enable()
+
+        self.app1 = TethysApp.objects.create(name="App 1", package="app1")
+        self.app2 = TethysApp.objects.create(name="App 2", package="app2")
+        self.john = User.objects.create_user(username="john", password="pass")
+        self.jane = User.objects.create_user(username="jane", password="pass")
+
+        self.write(self.workspaces_root / "app1" / "app_workspace" / "a", 3)
+        self.write(self.workspaces_root / "app1" / "user_workspaces" / "john" / "b", 10)
+        self.write(self.media_root / "app1" / "user" / "john" / "c" / "d", 5)
+        self.write(self.media_root / "app2" / "user" / "jane" / "e", 7)
+        self.write(self.media_root / "app2" / "user" / "ghost" / "f", 100)
+
+    def tearDown(self):
+        self.settings.disable()
+        usage_index.invalidate()
+        self.temp_dir.cleanup()
+
+    def write(self, path, size):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"0" * size)
+
+    def usage(self):
+        return {
+            (row.app.package, row.user.username if row.user else None): (
+                row.workspace_bytes,
+                row.media_bytes,
+                row.file_count,
+            )
+            for row in StorageUsage.objects.select_related("app", "user")
+        }
+
+    def test_recompute_all(self):
+        self.assertEqual(4, storage.recompute_storage_usage(jobs=2))
+
+        self.assertDictEqual(
+            {
+                ("app1", None): (3, 0, 1),
+                ("app2", None): (0, 0, 0),
+                ("app1", "john"): (10, 5, 2),
+                ("app2", "jane"): (0, 7, 1),
+            },
+            self.usage(),
+        )
+
+    def test_recompute_resets_removed_directories(self):
+        storage.recompute_storage_usage()
+        (self.media_root / "app2" / "user" / "jane" / "e").unlink()
+        (self.media_root / "app2" / "user" / "jane").rmdir()
+
+        storage.recompute_storage_usage()
+
+        self.assertEqual((0, 0, 0), self.usage()[("app2", "jane")])
+
+    def test_recompute_user(self):
+        storage.recompute_storage_usage()
+        self.write(self.workspaces_root / "app1" / "app_workspace" / "g", 1)
+        self.write(self.workspaces_root / "app2" / "user_workspaces" / "john" / "h", 2)
+
+        self.assertEqual(2, storage.recompute_storage_usage(users=["john"]))
+
+        usage = self.usage()
+        self.assertEqual((3, 0, 1), usage[("app1", None)])
+        self.assertEqual((2, 0, 1), usage[("app2", "john")])
+
+    def test_recompute_app(self):
+        self.assertEqual(2, storage.recompute_storage_usage(apps=[self.app1]))
+        self.assertEqual(
+            {("app1", None), ("app1", "john")},
+            set(self.usage()),
+        )
+
+    def test_recompute_rows_created_concurrently(self):
+        stale = timezone.now() - timedelta(days=1)
+        StorageUsage.objects.create(app=self.app1, user=None, last_scanned=stale)
+        StorageUsage.objects.create(app=self.app1, user=self.john, last_scanned=stale)
+        existing = StorageUsage.objects.filter(app=self.app2)
+
+        # The rows were created by another process after the rows were locked
+        with mock.patch.object(
+            storage.StorageUsage.objects, "filter", return_value=existing
+        ):
+            self.assertEqual(4, storage.recompute_storage_usage())
+
+        self.assertDictEqual(
+            {
+                ("app1", None): (3, 0, 1),
+                ("app2", None): (0, 0, 0),
+                ("app1", "john"): (10, 5, 2),
+                ("app2", "jane"): (0, 7, 1),
+            },
+            self.usage(),
+        )
+        self.assertFalse(StorageUsage.objects.filter(last_scanned=stale).exists())
+
+    def test_get_storage_usage(self):
+        self.assertIsNone(storage.get_storage_usage(self.john))
+        storage.recompute_storage_usage()
+
+        self.assertDictEqual(
+            {"app1": {"workspace": 10, "media": 5, "files": 2}},
+            storage.get_storage_usage(self.john),
+        )
+        self.assertDictEqual(
+            {"app1": {"workspace": 3, "media": 0, "files": 1}},
+            storage.get_storage_usage(self.app1),
+        )
+        self.assertIsNone(storage.get_storage_usage(self.john, max_age=0))
+        self.assertIsNone(storage.get_storage_usage(User()))
+
+    def test_get_storage_usage_stale(self):
+        storage.recompute_storage_usage()
+        StorageUsage.objects.filter(user=self.john).update(
+            last_scanned=timezone.now() - timedelta(seconds=301)
+        )
+
+        self.assertIsNone(storage.get_storage_usage(self.john))
+        self.assertIsNotNone(storage.get_storage_usage(self.john, max_age=600))
+
+    def test_update_storage_usage(self):
+        storage.update_storage_usage(
+            self.jane,
+            {
+                "app1": {"workspace": 0, "media": 0, "files": 0},
+                "app2": {"workspace": 1, "media": 2, "files": 3},
+                "not_installed": {"workspace": 4, "media": 5, "files": 6},
+            },
+        )
+
+        self.assertDictEqual(
+            {("app1", "jane"): (0, 0, 0), ("app2", "jane"): (1, 2, 3)},
+            self.usage(),
+        )
+
+    def test_recompute_uses_scan_time(self):
+        scanned = timezone.now() - timedelta(seconds=100)
+        with mock.patch(
+            "tethys_apps.base.usage_index.time.time",
+            return_value=scanned.timestamp(),
+        ):
+            storage.recompute_storage_usage(apps=[self.app1])
+
+        # The usage is as old as the scan it was read from
+        row = StorageUsage.objects.get(app=self.app1, user__isnull=True)
+        self.assertAlmostEqual(
+            scanned.timestamp(), row.last_scanned.timestamp(), places=3
+        )
+
+    def test_get_scan_time(self):
+        self.assertIsNone(storage.get_scan_time([{"scanned": None}]))
+        self.assertEqual(
+            100.0,
+            storage.get_scan_time(
+                [{"scanned": 200.0}, {"scanned": 100.0}, {"scanned": None}]
+            ).timestamp(),
+        )
+
+    def test_adjust_storage_usage(self):
+        storage.recompute_storage_usage()
+        scanned = StorageUsage.objects.get(user=self.john).last_scanned
+
+        storage.adjust_storage_usage(
+            self.workspaces_root / "app1" / "user_workspaces" / "john" / "x", -4, -1
+        )
+        storage.adjust_storage_usage(
+            self.media_root / "app1" / "user" / "john", -100, -5
+        )
+        storage.adjust_storage_usage(
+            self.workspaces_root / "app1" / "app_workspace", -1
+        )
+        # Paths outside of the workspace and media directories are ignored
+        storage.adjust_storage_usage(self.root / "other", -1, -1)
+        storage.adjust_storage_usage(self.media_root / "app1" / "other", -1, -1)
+
+        usage = self.usage()
+        self.assertEqual((6, 0, 0), usage[("app1", "john")])
+        self.assertEqual((2, 0, 1), usage[("app1", None)])
+        self.assertEqual((0, 7, 1), usage[("app2", "jane")])
+        # The usage stays as fresh as the scan it was computed from
+        self.assertEqual(scanned, StorageUsage.objects.get(user=self.john).last_scanned)
+
+    @mock.patch("tethys_quotas.storage.quota_cache")
+    def test_adjust_storage_usage_invalidates_quota_decisions(self, mock_cache):
+        storage.adjust_storage_usage(
+            self.media_root / "app1" / "user" / "john" / "c", -1, -1
+        )
+        mock_cache.invalidate_owner.assert_called_once_with("app1", "john")
+
+        storage.adjust_storage_usage(
+            self.workspaces_root / "app2" / "app_workspace", -1
+        )
+        mock_cache.invalidate_owner.assert_called_with("app2", None)
+
+        storage.adjust_storage_usage(self.root / "other", -1)
+        self.assertEqual(2, mock_cache.invalidate_owner.call_count)
+
+    @mock.patch("tethys_quotas.storage.log")
+    @mock.patch("tethys_quotas.storage.StorageUsage")
+    def test_adjust_storage_usage_error(self, mock_storage_usage, mock_log):
+        mock_storage_usage.objects.filter().filter().update.side_effect = Exception(
+            "locked"
+        )
+        storage.adjust_storage_usage(
+            self.workspaces_root / "app1" / "app_workspace", -1
+        )
+        mock_log.warning.assert_called_once()
+
+    def test_tethys_path_updates_storage_usage(self):
+        from tethys_apps.base.paths import TethysPath
+
+        storage.recompute_storage_usage()
+        workspace = TethysPath(
+            self.workspaces_root / "app1" / "user_workspaces" / "john"
+        )
+        media = TethysPath(self.media_root / "app1" / "user" / "john")
+
+        workspace.remove(workspace.path / "b")
+        self.assertEqual((0, 5, 1), self.usage()[("app1", "john")])
+
+        media.clear()
+        self.assertEqual((0, 0, 0), self.usage()[("app1", "john")])
+        self.assertIsNotNone(storage.get_storage_usage(self.john))
+
+    @mock.patch("tethys_quotas.storage.log")
+    @mock.patch("tethys_quotas.storage._save_storage_usage")
+    def test_update_storage_usage_error(self, mock_save, mock_log):
+        mock_save.side_effect = Exception("locked")
+        storage.update_storage_usage(self.app1, {"app1": {"workspace": 0, "media": 0}})
+        mock_log.warning.assert_called_once()
+
+    @mock.patch("tethys_quotas.handlers.workspace.SingletonHarvester")
+    def test_handler_reads_materialized_usage(self, mock_harvester):
+        mock_harvester().apps = [self.app1, self.app2]
+        handler = WorkspaceQuotaHandler(self.john)
+
+        # first read scans and materializes the usage
+        self.assertEqual(10, handler.get_storage_breakdown()["app1"]["workspace"])
+        self.assertEqual(2, StorageUsage.objects.filter(user=self.john).count())
+
+        # later reads use the table
+        self.write(self.workspaces_root / "app1" / "user_workspaces" / "john" / "i", 1)
+        with mock.patch(
+            "tethys_quotas.handlers.workspace.usage_index.get_many"
+        ) as mock_get_many:
+            self.assertEqual(10, handler.get_storage_breakdown()["app1"]["workspace"])
+        mock_get_many.assert_not_called()
+
+        usage_index.invalidate()
+        self.assertEqual(
+            11, handler.get_storage_breakdown(max_age=0)["app1"]["workspace"]
+        )
+
+    @mock.patch("tethys_quotas.storage.recompute_storage_usage", return_value=3)
+    async def test_refresh_storage_usage(self, mock_recompute):
+        await storage.refresh_storage_usage()
+        mock_recompute.assert_called_once_with()
@@ -0,0 +1,203 @@
+"""
+********************************************************************************
+* Name: app_registry.py
+* Author: Tethys Platform Developers
+* Created On: October 2026
+* Copyright: (c) Tethys Geospatial Foundation 2026
+* License: BSD 2-Clause
+********************************************************************************
+"""
+
+import copy
+import logging
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+
+from tethys_apps.harvester import SingletonHarvester
+
+tethys_log = logging.getLogger("tethys." + __name__)
+
+MULTIPLE = object()
+MISSING = object()
+GENERATION_KEY = "tethys_apps:registry:generation"
+
+
+class AppRegistry:
+    """
+    Per-process registry of the installed apps indexed by root url and package.
+
+    The TethysApp rows are loaded with a single query the first time the registry is used and are loaded again after ``APP_REGISTRY_TIMEOUT`` seconds or whenever a TethysApp is saved or deleted (see the signal receivers in tethys_apps.models). If ``APP_REGISTRY_CACHE_ALIAS`` names a Django cache backend, a generation token is stored in it so that saving or deleting an app in one process (e.g. disabling it in the admin pages) invalidates the registry of every process sharing the backend. Callers get a copy of the rows, so changing an app returned by the registry does not change the app returned to other callers.
+    """  # noqa: E501
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_root_url = None
+        self._by_package = None
+        self._first = None
+        self._loaded = None
+        self._classes = {}
+        self._classes_source = None
+
+    @property
+    def timeout(self):
+        return getattr(settings, "APP_REGISTRY_TIMEOUT", 30)
+
+    @property
+    def backend(self):
+        alias = getattr(settings, "APP_REGISTRY_CACHE_ALIAS", None)
+        return caches[alias] if alias else None
+
+    def _generation(self):
+        """
+        Get the shared generation of the registry, None if there is no shared backend or MISSING if it cannot be read.
+        """  # noqa: E501
+        backend = self.backend
+        if backend is None:
+            return None
+
+        try:
+            generation = backend.get(GENERATION_KEY)
+            if generation is None:
+                backend.add(GENERATION_KEY, uuid.uuid4().hex, timeout=None)
+                generation = backend.get(GENERATION_KEY)
+        except Exception as e:
+            tethys_log.debug(f"Unable to read app registry generation: {e}")
+            return MISSING
+
+        return generation
+
+    def _load(self, generation):
+        from tethys_apps.models import TethysApp
+
+        by_root_url = {}
+        by_package = {}
+        first = None
+
+        for app in TethysApp.objects.order_by("pk"):
+            if first is None:
+                first = app
+            by_package[app.package] = app
+            by_root_url[app.root_url] = MULTIPLE if app.root_url in by_root_url else app
+
+        with self._lock:
+            self._by_root_url = by_root_url
+            self._by_package = by_package
+            self._first = first
+            self._loaded = (generation, time.monotonic())
+
+        return by_root_url, by_package
+
+    def _indexes(self):
+        generation = self._generation()
+
+        with self._lock:
+            by_root_url, by_package = self._by_root_url, self._by_package
+            loaded = self._loaded
+
+        timeout = self.timeout
+        if (
+            by_root_url is None
+            or generation is MISSING
+            or not timeout
+            or loaded[0] != generation
+            or time.monotonic() - loaded[1] >= timeout
+        ):
+            by_root_url, by_package = self._load(generation)
+
+        return by_root_url, by_package
+
+    def get_by_root_url(self, root_url):
+        """
+        Get the TethysApp with the given root url.
+
+        Raises:
+            ObjectDoesNotExist: if there is no app with the given root url.
+            MultipleObjectsReturned: if there is more than one app with the given root url.
+        """
+        from tethys_apps.models import TethysApp
+
+        by_root_url, _ = self._indexes()
+        app = by_root_url.get(root_url)
+
+        if app is None:
+            # The app may have been installed by another process
+            app = TethysApp.objects.get(root_url=root_url)
+            with self._lock:
+                if self._by_root_url is by_root_url:
+                    by_root_url[root_url] = app
+        elif app is MULTIPLE:
+            raise TethysApp.MultipleObjectsReturned(
+                f'Multiple apps found with root url "{root_url}".'
+            )
+
+        return copy.copy(app)
+
+    def get_by_package(self, package):
+        """
+        Get the TethysApp with the given package.
+
+        Raises:
+            ObjectDoesNotExist: if there is no app with the given package.
+        """
+        from tethys_apps.models import TethysApp
+
+        _, by_package = self._indexes()
+        app = by_package.get(package)
+
+        if app is None:
+            app = TethysApp.objects.get(package=package)
+            with self._lock:
+                if self._by_package is by_package:
+                    by_package[package] = app
+
+        return copy.copy(app)
+
+    def first(self):
+        """
+        Get the first installed TethysApp or None if no apps are installed.
+        """
+        self._indexes()
+        with self._lock:
+            first = self._first
+        return copy.copy(first)
+
+    def get_app_class(self, package):
+        """
+        Get the harvested app class (TethysAppBase) with the given package or None.
+        """
+        apps = SingletonHarvester().apps
+
+        with self._lock:
+            # Re-index if the apps were harvested again
+            source = self._classes_source
+            if source is None or source[0] is not apps or source[1] != len(apps):
+                self._classes = {app.package: app for app in apps}
+                self._classes_source = (apps, len(apps))
+            return self._classes.get(package)
+
+    def invalidate(self, *args, **kwargs):
+        """
+        Clear the registry of this process and of every process sharing the backend, if any. Receiver for the save and delete signals of TethysApp.
+        """  # noqa: E501
+        with self._lock:
+            self._by_root_url = None
+            self._by_package = None
+            self._first = None
+            self._loaded = None
+            self._classes_source = None
+
+        backend = self.backend
+        if backend is None:
+            return
+
+        try:
+            backend.set(GENERATION_KEY, uuid.uuid4().hex, timeout=None)
+        except Exception as e:
+            tethys_log.warning(f"Unable to invalidate app registry: {e}")
+
+
+app_registry = AppRegistry()
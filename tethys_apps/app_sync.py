@@ -0,0 +1,401 @@
+"""
+********************************************************************************
+* Name: app_sync.py
+* Author: Tethys Platform Developers
+* Created On: October 2026
+* Copyright: (c) Tethys Geospatial Foundation 2026
+* License: BSD 2-Clause
+********************************************************************************
+"""
+
+import logging
+from functools import reduce
+from operator import or_
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+
+tethys_log = logging.getLogger("tethys." + __name__)
+
+# Fields of TethysApp that are always synced with the app class
+DEVELOPER_FIELDS = ("index", "root_url")
+
+# Fields of TethysApp that are only synced with the app class in debug mode
+DEBUG_FIELDS = (
+    "name",
+    "description",
+    "icon",
+    "color",
+    "tags",
+    "enable_feedback",
+    "feedback_emails",
+    "enabled",
+    "show_in_apps_library",
+)
+
+
+def _get_setting_categories():
+    """
+    Get the app class method defining each category of settings and the setting models of the category. Obsolete settings are only removed from the category that defined them.
+    """  # noqa: E501
+    from tethys_apps import models
+
+    return (
+        ("custom_settings", (models.CustomSettingBase,)),
+        ("dataset_service_settings", (models.DatasetServiceSetting,)),
+        ("spatial_dataset_service_settings", (models.SpatialDatasetServiceSetting,)),
+        ("web_processing_service_settings", (models.WebProcessingServiceSetting,)),
+        (
+            "persistent_store_settings",
+            (
+                models.PersistentStoreConnectionSetting,
+                models.PersistentStoreDatabaseSetting,
+            ),
+        ),
+        ("scheduler_settings", (models.SchedulerSetting,)),
+    )
+
+
+class AppSyncPlan:
+    """
+    The changes needed to bring the database in sync with a set of installed apps.
+    """
+
+    def __init__(self):
+        self.new_apps = []
+        self.changed_apps = {}
+        self.new_settings = []
+        self.obsolete_settings = []
+        self.new_permissions = []
+        self.changed_permissions = []
+        self.obsolete_permissions = []
+        self.new_groups = []
+        self.obsolete_groups = []
+        self.group_permissions = set()
+        self.new_group_permissions = set()
+        self.obsolete_group_permissions = []
+
+    def __bool__(self):
+        return any(
+            (
+                self.new_apps,
+                self.changed_apps,
+                self.new_settings,
+                self.obsolete_settings,
+                self.new_permissions,
+                self.changed_permissions,
+                self.obsolete_permissions,
+                self.new_groups,
+                self.obsolete_groups,
+                self.new_group_permissions,
+                self.obsolete_group_permissions,
+            )
+        )
+
+    def summary(self):
+        """
+        Get the number of changes of each kind.
+
+        Returns:
+            dict: number of apps, settings, permissions, groups and group object permissions created, updated or deleted.
+        """  # noqa: E501
+        return {
+            "apps_created": len(self.new_apps),
+            "apps_updated": len(self.changed_apps),
+            "settings_created": len(self.new_settings),
+            "settings_deleted": len(self.obsolete_settings),
+            "permissions_created": len(self.new_permissions),
+            "permissions_updated": len(self.changed_permissions),
+            "permissions_deleted": len(self.obsolete_permissions),
+            "groups_created": len(self.new_groups),
+            "groups_deleted": len(self.obsolete_groups),
+            "group_permissions_assigned": len(self.new_group_permissions),
+            "group_permissions_removed": len(self.obsolete_group_permissions),
+        }
+
+
+def _prefix_filter(field, prefixes):
+    return reduce(or_, (Q(**{f"{field}__startswith": p}) for p in prefixes))
+
+
+def plan_apps_sync(apps):
+    """
+    Compare the apps, settings, permissions and permission groups defined by the given apps with the database. The existing rows of all apps are read in a handful of queries, regardless of the number of apps.
+
+    Args:
+        apps (list of TethysAppBase): instances of the installed apps.
+
+    Returns:
+        AppSyncPlan: the changes needed to sync the database.
+    """  # noqa: E501
+    from django.contrib.auth.models import Group, Permission
+    from guardian.utils import get_group_obj_perms_model
+    from tethys_apps.models import TethysApp, TethysAppSetting
+
+    plan = AppSyncPlan()
+    if not apps:
+        return plan
+
+    debug = getattr(settings, "DEBUG", False)
+    packages = [app.package for app in apps]
+    prefixes = [f"{package}:" for package in packages]
+
+    # Apps
+    db_apps = {
+        db_app.package: db_app
+        for db_app in TethysApp.objects.filter(package__in=packages)
+    }
+    for app in apps:
+        db_app = db_apps.get(app.package)
+        if db_app is None:
+            plan.new_apps.append(
+                TethysApp(
+                    name=app.name,
+                    package=app.package,
+                    description=app.description,
+                    enable_feedback=app.enable_feedback,
+                    feedback_emails=app.feedback_emails,
+                    index=app.index,
+                    icon=app.icon,
+                    root_url=app.root_url,
+                    color=app.color,
+                    tags=app.tags,
+                    enabled=app.enabled,
+                    show_in_apps_library=app.show_in_apps_library,
+                )
+            )
+            continue
+
+        fields = DEVELOPER_FIELDS + (DEBUG_FIELDS if debug else ())
+        changed = [f for f in fields if getattr(db_app, f) != getattr(app, f)]
+        if changed:
+            for field in changed:
+                setattr(db_app, field, getattr(app, field))
+            plan.changed_apps[db_app] = changed
+
+    # Settings
+    existing_settings = {package: [] for package in packages}
+    app_ids = {db_app.pk: package for package, db_app in db_apps.items()}
+    for setting in TethysAppSetting.objects.filter(
+        tethys_app_id__in=list(app_ids)
+    ).select_subclasses():
+        existing_settings[app_ids[setting.tethys_app_id]].append(setting)
+
+    for app in apps:
+        existing = existing_settings[app.package]
+        existing_names = {setting.name for setting in existing}
+        for method, models in _get_setting_categories():
+            setting_list = getattr(app, method)() or []
+            names = {setting.name for setting in setting_list}
+
+            for setting in setting_list:
+                # Don't add the same setting twice
+                if setting.name not in existing_names:
+                    existing_names.add(setting.name)
+                    plan.new_settings.append((app.package, setting))
+
+            for setting in existing:
+                # Do not remove dynamically created settings
+                if (
+                    isinstance(setting, models)
+                    and not getattr(setting, "dynamic", False)
+                    and setting.name not in names
+                ):
+                    plan.obsolete_settings.append(setting)
+
+    # Permissions
+    content_type = TethysApp.get_content_type()
+    definitions = {app.package: app.get_permission_definitions() for app in apps}
+    app_permissions = {}
+    app_groups = {}
+    for permissions, groups in definitions.values():
+        app_permissions.update(permissions)
+        app_groups.update(groups)
+
+    db_permissions = {
+        permission.codename: permission
+        for permission in Permission.objects.filter(
+            _prefix_filter("codename", prefixes), content_type=content_type
+        )
+    }
+
+    for codename, permission in db_permissions.items():
+        if codename not in app_permissions:
+            plan.obsolete_permissions.append(permission)
+        elif permission.name != app_permissions[codename]:
+            permission.name = app_permissions[codename]
+            plan.changed_permissions.append(permission)
+
+    for codename, name in app_permissions.items():
+        if codename not in db_permissions:
+            plan.new_permissions.append(
+                Permission(name=name, codename=codename, content_type=content_type)
+            )
+
+    # Groups
+    db_groups = {
+        group.name: group
+        for group in Group.objects.filter(_prefix_filter("name", prefixes))
+    }
+    plan.obsolete_groups = [
+        group for name, group in db_groups.items() if name not in app_groups
+    ]
+    plan.new_groups = [Group(name=name) for name in app_groups if name not in db_groups]
+
+    # Group object permissions, as (group name, permission codename, app package)
+    plan.group_permissions = {
+        (name, codename, group["app_package"])
+        for name, group in app_groups.items()
+        for codename in group["permissions"]
+    }
+
+    existing_group_permissions = {}
+    db_app_packages = {str(pk): package for pk, package in app_ids.items()}
+    if db_app_packages:
+        GroupObjectPermission = get_group_obj_perms_model()
+        for obj_perm in GroupObjectPermission.objects.filter(
+            content_type=content_type,
+            object_pk__in=list(db_app_packages),
+            group__in=list(db_groups.values()),
+        ).select_related("group", "permission"):
+            key = (
+                obj_perm.group.name,
+                obj_perm.permission.codename,
+                db_app_packages[obj_perm.object_pk],
+            )
+            existing_group_permissions[key] = obj_perm
+
+    plan.new_group_permissions = plan.group_permissions - set(
+        existing_group_permissions
+    )
+    plan.obsolete_group_permissions = [
+        obj_perm
+        for key, obj_perm in existing_group_permissions.items()
+        if key not in plan.group_permissions
+    ]
+
+    return plan
+
+
+def apply_apps_sync(plan):
+    """
+    Apply the changes of an AppSyncPlan in a single transaction, using bulk queries wherever possible.
+
+    Args:
+        plan (AppSyncPlan): the changes to apply.
+    """  # noqa: E501
+    from django.contrib.auth.models import Group, Permission
+    from guardian.utils import get_group_obj_perms_model
+    from tethys_apps.app_registry import app_registry
+    from tethys_apps.models import TethysApp, TethysAppSetting
+    from tethys_apps.settings_cache import app_settings_cache
+
+    if not plan:
+        return
+
+    with transaction.atomic():
+        # Apps
+        if plan.new_apps:
+            TethysApp.objects.bulk_create(plan.new_apps)
+
+        changed_fields = {f for fields in plan.changed_apps.values() for f in fields}
+        if changed_fields:
+            TethysApp.objects.bulk_update(plan.changed_apps, list(changed_fields))
+
+        packages = (
+            {app.package for app in plan.new_apps}
+            | {app.package for app in plan.changed_apps}
+            | {package for package, _ in plan.new_settings}
+            | {package for _, _, package in plan.new_group_permissions}
+        )
+        db_apps = {
+            db_app.package: db_app
+            for db_app in TethysApp.objects.filter(package__in=packages)
+        }
+
+        # Settings: multi-table inherited models cannot be bulk created
+        if plan.obsolete_settings:
+            TethysAppSetting.objects.filter(
+                pk__in=[setting.pk for setting in plan.obsolete_settings]
+            ).delete()
+
+        for package, setting in plan.new_settings:
+            setting.tethys_app = db_apps[package]
+            setting.save()
+
+        # Permissions
+        if plan.obsolete_permissions:
+            Permission.objects.filter(
+                pk__in=[p.pk for p in plan.obsolete_permissions]
+            ).delete()
+
+        if plan.changed_permissions:
+            Permission.objects.bulk_update(plan.changed_permissions, ["name"])
+
+        if plan.new_permissions:
+            Permission.objects.bulk_create(plan.new_permissions)
+
+        # Groups
+        if plan.obsolete_groups:
+            Group.objects.filter(pk__in=[g.pk for g in plan.obsolete_groups]).delete()
+
+        if plan.new_groups:
+            Group.objects.bulk_create(plan.new_groups)
+
+        # Group object permissions
+        GroupObjectPermission = get_group_obj_perms_model()
+        if plan.obsolete_group_permissions:
+            GroupObjectPermission.objects.filter(
+                pk__in=[p.pk for p in plan.obsolete_group_permissions]
+            ).delete()
+
+        if plan.new_group_permissions:
+            content_type = TethysApp.get_content_type()
+            groups = {
+                g.name: g
+                for g in Group.objects.filter(
+                    name__in={name for name, _, _ in plan.new_group_permissions}
+                )
+            }
+            permissions = {
+                p.codename: p
+                for p in Permission.objects.filter(
+                    content_type=content_type,
+                    codename__in={c for _, c, _ in plan.new_group_permissions},
+                )
+            }
+            GroupObjectPermission.objects.bulk_create(
+                [
+                    GroupObjectPermission(
+                        group=groups[name],
+                        permission=permissions[codename],
+                        content_type=content_type,
+                        object_pk=str(db_apps[package].pk),
+                    )
+                    for name, codename, package in sorted(plan.new_group_permissions)
+                ]
+            )
+
+    # Bulk queries do not send the signals that invalidate these caches
+    app_registry.invalidate()
+    app_settings_cache.invalidate()
+
+
+def sync_apps(apps):
+    """
+    Sync the installed apps, their settings, permissions and permission groups with the database in bulk. Nothing is written if the database is already in sync.
+
+    Args:
+        apps (list of TethysAppBase): instances of the installed apps.
+
+    Returns:
+        dict: number of changes of each kind (see ``AppSyncPlan.summary``).
+    """  # noqa: E501
+    plan = plan_apps_sync(apps)
+
+    if plan:
+        apply_apps_sync(plan)
+        tethys_log.debug(f"Synced apps with the database: {plan.summary()}")
+
+    return plan.summary()
@@ -10,8 +10,11 @@
 
 import sys
 from django.apps import AppConfig
+from django.conf import settings
 
 from tethys_apps.harvester import SingletonHarvester
+from tethys_apps.lazy_controllers import lazy_controllers_enabled, warm_up_apps
+from tethys_compute.tasks import register_background_task
 
 
 class TethysAppsConfig(AppConfig):
@@ -26,3 +29,9 @@ class TethysAppsConfig(AppConfig):
             # Perform App Harvesting (if database is not being migrated)
             harvester = SingletonHarvester()
             harvester.harvest()
+
+            # Import the controllers of chosen apps once the server is running
+            if lazy_controllers_enabled() and getattr(settings, "APP_WARMUP", None):
+                register_background_task(
+                    warm_up_apps, delay=getattr(settings, "APP_WARMUP_DELAY", 0)
+                )
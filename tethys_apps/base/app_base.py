@@ -5,6 +5,7 @@
 # * Copyright: (c) Brigham Young University 2013
 # * License: BSD 2-Clause
 # ********************************************************************************
+import copy
 import logging
 import traceback
 import uuid
@@ -34,6 +35,7 @@ from .paths import (
     get_user_media,
 )
 from ..exceptions import TethysAppSettingDoesNotExist, TethysAppSettingNotAssigned
+from ..settings_cache import app_settings_cache
 
 has_bokeh_django = True
 try:
@@ -63,6 +65,9 @@ class TethysBase(TethysBaseMixin):
         self._url_patterns = None
         self._handler_patterns = None
         self._registered_url_maps = None
+        # URL maps recorded in the app manifest, used to load the controllers lazily
+        self._lazy_url_maps = None
+        self._controllers = None
 
     @classproperty
     def package_namespace(cls):
@@ -289,33 +294,83 @@ class TethysBase(TethysBaseMixin):
 
         return self._registered_url_maps
 
+    def _build_url_patterns(self):
+        """
+        Import the controllers of the app and generate its url pattern lists.
+        """
+        url_patterns = {"http": dict(), "websocket": dict()}
+
+        for url_map in self.registered_url_maps:
+            namespace = self.url_namespace
+
+            if namespace not in url_patterns[url_map.protocol]:
+                url_patterns[url_map.protocol][namespace] = []
+
+            # Create django url object
+            controller_function = self._resolve_ref_function(
+                url_map.controller, "controller"
+            )
+            django_url = re_path(url_map.url, controller_function, name=url_map.name)
+
+            # Append to namespace list
+            url_patterns[url_map.protocol][namespace].append(django_url)
+
+        return url_patterns
+
+    def _build_lazy_url_patterns(self):
+        """
+        Generate the url pattern lists of the app from the URL maps recorded in the app manifest, with placeholders that import the controllers of the app on its first request.
+        """  # noqa: E501
+        from tethys_apps.lazy_controllers import LazyConsumer, LazyController
+
+        url_patterns = {"http": dict(), "websocket": dict()}
+        namespace = self.url_namespace
+
+        for url_map in self._lazy_url_maps:
+            protocol = url_map["protocol"]
+            placeholder = LazyConsumer if protocol == "websocket" else LazyController
+            url_patterns[protocol].setdefault(namespace, []).append(
+                re_path(
+                    url_map["url"],
+                    placeholder(self, url_map["name"]),
+                    name=url_map["name"],
+                )
+            )
+
+        return url_patterns
+
+    @property
+    def lazy(self):
+        """
+        True if the controllers of the app are only imported on its first request (see the APP_LAZY_CONTROLLERS setting).
+        """  # noqa: E501
+        from tethys_apps.lazy_controllers import lazy_controllers_enabled
+
+        return self._lazy_url_maps is not None and lazy_controllers_enabled()
+
     @property
     def url_patterns(self):
         """
         Generate the url pattern lists for  app and namespace them accordingly.
         """
         if self._url_patterns is None:
-            url_patterns = {"http": dict(), "websocket": dict()}
-
-            for url_map in self.registered_url_maps:
-                namespace = self.url_namespace
+            if self.lazy:
+                self._url_patterns = self._build_lazy_url_patterns()
+            else:
+                self._url_patterns = self._build_url_patterns()
 
-                if namespace not in url_patterns[url_map.protocol]:
-                    url_patterns[url_map.protocol][namespace] = []
+        return self._url_patterns
 
-                # Create django url object
-                controller_function = self._resolve_ref_function(
-                    url_map.controller, "controller"
-                )
-                django_url = re_path(
-                    url_map.url, controller_function, name=url_map.name
-                )
+    def load_controllers(self):
+        """
+        Import the controllers of the app if they have not been imported yet.
 
-                # Append to namespace list
-                url_patterns[url_map.protocol][namespace].append(django_url)
-            self._url_patterns = url_patterns
+        Returns:
+            dict: the controller (or consumer) of each url of the app keyed by url name.
+        """
+        from tethys_apps.lazy_controllers import load_controllers
 
-        return self._url_patterns
+        return load_controllers(self)
 
     @property
     def handler_patterns(self):
@@ -325,6 +380,11 @@ class TethysBase(TethysBaseMixin):
         if self._handler_patterns is None:
             handler_patterns = {"http": dict(), "websocket": dict()}
 
+            # Handlers are needed to build their url patterns, so only lazy apps without handlers skip importing them
+            if self.lazy and not any(m["handler"] for m in self._lazy_url_maps):
+                self._handler_patterns = handler_patterns
+                return self._handler_patterns
+
             for url_map in self.registered_url_maps:
                 if url_map.handler:
                     namespace = self.url_namespace
@@ -972,14 +1032,13 @@ class TethysAppBase(TethysBase):
         """
         return None
 
-    def register_app_permissions(self):
-        """
-        Register and sync the app permissions.
+    def get_permission_definitions(self):
         """
-        from guardian.shortcuts import assign_perm, remove_perm, get_perms
-        from django.contrib.auth.models import Permission, Group
-        from tethys_apps.models import TethysApp
+        Get the name-spaced permissions and permission groups defined by the app, including the default access_app permission.
 
+        Returns:
+            tuple(dict, dict): permission names keyed by permission codename (e.g. "my_first_app:view_things") and, keyed by group name, dictionaries with the codenames of the permissions of the group ("permissions") and the app package ("app_package").
+        """  # noqa: E501
         perms = self.permissions()
         # add default access_app permission
         app_permissions = {
@@ -1023,6 +1082,19 @@ class TethysAppBase(TethysBase):
                         "app_package": self.package,
                     }
 
+        return app_permissions, app_groups
+
+    def register_app_permissions(self):
+        """
+        Register and sync the app permissions.
+        """
+        from guardian.shortcuts import assign_perm, remove_perm, get_perms
+        from django.contrib.auth.models import Permission, Group
+        from tethys_apps.models import TethysApp
+
+        app_permissions, app_groups = self.get_permission_definitions()
+        perm_codename_prefix = self.package + ":"
+
         # Get the TethysApp content type
         tethys_content_type = TethysApp.get_content_type()
 
@@ -1254,14 +1326,8 @@ class TethysAppBase(TethysBase):
 
 
         """
-        from tethys_apps.models import TethysApp
-
-        app = cls()
-        db_app = TethysApp.objects.get(package=app.package)
-        scheduler_settings = db_app.scheduler_settings
-
         try:
-            scheduler_setting = scheduler_settings.get(name=name)
+            scheduler_setting = cls._get_app_setting("scheduler_settings", name)
             return scheduler_setting.get_value()
         except ObjectDoesNotExist:
             raise TethysAppSettingDoesNotExist("SchedulerSetting", name, cls.name)
@@ -1286,14 +1352,21 @@ class TethysAppBase(TethysBase):
             max_count = App.get_custom_setting('max_count')
 
         """
-        from tethys_apps.models import TethysApp
+        from tethys_apps.utilities import get_secrets_version
 
-        db_app = TethysApp.objects.get(package=cls.package)
+        def get_value():
+            return cls._get_app_setting(
+                "custom_settings", name, cache=False
+            ).get_value()
 
-        custom_settings = db_app.custom_settings
         try:
-            custom_setting = custom_settings.get(name=name)
-            return custom_setting.get_value()
+            # The unsigned value of secret settings depends on the salt strings in secrets.yml
+            value = app_settings_cache.get_or_set(
+                cls.package,
+                ("custom_settings", name, get_secrets_version()),
+                get_value,
+            )
+            return copy.deepcopy(value)
         except ObjectDoesNotExist:
             raise TethysAppSettingDoesNotExist("CustomTethysAppSetting", name, cls.name)
 
@@ -1397,15 +1470,11 @@ class TethysAppBase(TethysBase):
             ckan_engine = App.get_dataset_service('primary_ckan', as_engine=True)
 
         """
-        from tethys_apps.models import TethysApp
-
-        app = cls()
-        db_app = TethysApp.objects.get(package=app.package)
-        dataset_services_settings = db_app.dataset_services_settings
-
         try:
-            dataset_services_setting = dataset_services_settings.get(name=name)
-            dataset_services_setting.get_value(
+            dataset_services_setting = cls._get_app_setting(
+                "dataset_services_settings", name
+            )
+            return dataset_services_setting.get_value(
                 as_public_endpoint=as_public_endpoint,
                 as_endpoint=as_endpoint,
                 as_engine=as_engine,
@@ -1447,15 +1516,9 @@ class TethysAppBase(TethysBase):
 
 
         """
-        from tethys_apps.models import TethysApp
-
-        app = cls()
-        db_app = TethysApp.objects.get(package=app.package)
-        spatial_dataset_service_settings = db_app.spatial_dataset_service_settings
-
         try:
-            spatial_dataset_service_setting = spatial_dataset_service_settings.get(
-                name=name
+            spatial_dataset_service_setting = cls._get_app_setting(
+                "spatial_dataset_service_settings", name
             )
             return spatial_dataset_service_setting.get_value(
                 as_public_endpoint=as_public_endpoint,
@@ -1494,12 +1557,8 @@ class TethysAppBase(TethysBase):
             wps_engine = App.get_web_processing_service('primary_52n')
 
         """
-        from tethys_apps.models import TethysApp
-
-        db_app = TethysApp.objects.get(package=cls.package)
-        wps_services_settings = db_app.wps_services_settings
         try:
-            wps_service_setting = wps_services_settings.objects.get(name=name)
+            wps_service_setting = cls._get_app_setting("wps_services_settings", name)
             return wps_service_setting.get_value(
                 as_public_endpoint=as_public_endpoint,
                 as_endpoint=as_endpoint,
@@ -1536,15 +1595,12 @@ class TethysAppBase(TethysBase):
             session = SessionMaker()
 
         """
-        from tethys_apps.models import TethysApp
-
-        db_app = TethysApp.objects.get(package=cls.package)
-        ps_connection_settings = db_app.persistent_store_connection_settings
-
         try:
             # Return as_engine if the other two are False
             as_engine = not as_sessionmaker and not as_url
-            ps_connection_setting = ps_connection_settings.get(name=name)
+            ps_connection_setting = cls._get_app_setting(
+                "persistent_store_connection_settings", name
+            )
             return ps_connection_setting.get_value(
                 as_url=as_url, as_sessionmaker=as_sessionmaker, as_engine=as_engine
             )
@@ -1582,17 +1638,14 @@ class TethysAppBase(TethysBase):
             session = SessionMaker()
 
         """
-        from tethys_apps.models import TethysApp
-
-        db_app = TethysApp.objects.get(package=cls.package)
-        ps_database_settings = db_app.persistent_store_database_settings
-
         verified_name = name if not is_testing_environment() else get_test_db_name(name)
 
         try:
             # Return as_engine if the other two are False
             as_engine = not as_sessionmaker and not as_url
-            ps_database_setting = ps_database_settings.get(name=verified_name)
+            ps_database_setting = cls._get_app_setting(
+                "persistent_store_database_settings", verified_name
+            )
             return ps_database_setting.get_value(
                 with_db=True,
                 as_url=as_url,
@@ -1992,6 +2045,32 @@ class TethysAppBase(TethysBase):
             except Exception as e:
                 tethys_log.error(e)
 
+    @classmethod
+    def _get_app_setting(cls, settings_property, name, cache=True):
+        """
+        Get a setting of the app from the app settings cache, querying it on a cache miss.
+
+        Args:
+            settings_property (str): name of the TethysApp property with the settings of the type requested (e.g. "scheduler_settings").
+            name (str): name of the setting.
+            cache (bool): Use the app settings cache if True.
+
+        Raises:
+            ObjectDoesNotExist: if the app or the setting does not exist.
+        """  # noqa: E501
+        from tethys_apps.models import TethysApp
+
+        def get_setting():
+            db_app = TethysApp.objects.get(package=cls.package)
+            return getattr(db_app, settings_property).get(name=name)
+
+        if not cache:
+            return get_setting()
+
+        return app_settings_cache.get_or_set(
+            cls.package, (settings_property, name), get_setting
+        )
+
     @classmethod
     def _log_tethys_app_setting_not_assigned_error(cls, setting_type, setting_name):
         """
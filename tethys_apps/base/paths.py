@@ -20,6 +20,7 @@ from django.utils.functional import SimpleLazyObject
 
 from tethys_quotas.utilities import passes_quota, _get_storage_units
 
+from .usage_index import scan_item, usage_index
 from .workspace import (
     get_app_workspace_old,
     get_user_workspace_old,
@@ -150,17 +151,26 @@ class TethysPath:
             exclude = list()
 
         files = self.files()
+        removed_size = removed_files = 0
 
         if not exclude_files:
             for file in files:
                 if file not in exclude and file.name not in exclude:
+                    size, count = scan_item(file)
                     file.unlink()
+                    removed_size += size
+                    removed_files += count
 
         if not exclude_directories:
             directories = self.directories()
             for directory in directories:
                 if directory not in exclude and directory.name not in exclude:
+                    size, count = scan_item(directory)
                     shutil.rmtree(directory)
+                    removed_size += size
+                    removed_files += count
+
+        _update_usage(self.path, -removed_size, -removed_files)
 
     def remove(self, item):
         """
@@ -191,24 +201,30 @@ class TethysPath:
         # ensure item is a subpath of self.path (raises ValueError if not)
         item.relative_to(self.path)
 
+        size, count = scan_item(item)
+
         if item.is_dir():
             shutil.rmtree(item)
         elif item.is_file():
             item.unlink()
+        else:
+            return
+
+        _update_usage(item.parent, -size, -count)
 
     def get_size(self, units="b"):
         """
-        Get the size on disk of the TethysPath directory.
+        Get the size on disk of the TethysPath directory, including all of its subdirectories.
+
+        Sizes are read from a disk usage index that is updated as items are removed through this TethysPath and is reconciled with a full scan of the directory when older than the ``TETHYS_PATH_USAGE_MAX_AGE`` setting.
 
         Args:
             units (str): Disk size units. One of "byte", "bytes", "KB", "MB", "GB", "TB", or "PB". Defaults to "b" (bytes).
 
         Returns:
             float: size on disk of TethysPath directory.
-        """
-        total_size = 0
-        for file in self.files():
-            total_size += file.stat().st_size
+        """  # noqa: E501
+        total_size = usage_index.get(self.path)["size"]
 
         if units.lower() == "b":
             conversion_factor = 1
@@ -221,6 +237,16 @@ class TethysPath:
         return total_size / conversion_factor
 
 
+def _update_usage(path, size_delta, files_delta):
+    """
+    Update the disk usage index and the materialized storage usage (see ``StorageUsage``) after items were removed from a directory.
+    """  # noqa: E501
+    from tethys_quotas.storage import adjust_storage_usage
+
+    usage_index.adjust(path, size_delta, files_delta)
+    adjust_storage_usage(path, size_delta, files_delta)
+
+
 def _resolve_app_class(app_or_request, bypass_quota=False):
     """
     Returns an app class
@@ -304,6 +330,20 @@ def _get_app_workspace_root(app):
     return Path(settings.TETHYS_WORKSPACES_ROOT) / app.package
 
 
+def _get_app_workspace_path(app):
+    """
+    Gets the path to the app workspace directory without creating it.
+    """
+    return _get_app_workspace_root(app) / "app_workspace"
+
+
+def _get_user_workspace_path(app, username):
+    """
+    Gets the path to a user workspace directory without creating it.
+    """
+    return _get_app_workspace_root(app) / "user_workspaces" / username
+
+
 def _get_app_workspace(app_or_request, bypass_quota=False) -> TethysPath:
     """
 
@@ -319,7 +359,7 @@ def _get_app_workspace(app_or_request, bypass_quota=False) -> TethysPath:
 
     """
     app = _resolve_app_class(app_or_request, bypass_quota=bypass_quota)
-    return TethysPath(_get_app_workspace_root(app) / "app_workspace")
+    return TethysPath(_get_app_workspace_path(app))
 
 
 def get_app_workspace(app_or_request) -> TethysPath:
@@ -358,7 +398,7 @@ def _get_user_workspace(app_or_request, user_or_request, bypass_quota=False):
     """
     app = _resolve_app_class(app_or_request)
     username = _resolve_username(user_or_request, bypass_quota=bypass_quota)
-    return TethysPath(_get_app_workspace_root(app) / "user_workspaces" / username)
+    return TethysPath(_get_user_workspace_path(app, username))
 
 
 def get_user_workspace(
@@ -401,6 +441,20 @@ def _get_app_media_root(app):
     return Path(settings.MEDIA_ROOT) / app.package
 
 
+def _get_app_media_path(app):
+    """
+    Gets the path to the app media directory without creating it.
+    """
+    return _get_app_media_root(app) / "app"
+
+
+def _get_user_media_path(app, username):
+    """
+    Gets the path to a user media directory without creating it.
+    """
+    return _get_app_media_root(app) / "user" / username
+
+
 def _get_app_media(app_or_request, bypass_quota=False):
     """
 
@@ -417,7 +471,7 @@ def _get_app_media(app_or_request, bypass_quota=False):
 
     """
     app = _resolve_app_class(app_or_request, bypass_quota=bypass_quota)
-    return TethysPath(_get_app_media_root(app) / "app")
+    return TethysPath(_get_app_media_path(app))
 
 
 def get_app_media(app_or_request):
@@ -456,7 +510,7 @@ def _get_user_media(app_or_request, username_or_request, bypass_quota=False):
     """
     app = _resolve_app_class(app_or_request)
     username = _resolve_username(username_or_request, bypass_quota=bypass_quota)
-    return TethysPath(_get_app_media_root(app) / "user" / username)
+    return TethysPath(_get_user_media_path(app, username))
 
 
 def get_user_media(app_or_request, username_or_request):
@@ -28,7 +28,13 @@ class TethysTestCase(TestCase):
         self.set_up()
 
     def tearDown(self):
+        from tethys_apps.app_registry import app_registry
+        from tethys_apps.settings_cache import app_settings_cache
+
         self.tear_down()
+        # The database is rolled back after each test without sending any signals
+        app_registry.invalidate()
+        app_settings_cache.invalidate()
         logging.disable(logging.NOTSET)
 
     def set_up(self):
@@ -0,0 +1,364 @@
+"""
+********************************************************************************
+* Name: usage_index.py
+* Author: Tethys Platform Developers
+* Created On: October 2026
+* Copyright: (c) Tethys Geospatial Foundation 2026
+* License: BSD 2-Clause
+********************************************************************************
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from django.conf import settings
+from django.core.cache import caches
+
+log = logging.getLogger(f"tethys.{__name__}")
+
+CACHE_KEY_PREFIX = "tethys_apps:usage"
+ENTRY_FIELDS = ("size", "files", "scanned")
+
+
+def scan_directory(path):
+    """
+    Recursively compute the size on disk of a directory using os.scandir.
+
+    Symbolic links to directories are not followed to avoid cycles. Entries that disappear or cannot be read while scanning are skipped.
+
+    Args:
+        path (str or Path): The directory to scan.
+
+    Returns:
+        tuple(int, int): total size in bytes and number of files.
+    """  # noqa: E501
+    total_size = 0
+    file_count = 0
+    pending = [str(path)]
+
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file():
+                            total_size += entry.stat().st_size
+                            file_count += 1
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+    return total_size, file_count
+
+
+def scan_item(path):
+    """
+    Compute the size on disk of a file or directory.
+
+    Args:
+        path (Path): The file or directory to scan.
+
+    Returns:
+        tuple(int, int): total size in bytes and number of files.
+    """
+    try:
+        if path.is_dir() and not path.is_symlink():
+            return scan_directory(path)
+        if path.is_file():
+            return path.stat().st_size, 1
+    except OSError:
+        pass
+    return 0, 0
+
+
+def _cache_keys(path):
+    """
+    Get the keys of the fields of the entry of a directory in the shared cache backend.
+    """  # noqa: E501
+    digest = hashlib.sha1(str(path).encode()).hexdigest()
+    return {field: f"{CACHE_KEY_PREFIX}:{digest}:{field}" for field in ENTRY_FIELDS}
+
+
+class DiskUsageIndex:
+    """
+    Process-wide index of recursive directory sizes.
+
+    Entries are created by a full os.scandir scan the first time a directory is requested and are then adjusted incrementally as files are removed through the TethysPath API. Because apps may write to their directories without going through TethysPath, entries older than ``TETHYS_PATH_USAGE_MAX_AGE`` seconds are reconciled with a fresh scan on the next read.
+
+    Nothing is written to the indexed directories. If ``TETHYS_PATH_USAGE_CACHE_ALIAS`` names a Django cache backend, entries are also stored in it so that they are shared between worker processes, and incremental updates are applied with atomic increments of the backend.
+    """  # noqa: E501
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _max_age():
+        return getattr(settings, "TETHYS_PATH_USAGE_MAX_AGE", 300)
+
+    @property
+    def backend(self):
+        alias = getattr(settings, "TETHYS_PATH_USAGE_CACHE_ALIAS", None)
+        return caches[alias] if alias else None
+
+    def _read_shared(self, paths):
+        """
+        Get the entries of the given directories. The shared backend, if any, is authoritative: directories it has no entry for (e.g. because another process invalidated them) are scanned again. The entries of this process are only used if there is no backend or it cannot be read.
+
+        Returns:
+            dict: entry or None keyed by path.
+        """  # noqa: E501
+        found = {path: self._entries.get(str(path)) for path in paths}
+        backend = self.backend
+        if backend is None:
+            return found
+
+        keys = {path: _cache_keys(path) for path in paths}
+        try:
+            values = backend.get_many(
+                [key for path_keys in keys.values() for key in path_keys.values()]
+            )
+        except Exception as e:
+            log.debug(f"Unable to read the shared disk usage index: {e}")
+            return found
+
+        for path, path_keys in keys.items():
+            found[path] = None
+            if not all(key in values for key in path_keys.values()):
+                self._entries.pop(str(path), None)
+                continue
+            try:
+                entry = {
+                    "size": max(int(values[path_keys["size"]]), 0),
+                    "files": max(int(values[path_keys["files"]]), 0),
+                    "scanned": float(values[path_keys["scanned"]]),
+                }
+            except (TypeError, ValueError):
+                log.debug(f"Ignoring invalid shared disk usage entry of {path}")
+                continue
+            self._entries[str(path)] = entry
+            found[path] = entry
+
+        return found
+
+    def _write_shared(self, path, entry):
+        backend = self.backend
+        if backend is None:
+            return
+
+        keys = _cache_keys(path)
+        try:
+            backend.set_many(
+                {keys[field]: entry[field] for field in ENTRY_FIELDS}, timeout=None
+            )
+        except Exception as e:
+            log.debug(f"Unable to write the shared disk usage index: {e}")
+
+    def _adjust_shared(self, path, size_delta, files_delta):
+        backend = self.backend
+        if backend is None:
+            return
+
+        keys = _cache_keys(path)
+        for field, delta in (("size", size_delta), ("files", files_delta)):
+            if not delta:
+                continue
+            try:
+                backend.incr(keys[field], delta)
+            except ValueError:
+                # The entry was dropped from the backend, so it is scanned on the next read
+                pass
+            except Exception as e:
+                log.debug(f"Unable to update the shared disk usage index: {e}")
+
+    def _delete_shared(self, paths):
+        backend = self.backend
+        if backend is None or not paths:
+            return
+
+        try:
+            backend.delete_many(
+                [key for path in paths for key in _cache_keys(path).values()]
+            )
+        except Exception as e:
+            log.warning(f"Unable to invalidate the shared disk usage index: {e}")
+
+    def get(self, path, max_age=None):
+        """
+        Get the usage entry for a directory, scanning it if it is not indexed or the entry is stale.
+
+        Args:
+            path (Path): Resolved path to the directory.
+            max_age (int): Maximum age in seconds of an entry before it is reconciled. Defaults to the ``TETHYS_PATH_USAGE_MAX_AGE`` setting.
+
+        Returns:
+            dict: with keys "size" (bytes), "files" (count) and "scanned" (timestamp of last full scan).
+        """  # noqa: E501
+        path = Path(path)
+        max_age = self._max_age() if max_age is None else max_age
+
+        with self._lock:
+            entry = self._read_shared([path])[path]
+            if entry is not None and time.time() - entry["scanned"] <= max_age:
+                return dict(entry)
+
+        # Scan outside of the lock so other directories can be read and scanned concurrently
+        return self.rescan(path)
+
+    def get_sizes(self, paths, max_workers=None):
+        """
+        Get the sizes of several directories at once, scanning any that are not indexed in a thread pool.
+
+        This method is read-only: directories that do not exist are reported with a size of 0 and are neither created nor indexed.
+
+        Args:
+            paths (iterable of Path): Resolved paths to the directories.
+            max_workers (int): Maximum number of threads used to scan directories. Defaults to the ThreadPoolExecutor default.
+
+        Returns:
+            dict: size in bytes keyed by path.
+        """  # noqa: E501
+        entries = self.get_many(paths, max_workers=max_workers)
+        return {path: entry["size"] for path, entry in entries.items()}
+
+    def get_many(self, paths, max_workers=None, max_age=None):
+        """
+        Get the usage entries of several directories at once, scanning any that are not indexed or are stale in a thread pool.
+
+        Directories that do not exist are reported with a size and file count of 0 and are neither created nor indexed.
+
+        Args:
+            paths (iterable of Path): Resolved paths to the directories.
+            max_workers (int): Maximum number of threads used to scan directories. Defaults to the ThreadPoolExecutor default.
+            max_age (int): Maximum age in seconds of an entry before it is reconciled. Use 0 to rescan every directory. Defaults to the ``TETHYS_PATH_USAGE_MAX_AGE`` setting.
+
+        Returns:
+            dict: usage entry (see ``get``) keyed by path.
+        """  # noqa: E501
+        resolved = {path: Path(path).resolve() for path in paths}
+        existing = list(dict.fromkeys(p for p in resolved.values() if p.is_dir()))
+        found = {}
+
+        def get(path):
+            return self.get(path, max_age=max_age)
+
+        if len(existing) == 1:
+            found[existing[0]] = get(existing[0])
+        elif existing:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                found = dict(zip(existing, executor.map(get, existing)))
+
+        empty = {"size": 0, "files": 0, "scanned": None}
+        return {
+            path: dict(found.get(real_path, empty))
+            for path, real_path in resolved.items()
+        }
+
+    def rescan(self, path):
+        """
+        Scan a directory and replace its entry in the index.
+
+        Args:
+            path (Path): Resolved path to the directory.
+
+        Returns:
+            dict: the new usage entry.
+        """
+        path = Path(path)
+        size, files = scan_directory(path)
+        entry = {"size": size, "files": files, "scanned": time.time()}
+
+        with self._lock:
+            self._entries[str(path)] = entry
+            self._write_shared(path, entry)
+
+        return dict(entry)
+
+    def adjust(self, path, size_delta, files_delta=0):
+        """
+        Incrementally update the entries of a directory and all of its indexed ancestors.
+
+        Args:
+            path (Path): Resolved path to the directory that changed.
+            size_delta (int): Change in size in bytes.
+            files_delta (int): Change in number of files.
+        """  # noqa: E501
+        path = Path(path)
+        if not size_delta and not files_delta:
+            return
+
+        directories = [path, *path.parents]
+        with self._lock:
+            entries = self._read_shared(directories)
+            for directory in directories:
+                entry = entries[directory]
+                if entry is None:
+                    continue
+                entry["size"] = max(entry["size"] + size_delta, 0)
+                entry["files"] = max(entry["files"] + files_delta, 0)
+                self._adjust_shared(directory, size_delta, files_delta)
+
+    def invalidate(self, path=None):
+        """
+        Remove the entry for a directory (and all directories beneath it) so the next read rescans it.
+
+        Args:
+            path (Path): Resolved path to the directory. Invalidates the whole index if None.
+        """  # noqa: E501
+        with self._lock:
+            if path is None:
+                keys = list(self._entries)
+            else:
+                path = Path(path)
+                keys = [
+                    key
+                    for key in self._entries
+                    if key == str(path) or path in Path(key).parents
+                ]
+
+            for key in keys:
+                del self._entries[key]
+
+        paths = {Path(key) for key in keys}
+        if path is not None:
+            paths.add(path)
+        self._delete_shared(paths)
+
+    def reconcile(self, max_age=0):
+        """
+        Rescan every indexed directory whose entry is older than max_age seconds. Intended to be run periodically.
+
+        Args:
+            max_age (int): Only rescan entries older than this many seconds. Defaults to 0 (rescan all).
+
+        Returns:
+            int: number of directories that were rescanned.
+        """  # noqa: E501
+        with self._lock:
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if time.time() - entry["scanned"] >= max_age
+            ]
+
+        count = 0
+        for key in stale:
+            path = Path(key)
+            if path.is_dir():
+                self.rescan(path)
+                count += 1
+            else:
+                self.invalidate(path)
+        return count
+
+
+usage_index = DiskUsageIndex()
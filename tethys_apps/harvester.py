@@ -8,14 +8,18 @@
 ********************************************************************************
 """
 
+import importlib
 import inspect
 import logging
 import pkgutil
 from sqlite3 import ProgrammingError as SqliteProgrammingError
 from django.db.utils import ProgrammingError
 from django.core.exceptions import ObjectDoesNotExist
+from tethys_apps.app_sync import sync_apps
 from tethys_apps.base import TethysAppBase, TethysExtensionBase
 from tethys_apps.base.testing.environment import is_testing_environment
+from tethys_apps.manifest import app_manifest, get_app_fingerprint
+from tethys_apps.startup_profiler import startup_profiler
 
 tethys_log = logging.getLogger("tethys." + __name__)
 
@@ -36,12 +40,19 @@ class SingletonHarvester:
     FAIL = "\033[91m"
     ENDC = "\033[0m"
 
-    def harvest(self):
+    def harvest(self, rebuild=False):
         """
         Harvest apps and extensions.
-        """
-        self.harvest_extensions()
-        self.harvest_apps()
+
+        Args:
+            rebuild(bool): Fully harvest all apps and rebuild the app manifest, ignoring its cached entries.
+        """  # noqa: E501
+        startup_profiler.reset()
+        with startup_profiler.measure("harvest_extensions"):
+            self.harvest_extensions()
+        with startup_profiler.measure("harvest_apps"):
+            self.harvest_apps(rebuild=rebuild)
+        startup_profiler.write()
 
     def harvest_extensions(self):
         """
@@ -61,10 +72,13 @@ class SingletonHarvester:
         except Exception:
             """DO NOTHING"""
 
-    def harvest_apps(self):
+    def harvest_apps(self, rebuild=False):
         """
         Searches the apps package for apps
-        """
+
+        Args:
+            rebuild(bool): Fully harvest all apps and rebuild the app manifest, ignoring its cached entries.
+        """  # noqa: E501
         # Notify user harvesting is taking place
 
         try:
@@ -79,7 +93,7 @@ class SingletonHarvester:
                     tethys_apps[modname] = "tethysapp.{}".format(modname)
 
             # Harvest App Instances
-            self._harvest_app_instances(tethys_apps)
+            self._harvest_app_instances(tethys_apps, rebuild=rebuild)
 
         except Exception:
             """DO NOTHING"""
@@ -96,10 +110,18 @@ class SingletonHarvester:
             apps = [app for app in apps if app.url_namespace in url_namespaces]
 
         for app in apps:
-            app_url_patterns.update(app.url_patterns["http"])
-
-        for app in apps:
-            ws_url_patterns.update(app.url_patterns["websocket"])
+            try:
+                with startup_profiler.measure("url_patterns", app=app.package):
+                    url_patterns = app.url_patterns
+            except Exception:
+                # Apps loaded from the app manifest load their controllers here
+                tethys_log.exception(
+                    f"Unable to load the urls of app {app.package}. "
+                    f"Its urls will not be registered:"
+                )
+                continue
+            app_url_patterns.update(url_patterns["http"])
+            ws_url_patterns.update(url_patterns["websocket"])
 
         for extension in self.extensions:
             ext_url_patterns.update(extension.url_patterns["http"])
@@ -123,10 +145,17 @@ class SingletonHarvester:
             apps = [app for app in apps if app.url_namespace in url_namespaces]
 
         for app in apps:
-            http_handler_patterns.update(app.handler_patterns["http"])
-
-        for app in apps:
-            ws_handler_patterns.update(app.handler_patterns["websocket"])
+            try:
+                with startup_profiler.measure("handler_patterns", app=app.package):
+                    handler_patterns = app.handler_patterns
+            except Exception:
+                tethys_log.exception(
+                    f"Unable to load the handlers of app {app.package}. "
+                    f"Its handlers will not be registered:"
+                )
+                continue
+            http_handler_patterns.update(handler_patterns["http"])
+            ws_handler_patterns.update(handler_patterns["websocket"])
 
         handler_patterns = {
             "http_handler_patterns": http_handler_patterns,
@@ -190,7 +219,8 @@ class SingletonHarvester:
         for extension_name, extension_package in extension_packages.items():
             try:
                 # Import the "ext" module from the extension package
-                ext_module = __import__(extension_package + ".ext", fromlist=[""])
+                with startup_profiler.measure("import", extension=extension_name):
+                    ext_module = __import__(extension_package + ".ext", fromlist=[""])
 
                 # Retrieve the members of the ext_module and iterate through
                 # them to find the the class that inherits from TethysExtensionBase.
@@ -210,7 +240,10 @@ class SingletonHarvester:
                             )
 
                             # sync app with Tethys db
-                            ext_instance.sync_with_tethys_db()
+                            with startup_profiler.measure(
+                                "sync_with_tethys_db", extension=extension_name
+                            ):
+                                ext_instance.sync_with_tethys_db()
 
                             # compile valid apps
                             if validated_ext_instance:
@@ -249,14 +282,110 @@ class SingletonHarvester:
                 + "\n"
             )
 
-    def _harvest_app_instances(self, app_packages_list):
+    @staticmethod
+    def _get_cached_apps(app_packages_list):
         """
-        Search each app package for the app.py module. Find the AppBase class in the app.py
-        module and instantiate it. Save the list of instantiated AppBase classes.
+        Get the app manifest entries that are still valid for the given apps.
+
+        Returns:
+            tuple(dict, dict): valid manifest entries and source fingerprints keyed by app name.
+        """  # noqa: E501
+        from tethys_apps.models import TethysApp
+
+        fingerprints = {}
+        for app_name, app_package in app_packages_list.items():
+            try:
+                fingerprints[app_name] = get_app_fingerprint(app_package)
+            except (ImportError, OSError):
+                continue
+
+        entries = app_manifest.load()
+        cached = {
+            app_name: entries[app_name]
+            for app_name, fingerprint in fingerprints.items()
+            if app_manifest.matches(entries.get(app_name), fingerprint)
+        }
+
+        if cached:
+            # Apps missing from the database (e.g. after it was reset) must be synced
+            try:
+                registered = set(
+                    TethysApp.objects.filter(package__in=list(cached)).values_list(
+                        "package", flat=True
+                    )
+                )
+            except Exception:
+                registered = set()
+            cached = {
+                app_name: entry
+                for app_name, entry in cached.items()
+                if app_name in registered
+            }
+
+        return cached, fingerprints
+
+    def _load_cached_app(self, entry):
+        """
+        Import the app class recorded in a manifest entry and instantiate it without syncing it with the database or loading its controllers.
+        """  # noqa: E501
+        app_module = importlib.import_module(entry["module"])
+        AppClass = getattr(app_module, entry["class"])
+
+        if not (
+            inspect.isclass(AppClass)
+            and issubclass(AppClass, TethysAppBase)
+            and AppClass is not TethysAppBase
+        ):
+            raise TypeError(f"{entry['module']}.{entry['class']} is not a Tethys app.")
+
+        app_instance = AppClass()
+        # Lets the app load its controllers lazily (see APP_LAZY_CONTROLLERS)
+        app_instance._lazy_url_maps = entry.get("url_maps")
+        return self._validate_app(app_instance)
+
+    @staticmethod
+    def _sync_apps(apps):
+        """
+        Sync the harvested apps, their settings and their permissions with the database in bulk.
+        """  # noqa: E501
+        try:
+            sync_apps(apps)
+        except ProgrammingError:
+            tethys_log.warning(
+                "Unable to sync apps with database. tethys_apps_tethysapp or "
+                "django_content_type table does not exist"
+            )
+        except SqliteProgrammingError:
+            tethys_log.warning(
+                "Unable to sync apps with database. tethys_apps_tethysapp or "
+                "django_content_type table does not exist in sqlite3"
+            )
+        except ObjectDoesNotExist as e:
+            tethys_log.warning(e)
+        except Exception as e:
+            tethys_log.error(e)
+
+    def _harvest_app_instances(self, app_packages_list, rebuild=False):
         """
+        Search each app package for the app.py module. Find the AppBase class in the app.py
+        module and instantiate it. Save the list of instantiated AppBase classes. The harvested apps
+        are synced with the database together once all of them are loaded.
+
+        If the app manifest is enabled, apps whose manifest entry is still valid are loaded from the class recorded in the manifest without being synced with the database. The manifest entries of the other apps are rebuilt.
+        """  # noqa: E501
         valid_app_instance_list = []
         valid_app_modules = {}
         loaded_apps = []
+
+        use_manifest = rebuild or app_manifest.enabled
+        cached_apps, fingerprints = {}, {}
+        manifest_entries = {}
+        harvested_apps = []
+        if use_manifest:
+            cached_apps, fingerprints = self._get_cached_apps(app_packages_list)
+            if rebuild:
+                cached_apps = {}
+
         for app_name, app_package in app_packages_list.items():
             # Skip these things
             if app_package in [
@@ -267,11 +396,28 @@ class SingletonHarvester:
             ]:
                 continue
 
+            if app_name in cached_apps:
+                try:
+                    with startup_profiler.measure("import", app=app_name):
+                        app_instance = self._load_cached_app(cached_apps[app_name])
+                except Exception:
+                    tethys_log.warning(
+                        f"Unable to load app {app_package} from the app manifest. "
+                        f"Harvesting it again."
+                    )
+                else:
+                    if app_instance:
+                        valid_app_modules[app_name] = app_package
+                        valid_app_instance_list.append(app_instance)
+                        loaded_apps.append(app_name)
+                    continue
+
             try:
                 # Import the app.py module from the custom app package programmatically
                 # (e.g.: apps.apps.<custom_package>.app)
 
-                app_module = __import__(app_package + ".app", fromlist=[""])
+                with startup_profiler.measure("import", app=app_name):
+                    app_module = __import__(app_package + ".app", fromlist=[""])
 
                 for name, obj in inspect.getmembers(app_module):
                     # Retrieve the members of the app_module and iterate through
@@ -288,12 +434,12 @@ class SingletonHarvester:
                             app_instance = AppClass()
                             validated_app_instance = self._validate_app(app_instance)
 
-                            # sync app with Tethys db
-                            app_instance.sync_with_tethys_db()
-
                             # load/validate app url patterns
                             try:
-                                app_instance.url_patterns
+                                with startup_profiler.measure(
+                                    "url_patterns", app=app_name
+                                ):
+                                    app_instance.url_patterns
                             except Exception:
                                 tethys_log.exception(
                                     "App {0} not loaded because of an issue with loading urls:".format(
@@ -305,7 +451,10 @@ class SingletonHarvester:
 
                             # load/validate app handler patterns
                             try:
-                                app_instance.handler_patterns
+                                with startup_profiler.measure(
+                                    "handler_patterns", app=app_name
+                                ):
+                                    app_instance.handler_patterns
                             except Exception:
                                 tethys_log.exception(
                                     "App {0} not loaded because of an issue with loading handlers:".format(
@@ -315,26 +464,21 @@ class SingletonHarvester:
                                 app_instance.remove_from_db()
                                 continue
 
-                            # register app permissions
-                            try:
-                                app_instance.register_app_permissions()
-                            except ProgrammingError:
-                                tethys_log.warning(
-                                    "Unable to register app permissions. django_content_type "
-                                    "table does not exist"
-                                )
-                            except SqliteProgrammingError:
-                                tethys_log.warning(
-                                    "Unable to register app permissions. django_content_type "
-                                    "table does not exist in sqlite3"
-                                )
-                            except ObjectDoesNotExist as e:
-                                tethys_log.warning(e)
-
                             # compile valid apps
                             if validated_app_instance:
                                 valid_app_modules[app_name] = app_package
                                 valid_app_instance_list.append(validated_app_instance)
+                                harvested_apps.append(validated_app_instance)
+
+                                if use_manifest and app_name in fingerprints:
+                                    manifest_entries[app_name] = (
+                                        app_manifest.make_entry(
+                                            app_package,
+                                            AppClass,
+                                            app_instance,
+                                            fingerprints[app_name],
+                                        )
+                                    )
 
                                 # Notify user that the app has been loaded
                                 loaded_apps.append(app_name)
@@ -352,10 +496,17 @@ class SingletonHarvester:
                 )
                 continue
 
+        # sync apps, their settings and their permissions with Tethys db
+        with startup_profiler.measure("sync_apps"):
+            self._sync_apps(harvested_apps)
+
         # Save valid apps
         self.apps = valid_app_instance_list
         self.app_modules = valid_app_modules
 
+        if use_manifest:
+            app_manifest.update(manifest_entries, installed=valid_app_modules)
+
         # Update user
         if not is_testing_environment():
             print(
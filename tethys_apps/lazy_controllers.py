@@ -0,0 +1,163 @@
+"""
+********************************************************************************
+* Name: lazy_controllers.py
+* Author: Tethys Platform Developers
+* Created On: October 2026
+* Copyright: (c) Tethys Geospatial Foundation 2026
+* License: BSD 2-Clause
+********************************************************************************
+"""
+
+import asyncio
+import logging
+import threading
+
+from asgiref.sync import async_to_sync, sync_to_async
+from django.conf import settings
+from django.http import Http404
+
+tethys_log = logging.getLogger("tethys." + __name__)
+
+# Registering controllers is not thread-safe, so apps load their controllers one at a time
+_load_lock = threading.RLock()
+
+CSRF_MIDDLEWARE = "django.middleware.csrf.CsrfViewMiddleware"
+
+
+def lazy_controllers_enabled():
+    """
+    Whether the URLs of apps loaded from the app manifest are served by placeholders that import the controllers of the app on its first request (see the APP_LAZY_CONTROLLERS setting).
+    """  # noqa: E501
+    return bool(getattr(settings, "APP_LAZY_CONTROLLERS", False))
+
+
+def load_controllers(app):
+    """
+    Import the controllers of an app and get them by url name. The controllers are only imported once per process.
+
+    Args:
+        app (TethysBase): the app.
+
+    Returns:
+        dict: the controller (or consumer) of each url of the app keyed by url name.
+    """  # noqa: E501
+    if app._controllers is None:
+        with _load_lock:
+            if app._controllers is None:
+                url_patterns = app._build_url_patterns()
+                app._controllers = {
+                    pattern.name: pattern.callback
+                    for patterns in url_patterns.values()
+                    for namespace_patterns in patterns.values()
+                    for pattern in namespace_patterns
+                }
+                tethys_log.info(f"Loaded the controllers of app {app.package}.")
+
+    return app._controllers
+
+
+class LazyController:
+    """
+    Placeholder view for an http url of an app that imports the controllers of the app on the first request and dispatches to the real controller.
+    """  # noqa: E501
+
+    # The CSRF check is done with the real controller (see __call__)
+    csrf_exempt = True
+
+    def __init__(self, app, url_name):
+        self.app = app
+        self.url_name = url_name
+        self.__name__ = self.__qualname__ = url_name
+
+    def __repr__(self):
+        return f"<LazyController: {self.app.package}:{self.url_name}>"
+
+    def resolve(self):
+        controllers = load_controllers(self.app)
+        try:
+            return controllers[self.url_name]
+        except KeyError:
+            tethys_log.error(
+                f'The app {self.app.package} has no controller named "{self.url_name}". '
+                f'Run "tethys manifest --rebuild" to rebuild the app manifest.'
+            )
+            raise Http404
+
+    def __call__(self, request, *args, **kwargs):
+        controller = self.resolve()
+
+        if CSRF_MIDDLEWARE in settings.MIDDLEWARE and not getattr(
+            controller, "csrf_exempt", False
+        ):
+            from django.middleware.csrf import CsrfViewMiddleware
+
+            response = CsrfViewMiddleware(lambda r: None).process_view(
+                request, controller, args, kwargs
+            )
+            if response is not None:
+                return response
+
+        if asyncio.iscoroutinefunction(controller):
+            return async_to_sync(controller)(request, *args, **kwargs)
+
+        return controller(request, *args, **kwargs)
+
+
+class LazyConsumer:
+    """
+    Placeholder ASGI application for a websocket url of an app that imports the controllers of the app on the first connection and dispatches to the real consumer.
+    """  # noqa: E501
+
+    def __init__(self, app, url_name):
+        self.app = app
+        self.url_name = url_name
+
+    def __repr__(self):
+        return f"<LazyConsumer: {self.app.package}:{self.url_name}>"
+
+    async def __call__(self, scope, receive, send):
+        controllers = await sync_to_async(load_controllers)(self.app)
+        try:
+            consumer = controllers[self.url_name]
+        except KeyError:
+            raise ValueError(
+                f'The app {self.app.package} has no consumer named "{self.url_name}".'
+            )
+
+        return await consumer(scope, receive, send)
+
+
+def get_warmup_apps(apps):
+    """
+    Get the apps listed in the APP_WARMUP setting. "*" selects all apps.
+    """
+    warmup = getattr(settings, "APP_WARMUP", None) or []
+    if isinstance(warmup, str):
+        warmup = [warmup]
+
+    return [app for app in apps if "*" in warmup or app.package in warmup]
+
+
+def _warm_up(apps):
+    for app in apps:
+        try:
+            load_controllers(app)
+        except Exception:
+            tethys_log.exception(f"Unable to warm up app {app.package}:")
+
+
+async def warm_up_apps(apps=None):
+    """
+    Import the controllers of the apps listed in the APP_WARMUP setting in a background thread, so that their first requests do not wait for them.
+
+    Args:
+        apps (list of TethysAppBase): the apps to choose from. Defaults to the harvested apps.
+    """  # noqa: E501
+    if apps is None:
+        from tethys_apps.harvester import SingletonHarvester
+
+        apps = SingletonHarvester().apps
+
+    apps = [app for app in get_warmup_apps(apps) if app._controllers is None]
+    if apps:
+        await asyncio.to_thread(_warm_up, apps)
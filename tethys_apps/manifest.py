@@ -0,0 +1,250 @@
+"""
+********************************************************************************
+* Name: manifest.py
+* Author: Tethys Platform Developers
+* Created On: October 2026
+* Copyright: (c) Tethys Geospatial Foundation 2026
+* License: BSD 2-Clause
+********************************************************************************
+"""
+
+import hashlib
+import importlib.util
+import json
+import logging
+import os
+from pathlib import Path
+
+from django.conf import settings
+
+tethys_log = logging.getLogger("tethys." + __name__)
+
+MANIFEST_VERSION = 1
+
+VALID = "valid"
+STALE = "stale"
+MISSING = "missing"
+UNREGISTERED = "unregistered"
+
+
+def _get_dot_path(obj):
+    if isinstance(obj, str):
+        return obj
+    name = getattr(obj, "__name__", type(obj).__name__)
+    return f"{getattr(obj, '__module__', '')}.{name}"
+
+
+def get_app_fingerprint(app_package):
+    """
+    Fingerprint the source of an app package without importing it.
+
+    Args:
+        app_package (str): dot-notation path to the app package (e.g. "tethysapp.my_app").
+
+    Returns:
+        dict: "source", a hash of the path, size and modification time of every Python module of the package, and "app_py", a hash of the content of its app.py.
+    """  # noqa: E501
+    spec = importlib.util.find_spec(app_package)
+    if spec is None or not spec.submodule_search_locations:
+        raise ImportError(f'Unable to locate the app package "{app_package}".')
+
+    root = Path(list(spec.submodule_search_locations)[0])
+    source = hashlib.sha256()
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(
+            d for d in dirnames if d != "__pycache__" and not d.startswith(".")
+        )
+        for filename in sorted(filenames):
+            if not filename.endswith(".py"):
+                continue
+            path = Path(dirpath) / filename
+            stat = path.stat()
+            source.update(
+                f"{path.relative_to(root)}:{stat.st_size}:{stat.st_mtime_ns}\n".encode()
+            )
+
+    app_py = hashlib.sha256((root / "app.py").read_bytes()).hexdigest()
+    return {"source": source.hexdigest(), "app_py": app_py}
+
+
+class AppManifest:
+    """
+    Cache of the results of harvesting apps, stored as JSON in the ``APP_MANIFEST_PATH`` file.
+
+    For each app the manifest records the path of the app class, its URL maps and a fingerprint of its source. While the fingerprint of an app is unchanged, the harvester imports the app class directly and skips syncing the app with the database, registering its permissions and importing its controllers. The whole manifest is invalidated when the Tethys Platform version or the database changes.
+    """  # noqa: E501
+
+    def __init__(self, path=None):
+        self._path = path
+
+    @property
+    def enabled(self):
+        return bool(getattr(settings, "APP_MANIFEST_CACHE", False))
+
+    @property
+    def path(self):
+        from tethys_apps.utilities import get_tethys_home_dir
+
+        if self._path:
+            return Path(self._path)
+        path = getattr(settings, "APP_MANIFEST_PATH", None)
+        return Path(path) if path else Path(get_tethys_home_dir()) / "app_manifest.json"
+
+    @staticmethod
+    def _header():
+        from tethys_portal import __version__
+
+        return {
+            "version": MANIFEST_VERSION,
+            "tethys_version": __version__,
+            "database": str(settings.DATABASES["default"].get("NAME")),
+        }
+
+    def load(self):
+        """
+        Read the app entries of the manifest.
+
+        Returns:
+            dict: manifest entries keyed by app name. Empty if the manifest does not exist, is invalid or was written by another version of Tethys Platform or for another database.
+        """  # noqa: E501
+        try:
+            with self.path.open() as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(data, dict) or data.get("header") != self._header():
+            return {}
+
+        apps = data.get("apps")
+        return apps if isinstance(apps, dict) else {}
+
+    def save(self, apps):
+        """
+        Write the manifest atomically.
+
+        Args:
+            apps (dict): manifest entries keyed by app name.
+        """
+        path = self.path
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tmp.open("w") as f:
+                json.dump({"header": self._header(), "apps": apps}, f, indent=2)
+            os.replace(tmp, path)
+        except OSError as e:
+            tethys_log.warning(f"Unable to write the app manifest {path}: {e}")
+            try:
+                tmp.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+    def update(self, entries, installed):
+        """
+        Add or replace entries and drop the entries of apps that are no longer installed. The manifest is only written if it changed.
+
+        Args:
+            entries (dict): new manifest entries keyed by app name.
+            installed (iterable of str): names of all installed apps.
+        """  # noqa: E501
+        installed = set(installed)
+        current = self.load()
+        apps = {name: entry for name, entry in current.items() if name in installed}
+        apps.update(entries)
+
+        if apps != current or not self.path.exists():
+            self.save(apps)
+
+    def clear(self):
+        """
+        Delete the manifest so that all apps are fully harvested on the next start.
+        """
+        self.path.unlink(missing_ok=True)
+
+    @staticmethod
+    def make_entry(app_package, app_class, app_instance, fingerprint):
+        """
+        Build the manifest entry of a fully harvested app.
+
+        Args:
+            app_package (str): dot-notation path to the app package.
+            app_class (class): the TethysAppBase subclass of the app.
+            app_instance (TethysAppBase): the harvested instance of the app.
+            fingerprint (dict): fingerprint of the app source (see ``get_app_fingerprint``).
+
+        Returns:
+            dict: the manifest entry.
+        """  # noqa: E501
+        return {
+            "module": app_class.__module__,
+            "class": app_class.__name__,
+            "package": app_package,
+            **fingerprint,
+            "url_maps": [
+                {
+                    "name": url_map.name,
+                    "url": url_map.url,
+                    "protocol": url_map.protocol,
+                    "controller": _get_dot_path(url_map.controller),
+                    "handler": (
+                        _get_dot_path(url_map.handler) if url_map.handler else None
+                    ),
+                    "handler_type": url_map.handler_type,
+                }
+                for url_map in app_instance.registered_url_maps
+            ],
+        }
+
+    @staticmethod
+    def matches(entry, fingerprint):
+        """
+        Whether a manifest entry was built from source with the given fingerprint.
+        """
+        return (
+            entry is not None
+            and fingerprint is not None
+            and entry.get("source") == fingerprint["source"]
+            and entry.get("app_py") == fingerprint["app_py"]
+        )
+
+    def validate(self, app_packages):
+        """
+        Check the manifest entries of the installed apps against their source and the database.
+
+        Args:
+            app_packages (dict): dot-notation path of the package of each installed app keyed by app name.
+
+        Returns:
+            dict: status of each app keyed by app name: "valid", "stale" (the source changed), "missing" (the app is not in the manifest) or "unregistered" (the app is not in the database).
+        """  # noqa: E501
+        from tethys_apps.models import TethysApp
+
+        entries = self.load()
+        registered = set(
+            TethysApp.objects.filter(package__in=list(app_packages)).values_list(
+                "package", flat=True
+            )
+        )
+
+        statuses = {}
+        for name, app_package in sorted(app_packages.items()):
+            entry = entries.get(name)
+            try:
+                fingerprint = get_app_fingerprint(app_package)
+            except (ImportError, OSError):
+                fingerprint = None
+
+            if entry is None:
+                statuses[name] = MISSING
+            elif not self.matches(entry, fingerprint):
+                statuses[name] = STALE
+            elif name not in registered:
+                statuses[name] = UNREGISTERED
+            else:
+                statuses[name] = VALID
+
+        return statuses
+
+
+app_manifest = AppManifest()
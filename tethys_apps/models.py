@@ -9,6 +9,7 @@
 """
 
 from django.dispatch import receiver
+import copy
 import logging
 import uuid
 import json
@@ -28,12 +29,14 @@ from tethys_compute.models.dask.dask_scheduler import DaskScheduler
 from tethys_compute.models.scheduler import Scheduler
 from tethys_sdk.testing import is_testing_environment, get_test_db_name
 from tethys_apps.base.function_extractor import TethysFunctionExtractor
+from tethys_apps.app_registry import app_registry
+from tethys_apps.settings_cache import app_settings_cache
 from tethys_apps.utilities import secrets_signed_unsigned_value
+from tethys_services.engines import engine_registry
 from tethys_portal.optional_dependencies import optional_import, has_module
 
 # optional imports
 sqlalchemy = optional_import("sqlalchemy")
-sessionmaker = optional_import("sessionmaker", from_module="sqlalchemy.orm")
 
 log = logging.getLogger("tethys")
 
@@ -177,6 +180,16 @@ class TethysApp(models.Model, TethysBaseMixin):
         )
 
 
+@receiver(models.signals.post_save, sender=TethysApp)
+@receiver(models.signals.post_delete, sender=TethysApp)
+def tethys_app_changed(sender, instance, **kwargs):
+    """
+    Invalidate the app registry and the cached settings of the app when a TethysApp is saved or deleted.
+    """  # noqa: E501
+    app_registry.invalidate()
+    app_settings_cache.invalidate(instance.package)
+
+
 class TethysExtension(models.Model, TethysBaseMixin):
     """
     DB Model for Tethys Extension
@@ -900,7 +913,7 @@ class PersistentStoreConnectionSetting(TethysAppSetting):
             return ps_service.get_engine()
 
         if as_sessionmaker:
-            return sessionmaker(bind=ps_service.get_engine())
+            return ps_service.get_sessionmaker()
 
         if as_url:
             return ps_service.get_url()
@@ -991,6 +1004,8 @@ class PersistentStoreDatabaseSetting(TethysAppSetting):
             )
 
         if with_db:
+            # Copy the service so the database is not set on a service shared with other settings
+            ps_service = copy.copy(ps_service)
             ps_service.database = self.get_namespaced_persistent_store_name()
 
         # Order here matters. Think carefully before changing.
@@ -998,7 +1013,7 @@ class PersistentStoreDatabaseSetting(TethysAppSetting):
             return ps_service.get_engine()
 
         if as_sessionmaker:
-            return sessionmaker(bind=ps_service.get_engine())
+            return ps_service.get_sessionmaker()
 
         if as_url:
             return ps_service.get_url()
@@ -1050,6 +1065,9 @@ class PersistentStoreDatabaseSetting(TethysAppSetting):
             )
         )
 
+        # Close the pooled connections to the database so it can be dropped
+        engine_registry.dispose(database=self.get_namespaced_persistent_store_name())
+
         # Get the database engine
         engine = self.get_value(as_engine=True)
 
@@ -1402,3 +1420,66 @@ class ProxyApp(models.Model):
             p.delete()
         except Permission.DoesNotExist:
             pass
+
+
+@receiver(models.signals.post_save, sender=CustomSetting)
+@receiver(models.signals.post_save, sender=SecretCustomSetting)
+@receiver(models.signals.post_save, sender=JSONCustomSetting)
+@receiver(models.signals.post_save, sender=DatasetServiceSetting)
+@receiver(models.signals.post_save, sender=SpatialDatasetServiceSetting)
+@receiver(models.signals.post_save, sender=WebProcessingServiceSetting)
+@receiver(models.signals.post_save, sender=PersistentStoreConnectionSetting)
+@receiver(models.signals.post_save, sender=PersistentStoreDatabaseSetting)
+@receiver(models.signals.post_save, sender=SchedulerSetting)
+@receiver(models.signals.post_delete, sender=CustomSetting)
+@receiver(models.signals.post_delete, sender=SecretCustomSetting)
+@receiver(models.signals.post_delete, sender=JSONCustomSetting)
+@receiver(models.signals.post_delete, sender=DatasetServiceSetting)
+@receiver(models.signals.post_delete, sender=SpatialDatasetServiceSetting)
+@receiver(models.signals.post_delete, sender=WebProcessingServiceSetting)
+@receiver(models.signals.post_delete, sender=PersistentStoreConnectionSetting)
+@receiver(models.signals.post_delete, sender=PersistentStoreDatabaseSetting)
+@receiver(models.signals.post_delete, sender=SchedulerSetting)
+def app_setting_changed(sender, instance, **kwargs):
+    """
+    Invalidate the cached settings of the app when one of its settings is saved or deleted.
+    """
+    try:
+        package = instance.tethys_app.package
+    except TethysApp.DoesNotExist:
+        package = None
+
+    app_settings_cache.invalidate(package)
+
+
+@receiver(models.signals.post_save, sender=DatasetService)
+@receiver(models.signals.post_save, sender=SpatialDatasetService)
+@receiver(models.signals.post_save, sender=WebProcessingService)
+@receiver(models.signals.post_save, sender=PersistentStoreService)
+@receiver(models.signals.post_save, sender=CondorScheduler)
+@receiver(models.signals.post_save, sender=DaskScheduler)
+@receiver(models.signals.post_delete, sender=DatasetService)
+@receiver(models.signals.post_delete, sender=SpatialDatasetService)
+@receiver(models.signals.post_delete, sender=WebProcessingService)
+@receiver(models.signals.post_delete, sender=PersistentStoreService)
+@receiver(models.signals.post_delete, sender=CondorScheduler)
+@receiver(models.signals.post_delete, sender=DaskScheduler)
+def service_changed(sender, instance, **kwargs):
+    """
+    Invalidate the cached settings of all apps when a service or scheduler that may be assigned to their settings is saved or deleted.
+    """  # noqa: E501
+    app_settings_cache.invalidate()
+
+
+@receiver(models.signals.post_save, sender=PersistentStoreDatabaseSetting)
+@receiver(models.signals.post_delete, sender=PersistentStoreDatabaseSetting)
+def persistent_store_database_setting_changed(sender, instance, **kwargs):
+    """
+    Dispose the engines connected to the database of a Persistent Store Database Setting when it is saved or deleted.
+    """  # noqa: E501
+    try:
+        database = instance.get_namespaced_persistent_store_name()
+    except TethysApp.DoesNotExist:
+        return
+
+    engine_registry.dispose(database=database)
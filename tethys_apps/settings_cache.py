@@ -0,0 +1,132 @@
+"""
+********************************************************************************
+* Name: settings_cache.py
+* Author: Tethys Platform Developers
+* Created On: October 2026
+* Copyright: (c) Tethys Geospatial Foundation 2026
+* License: BSD 2-Clause
+********************************************************************************
+"""
+
+import logging
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+
+tethys_log = logging.getLogger("tethys." + __name__)
+
+MISSING = object()
+GENERATION_KEY = "tethys_apps:settings:generation"
+
+
+class AppSettingsCache:
+    """
+    Per-process cache of resolved app settings, keyed by app package.
+
+    Entries expire after ``APP_SETTINGS_CACHE_TIMEOUT`` seconds and are dropped when a setting, an app or a service is saved or deleted (see the signal receivers in tethys_apps.models). Values are only held in the memory of the process. If ``APP_SETTINGS_CACHE_ALIAS`` names a Django cache backend, a generation token is stored in it for every app so that invalidating an app in one process invalidates it in every process sharing the backend.
+    """  # noqa: E501
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    @property
+    def timeout(self):
+        return getattr(settings, "APP_SETTINGS_CACHE_TIMEOUT", 300)
+
+    @property
+    def backend(self):
+        alias = getattr(settings, "APP_SETTINGS_CACHE_ALIAS", None)
+        return caches[alias] if alias else None
+
+    def _generation(self, package):
+        """
+        Get the shared generation of the given app or None if there is no shared backend.
+        """
+        backend = self.backend
+        if backend is None:
+            return None
+
+        keys = [GENERATION_KEY, f"{GENERATION_KEY}:{package}"]
+        try:
+            values = backend.get_many(keys)
+            missing = {key: uuid.uuid4().hex for key in keys if key not in values}
+            if missing:
+                for key, value in missing.items():
+                    backend.add(key, value, timeout=None)
+                values = backend.get_many(keys)
+        except Exception as e:
+            tethys_log.debug(f"Unable to read app settings cache generation: {e}")
+            return MISSING
+
+        return tuple(values.get(key) for key in keys)
+
+    def get_or_set(self, package, key, func):
+        """
+        Get a cached setting, resolving and caching it with func if it is not cached.
+
+        Args:
+            package (str): package of the app the setting belongs to.
+            key (hashable): key of the setting within the app (e.g. ("custom_setting", name)).
+            func (callable): called without arguments to resolve the setting. Exceptions are not cached.
+
+        Returns:
+            The cached or resolved setting.
+        """  # noqa: E501
+        timeout = self.timeout
+        if not timeout:
+            return func()
+
+        generation = self._generation(package)
+        if generation is MISSING:
+            return func()
+
+        with self._lock:
+            entry = self._entries.get(package, {}).get(key)
+
+        if (
+            entry is not None
+            and entry[1] == generation
+            and time.monotonic() - entry[2] < timeout
+        ):
+            return entry[0]
+
+        value = func()
+
+        with self._lock:
+            self._entries.setdefault(package, {})[key] = (
+                value,
+                generation,
+                time.monotonic(),
+            )
+
+        return value
+
+    def invalidate(self, package=None):
+        """
+        Drop the cached settings of an app or of all apps.
+
+        Args:
+            package (str): package of the app. Invalidates all apps if None.
+        """
+        with self._lock:
+            if package is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(package, None)
+
+        backend = self.backend
+        if backend is None:
+            return
+
+        key = GENERATION_KEY if package is None else f"{GENERATION_KEY}:{package}"
+        try:
+            backend.set(key, uuid.uuid4().hex, timeout=None)
+        except Exception as e:
+            tethys_log.warning(f"Unable to invalidate app settings cache: {e}")
+
+
+app_settings_cache = AppSettingsCache()
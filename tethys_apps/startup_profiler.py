@@ -0,0 +1,190 @@
+"""
+********************************************************************************
+* Name: startup_profiler.py
+* Author: Tethys Platform Developers
+* Created On: October 2026
+* Copyright: (c) Tethys Geospatial Foundation 2026
+* License: BSD 2-Clause
+********************************************************************************
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+from django.conf import settings
+
+tethys_log = logging.getLogger("tethys." + __name__)
+
+ENV_VAR = "TETHYS_PROFILE_STARTUP"
+
+
+class StartupProfiler:
+    """
+    Records how long each step of harvesting apps and extensions takes, and how many database queries it runs, to find what makes starting Tethys Platform slow.
+
+    Enabled by the TETHYS_PROFILE_STARTUP setting or environment variable (set by ``tethys manage start --profile-startup``). The report is printed to the terminal and written as JSON to TETHYS_PROFILE_STARTUP_PATH.
+    """  # noqa: E501
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.created = datetime.now(timezone.utc).isoformat()
+        self.phases = {}
+        self.apps = {}
+        self.extensions = {}
+
+    @property
+    def enabled(self):
+        env = os.environ.get(ENV_VAR, "").lower() in ("1", "true", "yes", "on")
+        return env or bool(getattr(settings, "TETHYS_PROFILE_STARTUP", False))
+
+    @property
+    def path(self):
+        from tethys_apps.utilities import get_tethys_home_dir
+
+        path = getattr(settings, "TETHYS_PROFILE_STARTUP_PATH", None)
+        return (
+            Path(path) if path else Path(get_tethys_home_dir()) / "startup_profile.json"
+        )
+
+    @contextmanager
+    def measure(self, step, app=None, extension=None):
+        """
+        Measure the duration and number of database queries of a startup step. Does nothing unless profiling is enabled.
+
+        Args:
+            step (str): name of the step (e.g. "import", "url_patterns").
+            app (str): package of the app the step belongs to.
+            extension (str): package of the extension the step belongs to. The step is a harvest phase if neither app nor extension is given.
+        """  # noqa: E501
+        if not self.enabled:
+            yield
+            return
+
+        from django.db import connections
+
+        queries = [0]
+
+        def count_queries(execute, sql, params, many, context):
+            queries[0] += 1
+            return execute(sql, params, many, context)
+
+        start = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(count_queries))
+                yield
+        finally:
+            self.record(
+                step,
+                time.perf_counter() - start,
+                queries[0],
+                app=app,
+                extension=extension,
+            )
+
+    def record(self, step, seconds, queries, app=None, extension=None):
+        with self._lock:
+            if app is not None:
+                records = self.apps.setdefault(app, {})
+            elif extension is not None:
+                records = self.extensions.setdefault(extension, {})
+            else:
+                records = self.phases
+
+            # Steps measured more than once (e.g. url_patterns) are added up
+            record = records.setdefault(step, {"seconds": 0.0, "queries": 0})
+            record["seconds"] += seconds
+            record["queries"] += queries
+
+    @staticmethod
+    def _total(records):
+        return {
+            "seconds": sum(r["seconds"] for r in records.values()),
+            "queries": sum(r["queries"] for r in records.values()),
+        }
+
+    def as_dict(self):
+        """
+        Get the report as a JSON-serializable dictionary.
+        """
+        from tethys_portal import __version__
+
+        with self._lock:
+            return {
+                "created": self.created,
+                "tethys_version": __version__,
+                "pid": os.getpid(),
+                "phases": dict(self.phases),
+                "apps": {
+                    package: {"steps": dict(steps), "total": self._total(steps)}
+                    for package, steps in self.apps.items()
+                },
+                "extensions": {
+                    package: {"steps": dict(steps), "total": self._total(steps)}
+                    for package, steps in self.extensions.items()
+                },
+            }
+
+    def format(self):
+        """
+        Get the report as text for the terminal, with the slowest apps and extensions first.
+        """  # noqa: E501
+        report = self.as_dict()
+        lines = ["Tethys Startup Profile", ""]
+
+        def format_row(name, record, indent=""):
+            return (
+                f"{indent}{name:<40} {record['seconds'] * 1000:>10.1f} ms "
+                f"{record['queries']:>7} queries"
+            )
+
+        if report["phases"]:
+            lines.append("Phases:")
+            for step, record in report["phases"].items():
+                lines.append(format_row(step, record, "  "))
+            lines.append("")
+
+        for kind in ("apps", "extensions"):
+            if not report[kind]:
+                continue
+            lines.append(f"{kind.title()}:")
+            for package, entry in sorted(
+                report[kind].items(), key=lambda item: -item[1]["total"]["seconds"]
+            ):
+                lines.append(format_row(package, entry["total"], "  "))
+                for step, record in entry["steps"].items():
+                    lines.append(format_row(step, record, "    "))
+            lines.append("")
+
+        return "\n".join(lines)
+
+    def write(self):
+        """
+        Print the report and write it as JSON. Does nothing unless profiling is enabled.
+        """
+        if not self.enabled:
+            return
+
+        print(self.format())
+
+        path = self.path
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(self.as_dict(), indent=2))
+        except OSError as e:
+            tethys_log.warning(f"Unable to write the startup profile {path}: {e}")
+        else:
+            print(f"Startup profile written to: {path}\n")
+
+
+startup_profiler = StartupProfiler()
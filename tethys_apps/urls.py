@@ -12,6 +12,7 @@ import logging
 from django.urls import include, re_path
 from channels.routing import URLRouter
 from tethys_apps.harvester import SingletonHarvester
+from tethys_apps.startup_profiler import startup_profiler
 from tethys_apps.views import library, send_beta_feedback_email
 from tethys_apps.utilities import get_configured_standalone_app
 from django.conf import settings
@@ -45,6 +46,9 @@ harvester = SingletonHarvester()
 normal_url_patterns = harvester.get_url_patterns(url_namespaces=url_namespaces)
 handler_url_patterns = harvester.get_handler_patterns(url_namespaces=url_namespaces)
 
+# Update the startup profile with the time spent loading the app urls
+startup_profiler.write()
+
 # configure handler HTTP routes
 http_handler_patterns = []
 for namespace, urls in handler_url_patterns["http_handler_patterns"].items():
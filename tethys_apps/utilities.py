@@ -28,6 +28,7 @@ from tethys_apps.base.mixins import (
     TethysWebsocketConsumerMixin,
 )
 from tethys_apps.exceptions import TethysAppSettingNotAssigned
+from .app_registry import app_registry
 from .harvester import SingletonHarvester
 from django.db.utils import ProgrammingError
 
@@ -129,10 +130,22 @@ def get_directories_in_tethys(directory_names, with_app_name=False):
 
 def get_active_app(request=None, url=None, get_class=False):
     """
-    Get the active TethysApp object based on the request or URL.
-    """
-    from tethys_apps.models import TethysApp
+    Get the active TethysApp object based on the request or URL. The app is looked up in the per-process app registry and, if a request is given, is attached to the request as ``request.tethys_app`` so it is resolved only once per request.
+    """  # noqa: E501
+    if request is not None and "tethys_app" in vars(request):
+        app = request.tethys_app
+    else:
+        app = _resolve_active_app(request, url)
+        if request is not None:
+            request.tethys_app = app
+
+    if get_class:
+        app = get_app_class(app)
 
+    return app
+
+
+def _resolve_active_app(request=None, url=None):
     # Find the app key
     if settings.MULTIPLE_APP_MODE:
         if request is not None:
@@ -156,8 +169,8 @@ def get_active_app(request=None, url=None, get_class=False):
 
             if app_root_url:
                 try:
-                    # Get the app from the database
-                    app = TethysApp.objects.get(root_url=app_root_url)
+                    # Get the app from the registry
+                    app = app_registry.get_by_root_url(app_root_url)
                 except ObjectDoesNotExist:
                     tethys_log.warning(
                         'Could not locate app with root url "{0}".'.format(app_root_url)
@@ -169,16 +182,13 @@ def get_active_app(request=None, url=None, get_class=False):
     else:
         app = get_configured_standalone_app()
 
-    if get_class:
-        app = get_app_class(app)
-
     return app
 
 
 def get_app_class(app):
-    for app_s in SingletonHarvester().apps:
-        if app_s.package == app.package:
-            return app_s
+    if app is None:
+        return None
+    return app_registry.get_app_class(app.package)
 
 
 def get_app_settings(app):
@@ -635,9 +645,9 @@ def get_configured_standalone_app():
     app = None
     try:
         if standalone_app:
-            app = TethysApp.objects.get(package=standalone_app)
+            app = app_registry.get_by_package(standalone_app)
         else:
-            app = TethysApp.objects.first()
+            app = app_registry.first()
     except (ProgrammingError, TethysApp.DoesNotExist):
         # If a tethys application is not actually installed or DB is not setup yet, continue and the UI will notify the user
         pass
@@ -698,6 +708,41 @@ def delete_secrets(app_name):
                     yaml.dump(portal_secrets, secrets_yaml)
 
 
+_secrets_yaml_cache = {}
+
+
+def get_secrets_version():
+    """
+    Get a token that changes whenever the secrets.yml file in the Tethys home directory changes or None if the file does not exist.
+    """  # noqa: E501
+    secrets_path = Path(get_tethys_home_dir()) / "secrets.yml"
+    try:
+        stat = secrets_path.stat()
+    except OSError:
+        return None
+    return str(secrets_path), stat.st_mtime_ns, stat.st_size
+
+
+def _load_secrets_yaml(secrets_path):
+    """
+    Parse the given secrets.yml file, reusing the parsed content while the modification time and size of the file are unchanged.
+    """  # noqa: E501
+    try:
+        stat = secrets_path.stat()
+        version = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        version = None
+
+    cached = _secrets_yaml_cache.get(str(secrets_path))
+    if version is not None and cached is not None and cached[0] == version:
+        return cached[1]
+
+    content = yaml.safe_load(secrets_path.read_text()) or {}
+    if version is not None:
+        _secrets_yaml_cache[str(secrets_path)] = (version, content)
+    return content
+
+
 def secrets_signed_unsigned_value(name, value, tethys_app_package_name, is_signing):
     return_string = ""
     TETHYS_HOME = get_tethys_home_dir()
@@ -707,9 +752,7 @@ def secrets_signed_unsigned_value(name, value, tethys_app_package_name, is_signi
         if not secrets_path.exists():
             return_string = sign_and_unsign_secret_string(signer, value, is_signing)
         else:
-            secret_app_settings = (yaml.safe_load(secrets_path.read_text()) or {}).get(
-                "secrets", {}
-            )
+            secret_app_settings = _load_secrets_yaml(secrets_path).get("secrets", {})
             if bool(secret_app_settings):
                 if tethys_app_package_name in secret_app_settings:
                     if (
@@ -16,10 +16,13 @@ from tethys_cli.app_settings_commands import add_app_settings_parser
 from tethys_cli.db_commands import add_db_parser
 from tethys_cli.docker_commands import add_docker_parser
 from tethys_cli.gen_commands import add_gen_parser
+from tethys_cli.jobs_commands import add_jobs_parser
 from tethys_cli.link_commands import add_link_parser
 from tethys_cli.list_command import add_list_parser
 from tethys_cli.manage_commands import add_manage_parser
+from tethys_cli.manifest_commands import add_manifest_parser
 from tethys_cli.scaffold_commands import add_scaffold_parser
+from tethys_cli.quotas_commands import add_quotas_parser
 from tethys_cli.scheduler_commands import add_scheduler_parser
 from tethys_cli.services_commands import add_services_parser
 from tethys_cli.settings_commands import add_settings_parser
@@ -48,10 +51,13 @@ def tethys_command_parser():
     add_gen_parser(subparsers)
     add_install_parser(subparsers)
     add_uninstall_parser(subparsers)
+    add_jobs_parser(subparsers)
     add_link_parser(subparsers)
     add_list_parser(subparsers)
     add_manage_parser(subparsers)
+    add_manifest_parser(subparsers)
     add_scaffold_parser(subparsers)
+    add_quotas_parser(subparsers)
     add_scheduler_parser(subparsers)
     add_services_parser(subparsers)
     add_settings_parser(subparsers)
@@ -0,0 +1,159 @@
+import asyncio
+
+from .cli_colors import FG_GREEN, FG_RED, pretty_output
+from tethys_cli.cli_helpers import setup_django
+
+
+def add_jobs_parser(subparsers):
+    # JOBS COMMANDS
+    jobs_parser = subparsers.add_parser(
+        "jobs", help="Job commands for Tethys Platform."
+    )
+    jobs_subparsers = jobs_parser.add_subparsers(title="Commands", dest="sub-command")
+    jobs_subparsers.required = True
+
+    # tethys jobs poll
+    jobs_poll = jobs_subparsers.add_parser(
+        "poll",
+        help="Periodically update the statuses of all pending and running jobs and process the results of completed jobs.",
+    )
+    jobs_poll.add_argument(
+        "-i",
+        "--interval",
+        type=int,
+        default=None,
+        help="Number of seconds between polls. Defaults to the JOB_STATUS_POLL_INTERVAL setting, or 30 seconds if it is not set.",
+    )
+    jobs_poll.add_argument(
+        "--once",
+        action="store_true",
+        help="Poll the statuses of the jobs once and exit.",
+    )
+    jobs_poll.add_argument(
+        "-b",
+        "--batch-size",
+        type=int,
+        default=None,
+        help="Maximum number of jobs of the same type and scheduler updated together. Defaults to the JOB_STATUS_POLL_BATCH_SIZE setting.",
+    )
+    jobs_poll.add_argument(
+        "-c",
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Maximum number of groups of jobs updated at the same time. Defaults to the JOB_STATUS_POLL_CONCURRENCY setting.",
+    )
+    jobs_poll.set_defaults(func=jobs_poll_command)
+
+    # tethys jobs purge
+    jobs_purge = jobs_subparsers.add_parser(
+        "purge",
+        help="Archive and delete the jobs with a terminal status that are past their retention period (see the JOB_RETENTION_DAYS and JOB_RETENTION_APP_DAYS settings).",
+    )
+    jobs_purge.add_argument(
+        "--older-than",
+        default=None,
+        help='Delete the jobs that completed longer ago than this age (e.g. "30d", "12h" or "2w"), instead of using the retention periods of the settings.',
+    )
+    jobs_purge.add_argument(
+        "-a",
+        "--app",
+        default=None,
+        help="Only delete the jobs of the app with this package name.",
+    )
+    jobs_purge.add_argument(
+        "-b",
+        "--batch-size",
+        type=int,
+        default=None,
+        help="Maximum number of jobs deleted in each transaction. Defaults to the JOB_PURGE_BATCH_SIZE setting.",
+    )
+    jobs_purge.add_argument(
+        "--archive-path",
+        default=None,
+        help="Directory where the archive of the deleted jobs is written. Defaults to the JOB_ARCHIVE_PATH setting.",
+    )
+    jobs_purge.add_argument(
+        "--no-archive",
+        action="store_true",
+        help="Delete the jobs without archiving them.",
+    )
+    jobs_purge.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only count the jobs that would be deleted.",
+    )
+    jobs_purge.set_defaults(func=jobs_purge_command)
+
+
+def jobs_poll_command(args):
+    setup_django()
+    from django.conf import settings
+    from tethys_compute.job_poller import JobStatusPoller
+
+    for name in ("interval", "batch_size", "concurrency"):
+        value = getattr(args, name)
+        if value is not None and value < 1:
+            with pretty_output(FG_RED) as p:
+                p.write(f"The {name.replace('_', ' ')} must be at least 1.")
+            exit(1)
+
+    poller = JobStatusPoller(batch_size=args.batch_size, concurrency=args.concurrency)
+
+    if args.once:
+        count = asyncio.run(poller.poll())
+        with pretty_output(FG_GREEN) as p:
+            p.write(f"Successfully updated the statuses of {count} jobs.")
+        return
+
+    interval = args.interval or getattr(settings, "JOB_STATUS_POLL_INTERVAL", 0) or 30
+    with pretty_output(FG_GREEN) as p:
+        p.write(
+            f"Polling the statuses of the jobs every {interval} seconds. "
+            f"Press CTRL+C to stop."
+        )
+
+    try:
+        asyncio.run(poller.run(interval))
+    except KeyboardInterrupt:
+        pass
+
+
+def jobs_purge_command(args):
+    setup_django()
+    from tethys_compute.job_cleanup import job_cleanup_queue
+    from tethys_compute.job_retention import JobPurger, get_expired_jobs, parse_age
+
+    if args.batch_size is not None and args.batch_size < 1:
+        with pretty_output(FG_RED) as p:
+            p.write("The batch size must be at least 1.")
+        exit(1)
+
+    try:
+        older_than = parse_age(args.older_than) if args.older_than else None
+    except ValueError as e:
+        with pretty_output(FG_RED) as p:
+            p.write(str(e))
+        exit(1)
+
+    jobs = get_expired_jobs(older_than=older_than, label=args.app)
+
+    if args.dry_run:
+        with pretty_output(FG_GREEN) as p:
+            p.write(f"{jobs.count()} jobs would be purged.")
+        return
+
+    purger = JobPurger(
+        batch_size=args.batch_size,
+        archive_path=args.archive_path,
+        archive=not args.no_archive,
+    )
+    count = purger.purge(jobs)
+
+    # Wait for the cleanup of the workspaces and remote files of the deleted jobs
+    job_cleanup_queue.join()
+
+    with pretty_output(FG_GREEN) as p:
+        p.write(f"Successfully purged {count} jobs.")
+        if count and purger.archive:
+            p.write(f"The jobs were archived to {purger.archive_file}.")
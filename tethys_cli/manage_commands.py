@@ -8,6 +8,8 @@
 ********************************************************************************
 """
 
+import os
+
 from django.core.management import get_commands
 
 from tethys_cli.cli_helpers import get_manage_path, run_process
@@ -73,6 +75,13 @@ def add_manage_parser(subparsers):
         help="Only used with collectstatic command. Link static directory to STATIC_ROOT "
         "instead of copying it. Not recommended.",
     )
+    manage_parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Only used with start command. Print how long starting Tethys Platform takes "
+        "for each app and extension and write the report as JSON "
+        "(see the TETHYS_PROFILE_STARTUP_PATH setting).",
+    )
     manage_parser.add_argument(
         "--django-help",
         action="store_true",
@@ -98,6 +107,10 @@ def manage_command(args, unknown_args=None):
     primary_process = None
 
     if args.command == MANAGE_START:
+        if getattr(args, "profile_startup", False):
+            # The environment is inherited by the server process
+            os.environ["TETHYS_PROFILE_STARTUP"] = "true"
+
         if args.port:
             primary_process = ["python", manage_path, "runserver", args.port]
         else:
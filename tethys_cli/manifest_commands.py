@@ -0,0 +1,72 @@
+import pkgutil
+
+from tethys_cli.cli_colors import write_error, write_info, write_success, write_warning
+from tethys_cli.cli_helpers import setup_django
+
+
+def add_manifest_parser(subparsers):
+    # Setup manifest command
+    manifest_parser = subparsers.add_parser(
+        "manifest",
+        help="Show, validate or rebuild the app manifest used to speed up startup.",
+    )
+    manifest_parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Fully harvest all apps (syncing them with the database and registering their permissions) and rebuild the app manifest.",
+    )
+    manifest_parser.add_argument(
+        "--validate",
+        action="store_true",
+        help="Exit with an error if the manifest entry of any installed app is missing or stale.",
+    )
+    manifest_parser.set_defaults(func=manifest_command, rebuild=False, validate=False)
+
+
+def get_app_packages():
+    """
+    Get the dot-notation path of the package of every installed app keyed by app name.
+    """
+    import tethysapp
+
+    return {
+        modname: f"tethysapp.{modname}"
+        for _, modname, ispkg in pkgutil.iter_modules(tethysapp.__path__)
+        if ispkg
+    }
+
+
+def manifest_command(args):
+    """
+    Show, validate or rebuild the app manifest.
+    """
+    setup_django()
+    from tethys_apps.harvester import SingletonHarvester
+    from tethys_apps.manifest import app_manifest, VALID
+
+    if args.rebuild:
+        SingletonHarvester().harvest(rebuild=True)
+        write_success(f"Successfully rebuilt the app manifest: {app_manifest.path}")
+
+    if not app_manifest.enabled:
+        write_warning(
+            "The app manifest is not used to start Tethys Platform because "
+            "APP_MANIFEST_CACHE is not enabled."
+        )
+
+    statuses = app_manifest.validate(get_app_packages())
+
+    write_info(f"App manifest: {app_manifest.path}")
+    for app_name, status in statuses.items():
+        if status == VALID:
+            write_success(f"  {app_name}: {status}")
+        else:
+            write_warning(f"  {app_name}: {status}")
+
+    invalid = [app_name for app_name, status in statuses.items() if status != VALID]
+    if args.validate and invalid:
+        write_error(
+            f"The app manifest is not valid for: {', '.join(invalid)}. "
+            f'Run "tethys manifest --rebuild" to rebuild it.'
+        )
+        exit(1)
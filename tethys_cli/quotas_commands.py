@@ -0,0 +1,71 @@
+from .cli_colors import FG_GREEN, FG_RED, pretty_output
+from tethys_cli.cli_helpers import setup_django
+
+
+def add_quotas_parser(subparsers):
+    # QUOTAS COMMANDS
+    quotas_parser = subparsers.add_parser(
+        "quotas", help="Resource quota commands for Tethys Platform."
+    )
+    quotas_subparsers = quotas_parser.add_subparsers(
+        title="Commands", dest="sub-command"
+    )
+    quotas_subparsers.required = True
+
+    # tethys quotas recompute
+    quotas_recompute = quotas_subparsers.add_parser(
+        "recompute",
+        help="Recompute the materialized workspace and media storage usage of users and apps.",
+    )
+    quotas_recompute.add_argument(
+        "-u",
+        "--user",
+        dest="users",
+        action="append",
+        help="Username of a user to recompute the storage usage of. May be given multiple times.",
+    )
+    quotas_recompute.add_argument(
+        "-a",
+        "--app",
+        dest="apps",
+        action="append",
+        help="Package of an app to recompute the storage usage of, including the usage of all of its users if no users are given. May be given multiple times.",
+    )
+    quotas_recompute.add_argument(
+        "--all",
+        action="store_true",
+        help="Recompute the storage usage of all users and apps.",
+    )
+    quotas_recompute.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of directories to scan in parallel.",
+    )
+    quotas_recompute.set_defaults(func=quotas_recompute_command)
+
+
+def quotas_recompute_command(args):
+    setup_django()
+    from tethys_quotas.storage import recompute_storage_usage
+
+    if args.all == bool(args.users or args.apps):
+        with pretty_output(FG_RED) as p:
+            p.write("Please specify either --all or at least one --user or --app.")
+        exit(1)
+
+    if args.jobs is not None and args.jobs < 1:
+        with pretty_output(FG_RED) as p:
+            p.write("The number of jobs must be at least 1.")
+        exit(1)
+
+    if args.all:
+        count = recompute_storage_usage(jobs=args.jobs)
+    else:
+        count = recompute_storage_usage(
+            users=args.users, apps=args.apps, jobs=args.jobs
+        )
+
+    with pretty_output(FG_GREEN) as p:
+        p.write(f"Successfully recomputed {count} storage usage records.")
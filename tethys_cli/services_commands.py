@@ -106,6 +106,30 @@ def add_services_parser(subparsers):
         help="The connection of the Service in the form "
         '"<username>:<password>@<host>:<port>"',
     )
+    services_create_ps.add_argument(
+        "--pool-size",
+        type=int,
+        help="Number of connections kept open in the connection pool of each engine. "
+        "Defaults to 5.",
+    )
+    services_create_ps.add_argument(
+        "--max-overflow",
+        type=int,
+        help="Number of connections that may be opened beyond the pool size. "
+        "Defaults to 10.",
+    )
+    services_create_ps.add_argument(
+        "--pool-recycle",
+        type=int,
+        help="Number of seconds after which pooled connections are replaced. "
+        "Defaults to -1 (never).",
+    )
+    services_create_ps.add_argument(
+        "--pool-pre-ping",
+        action="store_true",
+        default=None,
+        help="Test pooled connections for liveness before using them.",
+    )
     services_create_ps.set_defaults(func=services_create_persistent_command)
 
     # tethys services create spatial
@@ -251,12 +275,22 @@ def services_create_persistent_command(args):
         host = url_parts[0]
         port = url_parts[1]
 
+        pool_options = {
+            option: getattr(args, option, None)
+            for option in ("pool_size", "max_overflow", "pool_recycle", "pool_pre_ping")
+        }
+
         new_persistent_service = PersistentStoreService(
             name=name,
             host=host,
             port=port,
             username=store_username,
             password=store_password,
+            **{
+                option: value
+                for option, value in pool_options.items()
+                if value is not None
+            },
         )
         new_persistent_service.save()
 
@@ -9,8 +9,28 @@
 """
 
 from django.apps import AppConfig
+from django.conf import settings
+
+from tethys_compute.tasks import register_background_task
 
 
 class TethysComputeConfig(AppConfig):
     name = "tethys_compute"
     verbose_name = "Tethys Compute"
+
+    def ready(self):
+        # Periodically update the statuses of pending and running jobs
+        interval = getattr(settings, "JOB_STATUS_POLL_INTERVAL", 0)
+        if interval:
+            from tethys_compute.job_poller import poll_job_statuses
+
+            register_background_task(poll_job_statuses, delay=interval, periodic=True)
+
+        # Periodically close idle SSH connections to remote Condor schedulers
+        idle_timeout = getattr(settings, "CONDOR_SSH_POOL_IDLE_TIMEOUT", 300)
+        if idle_timeout:
+            from tethys_compute.condor_ssh_pool import prune_ssh_connections
+
+            register_background_task(
+                prune_ssh_connections, delay=idle_timeout, periodic=True
+            )
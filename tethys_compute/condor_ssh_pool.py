@@ -0,0 +1,352 @@
+"""
+********************************************************************************
+* Name: condor_ssh_pool.py
+* Author: Tethys Platform Developers
+* Created On: October 2026
+* Copyright: (c) Tethys Geospatial Foundation 2026
+* License: BSD 2-Clause
+********************************************************************************
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+
+from tethys_portal.optional_dependencies import optional_import
+
+# optional imports
+RemoteClient = optional_import("RemoteClient", from_module="condorpy.remote_utils")
+SCPClient = optional_import("SCPClient", from_module="scp")
+
+logger = logging.getLogger(f"tethys.{__name__}")
+
+
+class SSHSessionTimeout(Exception):
+    """
+    Raised when no SSH session to a scheduler became available in time.
+    """
+
+    pass
+
+
+class PooledSSHConnection:
+    """
+    An SSH connection to a CondorScheduler that is shared by all of the condorpy jobs and workflows of the scheduler. It is used in place of the condorpy RemoteClient of the jobs, so the connection is opened once instead of once per job and request.
+
+    Args:
+        pool (SSHConnectionPool): the pool of the connection.
+        scheduler (CondorScheduler): the scheduler to connect to.
+    """  # noqa: E501
+
+    def __init__(self, pool, scheduler):
+        self.pool = pool
+        self.client = RemoteClient(
+            host=scheduler.host,
+            username=scheduler.username,
+            password=scheduler.password,
+            private_key=scheduler.private_key_path,
+            private_key_pass=scheduler.private_key_pass,
+            port=scheduler.port,
+        )
+        self.lock = threading.RLock()
+        self.sessions = threading.BoundedSemaphore(pool.max_sessions)
+        self.active_sessions = 0
+        self.last_used = time.monotonic()
+        self.last_checked = self.last_used
+
+    def __getattr__(self, name):
+        # Delegate everything else (e.g. host, matches, sftp) to the condorpy client
+        if name == "client":
+            raise AttributeError(name)
+        return getattr(self.client, name)
+
+    def matches_scheduler(self, scheduler):
+        """
+        Check if the connection was opened with the current settings of the scheduler.
+        """
+        return self.client.matches(
+            scheduler.host,
+            scheduler.username,
+            scheduler.password,
+            scheduler.private_key_path,
+            scheduler.private_key_pass,
+            scheduler.port,
+        )
+
+    @property
+    def is_connected(self):
+        transport = self.client._transport
+        return transport is not None and transport.is_active()
+
+    @property
+    def idle_time(self):
+        """
+        Number of seconds since the connection was last used.
+        """
+        return time.monotonic() - self.last_used
+
+    def connect(self):
+        """
+        Open the SSH connection if it is not open yet, or open it again if it was lost.
+        """
+        with self.lock:
+            if not self.is_connected:
+                self.client._sftp = None
+                self.client._scp = None
+                self.client.transport
+                self.pool.count("connections_opened")
+
+    def disconnect(self):
+        """
+        Close the SSH connection. It is opened again the next time it is used.
+        """
+        with self.lock:
+            if self.client._transport is None:
+                return
+            try:
+                self.client.close()
+            except Exception:
+                logger.exception(f"Unable to close the SSH connection to {self.host}:")
+            self.client._transport = None
+            self.client._sftp = None
+            self.client._scp = None
+            self.pool.count("connections_closed")
+
+    def check_health(self):
+        """
+        Check that the SSH connection still works by sending it an ignore message, and close it if it does not.
+
+        Returns:
+            bool: False if the connection was lost, else True.
+        """  # noqa: E501
+        with self.lock:
+            self.last_checked = time.monotonic()
+            if self.client._transport is None:
+                return True
+
+            try:
+                if not self.is_connected:
+                    raise ConnectionError("The SSH transport is not active.")
+                self.client._transport.send_ignore()
+            except Exception:
+                logger.warning(
+                    f"The SSH connection to {self.host} was lost. Reconnecting..."
+                )
+                self.pool.count("health_check_failures")
+                self.disconnect()
+                return False
+
+            return True
+
+    @contextmanager
+    def session(self):
+        """
+        Reserve one of the sessions of the connection (see the CONDOR_SSH_POOL_MAX_SESSIONS setting).
+        """  # noqa: E501
+        if not self.sessions.acquire(timeout=self.pool.session_timeout):
+            self.pool.count("session_timeouts")
+            raise SSHSessionTimeout(
+                f"No SSH session to {self.host} became available within "
+                f"{self.pool.session_timeout} seconds."
+            )
+
+        with self.lock:
+            self.active_sessions += 1
+        self.pool.count("sessions")
+
+        try:
+            self.connect()
+            yield
+        finally:
+            with self.lock:
+                self.active_sessions -= 1
+                self.last_used = time.monotonic()
+            self.sessions.release()
+
+    def execute(self, command):
+        with self.session():
+            return self.client.execute(command)
+
+    @contextmanager
+    def transfer(self):
+        """
+        Reserve a session for a file transfer. Each transfer gets its own SCP client, because an SCP client keeps the state of a single transfer (the single SCP client of the condorpy RemoteClient cannot be shared by the sessions).
+        """  # noqa: E501
+        with self.session(), SCPClient(self.client.transport) as scp_client:
+            yield scp_client
+
+    def put(self, local_paths, remote_path):
+        with self.transfer() as scp_client:
+            scp_client.put(files=local_paths, remote_path=remote_path, recursive=True)
+
+    def get(self, remote_paths, local_path="."):
+        with self.transfer() as scp_client:
+            scp_client.get(remote_paths, local_path, recursive=True)
+
+    def makedirs(self, remote_path):
+        with self.session():
+            return self.client.makedirs(remote_path)
+
+    def remote_file(self, remote_file_path, mode="w"):
+        # Files share the single SFTP session of the connection
+        self.connect()
+        self.last_used = time.monotonic()
+        return self.client.remote_file(remote_file_path, mode)
+
+    def close(self):
+        """
+        The connection is shared, so closing it is left to the pool.
+        """
+        self.last_used = time.monotonic()
+
+
+class SSHConnectionPool:
+    """
+    Pool of SSH connections to remote CondorSchedulers, keyed by scheduler.
+
+    Args:
+        max_sessions (int): maximum number of commands and file transfers that run on one connection at the same time. Defaults to the CONDOR_SSH_POOL_MAX_SESSIONS setting.
+        idle_timeout (int): number of seconds after which unused connections are closed. Defaults to the CONDOR_SSH_POOL_IDLE_TIMEOUT setting.
+        health_check_interval (int): minimum number of seconds between checks that a connection still works. Defaults to the CONDOR_SSH_POOL_HEALTH_CHECK_INTERVAL setting.
+        session_timeout (int): number of seconds to wait for a session when all of the sessions of a connection are in use. Defaults to the CONDOR_SSH_POOL_SESSION_TIMEOUT setting.
+    """  # noqa: E501
+
+    COUNTERS = (
+        "requests",
+        "reused",
+        "connections_opened",
+        "connections_closed",
+        "health_check_failures",
+        "sessions",
+        "session_timeouts",
+    )
+
+    def __init__(
+        self,
+        max_sessions=None,
+        idle_timeout=None,
+        health_check_interval=None,
+        session_timeout=None,
+    ):
+        self.max_sessions = max_sessions or getattr(
+            settings, "CONDOR_SSH_POOL_MAX_SESSIONS", 8
+        )
+        self.idle_timeout = (
+            idle_timeout
+            if idle_timeout is not None
+            else getattr(settings, "CONDOR_SSH_POOL_IDLE_TIMEOUT", 300)
+        )
+        self.health_check_interval = (
+            health_check_interval
+            if health_check_interval is not None
+            else getattr(settings, "CONDOR_SSH_POOL_HEALTH_CHECK_INTERVAL", 60)
+        )
+        self.session_timeout = session_timeout or getattr(
+            settings, "CONDOR_SSH_POOL_SESSION_TIMEOUT", 60
+        )
+        self.connections = {}
+        self.counters = dict.fromkeys(self.COUNTERS, 0)
+        self.lock = threading.RLock()
+
+    @staticmethod
+    def get_key(scheduler):
+        return scheduler.pk or (scheduler.host, scheduler.port, scheduler.username)
+
+    def count(self, counter):
+        with self.lock:
+            self.counters[counter] += 1
+
+    def get_client(self, scheduler):
+        """
+        Get the pooled connection to a scheduler, which can be used in place of a condorpy RemoteClient.
+
+        Args:
+            scheduler (CondorScheduler): the remote scheduler.
+
+        Returns:
+            PooledSSHConnection: the connection to the scheduler.
+        """  # noqa: E501
+        key = self.get_key(scheduler)
+        with self.lock:
+            self.counters["requests"] += 1
+            self.prune()
+
+            connection = self.connections.get(key)
+            if connection is not None and not connection.matches_scheduler(scheduler):
+                # The scheduler was changed or its private key was replaced
+                del self.connections[key]
+                connection.disconnect()
+                connection = None
+
+            if connection is None:
+                connection = PooledSSHConnection(self, scheduler)
+                self.connections[key] = connection
+            else:
+                self.counters["reused"] += 1
+
+        if time.monotonic() - connection.last_checked >= self.health_check_interval:
+            connection.check_health()
+
+        return connection
+
+    def prune(self):
+        """
+        Close the connections that have not been used for longer than the idle timeout.
+
+        Returns:
+            int: number of connections that were closed.
+        """
+        if not self.idle_timeout:
+            return 0
+
+        with self.lock:
+            idle = [
+                key
+                for key, connection in self.connections.items()
+                if not connection.active_sessions
+                and connection.idle_time >= self.idle_timeout
+            ]
+            for key in idle:
+                self.connections.pop(key).disconnect()
+
+        return len(idle)
+
+    def close_all(self):
+        """
+        Close all of the connections of the pool.
+        """
+        with self.lock:
+            for connection in self.connections.values():
+                connection.disconnect()
+            self.connections.clear()
+
+    def metrics(self):
+        """
+        Get the usage metrics of the pool.
+
+        Returns:
+            dict: the counters of the pool and the current number of connections and active sessions.
+        """  # noqa: E501
+        with self.lock:
+            metrics = dict(self.counters)
+            metrics["connections"] = len(self.connections)
+            metrics["active_sessions"] = sum(
+                connection.active_sessions for connection in self.connections.values()
+            )
+
+        return metrics
+
+
+condor_ssh_pool = SSHConnectionPool()
+
+
+def prune_ssh_connections():
+    """
+    Close the SSH connections to Condor schedulers that have been idle for longer than the CONDOR_SSH_POOL_IDLE_TIMEOUT setting.
+    """  # noqa: E501
+    closed = condor_ssh_pool.prune()
+    if closed:
+        logger.debug(f"Closed {closed} idle SSH connections.")
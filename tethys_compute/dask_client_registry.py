@@ -0,0 +1,265 @@
+"""
+********************************************************************************
+* Name: dask_client_registry.py
+* Author: Tethys Platform Developers
+* Created On: October 2026
+* Copyright: (c) Tethys Geospatial Foundation 2026
+* License: BSD 2-Clause
+********************************************************************************
+"""
+
+import asyncio
+import atexit
+import logging
+import threading
+import weakref
+
+from tethys_portal.optional_dependencies import optional_import
+
+# optional imports
+Client = optional_import("Client", from_module="dask.distributed")
+
+logger = logging.getLogger(f"tethys.{__name__}")
+
+
+class _RegisteredClient:
+    def __init__(self, key, loop=None):
+        self.key = key
+        self.loop = loop
+        self.client = None
+        self.references = 0
+        self.lock = threading.Lock()
+        self.async_lock = None
+
+
+class DaskClientRegistry:
+    """
+    Process-wide registry of Dask clients, so that all of the jobs and requests that use the same Dask scheduler share one client instead of connecting (and disconnecting) each time.
+
+    Clients are keyed by scheduler address and client options and are reference counted: ``get_client`` adds a reference and ``release`` removes it. Clients whose connection failed are replaced the next time they are requested. Unused clients stay open until ``close_unused`` is called, and all clients are closed on shutdown.
+    """  # noqa: E501
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.clients = {}
+        self.references = {}
+
+    @staticmethod
+    def get_key(address, asynchronous=False, **options):
+        return address, asynchronous, tuple(sorted(options.items()))
+
+    @staticmethod
+    def is_connected(client):
+        """
+        Check if a client is still connected to its scheduler.
+        """
+        return client.status == "running"
+
+    def get_client(self, address=None, **options):
+        """
+        Get the shared client of a Dask scheduler and add a reference to it.
+
+        Args:
+            address (str): address of the scheduler. Defaults to a local cluster.
+            **options: other arguments of ``dask.distributed.Client`` (e.g. timeout).
+
+        Returns:
+            dask.distributed.Client: the shared client.
+        """  # noqa: E501
+        registered = self._get_registered(self.get_key(address, **options))
+
+        with registered.lock:
+            if registered.client is None or not self.is_connected(registered.client):
+                self._replace(registered, lambda: Client(address=address, **options))
+            return self._add_reference(registered)
+
+    def get_client_for(self, owner, address=None, **options):
+        """
+        Get the shared client of a Dask scheduler for an object (e.g. a DaskScheduler or a DaskJob), which holds its reference to the client until it is garbage collected.
+
+        Args:
+            owner (object): the object that uses the client.
+            address (str): address of the scheduler. Defaults to a local cluster.
+            **options: other arguments of ``dask.distributed.Client`` (e.g. timeout).
+
+        Returns:
+            dask.distributed.Client: the shared client.
+        """  # noqa: E501
+        client = getattr(owner, "_dask_client", None)
+        if client is not None and self.is_connected(client):
+            return client
+
+        finalizer = getattr(owner, "_dask_client_finalizer", None)
+        if finalizer:
+            finalizer()
+
+        client = self.get_client(address, **options)
+        owner._dask_client_finalizer = weakref.finalize(owner, self.release, client)
+        owner._dask_client = client
+        return client
+
+    async def get_async_client(self, address=None, **options):
+        """
+        Get the shared asynchronous client of a Dask scheduler for the running event loop and add a reference to it.
+
+        Args:
+            address (str): address of the scheduler. Defaults to a local cluster.
+            **options: other arguments of ``dask.distributed.Client`` (e.g. timeout).
+
+        Returns:
+            dask.distributed.Client: the shared asynchronous client.
+        """  # noqa: E501
+        loop = asyncio.get_running_loop()
+        key = self.get_key(address, asynchronous=id(loop), **options)
+        with self.lock:
+            registered = self.clients.get(key)
+            # The id of a closed loop may be reused by a new one
+            if registered is None or registered.loop is not loop:
+                registered = self.clients[key] = _RegisteredClient(key, loop)
+                registered.async_lock = asyncio.Lock()
+
+        async with registered.async_lock:
+            if registered.client is None or not self.is_connected(registered.client):
+                await self._replace_async(registered, address, options)
+            return self._add_reference(registered)
+
+    def release(self, client):
+        """
+        Remove a reference to a client. Clients that were replaced are closed when their last reference is removed.
+        """  # noqa: E501
+        with self.lock:
+            registered = self.references.get(id(client))
+            if (
+                registered is None
+                or registered.client is not client
+                or registered.references < 1
+            ):
+                return
+
+            registered.references -= 1
+            replaced = self.clients.get(registered.key) is not registered
+            if registered.references > 0 or not replaced:
+                return
+
+            del self.references[id(client)]
+
+        self._close(client)
+
+    def reference_count(self, client):
+        """
+        Get the number of references to a client.
+        """
+        with self.lock:
+            registered = self.references.get(id(client))
+            return registered.references if registered else 0
+
+    def close_unused(self):
+        """
+        Close the clients that nobody holds a reference to.
+
+        Returns:
+            int: number of clients that were closed.
+        """
+        with self.lock:
+            unused = [
+                registered
+                for registered in self.clients.values()
+                if registered.client is not None and not registered.references
+            ]
+            for registered in unused:
+                del self.clients[registered.key]
+                self.references.pop(id(registered.client), None)
+
+        for registered in unused:
+            self._close(registered.client)
+
+        return len(unused)
+
+    def close_all(self):
+        """
+        Close all of the clients (e.g. on shutdown).
+        """
+        with self.lock:
+            clients = [registered.client for registered in self.references.values()]
+            self.clients.clear()
+            self.references.clear()
+
+        for client in clients:
+            self._close(client)
+
+    def _get_registered(self, key):
+        with self.lock:
+            if key not in self.clients:
+                self.clients[key] = _RegisteredClient(key)
+            return self.clients[key]
+
+    def _add_reference(self, registered):
+        with self.lock:
+            registered.references += 1
+            self.references[id(registered.client)] = registered
+        return registered.client
+
+    def _replace(self, registered, create_client):
+        """
+        Connect a new client in place of a missing or failed one.
+        """
+        if registered.client is not None:
+            logger.warning(
+                f'The Dask client of "{registered.key[0]}" lost its connection. '
+                f"Reconnecting..."
+            )
+            unused = self._detach(registered)
+            if unused is not None:
+                self._close(unused)
+
+        registered.client = create_client()
+
+    async def _replace_async(self, registered, address, options):
+        if registered.client is not None:
+            unused = self._detach(registered)
+            if unused is not None:
+                try:
+                    await unused.close()
+                except Exception:
+                    logger.exception("Unable to close Dask client:")
+
+        registered.client = await Client(address=address, asynchronous=True, **options)
+
+    def _detach(self, registered):
+        """
+        Keep a failed client open for the callers that still reference it.
+
+        Returns:
+            dask.distributed.Client: the failed client if nobody references it, so it can be closed, else None.
+        """  # noqa: E501
+        with self.lock:
+            client, references = registered.client, registered.references
+            registered.client = None
+            registered.references = 0
+
+            if not references:
+                self.references.pop(id(client), None)
+                return client
+
+            old = _RegisteredClient(registered.key, registered.loop)
+            old.client = client
+            old.references = references
+            self.references[id(client)] = old
+
+    @staticmethod
+    def _close(client):
+        try:
+            result = client.close()
+            if asyncio.iscoroutine(result):
+                # Asynchronous clients are closed in their event loop
+                try:
+                    asyncio.get_running_loop()
+                    asyncio.ensure_future(result)
+                except RuntimeError:
+                    result.close()
+        except Exception:
+            logger.exception("Unable to close Dask client:")
+
+
+dask_client_registry = DaskClientRegistry()
+atexit.register(dask_client_registry.close_all)
@@ -0,0 +1,109 @@
+"""
+********************************************************************************
+* Name: dask_result_store.py
+* Author: Tethys Platform Developers
+* Created On: October 2026
+* Copyright: (c) Tethys Geospatial Foundation 2026
+* License: BSD 2-Clause
+********************************************************************************
+"""
+
+import logging
+import os
+import uuid
+import zlib
+
+from django.conf import settings
+
+from tethys_portal.optional_dependencies import optional_import
+
+# optional imports
+serialize_bytes, deserialize_bytes = optional_import(
+    ("serialize_bytes", "deserialize_bytes"), from_module="distributed.protocol"
+)
+
+logger = logging.getLogger(f"tethys.{__name__}")
+
+
+class DaskResultStore:
+    """
+    Storage of the results of Dask jobs. Results are serialized with Dask and compressed. Small results are stored in the database with the job, and larger results are written to files in the result storage path or in the workspace of the job.
+
+    Args:
+        storage_path (str): directory where large results are written. Defaults to the DASK_RESULT_STORAGE_PATH setting, or the workspace of the job if it is not set.
+        inline_max_size (int): maximum size in bytes of the compressed results that are stored in the database. Defaults to the DASK_RESULT_INLINE_MAX_SIZE setting.
+    """  # noqa: E501
+
+    def __init__(self, storage_path=None, inline_max_size=None):
+        self.storage_path = (
+            storage_path
+            if storage_path is not None
+            else getattr(settings, "DASK_RESULT_STORAGE_PATH", "")
+        )
+        self.inline_max_size = (
+            inline_max_size
+            if inline_max_size is not None
+            else getattr(settings, "DASK_RESULT_INLINE_MAX_SIZE", 65536)
+        )
+
+    @staticmethod
+    def dump(value):
+        """
+        Serialize and compress a result.
+
+        Returns:
+            bytes: the compressed result.
+        """
+        return zlib.compress(serialize_bytes(value))
+
+    @staticmethod
+    def load(blob):
+        """
+        Decompress and deserialize a result.
+        """
+        return deserialize_bytes(zlib.decompress(blob))
+
+    def save(self, blob, workspace=""):
+        """
+        Store a compressed result.
+
+        Args:
+            blob (bytes): the compressed result.
+            workspace (str): workspace of the job, where the result is written if no storage path is configured.
+
+        Returns:
+            tuple: the result to store in the database (or None) and the path of the file the result was written to (or an empty string).
+        """  # noqa: E501
+        directory = self.storage_path or workspace
+        if len(blob) <= self.inline_max_size or not directory:
+            return blob, ""
+
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"dask_result_{uuid.uuid4().hex}.zlib")
+
+        # Write to a temporary file first so that partial results are never read
+        with open(f"{path}.tmp", "wb") as f:
+            f.write(blob)
+        os.replace(f"{path}.tmp", path)
+
+        return None, path
+
+    @staticmethod
+    def read(path):
+        with open(path, "rb") as f:
+            return f.read()
+
+    @staticmethod
+    def delete(path):
+        """
+        Delete the file of a result, if it exists.
+        """
+        if not path:
+            return
+
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError:
+            logger.exception(f'Unable to delete Dask result "{path}":')
@@ -0,0 +1,85 @@
+"""
+********************************************************************************
+* Name: job_cleanup.py
+* Author: Tethys Platform Developers
+* Created On: October 2026
+* Copyright: (c) Tethys Geospatial Foundation 2026
+* License: BSD 2-Clause
+********************************************************************************
+"""
+
+import atexit
+import logging
+import queue
+import threading
+from functools import partial
+
+from django.db import transaction
+
+logger = logging.getLogger(f"tethys.{__name__}")
+
+# Maximum number of seconds to wait for the queued cleanup tasks when the process exits
+EXIT_TIMEOUT = 30
+
+
+class JobCleanupQueue:
+    """
+    Runs the cleanup of deleted jobs (e.g. removing their workspaces and their files on remote schedulers) in a background thread, so that deleting jobs (or the users and apps they belong to) does not wait for file systems and schedulers.
+    """  # noqa: E501
+
+    def __init__(self):
+        self.queue = queue.Queue()
+        self.lock = threading.Lock()
+        self.thread = None
+
+    def enqueue(self, fn, *args, using=None):
+        """
+        Queue a cleanup task once the current transaction is committed, so that nothing is cleaned up if the deletion is rolled back.
+
+        Args:
+            fn (callable): the cleanup function.
+            *args: the arguments of the function.
+            using (str): the alias of the database of the transaction.
+        """  # noqa: E501
+        transaction.on_commit(partial(self.put, fn, *args), using=using)
+
+    def put(self, fn, *args):
+        """
+        Queue a cleanup task now.
+        """
+        self.queue.put((fn, args))
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(
+                    target=self._run, name="tethys_job_cleanup", daemon=True
+                )
+                self.thread.start()
+
+    def _run(self):
+        while True:
+            fn, args = self.queue.get()
+            try:
+                fn(*args)
+            except Exception:
+                logger.exception("Unable to clean up a deleted job:")
+            finally:
+                self.queue.task_done()
+
+    def join(self, timeout=None):
+        """
+        Wait until the queued cleanup tasks are done.
+
+        Args:
+            timeout (float): maximum number of seconds to wait. Defaults to waiting until they are done.
+
+        Returns:
+            bool: True if all of the tasks are done, else False.
+        """  # noqa: E501
+        with self.queue.all_tasks_done:
+            return self.queue.all_tasks_done.wait_for(
+                lambda: not self.queue.unfinished_tasks, timeout
+            )
+
+
+job_cleanup_queue = JobCleanupQueue()
+atexit.register(job_cleanup_queue.join, EXIT_TIMEOUT)
@@ -0,0 +1,135 @@
+"""
+********************************************************************************
+* Name: job_logs.py
+* Author: Tethys Platform Developers
+* Created On: October 2026
+* Copyright: (c) Tethys Geospatial Foundation 2026
+* License: BSD 2-Clause
+********************************************************************************
+"""
+
+import fnmatch
+import io
+import os
+import posixpath
+from contextlib import contextmanager
+
+from django.conf import settings
+
+
+def get_chunk_size():
+    """
+    Get the default number of bytes of a log that are read at a time.
+    """
+    return getattr(settings, "JOB_LOG_CHUNK_SIZE", 65536)
+
+
+def get_range(size, offset=None, length=None):
+    """
+    Get the part of a log to read.
+
+    Args:
+        size (int): size of the log in bytes.
+        offset (int): position of the first byte to read. Defaults to reading the end (tail) of the log.
+        length (int): maximum number of bytes to read. Defaults to the JOB_LOG_CHUNK_SIZE setting.
+
+    Returns:
+        tuple: the start and the end positions of the part to read.
+    """  # noqa: E501
+    length = get_chunk_size() if length is None else max(0, int(length))
+    if offset is None:
+        start = max(0, size - length)
+    else:
+        start = min(max(0, int(offset)), size)
+    return start, min(start + length, size)
+
+
+def read_range(f, offset=None, length=None):
+    """
+    Read part of a log from a binary file object.
+
+    Args:
+        f (file): the log, opened in binary mode.
+        offset (int): position of the first byte to read. Defaults to reading the end (tail) of the log.
+        length (int): maximum number of bytes to read. Defaults to the JOB_LOG_CHUNK_SIZE setting.
+
+    Returns:
+        dict: the content that was read, its start ("offset") and end positions in the log and the size of the log.
+    """  # noqa: E501
+    f.seek(0, os.SEEK_END)
+    size = f.tell()
+    start, end = get_range(size, offset, length)
+    f.seek(start)
+    data = f.read(end - start)
+    return {
+        "content": data.decode("utf-8", errors="replace"),
+        "offset": start,
+        "end": start + len(data),
+        "size": size,
+    }
+
+
+def iter_range(f, offset=0, chunk_size=None):
+    """
+    Read a log from a binary file object one chunk at a time.
+
+    Args:
+        f (file): the log, opened in binary mode.
+        offset (int): position of the first byte to read. Default is 0.
+        chunk_size (int): number of bytes of each chunk. Defaults to the JOB_LOG_CHUNK_SIZE setting.
+
+    Yields:
+        bytes: the chunks of the log.
+    """  # noqa: E501
+    chunk_size = chunk_size or get_chunk_size()
+    f.seek(offset or 0)
+    while True:
+        data = f.read(chunk_size)
+        if not data:
+            return
+        yield data
+
+
+@contextmanager
+def open_log(path, remote=None):
+    """
+    Open a log file in binary mode.
+
+    Args:
+        path (str): path of the log.
+        remote (condorpy.remote_utils.RemoteClient): client of the remote host the log is on, or None if it is local.
+    """  # noqa: E501
+    if remote is None:
+        f = open(path, "rb")
+    else:
+        f = remote.remote_file(path, "rb")
+
+    try:
+        yield f
+    finally:
+        f.close()
+
+
+@contextmanager
+def open_text(text):
+    """
+    Open a log that is already in memory as a binary file object.
+    """
+    with io.BytesIO((text or "").encode("utf-8")) as f:
+        yield f
+
+
+def find_remote_file(remote, pattern):
+    """
+    Find the first remote file that matches a glob pattern, like glob does for local files.
+
+    Returns:
+        str: the path of the file, or None if no file matches.
+    """  # noqa: E501
+    directory, name = posixpath.split(pattern)
+    try:
+        matches = fnmatch.filter(sorted(remote.sftp.listdir(directory or ".")), name)
+    except IOError:
+        return None
+
+    return posixpath.join(directory, matches[0]) if matches else None
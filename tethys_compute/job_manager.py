@@ -10,7 +10,11 @@
 
 import logging
 
-from django.contrib.auth.models import User
+from django.contrib.auth.models import Group, User
+from django.core.exceptions import FieldDoesNotExist
+from django.db import transaction
+from django.db.models import CharField, Q, Value
+from django.db.models.constants import LOOKUP_SEP
 from django.urls import reverse
 from guardian.utils import get_anonymous_user
 
@@ -19,6 +23,8 @@ from tethys_compute.models.basic_job import BasicJob
 from tethys_compute.models.dask.dask_job import DaskJob
 from tethys_compute.models.condor.condor_job import CondorJob
 from tethys_compute.models.condor.condor_workflow import CondorWorkflow
+from tethys_compute.models.pool.process_pool_job import ProcessPoolJob
+from tethys_compute.models.pool.thread_pool_job import ThreadPoolJob
 from tethys_apps.base.paths import get_user_workspace
 
 log = logging.getLogger("tethys.tethys_compute.job_manager")
@@ -29,6 +35,8 @@ JOB_TYPES = {
     "CONDORWORKFLOW": CondorWorkflow,
     "BASIC": BasicJob,
     "DASK": DaskJob,
+    "PROCESS_POOL": ProcessPoolJob,
+    "THREAD_POOL": ThreadPoolJob,
 }
 
 
@@ -66,25 +74,132 @@ class JobManager:
         Returns:
             A new job object of the type specified by job_type.
         """  # noqa: E501
+        job = self._build_job(name, user, job_type, **kwargs)
+
+        if groups:
+            # Need to save the job before we can assign the groups
+            job.save()
+            job.groups.add(groups)
+        return job
+
+    def create_jobs(
+        self, specs, user=None, groups=None, job_type=None, batch_size=None
+    ):
+        """
+        Creates and saves many new jobs at once (e.g. the jobs of a parameter sweep), with a few queries per batch of jobs instead of several queries per job.
+
+        Args:
+            specs (list of dict): The arguments of ``create_job`` for each job (e.g. ``name``, ``user``, ``groups``, ``job_type`` and the fields of the job type).
+            user (django.contrib.auth.User, optional): The user of the jobs whose spec has no user.
+            groups (django.contrib.auth.Group, optional): A Group or list of Groups assigned to the jobs whose spec has no groups.
+            job_type (TethysJob, optional): The job type of the jobs whose spec has no job_type.
+            batch_size (int, optional): The maximum number of jobs inserted with each query. Defaults to the maximum supported by the database.
+
+        Returns:
+            list: The saved jobs, in the order of the specs.
+
+        **Example:**
+
+        ::
+
+            jobs = job_manager.create_jobs(
+                [{"name": f"sweep_{i}", "extended_properties": {"alpha": alpha}} for i, alpha in enumerate(alphas)],
+                user=request.user,
+                job_type="DASK",
+            )
+        """  # noqa: E501
+        jobs = []
+        job_groups = []
+        workspaces = dict()
+        for spec in specs:
+            spec = dict(spec)
+            spec.setdefault("user", user)
+            spec.setdefault("job_type", job_type)
+            spec_groups = spec.pop("groups", groups) or []
+            if isinstance(spec_groups, Group):
+                spec_groups = [spec_groups]
+            jobs.append(self._build_job(workspaces=workspaces, **spec))
+            job_groups.append(spec_groups)
+
+        with transaction.atomic():
+            TethysJob.create_many(jobs, batch_size=batch_size)
+
+            Membership = TethysJob.groups.through
+            Membership.objects.bulk_create(
+                [
+                    Membership(tethysjob_id=job.id, group_id=group.id)
+                    for job, spec_groups in zip(jobs, job_groups)
+                    for group in spec_groups
+                ],
+                batch_size=batch_size,
+            )
+
+        return jobs
+
+    def _build_job(self, name, user, job_type, workspaces=None, **kwargs):
+        """
+        Create a new job object without saving it. The paths of the user workspaces are cached in ``workspaces``, if given.
+        """  # noqa: E501
         # Allow the job class to be passed in as job_type.
         if isinstance(job_type, str):
             job_type = JOB_TYPES[job_type]
         if isinstance(user, User) and user.is_anonymous:
             user = get_anonymous_user()
-        user_workspace = get_user_workspace(self.app, user)
-        kwrgs = dict(
-            name=name, user=user, label=self.label, workspace=user_workspace.path
-        )
+        if workspaces is None:
+            workspace = get_user_workspace(self.app, user).path
+        else:
+            key = getattr(user, "pk", user)
+            if key not in workspaces:
+                workspaces[key] = get_user_workspace(self.app, user).path
+            workspace = workspaces[key]
+        kwrgs = dict(name=name, user=user, label=self.label, workspace=workspace)
         kwrgs.update(kwargs)
-        job = job_type(**kwrgs)
+        return job_type(**kwrgs)
 
-        if groups:
-            # Need to save the job before we can assign the groups
-            job.save()
-            job.groups.add(groups)
-        return job
+    def submit_many(self, jobs, args=None, kwargs=None, max_workers=None):
+        """
+        Executes many jobs, with no more than ``max_workers`` jobs of each job type and scheduler being executed at once. The jobs are grouped by job type and scheduler so that job types can submit the jobs of a group together (e.g. the Delayed objects of DaskJobs are computed with one call to the client of their scheduler).
+
+        Args:
+            jobs (list): The jobs to execute.
+            args (list, optional): The positional arguments of ``execute`` for each job (e.g. ``[(delayed,), ...]`` for DaskJobs). Default is no arguments.
+            kwargs (list, optional): The key-word arguments of ``execute`` for each job. Default is no key-word arguments.
+            max_workers (int, optional): The maximum number of jobs of each group that are executed at once. Defaults to the JOB_SUBMIT_MAX_WORKERS setting.
+
+        Returns:
+            list: The jobs.
+        """  # noqa: E501
+        jobs = list(jobs)
+        args = [()] * len(jobs) if args is None else list(args)
+        kwargs = [{}] * len(jobs) if kwargs is None else list(kwargs)
+        if not len(jobs) == len(args) == len(kwargs):
+            raise ValueError(
+                "The args and kwargs parameters must have one item for each job."
+            )
+
+        groups = dict()
+        for execution in zip(jobs, args, kwargs):
+            job = execution[0]
+            key = (
+                type(job).get_status_update_class(),
+                getattr(job, "scheduler_id", None),
+            )
+            groups.setdefault(key, []).append(execution)
+
+        for (job_class, _), executions in groups.items():
+            job_class.execute_many(executions, max_workers=max_workers)
 
-    def list_jobs(self, user=None, groups=None, order_by="id", filters=None):
+        return jobs
+
+    def list_jobs(
+        self,
+        user=None,
+        groups=None,
+        order_by="id",
+        filters=None,
+        page_size=None,
+        after=None,
+    ):
         """
         Lists all the jobs from current app for current user.
 
@@ -93,11 +208,20 @@ class JobManager:
             together with the groups parameter. Choose one or the other.
             groups (django.contrib.auth.Group, optional): One or more Group objects to filter the jobs by. Default is None. This parameter
             cannot be passed together with the user parameter. Choose one or the other.
-            order_by (str, optional): An expression to order jobs. Default is 'id'.
+            order_by (str, optional): An expression to order jobs. When a page_size is given, it must be a field of TethysJob that cannot be null (see get_page). Default is 'id'.
             filters (dict, optional): A list of key-value pairs to filter the jobs by. Default is None.
+            page_size (int, optional): The maximum number of jobs to list. When given, only one page of jobs is listed and only the tables of the job types on the page are queried. Default is None (all jobs).
+            after (int, optional): The id of the last job of the previous page, to list the next page of jobs. Default is None (first page).
 
         Returns:
             A list of jobs created in the app (and by the user if the user argument is passed in).
+
+        **Example:**
+
+        ::
+
+            page = job_manager.list_jobs(user=request.user, order_by="-creation_time", page_size=50)
+            next_page = job_manager.list_jobs(user=request.user, order_by="-creation_time", page_size=50, after=page[len(page) - 1].id)
         """  # noqa: E501
         if user and groups:
             raise ValueError(
@@ -113,11 +237,129 @@ class JobManager:
         elif user:
             filters["user"] = user
 
-        jobs = (
-            TethysJob.objects.filter(**filters).order_by(order_by).select_subclasses()
+        if page_size is None:
+            if after is not None:
+                raise ValueError("The after parameter requires a page_size.")
+            return (
+                TethysJob.objects.filter(**filters)
+                .order_by(order_by)
+                .select_subclasses()
+            )
+
+        return self.get_page(
+            TethysJob.objects.filter(**filters), page_size, order_by, after
         )
 
-        return jobs
+    @classmethod
+    def get_page(cls, jobs, page_size, order_by="id", after=None):
+        """
+        Get one page of jobs using keyset pagination. Only the tables of the job types on the page are queried.
+
+        Args:
+            jobs (QuerySet): A TethysJob queryset with the jobs to page through.
+            page_size (int): The maximum number of jobs in the page.
+            order_by (str, optional): A field to order jobs by, prefixed with "-" for descending order. Jobs with the same value are ordered by id. Only fields of TethysJob that cannot be null are supported. Default is 'id'.
+            after (int, optional): The id of the last job of the previous page. Jobs with a greater id (or a lower id in descending order) are listed if this job no longer exists. Default is None (first page).
+
+        Returns:
+            A queryset of the jobs in the page, as instances of their subclass of TethysJob.
+
+        Raises:
+            ValueError: if the jobs cannot be paged through in the given order.
+        """  # noqa: E501
+        # Order by id last so that every job has a unique position for the next page
+        field = order_by.lstrip("-")
+        descending = order_by.startswith("-")
+        cls._check_page_field(field)
+        ordering = (
+            [order_by]
+            if field in ("id", "pk")
+            else [order_by, "-id" if descending else "id"]
+        )
+
+        if after is not None:
+            jobs = jobs.filter(cls._get_after_filter(field, descending, after))
+
+        # Get the page from the jobs table alone, then load only the job types on the page
+        job_ids = list(
+            jobs.order_by(*ordering).values_list("id", flat=True)[:page_size]
+        )
+        job_classes = cls._get_job_classes(job_ids)
+
+        return (
+            TethysJob.objects.filter(id__in=job_ids)
+            .order_by(*ordering)
+            .select_subclasses(*job_classes)
+        )
+
+    @staticmethod
+    def _check_page_field(field):
+        """
+        Check that jobs can be paged through in the order of the given field. Null values cannot be compared with the last job of the previous page (and are sorted first or last depending on the database).
+        """  # noqa: E501
+        if field == "pk":
+            return
+
+        try:
+            model_field = TethysJob._meta.get_field(field)
+        except FieldDoesNotExist:
+            model_field = None
+
+        if (
+            model_field is None
+            or not model_field.concrete
+            or model_field.null
+            or model_field.is_relation
+        ):
+            raise ValueError(
+                f'Jobs cannot be listed one page at a time in the order of "{field}". '
+                f"Please order them by a field of TethysJob that cannot be null."
+            )
+
+    @staticmethod
+    def _get_after_filter(field, descending, after):
+        """
+        Get the filter of the jobs that come after the given job in the given order.
+        """
+        lookup = "lt" if descending else "gt"
+        if field in ("id", "pk"):
+            return Q(**{f"id__{lookup}": after})
+
+        values = TethysJob.objects.filter(id=after).values_list(field, flat=True)
+        if not values:
+            # The job was deleted since the previous page was listed
+            return Q(**{f"id__{lookup}": after})
+
+        value = values[0]
+        return Q(**{f"{field}__{lookup}": value}) | Q(
+            **{field: value, f"id__{lookup}": after}
+        )
+
+    @staticmethod
+    def _get_job_classes(job_ids):
+        """
+        Get the paths of the most specific job classes of the given jobs (e.g. "condorbase__condorjob"), querying the table of each job class alone.
+        """  # noqa: E501
+        if not job_ids:
+            return []
+
+        tables = []
+        for path in TethysJob.objects.select_subclasses().subclasses:
+            job_class = TethysJob
+            for name in path.split(LOOKUP_SEP):
+                job_class = job_class._meta.get_field(name).related_model
+            tables.append(
+                job_class._base_manager.filter(pk__in=job_ids)
+                .annotate(path=Value(path, output_field=CharField()))
+                .values_list("pk", "path")
+            )
+
+        job_classes = dict()
+        for job_id, path in tables[0].union(*tables[1:], all=True):
+            if path.count(LOOKUP_SEP) >= job_classes.get(job_id, "").count(LOOKUP_SEP):
+                job_classes[job_id] = path
+
+        return sorted(set(job_classes.values()))
 
     def get_job(self, job_id, user=None, filters=None):
         """
@@ -0,0 +1,147 @@
+"""
+********************************************************************************
+* Name: job_poller.py
+* Author: Tethys Platform Developers
+* Created On: October 2026
+* Copyright: (c) Tethys Geospatial Foundation 2026
+* License: BSD 2-Clause
+********************************************************************************
+"""
+
+import asyncio
+import logging
+
+from channels.db import database_sync_to_async
+from django.conf import settings
+from django.db.models import Q
+
+logger = logging.getLogger(f"tethys.{__name__}")
+
+
+class JobStatusPoller:
+    """
+    Updates the statuses of all executed jobs that are pending or running, so that they progress and their results are processed whether or not anyone is looking at them.
+
+    Jobs are grouped by job type and scheduler, and the jobs of each group are updated in batches with ``TethysJob.update_statuses``, so that job types can query the statuses of a whole batch at once.
+
+    Args:
+        batch_size (int): maximum number of jobs updated together. Defaults to the JOB_STATUS_POLL_BATCH_SIZE setting.
+        concurrency (int): maximum number of groups updated at the same time. Defaults to the JOB_STATUS_POLL_CONCURRENCY setting.
+    """  # noqa: E501
+
+    def __init__(self, batch_size=None, concurrency=None):
+        self.batch_size = batch_size or getattr(
+            settings, "JOB_STATUS_POLL_BATCH_SIZE", 100
+        )
+        self.concurrency = concurrency or getattr(
+            settings, "JOB_STATUS_POLL_CONCURRENCY", 4
+        )
+
+    def get_job_groups(self):
+        """
+        Get the executed jobs whose status may still change.
+
+        Returns:
+            dict: lists of jobs keyed by status update class and scheduler id.
+        """
+        from tethys_compute.models import TethysJob
+
+        jobs = (
+            TethysJob.objects.filter(
+                Q(_status__in=TethysJob.NON_TERMINAL_STATUS_CODES) | Q(_status="OTH"),
+                execute_time__isnull=False,
+            )
+            .order_by("id")
+            .select_subclasses()
+        )
+
+        groups = {}
+        for job in jobs:
+            # Custom statuses are only known by their display name
+            if job.is_update_needed():
+                key = (
+                    type(job).get_status_update_class(),
+                    getattr(job, "scheduler_id", None),
+                )
+                groups.setdefault(key, []).append(job)
+
+        return groups
+
+    def update_jobs(self, job_class, jobs):
+        """
+        Update the statuses of a group of jobs in batches.
+
+        Args:
+            job_class (type): the class of the jobs.
+            jobs (list of TethysJob): jobs of the same type and scheduler.
+
+        Returns:
+            int: number of jobs that were updated.
+        """
+        updated = 0
+        for start in range(0, len(jobs), self.batch_size):
+            batch = jobs[start : start + self.batch_size]
+            try:
+                updated += len(job_class.update_statuses(batch))
+            except Exception:
+                logger.exception(
+                    f"Unable to update the statuses of {job_class.__name__} jobs "
+                    f"{', '.join(str(job.id) for job in batch)}:"
+                )
+
+        return updated
+
+    async def poll(self):
+        """
+        Update the statuses of all pending and running jobs once.
+
+        Returns:
+            int: number of jobs that were updated.
+        """
+        groups = await database_sync_to_async(self.get_job_groups)()
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def update_group(job_class, jobs):
+            async with semaphore:
+                # Each group is updated in a thread of its own, so that slow
+                # schedulers do not hold up the others
+                return await database_sync_to_async(
+                    self.update_jobs, thread_sensitive=False
+                )(job_class, jobs)
+
+        updated = await asyncio.gather(
+            *(update_group(job_class, jobs) for (job_class, _), jobs in groups.items())
+        )
+        logger.debug(
+            f"Updated the statuses of {sum(updated)} of "
+            f"{sum(len(jobs) for jobs in groups.values())} pending and running jobs."
+        )
+        return sum(updated)
+
+    async def run(self, interval, count=None):
+        """
+        Poll the statuses of the jobs periodically.
+
+        Args:
+            interval (int): number of seconds to wait between polls.
+            count (int): number of polls. Defaults to polling indefinitely.
+        """
+        while count is None or count > 0:
+            try:
+                await self.poll()
+            except Exception:
+                logger.exception("Unable to poll the statuses of the jobs:")
+
+            if count is not None:
+                count -= 1
+                if not count:
+                    break
+
+            await asyncio.sleep(interval)
+
+
+async def poll_job_statuses():
+    """
+    Update the statuses of all pending and running jobs once (see the JOB_STATUS_POLL_INTERVAL setting).
+    """  # noqa: E501
+    await JobStatusPoller().poll()
@@ -0,0 +1,256 @@
+"""
+********************************************************************************
+* Name: job_pools.py
+* Author: Tethys Platform Developers
+* Created On: October 2026
+* Copyright: (c) Tethys Geospatial Foundation 2026
+* License: BSD 2-Clause
+********************************************************************************
+"""
+
+import atexit
+import logging
+import multiprocessing
+import os
+import pickle
+import sys
+import threading
+import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from pathlib import Path
+
+from django.conf import settings
+
+from tethys_apps.base.function_extractor import TethysFunctionExtractor
+
+logger = logging.getLogger(f"tethys.{__name__}")
+
+PROCESS = "process"
+THREAD = "thread"
+
+# Files written to the run directory of a job
+STDOUT_FILE = "stdout.log"
+STDERR_FILE = "stderr.log"
+ERROR_FILE = "error.log"
+RESULT_FILE = "result.pkl"
+CANCELLED_FILE = "cancelled"
+
+_capture = threading.local()
+_install_lock = threading.Lock()
+
+
+class _OutputRouter:
+    """
+    Replaces ``sys.stdout`` or ``sys.stderr`` to write the output of each thread that is running a job to the log of the job, and the output of other threads to the original stream.
+    """  # noqa: E501
+
+    def __init__(self, stream, name):
+        self.stream = stream
+        self.name = name
+
+    def _get_target(self):
+        return getattr(_capture, self.name, None) or self.stream
+
+    def write(self, s):
+        return self._get_target().write(s)
+
+    def flush(self):
+        self._get_target().flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+def _install_output_routers():
+    with _install_lock:
+        if not isinstance(sys.stdout, _OutputRouter):
+            sys.stdout = _OutputRouter(sys.stdout, "stdout")
+        if not isinstance(sys.stderr, _OutputRouter):
+            sys.stderr = _OutputRouter(sys.stderr, "stderr")
+
+
+@contextmanager
+def capture_output(stdout, stderr):
+    """
+    Write what the current thread prints to the given files.
+    """
+    _install_output_routers()
+    _capture.stdout, _capture.stderr = stdout, stderr
+    try:
+        yield
+    finally:
+        _capture.stdout = _capture.stderr = None
+
+
+def write_file(path, data):
+    """
+    Write a file of the run directory of a job atomically, so other processes never read part of it.
+    """  # noqa: E501
+    path = Path(path)
+    temp_path = path.with_name(f".{path.name}.tmp")
+    temp_path.write_bytes(data)
+    os.replace(temp_path, path)
+
+
+def run_job(function, args, kwargs, run_directory):
+    """
+    Run the function of a process pool or thread pool job in a worker of its pool. What the function prints is written to the stdout and stderr logs of the job, and its result (or the traceback of the exception it raised) to the run directory of the job.
+
+    Args:
+        function (str): dotted path of the function.
+        args (list): positional arguments of the function.
+        kwargs (dict): key-word arguments of the function.
+        run_directory (str): the run directory of the job.
+
+    Returns:
+        bool: True if the function succeeded, else False.
+    """  # noqa: E501
+    run_directory = Path(run_directory)
+    with open(run_directory / STDOUT_FILE, "w") as stdout, open(
+        run_directory / STDERR_FILE, "w"
+    ) as stderr:
+        try:
+            with capture_output(stdout, stderr):
+                function = TethysFunctionExtractor(function, None, throw=True).function
+                result = function(*args, **kwargs)
+            data = pickle.dumps(result)
+        except Exception:
+            write_file(run_directory / ERROR_FILE, traceback.format_exc().encode())
+            return False
+
+    # The result of a job that was stopped while it was running is discarded
+    if (run_directory / CANCELLED_FILE).exists():
+        return False
+
+    write_file(run_directory / RESULT_FILE, data)
+    return True
+
+
+def init_worker(setup_django=True):
+    """
+    Initialize a process of a process pool. Django is set up so that the functions of the jobs can use the models and settings of the portal.
+    """  # noqa: E501
+    if setup_django and os.environ.get("DJANGO_SETTINGS_MODULE"):
+        import django
+
+        django.setup()
+
+
+class JobPoolRegistry:
+    """
+    Process-wide registry of the pools that run process pool and thread pool jobs. Each app has a pool of each kind in each process that runs jobs, and the number of workers of the pool limits the number of jobs of the app that run at once (see the ``JOB_POOL_MAX_WORKERS`` and ``JOB_POOL_APP_MAX_WORKERS`` settings). Jobs submitted while all of the workers are busy wait in the queue of the pool.
+    """  # noqa: E501
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.pools = {}
+        self.futures = {}
+
+    @staticmethod
+    def get_max_workers(label):
+        """
+        Get the maximum number of jobs of an app that run at once in each pool.
+
+        Args:
+            label (str): the label of the jobs of the app (i.e. the package of the app).
+
+        Returns:
+            int: the maximum number of workers, or None for the default of ``concurrent.futures``.
+        """  # noqa: E501
+        app_max_workers = getattr(settings, "JOB_POOL_APP_MAX_WORKERS", None) or {}
+        return app_max_workers.get(
+            label, getattr(settings, "JOB_POOL_MAX_WORKERS", None)
+        )
+
+    def get_pool(self, kind, label):
+        """
+        Get the pool of an app, creating it the first time (or if a process of the pool died).
+
+        Args:
+            kind (str): PROCESS or THREAD.
+            label (str): the label of the jobs of the app.
+
+        Returns:
+            concurrent.futures.Executor: the pool.
+        """  # noqa: E501
+        key = (kind, label)
+        with self.lock:
+            pool = self.pools.get(key)
+            if pool is None or getattr(pool, "_broken", False):
+                pool = self.pools[key] = self._create_pool(kind, label)
+            return pool
+
+    def _create_pool(self, kind, label):
+        max_workers = self.get_max_workers(label)
+        if kind == PROCESS:
+            start_method = getattr(settings, "JOB_PROCESS_POOL_START_METHOD", "spawn")
+            setup_django = getattr(settings, "JOB_PROCESS_POOL_SETUP_DJANGO", True)
+            return ProcessPoolExecutor(
+                max_workers,
+                mp_context=multiprocessing.get_context(start_method),
+                initializer=init_worker,
+                initargs=(setup_django,),
+            )
+        return ThreadPoolExecutor(max_workers, thread_name_prefix=f"tethys_job_{label}")
+
+    def submit(self, kind, label, job_id, fn, *args):
+        """
+        Submit the function of a job to the pool of its app.
+
+        Args:
+            kind (str): PROCESS or THREAD.
+            label (str): the label of the job.
+            job_id (int): the id of the job.
+            fn (callable): the function to call in a worker of the pool.
+            *args: the arguments of the function.
+
+        Returns:
+            concurrent.futures.Future: the future of the job, which is tracked until it is done.
+        """  # noqa: E501
+        future = self.get_pool(kind, label).submit(fn, *args)
+        with self.lock:
+            self.futures[job_id] = future
+        future.add_done_callback(partial(self._discard, job_id))
+        return future
+
+    def _discard(self, job_id, future):
+        with self.lock:
+            if self.futures.get(job_id) is future:
+                del self.futures[job_id]
+
+    def get_future(self, job_id):
+        """
+        Get the future of a job that was submitted by this process and is not done yet.
+        """
+        with self.lock:
+            return self.futures.get(job_id)
+
+    def cancel(self, job_id):
+        """
+        Cancel a job that is waiting for a worker of its pool.
+
+        Returns:
+            bool: True if the job was cancelled, else False (e.g. if it is running or was submitted by another process).
+        """  # noqa: E501
+        future = self.get_future(job_id)
+        return future is not None and future.cancel()
+
+    def shutdown(self, wait=False):
+        """
+        Shut down all of the pools, cancelling the jobs that did not start.
+        """
+        with self.lock:
+            pools = list(self.pools.values())
+            self.pools.clear()
+
+        for pool in pools:
+            try:
+                pool.shutdown(wait=wait, cancel_futures=True)
+            except Exception as e:
+                logger.warning(f"Unable to shut down job pool: {e}")
+
+
+job_pool_registry = JobPoolRegistry()
+atexit.register(job_pool_registry.shutdown)
@@ -0,0 +1,199 @@
+"""
+********************************************************************************
+* Name: job_retention.py
+* Author: Tethys Platform Developers
+* Created On: October 2026
+* Copyright: (c) Tethys Geospatial Foundation 2026
+* License: BSD 2-Clause
+********************************************************************************
+"""
+
+import datetime
+import gzip
+import json
+import logging
+import operator
+import re
+from functools import reduce
+from pathlib import Path
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models, transaction
+from django.db.models import Q
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+logger = logging.getLogger(f"tethys.{__name__}")
+
+AGE_UNITS = {"s": "seconds", "m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+
+
+def parse_age(value):
+    """
+    Parse an age like "30d", "12h" or "2w" (s, m, h, d and w units). A number without a unit is a number of days.
+
+    Returns:
+        datetime.timedelta: the age.
+
+    Raises:
+        ValueError: if the age is not valid.
+    """  # noqa: E501
+    match = re.fullmatch(r"(\d+)([smhdw]?)", str(value).strip().lower())
+    if not match:
+        raise ValueError(
+            f'Invalid age "{value}". Use a number followed by one of the units '
+            f's, m, h, d or w (e.g. "30d").'
+        )
+    number, unit = match.groups()
+    return datetime.timedelta(**{AGE_UNITS[unit or "d"]: int(number)})
+
+
+def get_expired_jobs(older_than=None, label=None):
+    """
+    Get the jobs that are past their retention period: the jobs with a terminal status that completed (or were created, if they have no completion time) longer ago than the retention period of their app. The retention periods are set with the JOB_RETENTION_DAYS and JOB_RETENTION_APP_DAYS settings.
+
+    Args:
+        older_than (datetime.timedelta): retention period of all of the apps, instead of the settings.
+        label (str): only get the jobs of the app with this label (i.e. the package of the app).
+
+    Returns:
+        QuerySet: the expired jobs.
+    """  # noqa: E501
+    from tethys_compute.models import TethysJob
+
+    now = timezone.now()
+    jobs = TethysJob.objects.filter(
+        _status__in=TethysJob.TERMINAL_STATUS_CODES
+    ).annotate(retention_time=Coalesce("completion_time", "creation_time"))
+    if label:
+        jobs = jobs.filter(label=label)
+
+    if older_than is not None:
+        return jobs.filter(retention_time__lt=now - older_than)
+
+    default_days = getattr(settings, "JOB_RETENTION_DAYS", None)
+    app_days = getattr(settings, "JOB_RETENTION_APP_DAYS", None) or {}
+    policies = [
+        Q(label=app_label, retention_time__lt=now - datetime.timedelta(days=days))
+        for app_label, days in app_days.items()
+        if days is not None
+    ]
+    if default_days is not None:
+        policies.append(
+            Q(retention_time__lt=now - datetime.timedelta(days=default_days))
+            & ~Q(label__in=list(app_days))
+        )
+
+    if not policies:
+        return jobs.none()
+    return jobs.filter(reduce(operator.or_, policies))
+
+
+class JobArchiveEncoder(DjangoJSONEncoder):
+    """
+    Encodes the values of fields of custom types as strings.
+    """
+
+    def default(self, o):
+        try:
+            return super().default(o)
+        except TypeError:
+            return str(o)
+
+
+def serialize_job(job):
+    """
+    Get the metadata of a job as it is archived: its type, user, groups and the values of its fields. Binary fields (e.g. the results of Dask jobs) are not archived.
+
+    Returns:
+        dict: the metadata of the job.
+    """  # noqa: E501
+    data = {
+        "type": job.type,
+        "username": job.user.username,
+        "groups": [group.name for group in job.groups.all()],
+    }
+    parent_links = set(job._meta.parents.values())
+    for field in job._meta.concrete_fields:
+        if field in parent_links or isinstance(field, models.BinaryField):
+            continue
+        data[field.attname] = field.value_from_object(job)
+    return data
+
+
+class JobPurger:
+    """
+    Deletes jobs in batches, with one transaction per batch, after appending the metadata of each batch to a compressed JSON Lines archive (one job per line). The cleanup of the workspaces and remote files of the deleted jobs runs in the background (see ``tethys_compute.job_cleanup``).
+
+    Args:
+        batch_size (int): maximum number of jobs deleted in each transaction. Defaults to the JOB_PURGE_BATCH_SIZE setting.
+        archive_path (str): directory where the archives are written. Defaults to the JOB_ARCHIVE_PATH setting.
+        archive (bool): archive the jobs before they are deleted. Defaults to True.
+    """  # noqa: E501
+
+    def __init__(self, batch_size=None, archive_path=None, archive=True):
+        self.batch_size = batch_size or getattr(settings, "JOB_PURGE_BATCH_SIZE", 1000)
+        self.archive_path = archive_path or getattr(settings, "JOB_ARCHIVE_PATH", "")
+        self.archive = archive
+        self.archive_file = None
+
+    def get_archive_file(self):
+        """
+        Get the path of the archive of this purge, in the archive directory.
+        """
+        if self.archive_file is None:
+            timestamp = timezone.now().strftime("%Y%m%dT%H%M%S%f")
+            self.archive_file = (
+                Path(self.archive_path) / f"tethys_jobs_{timestamp}.jsonl.gz"
+            )
+        return self.archive_file
+
+    def archive_jobs(self, jobs):
+        """
+        Append the metadata of the jobs to the archive. Each batch is written as a complete gzip member, so the archive stays readable if a purge is interrupted.
+        """  # noqa: E501
+        archive_file = self.get_archive_file()
+        archive_file.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(archive_file, "at", encoding="utf-8") as f:
+            for job in jobs:
+                f.write(json.dumps(serialize_job(job), cls=JobArchiveEncoder))
+                f.write("\n")
+
+    def purge(self, jobs):
+        """
+        Archive and delete jobs.
+
+        Args:
+            jobs (QuerySet): the TethysJob queryset of the jobs to delete (e.g. from ``get_expired_jobs``).
+
+        Returns:
+            int: number of jobs that were deleted.
+        """  # noqa: E501
+        from tethys_compute.models import TethysJob
+
+        job_ids = jobs.order_by("id").values_list("id", flat=True)
+        deleted = 0
+        last_id = None
+        while True:
+            batch_ids = job_ids if last_id is None else job_ids.filter(id__gt=last_id)
+            batch_ids = list(batch_ids[: self.batch_size])
+            if not batch_ids:
+                break
+            last_id = batch_ids[-1]
+
+            with transaction.atomic():
+                batch = TethysJob.objects.filter(id__in=batch_ids)
+                if self.archive:
+                    self.archive_jobs(
+                        batch.order_by("id")
+                        .select_subclasses()
+                        .select_related("user")
+                        .prefetch_related("groups")
+                    )
+                batch.delete()
+
+            deleted += len(batch_ids)
+            logger.info(f"Purged {deleted} jobs.")
+
+        return deleted
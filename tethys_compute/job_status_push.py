@@ -0,0 +1,145 @@
+"""
+********************************************************************************
+* Name: job_status_push.py
+* Author: Tethys Platform Developers
+* Created On: October 2026
+* Copyright: (c) Tethys Geospatial Foundation 2026
+* License: BSD 2-Clause
+********************************************************************************
+"""
+
+import logging
+import threading
+from contextlib import contextmanager
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.db import transaction
+
+logger = logging.getLogger(f"tethys.{__name__}")
+
+_local = threading.local()
+
+
+def get_user_group(user_id):
+    """
+    Get the name of the channel layer group that receives the status changes of all of the jobs of a user.
+    """  # noqa: E501
+    return f"tethys_jobs_user_{user_id}"
+
+
+def get_job_group(job_id):
+    """
+    Get the name of the channel layer group that receives the status changes of a job.
+    """
+    return f"tethys_jobs_job_{job_id}"
+
+
+def get_status_data(job):
+    """
+    Get the status of a job in the format it is pushed to clients.
+    """
+    return {
+        "job_id": job.id,
+        "status": job.cached_status,
+        "status_code": job._status,
+    }
+
+
+class PendingStatuses(dict):
+    """
+    The status changes published in a transaction, by job id. They are sent when the transaction is committed, and discarded with the transaction (or savepoint) when it is rolled back.
+    """  # noqa: E501
+
+    savepoint_ids = None
+
+    def __call__(self):
+        send(self)
+
+    def schedule(self):
+        """
+        Send the status changes once the current transaction is committed (or now if there is no transaction).
+        """  # noqa: E501
+        self.savepoint_ids = set(transaction.get_connection().savepoint_ids)
+        transaction.on_commit(self)
+
+    def is_scheduled(self):
+        """
+        Check if the status changes will be sent when the current transaction is committed, from the current savepoint.
+        """  # noqa: E501
+        connection = transaction.get_connection()
+        return (
+            connection.in_atomic_block
+            and self.savepoint_ids == set(connection.savepoint_ids)
+            and any(callback[1] is self for callback in connection.run_on_commit)
+        )
+
+
+def _add_pending(changes):
+    pending = getattr(_local, "pending", None)
+    if pending is not None and pending.is_scheduled():
+        pending.update(changes)
+        return
+
+    pending = _local.pending = PendingStatuses(changes)
+    pending.schedule()
+
+
+def publish_status_change(job):
+    """
+    Publish the new status of a job to the groups of its user and of the job (see ``get_user_group`` and ``get_job_group``) once the current transaction is committed. The changes published in the same transaction or ``batch`` are sent together, and only the last status of each job is sent. The changes are not sent if the transaction is rolled back.
+
+    The groups receive messages of type ``job.statuses``, with the ``jobs`` that changed in the format of ``get_status_data``.
+    """  # noqa: E501
+    changes = {job.id: (job.user_id, get_status_data(job))}
+    if getattr(_local, "depth", 0) and not transaction.get_connection().in_atomic_block:
+        # The change is already committed, it is sent at the end of the batch
+        _local.held.update(changes)
+    else:
+        _add_pending(changes)
+
+
+@contextmanager
+def batch():
+    """
+    Publish the status changes made in the block together at the end of the block (e.g. when the statuses of many jobs are updated at once). The changes made in a transaction are still sent once the transaction is committed.
+    """  # noqa: E501
+    if not getattr(_local, "depth", 0):
+        _local.depth = 0
+        _local.held = {}
+    _local.depth += 1
+    try:
+        yield
+    finally:
+        _local.depth -= 1
+        if not _local.depth:
+            held, _local.held = _local.held, {}
+            if held:
+                _add_pending(held)
+
+
+def send(pending):
+    """
+    Send status changes to the channel layer, one message per group.
+
+    Args:
+        pending (dict): the user id and the status data of each job, by job id.
+    """
+    if not pending:
+        return
+
+    channel_layer = get_channel_layer()
+    if channel_layer is None:
+        return
+
+    messages = {}
+    for job_id, (user_id, data) in pending.items():
+        messages.setdefault(get_user_group(user_id), []).append(data)
+        messages[get_job_group(job_id)] = [data]
+
+    group_send = async_to_sync(channel_layer.group_send)
+    for group, jobs in messages.items():
+        try:
+            group_send(group, {"type": "job.statuses", "jobs": jobs})
+        except Exception as e:
+            logger.warning(f'Unable to publish job statuses to group "{group}": {e}')
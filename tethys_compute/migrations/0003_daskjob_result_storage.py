@@ -0,0 +1,106 @@
+import logging
+from ast import literal_eval
+
+from django.db import migrations, models
+
+from tethys_compute.dask_result_store import DaskResultStore
+from tethys_compute.models.dask.dask_field import deserialize
+
+logger = logging.getLogger(f"tethys.{__name__}")
+
+BATCH_SIZE = 100
+
+
+def store_results(apps, schema_editor):
+    """
+    Move the results stored in the old text column to the result storage.
+    """
+    DaskJob = apps.get_model("tethys_compute", "DaskJob")
+    TethysJob = apps.get_model("tethys_compute", "TethysJob")
+    store = DaskResultStore()
+    connection = schema_editor.connection
+    qn = connection.ops.quote_name
+    pk_column = qn(DaskJob._meta.pk.column)
+
+    # Read the raw text, so that results that cannot be deserialized do not stop the migration.
+    # The results may be large, so they are read in batches ordered by primary key.
+    query = (
+        f"SELECT d.{pk_column}, j.{qn('name')}, j.{qn('workspace')}, d.{qn('result')} "
+        f"FROM {qn(DaskJob._meta.db_table)} d "
+        f"INNER JOIN {qn(TethysJob._meta.db_table)} j "
+        f"ON j.{qn(TethysJob._meta.pk.column)} = d.{pk_column} "
+        f"WHERE d.{qn('result')} IS NOT NULL AND d.{pk_column} > %s "
+        f"ORDER BY d.{pk_column} LIMIT %s"
+    )
+    last_pk = 0
+    while True:
+        with connection.cursor() as cursor:
+            cursor.execute(query, [last_pk, BATCH_SIZE])
+            rows = cursor.fetchall()
+
+        for pk, name, workspace, text in rows:
+            try:
+                blob = store.dump(deserialize(*literal_eval(text)))
+            except Exception:
+                logger.warning(f'Unable to migrate the result of Dask job "{name}".')
+                continue
+
+            result_data, result_path = store.save(blob, workspace)
+            DaskJob.objects.filter(pk=pk).update(
+                result_data=result_data, result_path=result_path, result_size=len(blob)
+            )
+
+        if len(rows) < BATCH_SIZE:
+            break
+        last_pk = rows[-1][0]
+
+
+def restore_results(apps, schema_editor):
+    DaskJob = apps.get_model("tethys_compute", "DaskJob")
+    store = DaskResultStore()
+
+    jobs = DaskJob.objects.exclude(result_data=None, result_path="")
+    for job in jobs.iterator():
+        try:
+            if job.result_data is not None:
+                blob = bytes(job.result_data)
+            else:
+                blob = store.read(job.result_path)
+            # The old field serializes the value when it is saved
+            job.result = store.load(blob)
+        except Exception:
+            logger.warning(f'Unable to migrate the result of Dask job "{job.name}".')
+            continue
+
+        job.save(update_fields=["result"])
+        store.delete(job.result_path)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tethys_compute", "0002_alter_tethysjob_options"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="daskjob",
+            name="result_data",
+            field=models.BinaryField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="daskjob",
+            name="result_path",
+            field=models.CharField(blank=True, default="", max_length=1024),
+        ),
+        migrations.AddField(
+            model_name="daskjob",
+            name="result_size",
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.RunPython(store_results, restore_results),
+        migrations.RemoveField(
+            model_name="daskjob",
+            name="result",
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 4.2.30 on 2026-10-18 04:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tethys_compute", "0003_daskjob_result_storage"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="tethysjob",
+            index=models.Index(
+                fields=["label", "user", "_status", "creation_time"],
+                name="tethys_job_user_status_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="tethysjob",
+            index=models.Index(
+                fields=["label", "user", "creation_time"],
+                name="tethys_job_user_created_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 4.2.30 on 2026-10-18 05:23
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tethys_compute", "0004_tethysjob_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PoolJob",
+            fields=[
+                (
+                    "tethysjob_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="tethys_compute.tethysjob",
+                    ),
+                ),
+                (
+                    "_function",
+                    models.CharField(blank=True, default="", max_length=1024),
+                ),
+                ("args", models.JSONField(blank=True, default=list)),
+                ("kwargs", models.JSONField(blank=True, default=dict)),
+            ],
+            bases=("tethys_compute.tethysjob",),
+        ),
+        migrations.CreateModel(
+            name="ProcessPoolJob",
+            fields=[
+                (
+                    "pooljob_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="tethys_compute.pooljob",
+                    ),
+                ),
+            ],
+            bases=("tethys_compute.pooljob",),
+        ),
+        migrations.CreateModel(
+            name="ThreadPoolJob",
+            fields=[
+                (
+                    "pooljob_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="tethys_compute.pooljob",
+                    ),
+                ),
+            ],
+            bases=("tethys_compute.pooljob",),
+        ),
+    ]
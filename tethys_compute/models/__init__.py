@@ -33,7 +33,13 @@ from tethys_compute.models.condor.condor_workflow_job_node import (  # noqa: F40
 from tethys_compute.models.dask.dask_job import DaskJob
 from tethys_compute.models.dask.dask_scheduler import DaskScheduler  # noqa: F401
 
+from tethys_compute.models.pool.pool_job import PoolJob  # noqa: F401
+from tethys_compute.models.pool.process_pool_job import ProcessPoolJob
+from tethys_compute.models.pool.thread_pool_job import ThreadPoolJob
 
+
+@receiver(post_save, sender=ThreadPoolJob)
+@receiver(post_save, sender=ProcessPoolJob)
 @receiver(post_save, sender=DaskJob)
 @receiver(post_save, sender=CondorJob)
 @receiver(post_save, sender=BasicJob)
@@ -41,4 +47,4 @@ from tethys_compute.models.dask.dask_scheduler import DaskScheduler  # noqa: F40
 def tethys_job_post_save(sender, instance, raw, using, update_fields, **kwargs):
     if instance.name.find("{id}") >= 0:
         instance.name = instance.name.format(id=instance.id)
-        instance.save()
+        instance.save(update_fields=["name"])
@@ -11,12 +11,25 @@ from abc import abstractmethod
 from pathlib import Path
 from functools import partial
 import logging
+import posixpath
 
+from django.conf import settings
 from django.db import models
 from django.utils import timezone
 
+from tethys_compute.condor_ssh_pool import condor_ssh_pool
+from tethys_compute.job_logs import find_remote_file, iter_range, open_log, read_range
 from tethys_compute.models.tethys_job import TethysJob
 from tethys_compute.models.condor.condor_scheduler import CondorScheduler
+from tethys_portal.optional_dependencies import optional_import
+
+# optional imports
+HTCondorObjectBase = optional_import(
+    "HTCondorObjectBase", from_module="condorpy.htcondor_object_base"
+)
+CONDOR_JOB_STATUSES = optional_import(
+    "CONDOR_JOB_STATUSES", from_module="condorpy.static"
+)
 
 log = logging.getLogger(__name__)
 
@@ -49,20 +62,49 @@ class CondorBase(TethysJob):
         """
         Returns: an instance of a condorpy job or condorpy workflow with scheduler, cluster_id, and remote_id attributes set
         """  # noqa: E501
-        condor_object = self._condor_object
-        condor_object._cluster_id = self.cluster_id
-        condor_object._cwd = self.workspace
+        condor_object = self.connect_condor_object(
+            self._condor_object,
+            self.cluster_id,
+            self.workspace,
+            self.scheduler,
+            self.remote_id,
+        )
         if self.scheduler:
+            self.remote_id = condor_object._remote_id
+        return condor_object
+
+    @staticmethod
+    def connect_condor_object(
+        condor_object, cluster_id, workspace, scheduler=None, remote_id=None
+    ):
+        """
+        Set the cluster id, working directory and scheduler of a condorpy job or workflow (e.g. to clean up a job from its fields once it is deleted).
+
+        Args:
+            condor_object (HTCondorObjectBase): the condorpy job or workflow.
+            cluster_id (int): the condor cluster id of the job or workflow.
+            workspace (str): the working directory of the job or workflow.
+            scheduler (CondorScheduler): the scheduler of the job or workflow, if any.
+            remote_id (str): the id of the remote working directory on the scheduler, if any.
+
+        Returns:
+            HTCondorObjectBase: the condorpy job or workflow.
+        """  # noqa: E501
+        condor_object._cluster_id = cluster_id
+        condor_object._cwd = workspace
+        if scheduler:
+            # Share the pooled SSH connection of the scheduler, which set_scheduler
+            # keeps instead of opening a new one
+            condor_object._remote = condor_ssh_pool.get_client(scheduler)
             condor_object.set_scheduler(
-                host=self.scheduler.host,
-                port=self.scheduler.port,
-                username=self.scheduler.username,
-                password=self.scheduler.password,
-                private_key=self.scheduler.private_key_path,
-                private_key_pass=self.scheduler.private_key_pass,
+                host=scheduler.host,
+                port=scheduler.port,
+                username=scheduler.username,
+                password=scheduler.password,
+                private_key=scheduler.private_key_path,
+                private_key_pass=scheduler.private_key_pass,
             )
-            self.remote_id = self.remote_id or condor_object._remote_id
-            condor_object._remote_id = self.remote_id
+            condor_object._remote_id = remote_id or condor_object._remote_id
         return condor_object
 
     @abstractmethod
@@ -85,27 +127,188 @@ class CondorBase(TethysJob):
     @abstractmethod
     def _execute(self, *args, **kwargs):
         self.cluster_id = self.condor_object.submit(*args, **kwargs)
-        self.save()
+        self.save_changes()
 
     def _update_status(self, *args, **kwargs):
         if not self.execute_time:
             return "PEN"
         try:
             # get the status of the condorpy job/workflow
-            condor_status = self.condor_object.status
-
-            if condor_status == "Various":
-                statuses = self.statuses
-                running_statuses = (
-                    statuses["Unexpanded"] + statuses["Idle"] + statuses["Running"]
-                )
-                if not running_statuses:
-                    condor_status = "Various-Complete"
+            condor_status = self._resolve_condor_status(
+                self.condor_object.status, lambda: self.statuses
+            )
         except Exception:
             condor_status = "Submission_err"
 
         self._status = self.STATUS_MAP[condor_status]
-        self.save()
+
+    def _resolve_condor_status(self, condor_status, get_statuses):
+        """
+        Resolve the condorpy status of the job/workflow into one of the keys of STATUS_MAP.
+
+        Args:
+            condor_status (str): the status of the condorpy job/workflow.
+            get_statuses (callable): returns the statuses of the condorpy job/workflow. Only called if they are needed.
+
+        Returns:
+            str: the resolved condor status.
+        """  # noqa: E501
+        if condor_status == "Various":
+            statuses = get_statuses()
+            running_statuses = (
+                statuses["Unexpanded"] + statuses["Idle"] + statuses["Running"]
+            )
+            if not running_statuses:
+                condor_status = "Various-Complete"
+
+        return condor_status
+
+    @classmethod
+    def get_status_update_class(cls):
+        """
+        CondorJobs and CondorWorkflows that use the same scheduler are updated together.
+        """
+        return CondorBase
+
+    @classmethod
+    def execute_many(cls, executions, max_workers=None):
+        """
+        Submit several jobs and workflows of the same scheduler. They share the pooled SSH connection of the scheduler, so no more of them are submitted at once than the connection has sessions (see the CONDOR_SSH_POOL_MAX_SESSIONS setting).
+        """  # noqa: E501
+        if executions and executions[0][0].scheduler_id:
+            max_workers = min(
+                max_workers or getattr(settings, "JOB_SUBMIT_MAX_WORKERS", 4),
+                condor_ssh_pool.max_sessions,
+            )
+        return super().execute_many(executions, max_workers)
+
+    @classmethod
+    def _update_statuses(cls, jobs):
+        """
+        Query the statuses of all of the jobs and workflows with a single condor_q/condor_history command on their scheduler, instead of one command (and SSH session) per job.
+        """  # noqa: E501
+        jobs = [job for job in jobs if job.execute_time]
+        cluster_ids = sorted({job.cluster_id for job in jobs if job.cluster_id})
+
+        procs, nodes = {}, {}
+        if cluster_ids:
+            try:
+                procs, nodes = cls.query_condor_statuses(jobs[0].scheduler, cluster_ids)
+            except Exception:
+                log.exception(
+                    f"Unable to query the statuses of condor clusters "
+                    f"{', '.join(str(cluster_id) for cluster_id in cluster_ids)}:"
+                )
+                return
+
+        job_classes = {}
+        for job in jobs:
+            job_classes.setdefault(type(job), []).append(job)
+        for job_class, class_jobs in job_classes.items():
+            try:
+                job_class._load_status_data(class_jobs)
+            except Exception:
+                log.exception("Unable to load the data needed to update job statuses:")
+
+        for job in jobs:
+            try:
+                condor_status, statuses = job._get_queried_condor_status(procs, nodes)
+                job._statuses = statuses
+                condor_status = job._resolve_condor_status(
+                    condor_status, partial(getattr, job, "_statuses")
+                )
+            except Exception:
+                condor_status = "Submission_err"
+
+            job._status = cls.STATUS_MAP[condor_status]
+
+    @classmethod
+    def _load_status_data(cls, jobs):
+        """
+        Load the data that _get_queried_condor_status needs from the database for several jobs or workflows of this type at once, instead of once per job.
+
+        Args:
+            jobs (list of CondorBase): the jobs or workflows, all of this type.
+        """  # noqa: E501
+        pass
+
+    def _get_queried_condor_status(self, procs, nodes):
+        """
+        Get the condorpy status and statuses of the job/workflow from the results of query_condor_statuses.
+
+        Returns:
+            tuple: the status and the dictionary of statuses of the condorpy job/workflow.
+        """  # noqa: E501
+        raise NotImplementedError()
+
+    @staticmethod
+    def _count_statuses(statuses):
+        """
+        Count condor status names, like the statuses of condorpy jobs and workflows.
+        """
+        counts = dict.fromkeys(CONDOR_JOB_STATUSES.values(), 0)
+        for status in statuses:
+            counts[status] += 1
+        return counts
+
+    @staticmethod
+    def query_condor_statuses(scheduler, cluster_ids):
+        """
+        Get the statuses of the procs of the given clusters and of the nodes of the DAGs among them with one condor_q and condor_history command.
+
+        Args:
+            scheduler (CondorScheduler): the scheduler of the clusters, or None for the local scheduler.
+            cluster_ids (list of int): the ids of the clusters.
+
+        Returns:
+            tuple: a dictionary of the condor status names of the procs of each cluster, keyed by cluster id and proc id, and a dictionary of the condor status names of the node clusters of each DAG, keyed by DAG cluster id and node cluster id.
+        """  # noqa: E501
+        attributes = "ClusterId ProcId JobStatus DAGManJobId"
+        constraint = " || ".join(
+            [f"ClusterId == {cluster_id}" for cluster_id in cluster_ids]
+            + [f"DAGManJobId == {cluster_id}" for cluster_id in cluster_ids]
+        )
+        query = f"-constraint '{constraint}' -af {attributes}"
+        # Jobs that leave the queue between the two commands may be listed by both,
+        # in which case the later condor_history record wins
+        cmd = f"condor_q {query} && condor_history {query}"
+
+        condor_object = HTCondorObjectBase()
+        if scheduler:
+            condor_object._remote = condor_ssh_pool.get_client(scheduler)
+
+        out, err = condor_object._execute([cmd], shell=True, run_in_job_dir=False)
+
+        if err:
+            raise RuntimeError(err)
+
+        procs = {}
+        node_procs = {}
+        for line in (out or "").splitlines():
+            try:
+                cluster_id, proc_id, status, dag_id = line.split()
+                cluster_id, proc_id = int(cluster_id), int(proc_id)
+                status = CONDOR_JOB_STATUSES[int(status)]
+            except (ValueError, KeyError):
+                log.warning(f'Unable to parse condor status record: "{line}"')
+                continue
+
+            procs.setdefault(cluster_id, {})[proc_id] = status
+            if dag_id.isdigit():
+                node_procs.setdefault(int(dag_id), {}).setdefault(cluster_id, {})[
+                    proc_id
+                ] = status
+
+        nodes = {}
+        for dag_id, clusters in node_procs.items():
+            nodes[dag_id] = {}
+            for cluster_id, statuses in clusters.items():
+                statuses = set(statuses.values())
+                nodes[dag_id][cluster_id] = (
+                    statuses.pop() if len(statuses) == 1 else "Various"
+                )
+
+        return procs, nodes
 
     def _process_results(self):
         if self.scheduler:
@@ -184,6 +387,47 @@ class CondorBase(TethysJob):
             )
         return log_contents
 
+    def read_log(self, key1, key2=None, offset=None, length=None):
+        """
+        Read part of a log file of the job, without reading the whole file. The file is read from the workspace of the job if it exists there, or else from the remote scheduler.
+        """  # noqa: E501
+        path, remote = self._find_log_file(key1, key2)
+        with open_log(path, remote) as f:
+            return read_range(f, offset, length)
+
+    def iter_log(self, key1, key2=None, offset=0, chunk_size=None):
+        """
+        Read a log file of the job one chunk of bytes at a time.
+        """
+        path, remote = self._find_log_file(key1, key2)
+        with open_log(path, remote) as f:
+            yield from iter_range(f, offset, chunk_size)
+
+    def _find_log_file(self, key1, key2=None):
+        """
+        Find a log file of the job.
+
+        Returns:
+            tuple: the path of the log file and the SSH client of the remote scheduler it is on (None if it is local).
+        """  # noqa: E501
+        log_file = (self._log_files() or {})[key1]
+        if key2 is not None:
+            log_file = log_file[key2]
+
+        remote_id = self.remote_id or ""
+        local_path = Path(self.workspace) / remote_id / log_file
+        local_files = sorted(local_path.parent.glob(local_path.name))
+        if local_files:
+            return local_files[0].as_posix(), None
+
+        if self.scheduler:
+            remote = condor_ssh_pool.get_client(self.scheduler)
+            remote_path = find_remote_file(remote, posixpath.join(remote_id, log_file))
+            if remote_path:
+                return remote_path, remote
+
+        raise FileNotFoundError(f"{log_file} does not exist")
+
     def pause(self):
         """
         Pauses job during execution
@@ -9,12 +9,14 @@
 
 import shutil
 import logging
+from pathlib import Path
 
 from django.db.models.signals import pre_save, pre_delete
 from django.dispatch import receiver
 
+from tethys_compute.job_cleanup import job_cleanup_queue
 from tethys_compute.models.condor.condor_base import CondorBase
-from tethys_compute.models.condor.condor_py_job import CondorPyJob
+from tethys_compute.models.condor.condor_py_job import CondorPyJob, Job
 
 
 log = logging.getLogger("tethys." + __name__)
@@ -39,6 +41,27 @@ class CondorJob(CondorBase, CondorPyJob):
         self.num_jobs = queue or self.num_jobs
         super()._execute(queue=self.num_jobs, options=options)
 
+    def _get_queried_condor_status(self, procs, nodes):
+        if not self.cluster_id:
+            return "Unexpanded", self._count_statuses([])
+
+        if self.cluster_id not in procs:
+            raise ValueError(f"Job {self.cluster_id} not found.")
+
+        statuses = [status for _, status in sorted(procs[self.cluster_id].items())]
+        if len(statuses) < self.num_jobs:
+            raise ValueError(
+                f"There are {self.num_jobs} sub-jobs, but {len(statuses)} status(es)."
+            )
+        statuses = self._count_statuses(statuses[: self.num_jobs])
+
+        condor_status = "Various"
+        for key, value in statuses.items():
+            if value == self.num_jobs:
+                condor_status = key
+
+        return condor_status, statuses
+
     def update_database_fields(self):
         CondorBase.update_database_fields(self)
         CondorPyJob.update_database_fields(self)
@@ -51,8 +74,38 @@ def condor_job_pre_save(sender, instance, raw, using, update_fields, **kwargs):
 
 @receiver(pre_delete, sender=CondorJob)
 def condor_job_pre_delete(sender, instance, using, **kwargs):
+    # The remote files and the workspace are removed in the background once the job is deleted.
+    # Only the fields of the job are read here: the condorpy job (and its SSH connection) is created by the cleanup.
+    try:
+        job_cleanup_queue.enqueue(
+            condor_job_cleanup,
+            instance.name,
+            instance.attributes,
+            instance.cluster_id,
+            instance.workspace,
+            instance.scheduler,
+            instance.remote_id,
+            using=using,
+        )
+    except Exception as e:
+        log.exception(str(e))
+
+
+def condor_job_cleanup(name, attributes, cluster_id, workspace, scheduler, remote_id):
     try:
-        instance.condor_object.close_remote()
-        shutil.rmtree(instance.initial_dir, ignore_errors=True)
+        condor_object = CondorBase.connect_condor_object(
+            Job(
+                name=name.replace(" ", "_"),
+                attributes=attributes,
+                working_directory=workspace,
+            ),
+            cluster_id,
+            workspace,
+            scheduler,
+            remote_id,
+        )
+        initial_dir = Path(workspace) / condor_object.initial_dir
+        condor_object.close_remote()
+        shutil.rmtree(initial_dir, ignore_errors=True)
     except Exception as e:
         log.exception(str(e))
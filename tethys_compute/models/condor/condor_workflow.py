@@ -11,11 +11,16 @@ import shutil
 import logging
 from pathlib import Path
 
+from django.db.models import Count
 from django.db.models.signals import pre_save, pre_delete
 from django.dispatch import receiver
 
+from tethys_compute.job_cleanup import job_cleanup_queue
 from tethys_compute.models.condor.condor_base import CondorBase
-from tethys_compute.models.condor.condor_py_workflow import CondorPyWorkflow
+from tethys_compute.models.condor.condor_py_workflow import (
+    CondorPyWorkflow,
+    Workflow,
+)
 from tethys_compute.models.condor.condor_workflow_node import CondorWorkflowNode
 
 
@@ -46,27 +51,9 @@ class CondorWorkflow(CondorBase, CondorPyWorkflow):
             return "SUB"
         try:
             # get the status of the condorpy job/workflow
-            condor_status = self.condor_object.status
-
-            if condor_status == "Running":
-                condor_status = "Various"
-                statuses = self.statuses
-
-                running_statuses = (
-                    statuses["Unexpanded"] + statuses["Idle"] + statuses["Running"]
-                )
-                if not running_statuses:
-                    condor_status = "Various-Complete"
-
-                # Handle case where DAG has been submitted (i.e.: condor_status is running)
-                # but jobs have not started (i.e.: all statuses at 0 count)
-                num_statuses = 0
-                for val in statuses.values():
-                    num_statuses += val
-
-                if not num_statuses:
-                    condor_status = "Idle"
-
+            condor_status = self._resolve_condor_status(
+                self.condor_object.status, lambda: self.statuses
+            )
         except Exception as e:
             log.error(
                 "Unexpected exception encountered while attempting to update "
@@ -75,7 +62,66 @@ class CondorWorkflow(CondorBase, CondorPyWorkflow):
             condor_status = "Submission_err"
 
         self._status = self.STATUS_MAP[condor_status]
-        self.save()
+
+    def _resolve_condor_status(self, condor_status, get_statuses):
+        if condor_status == "Running":
+            condor_status = "Various"
+            statuses = get_statuses()
+
+            running_statuses = (
+                statuses["Unexpanded"] + statuses["Idle"] + statuses["Running"]
+            )
+            if not running_statuses:
+                condor_status = "Various-Complete"
+
+            # Handle case where DAG has been submitted (i.e.: condor_status is running)
+            # but jobs have not started (i.e.: all statuses at 0 count)
+            num_statuses = 0
+            for val in statuses.values():
+                num_statuses += val
+
+            if not num_statuses:
+                condor_status = "Idle"
+
+        return condor_status
+
+    @classmethod
+    def _load_status_data(cls, jobs):
+        """
+        Count the nodes of all of the workflows with a single query.
+        """
+        counts = dict(
+            CondorWorkflowNode.objects.filter(
+                workflow_id__in=[job.condorpyworkflow_id for job in jobs]
+            )
+            .values("workflow_id")
+            .annotate(count=Count("id"))
+            .values_list("workflow_id", "count")
+        )
+        for job in jobs:
+            job._num_nodes = counts.get(job.condorpyworkflow_id, 0)
+
+    def _get_queried_condor_status(self, procs, nodes):
+        if not self.cluster_id:
+            return "Unexpanded", self._count_statuses([])
+
+        if self.cluster_id not in procs:
+            raise ValueError(f"Job {self.cluster_id} not found.")
+
+        condor_status = list(procs[self.cluster_id].values())[-1]
+
+        # Like condorpy, count the nodes that have not been submitted yet and the
+        # nodes whose procs have different statuses as unexpanded
+        statuses = [
+            "Unexpanded" if status == "Various" else status
+            for status in nodes.get(self.cluster_id, {}).values()
+        ]
+        num_nodes = getattr(self, "_num_nodes", None)
+        if num_nodes is None:
+            num_nodes = self.node_set.count()
+        statuses += ["Unexpanded"] * (num_nodes - len(statuses))
+
+        return condor_status, self._count_statuses(statuses)
 
     def get_job(self, job_name):
         try:
@@ -120,8 +166,37 @@ def condor_workflow_pre_save(sender, instance, raw, using, update_fields, **kwar
 
 @receiver(pre_delete, sender=CondorWorkflow)
 def condor_workflow_pre_delete(sender, instance, using, **kwargs):
+    # The remote files and the workspace are removed in the background once the workflow is deleted.
+    # Only the fields of the workflow are read here: the condorpy workflow (and its SSH connection) is created by the cleanup.
+    try:
+        job_cleanup_queue.enqueue(
+            condor_workflow_cleanup,
+            instance.name,
+            instance.cluster_id,
+            instance.workspace,
+            instance.scheduler,
+            instance.remote_id,
+            using=using,
+        )
+    except Exception as e:
+        log.exception(str(e))
+
+
+def condor_workflow_cleanup(name, cluster_id, workspace, scheduler, remote_id):
     try:
-        instance.condor_object.close_remote()
-        shutil.rmtree(instance.workspace, ignore_errors=True)
+        condor_object = CondorBase.connect_condor_object(
+            Workflow(
+                name=name.replace(" ", "_"),
+                config=None,
+                max_jobs=None,
+                working_directory=workspace,
+            ),
+            cluster_id,
+            workspace,
+            scheduler,
+            remote_id,
+        )
+        condor_object.close_remote()
+        shutil.rmtree(workspace, ignore_errors=True)
     except Exception as e:
         log.exception(str(e))
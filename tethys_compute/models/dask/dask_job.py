@@ -10,23 +10,27 @@
 import logging
 import datetime
 import json
+from functools import partial
 
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
+from django.db.models.signals import pre_save, pre_delete
+from django.dispatch import receiver
 from django.utils import timezone
-from django.db import models
 
+from tethys_compute.dask_client_registry import dask_client_registry
+from tethys_compute.dask_result_store import DaskResultStore
+from tethys_compute.job_cleanup import job_cleanup_queue
 from tethys_compute.models.tethys_job import TethysJob
 from tethys_compute.models.dask.dask_scheduler import DaskScheduler
-from tethys_compute.models.dask.dask_field import DaskSerializedField
 from tethys_portal.optional_dependencies import optional_import
 
 # optional imports
 Delayed = optional_import("Delayed", from_module="dask.delayed")
-Client = optional_import("Client", from_module="dask.distributed")
 Future = optional_import("Future", from_module="dask.distributed")
 fire_and_forget = optional_import("fire_and_forget", from_module="dask.distributed")
 
 log = logging.getLogger("tethys." + __name__)
-client_fire_forget = None
 
 
 class DaskJob(TethysJob):
@@ -39,7 +43,10 @@ class DaskJob(TethysJob):
         DaskScheduler, on_delete=models.SET_NULL, blank=True, null=True
     )
     forget = models.BooleanField(default=False)
-    result = DaskSerializedField(blank=True, null=True)
+    # The compressed result is stored in result_data if it is small, else in the file at result_path
+    result_data = models.BinaryField(blank=True, null=True)
+    result_path = models.CharField(max_length=1024, blank=True, default="")
+    result_size = models.BigIntegerField(default=0)
 
     DASK_TO_STATUS_TYPES = {
         # States returned from Scheduler transition event.
@@ -62,12 +69,68 @@ class DaskJob(TethysJob):
         "finished": "COM",
     }
 
+    @property
+    def result(self):
+        """
+        The result of the job, loaded from the database or the result storage the first time it is accessed.
+        """  # noqa: E501
+        if "_result" not in self.__dict__:
+            self._result = self._load_result()
+        return self._result
+
+    @result.setter
+    def result(self, value):
+        try:
+            blob = None if value is None else DaskResultStore.dump(value)
+        except Exception:
+            raise ValidationError("Unable to serialize value: {}".format(value))
+
+        self._result = value
+        self._pending_result = blob
+
+    def _load_result(self):
+        try:
+            if self.result_data is not None:
+                return DaskResultStore.load(bytes(self.result_data))
+            if self.result_path:
+                return DaskResultStore.load(DaskResultStore.read(self.result_path))
+        except Exception:
+            raise ValidationError(
+                'Unable to load the result of job "{}"'.format(self.name)
+            )
+
+        return None
+
+    def store_result(self):
+        """
+        Store the result that was set since the job was last saved, in the database or in a file of the result storage.
+        """  # noqa: E501
+        if "_pending_result" not in self.__dict__:
+            return
+
+        blob = self.__dict__.pop("_pending_result")
+        store = DaskResultStore()
+        old_path = self.result_path
+
+        if blob is None:
+            self.result_data, self.result_path = None, ""
+        else:
+            self.result_data, self.result_path = store.save(blob, self.workspace)
+        self.result_size = len(blob) if blob else 0
+
+        # Keep the previous result until the new one is committed
+        if old_path and old_path != self.result_path:
+            transaction.on_commit(partial(store.delete, old_path))
+
     @property
     def client(self):
+        """
+        Get the Client of the scheduler of the job, or of a local cluster if the job has no scheduler. The Client is shared (see ``DaskClientRegistry``) and should not be closed.
+        """  # noqa: E501
         if self.scheduler:
             return self.scheduler.client
         else:
-            return Client()
+            return dask_client_registry.get_client_for(self)
 
     @property
     def update_status_interval(self):
@@ -131,14 +194,35 @@ class DaskJob(TethysJob):
         self.client.set_metadata(self.key, True)
 
         # Save updated attributes
-        self.save()
+        self.save_changes()
 
         # Must use fire and forget to ensure job runs after the future goes out of scope.
         fire_and_forget(future)
 
-        # Save this client to close it after obtaining the result.
-        global client_fire_forget
-        client_fire_forget = self.client
+    @classmethod
+    def execute_many(cls, executions, max_workers=None):
+        """
+        Execute several jobs of the same scheduler. The Delayed objects of the jobs are computed with a single call to the client of the scheduler, instead of one call per job.
+        """  # noqa: E501
+        delayed = [
+            i
+            for i, (_, args, _) in enumerate(executions)
+            if args and isinstance(args[0], Delayed)
+        ]
+        if delayed:
+            try:
+                client = executions[delayed[0]][0].client
+                futures = client.compute([executions[i][1][0] for i in delayed])
+            except Exception:
+                # Each job reports its own error when it is executed
+                log.exception("Unable to compute the Delayed objects of the jobs")
+            else:
+                executions = list(executions)
+                for i, future in zip(delayed, futures):
+                    job, args, kwargs = executions[i]
+                    executions[i] = (job, (future, *args[1:]), kwargs)
+
+        return super().execute_many(executions, max_workers)
 
     def _update_status(self, *args, **kwargs):
         """
@@ -157,13 +241,32 @@ class DaskJob(TethysJob):
         try:
             # Translate to TethysJob status
             self._status = self.DASK_TO_STATUS_TYPES[dask_status]
-            self.save()
-            # Clean up client
-            self.client.close()
 
         except KeyError:
             log.error('Unknown Dask Status: "{}"'.format(dask_status))
 
+    @classmethod
+    def _update_statuses(cls, jobs):
+        """
+        Check the statuses of several jobs of the same scheduler using a single client, and translate them to Tethys Jobs statuses.
+        """  # noqa: E501
+        jobs = [job for job in jobs if job.key]
+        if not jobs:
+            return
+
+        client = jobs[0].client
+        for job in jobs:
+            try:
+                dask_status = Future(key=job.key, client=client).status.lower()
+            except Exception:
+                log.exception("Dask Future Init Error")
+                continue
+
+            try:
+                job._status = cls.DASK_TO_STATUS_TYPES[dask_status]
+            except KeyError:
+                log.error('Unknown Dask Status: "{}"'.format(dask_status))
+
     def _process_results(self, *args, **kwargs):
         """
         Process results callback. If process_results_function is specified, we call it with the results as an argument, otherwise get the result, serialize, and save to database. Also update job status accordingly.
@@ -172,6 +275,16 @@ class DaskJob(TethysJob):
         if not self._acquire_pr_lock():
             return
 
+        try:
+            self._process_future_results()
+        finally:
+            # Always release the lock, even if processing the results failed
+            self._release_pr_lock()
+
+    def _process_future_results(self):
+        """
+        Gather the result of the future of the job, process it and save it. Called while the processing results lock is held.
+        """  # noqa: E501
         # Get the future instance
         future = self.future
 
@@ -181,18 +294,12 @@ class DaskJob(TethysJob):
 
         # Skip processing results if forget
         if self.forget:
-            # Clean up client
-            self.client.close()
             return
 
         try:
             # Get results using the client
             result = self.client.gather(future)
         except Exception as e:
-            # Tell scheduler to stop sending updates about this key
-            self.client.set_metadata(self.key, False)
-            # Clean up client
-            self.client.close()
             result = e
             log.warning(
                 'Exception encountered when retrieving results: "{}"'.format(str(e))
@@ -224,46 +331,33 @@ class DaskJob(TethysJob):
         self.key = ""
 
         # save the results or status in the database
-        self.save()
-
-        # Clean up client
-        self.client.close()
-
-        if client_fire_forget:
-            client_fire_forget.close()
-
-        self._release_pr_lock()
+        self.save_changes()
 
     def _acquire_pr_lock(self):
         """
-        Processing results lock to prevent collisions between multiple processes.
+        Processing results lock to prevent collisions between multiple processes. The lock is acquired atomically in the database, so only one process can hold it.
 
         Returns:
             bool: True if lock acquired successfully, else False.
-        """
-
-        ep = self.extended_properties
-        is_processing_results = ep.get("processing_results", False)
-
-        if not is_processing_results:
-            ep["processing_results"] = True
-            self.extended_properties = ep
-            self.save()
+        """  # noqa: E501
+        if self._set_extended_flag("processing_results", True):
             return True
-        else:
-            log.warning(
-                "Unable to aquire lock. Processing results already occurring. Skipping..."
-            )
-            return False
+
+        log.warning(
+            "Unable to aquire lock. Processing results already occurring. Skipping..."
+        )
+        return False
 
     def _release_pr_lock(self):
         """
         Release processing results lock.
         """
-        ep = self.extended_properties
-        ep["processing_results"] = False
-        self.extended_properties = ep
-        self.save()
+        self._set_extended_flag("processing_results", False)
+
+    def get_dirty_fields(self):
+        # The result that was set is only stored when the job is saved
+        self.store_result()
+        return super().get_dirty_fields()
 
     def stop(self):
         """
@@ -335,3 +429,16 @@ class DaskJob(TethysJob):
             log_content = json.dumps(log_content).strip("[]")
             log_content = log_content.replace("], [", "\n")
         return log_content
+
+
+@receiver(pre_save, sender=DaskJob)
+def dask_job_pre_save(sender, instance, raw, using, update_fields, **kwargs):
+    instance.store_result()
+
+
+@receiver(pre_delete, sender=DaskJob)
+def dask_job_pre_delete(sender, instance, using, **kwargs):
+    if instance.result_path:
+        job_cleanup_queue.enqueue(
+            DaskResultStore.delete, instance.result_path, using=using
+        )
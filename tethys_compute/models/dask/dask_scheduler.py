@@ -9,12 +9,9 @@
 
 import logging
 from django.db import models
+from tethys_compute.dask_client_registry import dask_client_registry
 from tethys_compute.models.scheduler import Scheduler
 from tethys_compute.models.dask.dask_job_exception import DaskJobException
-from tethys_portal.optional_dependencies import optional_import
-
-# optional imports
-Client = optional_import("Client", from_module="dask.distributed")
 
 log = logging.getLogger("tethys." + __name__)
 
@@ -31,37 +28,33 @@ class DaskScheduler(Scheduler):
     @property
     def client(self):
         """
-        Get the Client associated with this job. The Client connects users to a dask.distributed compute cluster. It provides an asynchronous user interface around functions and futures.
+        Get the Client associated with this job. The Client connects users to a dask.distributed compute cluster. It provides an asynchronous user interface around functions and futures. The Client is shared with the other users of the scheduler (see ``DaskClientRegistry``) and should not be closed.
 
         Returns:
             dask.distributed.Client: Client initialized with Scheduler configuration if defined, otherwise bound locally.
         """  # noqa: #501
-        if not getattr(self, "_client", None):
-            if self.heartbeat_interval == 0:
-                heartbeat_interval = None
-            else:
-                heartbeat_interval = self.heartbeat_interval
-
-            if self.timeout == 0:
-                timeout = "__no_default__"
-            else:
-                timeout = self.timeout
-
-            try:
-                # validating the invalid scheduler
-                client = Client(
-                    address=self.host,
-                    heartbeat_interval=heartbeat_interval,
-                    timeout=timeout,
-                )
-
-            except Exception:
-                log.exception("Dask Client Init Error")
-                raise DaskJobException("Invalid scheduler is provided")
-
-            self._client = client
-
-        return self._client
+        if self.heartbeat_interval == 0:
+            heartbeat_interval = None
+        else:
+            heartbeat_interval = self.heartbeat_interval
+
+        if self.timeout == 0:
+            timeout = "__no_default__"
+        else:
+            timeout = self.timeout
+
+        try:
+            # validating the invalid scheduler
+            return dask_client_registry.get_client_for(
+                self,
+                address=self.host,
+                heartbeat_interval=heartbeat_interval,
+                timeout=timeout,
+            )
+
+        except Exception:
+            log.exception("Dask Client Init Error")
+            raise DaskJobException("Invalid scheduler is provided")
 
     class Meta:
         verbose_name = "Dask Scheduler"
@@ -0,0 +1,275 @@
+"""
+********************************************************************************
+* Name: pool_job.py
+* Author: Tethys Platform Developers
+* Created On: October 2026
+* Copyright: (c) Tethys Geospatial Foundation 2026
+* License: BSD 2-Clause
+********************************************************************************
+"""
+
+import datetime
+import inspect
+import logging
+import pickle
+import shutil
+from functools import partial
+from pathlib import Path
+
+from django.db import connection, models
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from tethys_apps.base.function_extractor import TethysFunctionExtractor
+from tethys_compute import job_pools
+from tethys_compute.job_cleanup import job_cleanup_queue
+from tethys_compute.job_logs import iter_range, open_log, read_range
+from tethys_compute.job_pools import job_pool_registry, run_job, write_file
+from tethys_compute.models.tethys_job import TethysJob
+
+log = logging.getLogger("tethys." + __name__)
+
+
+class PoolJob(TethysJob):
+    """
+    Base class for ProcessPoolJob and ThreadPoolJob, which run a Python function in a local pool of workers of the process that executes the job (see ``tethys_compute.job_pools``).
+    """  # noqa: E501
+
+    _function = models.CharField(max_length=1024, blank=True, default="")
+    args = models.JSONField(default=list, blank=True)
+    kwargs = models.JSONField(default=dict, blank=True)
+
+    # The kind of pool that runs the jobs (job_pools.PROCESS or job_pools.THREAD)
+    pool_kind = None
+
+    LOG_FILES = {
+        "stdout": job_pools.STDOUT_FILE,
+        "stderr": job_pools.STDERR_FILE,
+        "error": job_pools.ERROR_FILE,
+    }
+
+    @property
+    def function(self):
+        """
+        The function that the job runs, resolved from its dotted path (e.g. "tethysapp.my_app.job_functions.run_model").
+
+        Returns:
+            A function handle or None if the function cannot be resolved.
+        """  # noqa: E501
+        if self._function:
+            function_extractor = TethysFunctionExtractor(self._function, None)
+            if function_extractor.valid:
+                return function_extractor.function
+
+    @function.setter
+    def function(self, function):
+        if isinstance(function, str):
+            self._function = function
+            return
+        module_path = inspect.getmodule(function).__name__.split(".")
+        module_path.append(function.__name__)
+        self._function = ".".join(module_path)
+
+    @property
+    def run_directory(self):
+        """
+        The directory of the workspace of the job where its logs and result are written.
+        """
+        return Path(self.workspace) / f"job_{self.id}"
+
+    @property
+    def update_status_interval(self):
+        """
+        Override default update status interval. The status is read from the files of the run directory.
+
+        Returns:
+            datetime.timedelta: update status interval.
+        """  # noqa: E501
+        if not hasattr(self, "_update_status_interval"):
+            self._update_status_interval = datetime.timedelta(seconds=0)
+        return self._update_status_interval
+
+    @property
+    def result(self):
+        """
+        The value returned by the function of the job (or by the ``process_results_function`` of the job, if any), or None if the job is not complete.
+        """  # noqa: E501
+        try:
+            data = (self.run_directory / job_pools.RESULT_FILE).read_bytes()
+        except FileNotFoundError:
+            return None
+        return pickle.loads(data)
+
+    @result.setter
+    def result(self, value):
+        write_file(self.run_directory / job_pools.RESULT_FILE, pickle.dumps(value))
+
+    def _execute(self, *args, **kwargs):
+        """
+        Submit the function of the job to the pool of its app.
+
+        Args:
+            *args: positional arguments of the function. Default to the ``args`` of the job.
+            **kwargs: key-word arguments of the function. Default to the ``kwargs`` of the job.
+        """  # noqa: E501
+        if not self._function:
+            raise ValueError(
+                "The function of the job must be set before it is executed."
+            )
+        if job_pool_registry.get_future(self.id) is not None:
+            raise RuntimeError("The job is still running.")
+        if args:
+            self.args = list(args)
+        if kwargs:
+            self.kwargs = kwargs
+
+        # The job may finish before execute returns, so it is saved as submitted first.
+        # The status may have been updated by another process (e.g. when it is resubmitted).
+        if not self._state.adding:
+            self.refresh_from_db(fields=["_status"])
+        self.execute_time = timezone.now()
+        self._status = "SUB"
+        self.save_changes()
+
+        run_directory = self.run_directory
+        shutil.rmtree(run_directory, ignore_errors=True)
+        run_directory.mkdir(parents=True)
+
+        future = job_pool_registry.submit(
+            self.pool_kind,
+            self.label,
+            self.id,
+            run_job,
+            self._function,
+            self.args,
+            self.kwargs,
+            str(run_directory),
+        )
+        future.add_done_callback(partial(job_done, self.id, run_directory))
+
+    @classmethod
+    def execute_many(cls, executions, max_workers=None):
+        """
+        Execute several jobs one after another. Submitting a job to its pool does not wait for the job, and the pools already limit the number of jobs that run at once.
+        """  # noqa: E501
+        return super().execute_many(executions, max_workers=1)
+
+    def _update_status(self, *args, **kwargs):
+        """
+        Get the status of the job from the files of its run directory, so that it can be updated by any process.
+        """  # noqa: E501
+        run_directory = self.run_directory
+        if (run_directory / job_pools.CANCELLED_FILE).exists():
+            self._status = "ABT"
+        elif (run_directory / job_pools.ERROR_FILE).exists():
+            self._status = "ERR"
+            error = (run_directory / job_pools.ERROR_FILE).read_text().strip()
+            self.status_message = error.splitlines()[-1][:2048] if error else None
+        elif (run_directory / job_pools.RESULT_FILE).exists():
+            self._status = "RES"
+        elif (run_directory / job_pools.STDOUT_FILE).exists():
+            self._status = "RUN"
+        # Otherwise the job is waiting for a worker of its pool
+
+    def _process_results(self, *args, **kwargs):
+        """
+        Call the ``process_results_function`` of the job, if any, with the result of the job. The value it returns becomes the result of the job.
+        """  # noqa: E501
+        if not self.process_results_function:
+            return
+
+        try:
+            self.result = self.process_results_function(self.result)
+        except Exception:
+            log.exception("Process Results Function Error")
+
+    def stop(self):
+        """
+        Stop the job. A job that is waiting for a worker is cancelled. The function of a job that is running is not interrupted, but its result is discarded.
+        """  # noqa: E501
+        if self.run_directory.is_dir():
+            write_file(self.run_directory / job_pools.CANCELLED_FILE, b"")
+        job_pool_registry.cancel(self.id)
+        self.update_status(status="ABT")
+
+    def pause(self):
+        """
+        Pauses job during execution.
+        """
+        raise NotImplementedError()
+
+    def resume(self):
+        """
+        Resumes a job that has been paused.
+        """
+        raise NotImplementedError()
+
+    def _resubmit(self, *args, **kwargs):
+        """
+        Run the function of the job again.
+        """
+        self.start_time = None
+        self.completion_time = None
+        self.status_message = None
+        self.execute(*args, **kwargs)
+
+    def _get_logs(self):
+        """
+        Get the stdout and stderr logs of the function of the job, and the traceback of the exception it raised, if any.
+        """  # noqa: E501
+        logs = {key: partial(self._read_log_file, key) for key in ("stdout", "stderr")}
+        if (self.run_directory / job_pools.ERROR_FILE).exists():
+            logs["error"] = partial(self._read_log_file, "error")
+        return logs
+
+    def _read_log_file(self, key):
+        try:
+            return self._get_log_path(key).read_text(errors="replace")
+        except FileNotFoundError:
+            return ""
+
+    def _get_log_path(self, key1, key2=None):
+        if key2 is not None or key1 not in self.LOG_FILES:
+            raise KeyError(key1)
+        return self.run_directory / self.LOG_FILES[key1]
+
+    def read_log(self, key1, key2=None, offset=None, length=None):
+        with open_log(self._get_log_path(key1, key2)) as f:
+            return read_range(f, offset, length)
+
+    def iter_log(self, key1, key2=None, offset=0, chunk_size=None):
+        with open_log(self._get_log_path(key1, key2)) as f:
+            yield from iter_range(f, offset, chunk_size)
+
+
+def job_done(job_id, run_directory, future):
+    """
+    Record the error of a job that failed outside of its function (e.g. if a process of the pool died) and update the status of the job as soon as it is done. Called by the pool.
+    """  # noqa: E501
+    try:
+        error_file = Path(run_directory) / job_pools.ERROR_FILE
+        if (
+            not future.cancelled()
+            and future.exception() is not None
+            and not error_file.exists()
+        ):
+            write_file(error_file, repr(future.exception()).encode())
+
+        TethysJob.objects.get_subclass(id=job_id).update_status()
+    except TethysJob.DoesNotExist:
+        pass
+    except Exception:
+        log.exception(f"Unable to update the status of job {job_id}:")
+    finally:
+        # Called from a thread of the pool, which does not close its connection otherwise
+        if not connection.in_atomic_block:
+            connection.close()
+
+
+@receiver(pre_delete, sender=PoolJob)
+def pool_job_pre_delete(sender, instance, using, **kwargs):
+    job_pool_registry.cancel(instance.id)
+    job_cleanup_queue.enqueue(
+        partial(shutil.rmtree, ignore_errors=True), instance.run_directory, using=using
+    )
@@ -0,0 +1,20 @@
+"""
+********************************************************************************
+* Name: process_pool_job.py
+* Author: Tethys Platform Developers
+* Created On: October 2026
+* Copyright: (c) Tethys Geospatial Foundation 2026
+* License: BSD 2-Clause
+********************************************************************************
+"""
+
+from tethys_compute import job_pools
+from tethys_compute.models.pool.pool_job import PoolJob
+
+
+class ProcessPoolJob(PoolJob):
+    """
+    Process pool job type. Runs a Python function in a separate process of a pool of the process that executes the job, so CPU-bound functions run in parallel with the portal. The function, its arguments and its result must be picklable.
+    """  # noqa: E501
+
+    pool_kind = job_pools.PROCESS
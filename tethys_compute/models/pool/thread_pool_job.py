@@ -0,0 +1,20 @@
+"""
+********************************************************************************
+* Name: thread_pool_job.py
+* Author: Tethys Platform Developers
+* Created On: October 2026
+* Copyright: (c) Tethys Geospatial Foundation 2026
+* License: BSD 2-Clause
+********************************************************************************
+"""
+
+from tethys_compute import job_pools
+from tethys_compute.models.pool.pool_job import PoolJob
+
+
+class ThreadPoolJob(PoolJob):
+    """
+    Thread pool job type. Runs a Python function in a thread of a pool of the process that executes the job. Best suited for functions that mostly wait (e.g. for web services or other programs), since threads share the interpreter of the portal.
+    """  # noqa: E501
+
+    pool_kind = job_pools.THREAD
@@ -7,17 +7,23 @@
 ********************************************************************************
 """
 
+import copy
 import logging
 import datetime
 import inspect
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
+from django.conf import settings
 from django.contrib.auth.models import User, Group
-from django.db import models
+from django.db import connection, connections, models, router, transaction
+from django.db.models.signals import pre_save
 from django.utils import timezone
 from model_utils.managers import InheritanceManager
 
 from tethys_apps.base.function_extractor import TethysFunctionExtractor
+from tethys_compute.job_logs import iter_range, open_text, read_range
+from tethys_compute.job_status_push import batch, publish_status_change
 
 
 log = logging.getLogger("tethys." + __name__)
@@ -33,6 +39,16 @@ class TethysJob(models.Model):
         permissions = [
             ("jobs_table_actions", "Can access job's table endpoints for all jobs."),
         ]
+        indexes = [
+            models.Index(
+                fields=["label", "user", "_status", "creation_time"],
+                name="tethys_job_user_status_idx",
+            ),
+            models.Index(
+                fields=["label", "user", "creation_time"],
+                name="tethys_job_user_created_idx",
+            ),
+        ]
 
     objects = InheritanceManager()
 
@@ -85,6 +101,90 @@ class TethysJob(models.Model):
     def __lt__(self, other):
         return self.id < other.id
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._take_snapshot()
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+        self._take_snapshot(fields)
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        status_changed = self._is_status_changed(update_fields)
+        super().save(*args, **kwargs)
+        self._take_snapshot(update_fields)
+        if status_changed:
+            publish_status_change(self)
+
+    def _is_status_changed(self, update_fields=None):
+        """
+        Check if the status of a saved job changed since it was loaded or last saved, and is saved with the given fields.
+        """  # noqa: E501
+        loaded_values = getattr(self, "_loaded_values", None)
+        if self._state.adding or loaded_values is None:
+            return False
+        if update_fields is not None and "_status" not in update_fields:
+            return False
+        return loaded_values.get("_status", self._status) != self._status
+
+    def _take_snapshot(self, fields=None):
+        """
+        Remember the values of the fields as they are in the database, to find the fields that changed since.
+
+        Args:
+            fields (list of str): names of the fields that were loaded or saved. Defaults to all loaded fields.
+        """  # noqa: E501
+        if fields is None or not hasattr(self, "_loaded_values"):
+            self._loaded_values = {}
+        for field in self._meta.concrete_fields:
+            if field.attname not in self.__dict__:
+                continue  # Deferred
+            if fields is not None and not {field.name, field.attname} & set(fields):
+                continue
+            value = getattr(self, field.attname)
+            if isinstance(field, models.JSONField):
+                value = copy.deepcopy(value)
+            self._loaded_values[field.attname] = value
+
+    def get_dirty_fields(self):
+        """
+        Get the fields of the job that changed since it was loaded from or last saved to the database.
+
+        Returns:
+            list of str: the names of the changed fields, or None if the job has not been saved yet.
+        """  # noqa: E501
+        loaded_values = getattr(self, "_loaded_values", None)
+        if self._state.adding or loaded_values is None:
+            return None
+
+        return [
+            field.name
+            for field in self._meta.concrete_fields
+            if not field.primary_key
+            and field.attname in self.__dict__
+            and (
+                field.attname not in loaded_values
+                or getattr(self, field.attname) != loaded_values[field.attname]
+            )
+        ]
+
+    def save_changes(self):
+        """
+        Save only the fields of the job that changed (see ``get_dirty_fields``), so that fields changed by other processes in the meantime are not overwritten. The whole job is saved if it has not been saved yet.
+
+        Returns:
+            list of str: the names of the fields that were saved, or None if the whole job was saved.
+        """  # noqa: E501
+        dirty_fields = self.get_dirty_fields()
+        if dirty_fields is None:
+            self.save()
+        elif dirty_fields:
+            self.save(update_fields=dirty_fields)
+        return dirty_fields
+
     @property
     def type(self):
         """
@@ -225,7 +325,7 @@ class TethysJob(models.Model):
             self._status = "SUB"
         except Exception:
             self._status = "ERR"
-        self.save()
+        self.save_changes()
 
     def update_status(self, status=None, *args, **kwargs):
         """
@@ -242,11 +342,7 @@ class TethysJob(models.Model):
 
         """
         old_status = self._status
-        update_needed = old_status in self.NON_TERMINAL_STATUS_CODES or (
-            old_status == "OTH"
-            and self.extended_properties[self.OTHER_STATUS_KEY]
-            in self.NON_TERMINAL_STATUSES
-        )
+        update_needed = self.is_update_needed()
 
         # Set status from status given
         if status:
@@ -259,23 +355,308 @@ class TethysJob(models.Model):
             if status != "OTH":
                 self.extended_properties.pop(self.OTHER_STATUS_KEY, None)
             self._status = status
-            self.save()
 
         # Update status if status not given and still pending/running
         elif update_needed and self.is_time_to_update():
             self._update_status(*args, **kwargs)
             self._last_status_update = timezone.now()
+            # Only post-process the new status if another process did not update it first
+            update_needed = self._claim_status(old_status)
 
         # Post-process status after update if old status was pending/running
         if update_needed:
-            if self._status == "RUN" and (old_status in ("PEN", "SUB")):
-                self.start_time = timezone.now()
-            if self._status in ["COM", "VCP", "RES"]:
-                self.process_results()
-            elif self._status == "ERR" or self._status == "ABT":
-                self.completion_time = timezone.now()
+            self._post_process_status(old_status)
+
+        self.save_changes()
+
+    @classmethod
+    def update_statuses(cls, jobs):
+        """
+        Updates the statuses of several jobs of this type that use the same scheduler, like ``update_status`` does for one job. The current statuses are retrieved with ``_update_statuses``, which job types can override to query the statuses of all of the jobs at once.
+
+        Args:
+            jobs (list of TethysJob): the jobs to update.
+
+        Returns:
+            list of TethysJob: the jobs that were due for an update.
+        """  # noqa: E501
+        jobs = [
+            job for job in jobs if job.is_update_needed() and job.is_time_to_update()
+        ]
+        if not jobs:
+            return jobs
+
+        # Publish the status changes of all of the jobs together
+        with batch():
+            old_statuses = [job._status for job in jobs]
+            cls._update_statuses(jobs)
+
+            for job, old_status in zip(jobs, old_statuses):
+                try:
+                    job._last_status_update = timezone.now()
+                    if job._claim_status(old_status):
+                        job._post_process_status(old_status)
+                except Exception:
+                    log.exception(f"Unable to update the status of job {job.id}:")
+
+            # Save the changed fields of all of the jobs at once, grouped by job type and by the fields that changed
+            groups = {}
+            for job in jobs:
+                job_class = type(job)
+                dirty_fields = job.get_dirty_fields() or []
+                concrete_fields = {
+                    field.name
+                    for field in job_class._meta.concrete_fields
+                    if not field.primary_key
+                }
+                fields = tuple(
+                    field for field in dirty_fields if field in concrete_fields
+                )
+                if fields:
+                    groups.setdefault((job_class, fields), []).append(job)
+
+            for (job_class, fields), group in groups.items():
+                job_class._base_manager.bulk_update(group, fields)
+                for job in group:
+                    job._take_snapshot(fields)
+
+        return jobs
+
+    @classmethod
+    def get_status_update_class(cls):
+        """
+        Get the class used to update the statuses of jobs of this type with ``update_statuses``. Job types that can query the statuses of related job types at once should return their common base class.
+
+        Returns:
+            type: the class whose ``update_statuses`` method updates jobs of this type.
+        """  # noqa: E501
+        return cls
+
+    @classmethod
+    def _update_statuses(cls, jobs):
+        """
+        Retrieves the current statuses of several jobs and saves them as the ``_status`` of each job. Job types that can retrieve many statuses at once (e.g. with a single query to the scheduler) should override this method. By default ``_update_status`` is called for each job.
+
+        Args:
+            jobs (list of TethysJob): the jobs to update. All jobs are of this type and use the same scheduler.
+        """  # noqa: E501
+        for job in jobs:
+            try:
+                job._update_status()
+            except Exception:
+                log.exception(f"Unable to update the status of job {job.id}:")
+
+    @classmethod
+    def create_many(cls, jobs, batch_size=None):
+        """
+        Saves several new jobs of any job types with one insert per table of their job types (per batch), instead of one insert per table for each job. The ``pre_save`` signal is sent for each job so that job types can prepare their fields, but ``post_save`` is not sent (like ``QuerySet.bulk_create``). Names that contain "{id}" are formatted with the id of the job.
+
+        Args:
+            jobs (list of TethysJob): the new jobs to save.
+            batch_size (int, optional): maximum number of rows inserted with each query. Defaults to the maximum supported by the database.
+
+        Returns:
+            list of TethysJob: the saved jobs.
+        """  # noqa: E501
+        jobs = list(jobs)
+        using = router.db_for_write(TethysJob)
+
+        with transaction.atomic(using=using, savepoint=False):
+            # Databases that cannot return the ids of the inserted rows (e.g. MySQL)
+            if not connections[using].features.can_return_rows_from_bulk_insert:
+                for job in jobs:
+                    job.save(using=using)
+                return jobs
+
+            job_classes = {}
+            for job in jobs:
+                pre_save.send(
+                    sender=type(job),
+                    instance=job,
+                    raw=False,
+                    using=using,
+                    update_fields=None,
+                )
+                job_classes.setdefault(type(job), []).append(job)
+
+            for job_class, group in job_classes.items():
+                cls._insert_rows(job_class, group, using, batch_size, set())
+
+            for job in jobs:
+                job._state.adding = False
+                job._state.db = using
+
+            named_jobs = [job for job in jobs if job.name.find("{id}") >= 0]
+            for job in named_jobs:
+                job.name = job.name.format(id=job.id)
+            TethysJob.objects.using(using).bulk_update(
+                named_jobs, ["name"], batch_size=batch_size
+            )
+
+        for job in jobs:
+            job._take_snapshot()
 
-        self.save()
+        return jobs
+
+    @classmethod
+    def _insert_rows(cls, model, jobs, using, batch_size, inserted):
+        """
+        Insert the rows of the jobs in the table of the model, after the tables of its parents, like ``Model.save`` does for one job.
+        """  # noqa: E501
+        if model in inserted:
+            return
+        inserted.add(model)
+
+        meta = model._meta
+        for parent, field in meta.parents.items():
+            cls._insert_rows(parent, jobs, using, batch_size, inserted)
+            for job in jobs:
+                setattr(job, field.attname, job._get_pk_val(parent._meta))
+
+        fields = [
+            field
+            for field in meta.local_concrete_fields
+            if field is not meta.auto_field
+        ]
+        rows = model._base_manager.using(using)._batched_insert(
+            jobs, fields, batch_size
+        )
+
+        # Only the tables of the models without parents generate ids
+        if meta.auto_field:
+            for job, row in zip(jobs, rows):
+                for value, field in zip(row, meta.db_returning_fields):
+                    setattr(job, field.attname, value)
+
+    @classmethod
+    def execute_many(cls, executions, max_workers=None):
+        """
+        Executes several jobs of this type that use the same scheduler, like ``execute`` does for one job, with no more than ``max_workers`` jobs being executed at once. Job types that can submit many jobs at once should override this method.
+
+        Args:
+            executions (list of tuple): the (job, args, kwargs) to execute, where args and kwargs are passed to ``execute``.
+            max_workers (int, optional): the maximum number of jobs executed at once. Defaults to the JOB_SUBMIT_MAX_WORKERS setting.
+
+        Returns:
+            list of TethysJob: the jobs.
+        """  # noqa: E501
+        max_workers = max_workers or getattr(settings, "JOB_SUBMIT_MAX_WORKERS", 4)
+        if max_workers <= 1 or len(executions) <= 1:
+            for execution in executions:
+                cls._execute_one(*execution)
+        else:
+            with ThreadPoolExecutor(
+                min(max_workers, len(executions)), thread_name_prefix="tethys_submit"
+            ) as pool:
+                for execution in executions:
+                    pool.submit(cls._execute_in_thread, *execution)
+
+        return [job for job, _, _ in executions]
+
+    @staticmethod
+    def _execute_one(job, args, kwargs):
+        try:
+            job.execute(*args, **kwargs)
+        except Exception:
+            log.exception(f"Unable to execute job {job.id}:")
+
+    @classmethod
+    def _execute_in_thread(cls, job, args, kwargs):
+        try:
+            cls._execute_one(job, args, kwargs)
+        finally:
+            # The threads of the pool do not close their connections otherwise
+            connection.close()
+
+    def is_update_needed(self):
+        """
+        Check if the status of the job may still change (i.e. if it is pending or running).
+
+        Returns:
+            bool: True if the job has one of the NON_TERMINAL_STATUSES, else False.
+        """  # noqa: E501
+        return self._status in self.NON_TERMINAL_STATUS_CODES or (
+            self._status == "OTH"
+            and self.extended_properties[self.OTHER_STATUS_KEY]
+            in self.NON_TERMINAL_STATUSES
+        )
+
+    def _claim_status(self, old_status):
+        """
+        Save the new status of the job only if its status in the database is still ``old_status``, with a single conditional update. When several processes update the status of the same job at once, only the first one makes the transition (and post-processes it, e.g. processes the results); the others reload the status saved by the first.
+
+        Args:
+            old_status (str): the status of the job before it was updated.
+
+        Returns:
+            bool: True if the status was saved or did not change, else False.
+        """  # noqa: E501
+        if self._state.adding or self._status == old_status:
+            return True
+
+        claimed = TethysJob.objects.filter(pk=self.pk, _status=old_status).update(
+            _status=self._status
+        )
+        if claimed:
+            self._take_snapshot(["_status"])
+            publish_status_change(self)
+            return True
+
+        log.debug(
+            f"The status of job {self.pk} was already updated by another process."
+        )
+        self.refresh_from_db(
+            fields=["_status", "start_time", "completion_time", "extended_properties"]
+        )
+        return False
+
+    def _set_extended_flag(self, key, value):
+        """
+        Set a boolean extended property of the job in the database, unless it is already set to ``value``. The row of the job is locked while the extended properties are read and written, so only one process can change the flag (e.g. to acquire a lock). Other unsaved changes to the extended properties are kept.
+
+        Args:
+            key (str): the key of the extended property.
+            value (bool): the value to set.
+
+        Returns:
+            bool: True if the flag was changed, else False.
+        """  # noqa: E501
+        if self._state.adding:
+            if bool(self.extended_properties.get(key, False)) == value:
+                return False
+            self.extended_properties[key] = value
+            return True
+
+        with transaction.atomic():
+            jobs = TethysJob.objects.select_for_update().filter(pk=self.pk)
+            extended_properties = (
+                jobs.values_list("extended_properties", flat=True).first() or {}
+            )
+            if bool(extended_properties.get(key, False)) == value:
+                return False
+            extended_properties[key] = value
+            if not jobs.update(extended_properties=extended_properties):
+                return False
+
+        if self.extended_properties is None:
+            self.extended_properties = {}
+        self.extended_properties[key] = value
+        loaded_values = getattr(self, "_loaded_values", {})
+        if loaded_values.get("extended_properties") is None:
+            loaded_values["extended_properties"] = {}
+        loaded_values["extended_properties"][key] = value
+        return True
+
+    def _post_process_status(self, old_status):
+        """
+        Record the start and completion times and process the results after the status of a pending or running job is updated.
+        """  # noqa: E501
+        if self._status == "RUN" and (old_status in ("PEN", "SUB")):
+            self.start_time = timezone.now()
+        if self._status in ["COM", "VCP", "RES"]:
+            self.process_results()
+        elif self._status == "ERR" or self._status == "ABT":
+            self.completion_time = timezone.now()
 
     def is_time_to_update(self):
         """
@@ -319,7 +700,7 @@ class TethysJob(models.Model):
         self._process_results(*args, **kwargs)
         self.completion_time = timezone.now()
         self._status = "COM"
-        self.save()
+        self.save_changes()
         log.debug("Finished processing results for job: {}".format(self))
 
     def resubmit(self, *args, **kwargs):
@@ -328,6 +709,46 @@ class TethysJob(models.Model):
     def get_logs(self):
         return self._get_logs()
 
+    def read_log(self, key1, key2=None, offset=None, length=None):
+        """
+        Read part of a log of the job, instead of the whole log.
+
+        Args:
+            key1 (str): key of the log (or of the group of logs) in the logs returned by get_logs.
+            key2 (str): key of the log in the group of logs, if any.
+            offset (int): position of the first byte to read. Defaults to reading the end (tail) of the log.
+            length (int): maximum number of bytes to read. Defaults to the JOB_LOG_CHUNK_SIZE setting.
+
+        Returns:
+            dict: the content that was read, its start ("offset") and end positions in the log and the size of the log.
+        """  # noqa: E501
+        with open_text(self._get_log_content(key1, key2)) as f:
+            return read_range(f, offset, length)
+
+    def iter_log(self, key1, key2=None, offset=0, chunk_size=None):
+        """
+        Read a log of the job one chunk of bytes at a time.
+
+        Args:
+            key1 (str): key of the log (or of the group of logs) in the logs returned by get_logs.
+            key2 (str): key of the log in the group of logs, if any.
+            offset (int): position of the first byte to read. Default is 0.
+            chunk_size (int): number of bytes of each chunk. Defaults to the JOB_LOG_CHUNK_SIZE setting.
+        """  # noqa: E501
+        with open_text(self._get_log_content(key1, key2)) as f:
+            yield from iter_range(f, offset, chunk_size)
+
+    def _get_log_content(self, key1, key2=None):
+        """
+        Get the whole content of a log. Job types that can read parts of their logs override read_log and iter_log instead.
+        """  # noqa: E501
+        content = self.get_logs()[key1]
+        if key2 is not None:
+            content = content[key2]
+        if callable(content):
+            content = content()
+        return content
+
     @abstractmethod
     def _get_logs(self):
         pass
@@ -13,6 +13,9 @@ import logging
 
 logger = logging.getLogger(f"tethys.{__name__}")
 
+_background_tasks = []
+_background_tasks_started = False
+
 
 def create_task(func, /, *args, delay=0, periodic=False, count=None, **kwargs):
     """
@@ -71,3 +74,39 @@ async def _run_after_delay(func, /, *args, delay, periodic, count, **kwargs):
                 func, *args, delay=delay, periodic=periodic, count=count, **kwargs
             )
         )
+
+
+def register_background_task(
+    func, /, *args, delay=0, periodic=False, count=None, **kwargs
+):
+    """
+    Registers a task to be scheduled with `create_task` as soon as the event loop of the ASGI server is running (see
+    `BackgroundTasksMiddleware`). Tasks are started once per process. Accepts the same arguments as `create_task`.
+    """
+    _background_tasks.append((func, args, delay, periodic, count, kwargs))
+
+
+def start_background_tasks():
+    """
+    Schedules all registered background tasks on the running event loop. Subsequent calls do nothing.
+    """
+    global _background_tasks_started
+    if _background_tasks_started:
+        return
+
+    _background_tasks_started = True
+    for func, args, delay, periodic, count, kwargs in _background_tasks:
+        create_task(func, *args, delay=delay, periodic=periodic, count=count, **kwargs)
+
+
+class BackgroundTasksMiddleware:
+    """
+    ASGI middleware that starts the registered background tasks on the event loop of the server with the first call.
+    """
+
+    def __init__(self, inner):
+        self.inner = inner
+
+    async def __call__(self, scope, receive, send):
+        start_background_tasks()
+        return await self.inner(scope, receive, send)
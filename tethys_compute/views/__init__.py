@@ -12,6 +12,7 @@
 from .dask_dashboard_view import dask_dashboard
 from .update_status import (
     get_job,
+    get_jobs,
     do_job_action,
     update_job_status,
     update_dask_job_status,
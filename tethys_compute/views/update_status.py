@@ -45,7 +45,31 @@ def get_job(job_id, user=None):
     return TethysJob.objects.get_subclass(id=job_id, user=user)
 
 
-async def do_job_action(job, action):
+@database_sync_to_async
+def get_jobs(job_ids, user=None):
+    """
+    Helper method to query several `TethysJob` objects with a single query from an asynchronous context.
+
+    Args:
+        job_ids: database IDs of `TethysJob` objects
+        user: django user object. If `None` then permission are not checked. Default=None
+
+    Returns: dict of `TethysJob` objects keyed by job ID. Jobs that do not exist or that the user may not access are omitted.
+
+    """  # noqa: E501
+    if user is not None and user.is_anonymous:
+        user = get_anonymous_user()
+    jobs = TethysJob.objects.filter(id__in=job_ids)
+    if not (
+        user is None
+        or user.is_staff
+        or user.has_perm("tethys_compute.jobs_table_actions")
+    ):
+        jobs = jobs.filter(user=user)
+    return {job.id: job for job in jobs.select_subclasses()}
+
+
+async def do_job_action(job, action, thread_sensitive=True):
     """
     Helper function to call job actions from an asynchronous context.
     Handles both sync methods and coroutine job actions.
@@ -53,16 +77,17 @@ async def do_job_action(job, action):
     Args:
         job: `TethysJob` object
         action (str): name of method to call (without arguments) on the  `job`
+        thread_sensitive (bool): run sync methods in the single thread shared by all thread-sensitive code (the default), or in a thread of their own so that several can run concurrently.
 
     Returns: return value of `action`
 
-    """
+    """  # noqa: E501
     func = getattr(job, action)
     if asyncio.iscoroutinefunction(func):
         ret = await func()
         await job.safe_close()
     else:
-        ret = await database_sync_to_async(func)()
+        ret = await database_sync_to_async(func, thread_sensitive=thread_sensitive)()
     return ret
 
 
@@ -0,0 +1,172 @@
+"""
+********************************************************************************
+* Name: consumers.py
+* Author: Tethys Platform Developers
+* Created On: October 2026
+* Copyright: (c) Tethys Geospatial Foundation 2026
+* License: BSD 2-Clause
+********************************************************************************
+"""
+
+import asyncio
+import logging
+
+from channels.db import database_sync_to_async
+from channels.generic.websocket import AsyncJsonWebsocketConsumer
+from django.conf import settings
+
+from tethys_compute.job_status_push import get_job_group, get_user_group
+from tethys_compute.models import TethysJob
+from tethys_compute.views import get_job, get_jobs
+from tethys_gizmos.views.gizmos.jobs_table import _read_log
+
+logger = logging.getLogger(f"tethys.{__name__}")
+
+
+class JobLogConsumer(AsyncJsonWebsocketConsumer):
+    """
+    Follow a log of a job over a websocket. Once the client sends the position to follow the log from (e.g. ``{"offset": 1024}``), the content that is appended to the log is sent as it is written, in the format of the responses of the read-log endpoint, until the job is finished (``{"complete": true}``).
+    """  # noqa: E501
+
+    job = None
+    task = None
+
+    async def connect(self):
+        user = self.scope.get("user")
+        kwargs = self.scope["url_route"]["kwargs"]
+        self.key1 = kwargs["key1"]
+        self.key2 = kwargs.get("key2")
+
+        if user is None or not user.is_authenticated:
+            await self.close()
+            return
+
+        try:
+            self.job = await get_job(kwargs["job_id"], user)
+        except TethysJob.DoesNotExist:
+            await self.close()
+            return
+
+        await self.accept()
+
+    async def disconnect(self, code):
+        if self.task is not None:
+            self.task.cancel()
+
+    async def receive_json(self, content, **kwargs):
+        offset = content.get("offset")
+        if self.task is not None:
+            self.task.cancel()
+        self.task = asyncio.create_task(
+            self.follow(int(offset) if offset is not None else None)
+        )
+
+    async def follow(self, offset=None):
+        """
+        Send the content appended to the log after the given position (or the end of the log), until the job is finished.
+        """  # noqa: E501
+        interval = getattr(settings, "JOB_LOG_FOLLOW_INTERVAL", 2)
+        while True:
+            # Check the status first, so that nothing written before the job finished is missed
+            complete = await self.is_complete()
+            try:
+                offset = await self.send_new_content(offset)
+            except FileNotFoundError:
+                # The log is not written until the job starts
+                pass
+            except Exception as e:
+                logger.warning(
+                    f'Following log "{self.key1} {self.key2 or ""}" of job '
+                    f'"{self.job.id}" failed: {e}'
+                )
+                await self.send_json(
+                    {"error_message": "An error occurred while following the log."}
+                )
+                await self.close()
+                return
+
+            if complete:
+                await self.send_json({"complete": True})
+                await self.close()
+                return
+
+            await asyncio.sleep(interval)
+
+    async def send_new_content(self, offset):
+        """
+        Send the content of the log after the given position, one chunk at a time.
+
+        Returns:
+            int: the position of the end of the content that was sent.
+        """
+        while True:
+            chunk = await _read_log(self.job, self.key1, self.key2, offset)
+            if chunk["content"]:
+                await self.send_json(chunk)
+            offset = chunk["end"]
+            if offset >= chunk["size"]:
+                return offset
+
+    @database_sync_to_async
+    def is_complete(self):
+        # The statuses are updated by the jobs table and the job status poller
+        self.job.refresh_from_db(fields=["_status"])
+        return self.job._status in TethysJob.TERMINAL_STATUS_CODES
+
+
+class JobStatusConsumer(AsyncJsonWebsocketConsumer):
+    """
+    Push the statuses of jobs over a websocket as they change, instead of polling for them. The statuses of all of the jobs of the user are pushed, and of the other jobs the user may access once the client subscribes to them (e.g. ``{"job_ids": [1, 2]}``). The changes are coalesced and sent at most every JOB_STATUS_PUSH_INTERVAL seconds (e.g. ``{"jobs": [{"job_id": 1, "status": "Running", "status_code": "RUN"}]}``).
+    """  # noqa: E501
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.joined_groups = set()
+        self.pending = {}
+        self.flush_task = None
+
+    async def connect(self):
+        user = self.scope.get("user")
+        if user is None or not user.is_authenticated or self.channel_layer is None:
+            await self.close()
+            return
+
+        await self.join(get_user_group(user.id))
+        await self.accept()
+
+    async def disconnect(self, code):
+        if self.flush_task is not None:
+            self.flush_task.cancel()
+        for group in self.joined_groups:
+            await self.channel_layer.group_discard(group, self.channel_name)
+        self.joined_groups.clear()
+
+    async def join(self, group):
+        if group not in self.joined_groups:
+            await self.channel_layer.group_add(group, self.channel_name)
+            self.joined_groups.add(group)
+
+    async def receive_json(self, content, **kwargs):
+        job_ids = content.get("job_ids")
+        if not isinstance(job_ids, list):
+            return
+
+        # Only subscribe to the jobs the user may access
+        jobs = await get_jobs([str(job_id) for job_id in job_ids], self.scope["user"])
+        for job_id in jobs:
+            await self.join(get_job_group(job_id))
+
+    async def job_statuses(self, event):
+        """
+        Handle the status changes published to the groups (see ``tethys_compute.job_status_push``). Only the last status of each job is sent.
+        """  # noqa: E501
+        for data in event["jobs"]:
+            self.pending[data["job_id"]] = data
+        if self.flush_task is None:
+            self.flush_task = asyncio.create_task(self.flush())
+
+    async def flush(self):
+        await asyncio.sleep(getattr(settings, "JOB_STATUS_PUSH_INTERVAL", 1))
+        jobs, self.pending = list(self.pending.values()), {}
+        self.flush_task = None
+        await self.send_json({"jobs": jobs})
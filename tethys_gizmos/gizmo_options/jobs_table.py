@@ -11,9 +11,9 @@
 from collections import namedtuple
 import logging
 from functools import wraps
-from copy import deepcopy
 from pathlib import Path
 
+from django.core.exceptions import FieldDoesNotExist
 from django.urls import reverse
 
 from tethys_portal.dependencies import vendor_static_dependencies
@@ -185,6 +185,8 @@ class JobsTable(TethysGizmoOptions):
         show_detailed_status(bool): Show status of each node in CondorWorkflow jobs when True. Defaults to False.
         sort(bool|callable): Whether to sort the list of jobs in the table. If True, jobs are sorted by creation time from oldest (top of the table) to newest. If a callable is passed then it is used as the key to sort the jobs. Default is True.
         reverse_sort(bool): Whether to reverse the sorting order. If ``sort`` is False then this argument has no effect. Default is False.
+        page_size(int): Number of jobs in each page of the table. When given, ``jobs`` must be the ``JobManager`` of the app and the table loads the jobs of the user from the server one page at a time, sorted and filtered (by status, owner and creation date) by the database. Only the columns of database fields can be sorted by. Users with permission to manage all jobs can view the jobs of other users with the owner filter. Default is None (all the jobs are rendered with the page).
+        live_updates(bool): Update the statuses of the jobs as they change, with the status changes pushed by the server over a websocket, instead of polling for them every ``refresh_interval``. The table falls back to polling if the websocket is closed. Requires the portal to be served with ASGI, and a shared channel layer (see the ``CHANNEL_LAYERS`` setting) if the statuses are updated by other processes. Default is False.
 
     Controller Example
 
@@ -206,6 +208,20 @@ class JobsTable(TethysGizmoOptions):
             'jobs_table_options': jobs_table_options,
         }
 
+    Controller Example with Server-Side Paging
+
+    ::
+
+        from tethys_sdk.gizmos import JobsTable
+        from .app import App
+
+        jobs_table_options = JobsTable(
+            jobs=App.get_job_manager(),
+            column_fields=('id', 'name', 'description', 'creation_time', 'execute_time'),
+            page_size=25,
+            reverse_sort=True,  # newest jobs first
+        )
+
     Controller Example with Custom Actions
 
     ::
@@ -296,6 +312,8 @@ class JobsTable(TethysGizmoOptions):
         data_table_options=None,
         sort=True,
         reverse_sort=False,
+        page_size=None,
+        live_updates=False,
     ):
         """
         Constructor
@@ -305,10 +323,20 @@ class JobsTable(TethysGizmoOptions):
         # Initialize super class
         super().__init__(attributes=attributes, classes=classes)
 
-        self.jobs = list(jobs)
-        if sort:
-            key = sort if callable(sort) else lambda j: j.creation_time
-            self.jobs.sort(key=key, reverse=reverse_sort)
+        self.page_size = page_size
+        self.label = None
+        self.order_by = None
+        self.statuses = TethysJob.STATUSES if page_size else ()
+        if page_size:
+            # The jobs are loaded from the server one page at a time
+            self.label = jobs.label
+            self.order_by = "-creation_time" if reverse_sort else "creation_time"
+            self.jobs = []
+        else:
+            self.jobs = list(jobs)
+            if sort:
+                key = sort if callable(sort) else lambda j: j.creation_time
+                self.jobs.sort(key=key, reverse=reverse_sort)
         self.rows = None
         self.column_fields = None
         self.column_names = None
@@ -323,9 +351,10 @@ class JobsTable(TethysGizmoOptions):
         self.attributes = attributes or {}
         self.classes = classes
         self.refresh_interval = refresh_interval
+        self.live_updates = live_updates
         self.delay_loading_status = delay_loading_status
         self.show_detailed_status = show_detailed_status
-        self.enable_data_table = enable_data_table
+        self.enable_data_table = enable_data_table and not page_size
         self.data_table_options = data_table_options or {
             "ordering": True,
             "searching": False,
@@ -453,14 +482,21 @@ class JobsTable(TethysGizmoOptions):
         self.base_ajax_url = self.base_ajax_url.replace("9999/action/delete", "")
 
     def set_rows_and_columns(self, jobs, column_fields):
+        from tethys_compute.models import TethysJob
+
         self.rows = list()
         self.column_fields = list()
         self.column_names = list()
+        self.sort_fields = list()
 
-        if len(jobs) == 0:
+        if self.page_size:
+            # Validate the columns against the job class, since the jobs are loaded later
+            first_job = TethysJob
+        elif len(jobs) == 0:
             return
+        else:
+            first_job = jobs[0]
 
-        first_job = jobs[0]
         for field in column_fields:
             if isinstance(field, tuple):
                 column_name, field = field
@@ -476,6 +512,7 @@ class JobsTable(TethysGizmoOptions):
                     )  # verify that the field name is a valid attribute on the job
                 self.column_names.append(column_name)
                 self.column_fields.append(field)
+                self.sort_fields.append(self.get_sort_field(field))
             except AttributeError:
                 log.warning(
                     "Column %s was not added because the %s has no attribute %s.",
@@ -488,11 +525,35 @@ class JobsTable(TethysGizmoOptions):
             row_values = self.get_row(
                 job,
                 self.column_fields,
-                deepcopy(self.actions),
+                self.actions,
                 delay_loading_status=self.delay_loading_status,
             )
             self.rows.append(row_values)
 
+    @staticmethod
+    def get_sort_field(field):
+        """
+        Get the database field that a column can be sorted by when the jobs are loaded one page at a time.
+
+        Args:
+            field (str): the job attribute of the column.
+
+        Returns:
+            str: the name of the field, or None if the column cannot be sorted by the database.
+        """  # noqa: E501
+        from tethys_compute.models import TethysJob
+
+        try:
+            model_field = TethysJob._meta.get_field(field)
+        except FieldDoesNotExist:
+            return None
+
+        # Null values cannot be compared with the last job of the previous page
+        if not model_field.concrete or model_field.null or model_field.is_relation:
+            return None
+
+        return model_field.name
+
     @staticmethod
     def get_row(job, job_attributes, actions=None, delay_loading_status=False):
         """Get the field values for one row (corresponding to one job).
@@ -500,7 +561,7 @@ class JobsTable(TethysGizmoOptions):
         Args:
             job (TethysJob): An instance of a subclass of TethysJob
             job_attributes (list): a list of attribute names corresponding to the fields in the jobs table
-            actions (dict): a dictionary of custom actions
+            actions (dict): a dictionary of custom actions. It is not modified: the actions of the row are returned with an "enabled" property.
             delay_loading_status (bool): whether to delay loading the status.
                 Note that ``cached_status`` will be used and only non-terminal statuses will be updated on load.
 
@@ -510,7 +571,6 @@ class JobsTable(TethysGizmoOptions):
         """
         from tethys_compute.models import TethysJob
 
-        job_actions = actions or {}
         row_values = list()
         extended_properties = job.extended_properties
         for attribute in job_attributes:
@@ -529,16 +589,17 @@ class JobsTable(TethysGizmoOptions):
 
             row_values.append(value)
 
-        job_status = job.cached_status
+        cached_status = job_status = job.cached_status
         if job_status not in TethysJob.TERMINAL_STATUSES:
             job_status = None if delay_loading_status else job.status
 
-        for action, properties in job_actions.items():
-            properties["enabled"] = getattr(
+        # use cached status in case job_status is None
+        job_actions = dict()
+        for action, properties in (actions or {}).items():
+            enabled = getattr(
                 job, CustomJobAction.get_enabled_callback_name(action), lambda js: True
-            )(
-                job.cached_status
-            )  # use cached status in case job_status is None
+            )(cached_status)
+            job_actions[action] = {**properties, "enabled": enabled}
 
         return JobsTableRow(row_values, job_status=job_status, actions=job_actions)
 
@@ -77,10 +77,14 @@ function bind_action(action, on_success=()=>{}){
   }
 }
 
-var log_contents = {};
+// Logs are read one chunk at a time: the end of the log first, then earlier chunks on demand
+var log_chunk_size = 65536;
+var log_state = {};
+var log_socket = null;
 
 function load_log_content(job_id) {
     // Clear content
+    stop_following_log();
     $('#modal-dialog-jobs-table-log-content').html('');
     $("#jobs_table_logs_overlay").removeClass('d-none');
 
@@ -90,7 +94,7 @@ function load_log_content(job_id) {
         url: show_log_url
     }).done(function(json){
         if(json.success){
-            log_contents = json.log_contents;
+            log_chunk_size = json.chunk_size || log_chunk_size;
             $('#modal-dialog-jobs-table-log-nav').html(json.html);
             $('#modal-dialog-jobs-table-log-nav').find('.tethys-select2').select2();
             if ($('.jobs-table-log-menu').length > 0){
@@ -116,45 +120,109 @@ function update_log_menu(event){
   $('#log_' + key).trigger('change');
 }
 
-function update_log_content(event, use_cache=true){
+function get_log_url(view){
   var job_id = $('#sub_job_select').data('job-id');
   var key1 = $('#sub_job_select').val();
   var key2 = $('#log_' + key1).val();
-  var content;
-  var log_content_url = base_ajax_url + job_id + '/log-content/' + key1;
-  if (key2 === undefined){
-    content = log_contents[key1];
-  }else{
-    log_content_url += '/' + key2;
-    content = log_contents[key1][key2];
+  var log_url = base_ajax_url + job_id + '/' + view + '/' + key1;
+  if (key2 !== undefined && key2 !== null){
+    log_url += '/' + key2;
   }
+  return log_url;
+}
 
-  if(use_cache && content != null){
-    $("#jobs_table_logs_overlay").addClass('d-none');
-    $('#modal-dialog-jobs-table-log-content').html(`<pre>${content}</pre>`);
-  }
-  else{
-    $('#modal-dialog-jobs-table-log-content').html('');
-    $("#jobs_table_logs_overlay").removeClass('d-none');
+function update_log_content(event){
+  stop_following_log();
+  $('#modal-dialog-jobs-table-log-content').html('');
+  $("#jobs_table_logs_overlay").removeClass('d-none');
 
-    $.ajax({
-        url: log_content_url
-    }).done(function(json){
+  var log_url = get_log_url('read-log');
+  $.ajax({
+      url: log_url
+  }).done(function(json){
     $("#jobs_table_logs_overlay").addClass('d-none');
-      if(json.success){
-        content = json.content;
-        $('#modal-dialog-jobs-table-log-content').html(`<pre>${content}</pre>`);
-        if (key2 === undefined){
-          log_contents[key1] = content;
-        }else{
-          log_contents[key1][key2] = content;
-        }
-      }
-      else{
-        $('#modal-dialog-jobs-table-log-content').html(json.error_message);
-      }
-    });
+    if(json.success){
+      log_state = {url: log_url, offset: json.offset, end: json.end};
+      render_log_content(json.content);
+    }
+    else{
+      $('#modal-dialog-jobs-table-log-content').html(json.error_message);
+    }
+  });
+}
+
+function render_log_content(content){
+  var $earlier = $('<button type="button" class="btn btn-sm btn-outline-secondary jobs-table-log-earlier">Load Earlier</button>');
+  $earlier.toggleClass('d-none', log_state.offset == 0).on('click', load_earlier_log_content);
+
+  var $follow = $('<button type="button" class="btn btn-sm btn-outline-secondary jobs-table-log-follow" data-bs-toggle="button">Follow</button>');
+  $follow.on('click', function(){
+    if ($(this).hasClass('active')){
+      follow_log();
+    }
+    else{
+      stop_following_log();
+    }
+  });
+
+  var $download = $('<a class="btn btn-sm btn-outline-secondary" download>Download</a>');
+  $download.attr('href', get_log_url('download-log'));
+
+  var $controls = $('<div class="jobs-table-log-controls"></div>').append($earlier, $follow, $download);
+  var $text = $('<pre class="jobs-table-log-text"></pre>').text(content);
+  $('#modal-dialog-jobs-table-log-content').empty().append($controls, $text);
+}
+
+function load_earlier_log_content(){
+  var offset = Math.max(0, log_state.offset - log_chunk_size);
+  $.ajax({
+      url: log_state.url,
+      data: {offset: offset, length: log_state.offset - offset}
+  }).done(function(json){
+    if(json.success){
+      log_state.offset = json.offset;
+      $('.jobs-table-log-text').prepend(document.createTextNode(json.content));
+      $('.jobs-table-log-earlier').toggleClass('d-none', json.offset == 0);
+    }
+  });
+}
+
+function follow_log(){
+  // Receive the content appended to the log while the job is running
+  stop_following_log();
+  var protocol = window.location.protocol === 'https:' ? 'wss://' : 'ws://';
+  var socket = new WebSocket(protocol + window.location.host + log_state.url.replace('/read-log/', '/follow-log/'));
+  socket.onopen = function(){
+    socket.send(JSON.stringify({offset: log_state.end}));
+  };
+  socket.onmessage = function(event){
+    var data = JSON.parse(event.data);
+    if (data.content){
+      log_state.end = data.end;
+      $('.jobs-table-log-text').append(document.createTextNode(data.content));
+      var $body = $('#modal-dialog-jobs-table-log-body');
+      $body.scrollTop($body.prop('scrollHeight'));
+    }
+    if (data.complete || data.error_message){
+      stop_following_log();
+    }
+  };
+  socket.onclose = function(){
+    $('.jobs-table-log-follow').removeClass('active');
+  };
+  log_socket = socket;
+}
+
+$(document).on('hidden.bs.modal', '#modal-dialog-jobs-table-show-log', function(){
+  stop_following_log();
+});
+
+function stop_following_log(){
+  if (log_socket !== null){
+    log_socket.close();
+    log_socket = null;
   }
+  $('.jobs-table-log-follow').removeClass('active');
 }
 
 function bind_show_log_action(action){
@@ -170,7 +238,7 @@ function bind_log_refresh_button(job_id){
   var $btn = $("#tethys_log_refresh_job_id");
   $btn.val(job_id);
   $btn.on('click', function(){
-        update_log_content(null, use_cache=false);
+        update_log_content(null);
     });
 }
 
@@ -285,45 +353,52 @@ function render_workflow_nodes_graph(dag, target_selector) {
     }
 }
 
+function update_row_html(table_elem, json){
+    // Returns whether the job is still active
+    if(json.success){
+        var job_id = $(table_elem).data('job-id');
+        var current_status = $('#jobs-table-status-'+job_id).children('div').attr('title') || 'None';
+        if(current_status != json.status) {
+            $(table_elem).html(json.html);
+            bind_jobs_table_actions(table_elem);
+        }
+
+        var active_statuses = $(table_elem).closest('table').data('active-statuses');
+        if(active_statuses.includes(json.status)) {
+            active_counter++;
+            return true;
+        }
+    } else {
+        $(table_elem).html(json.html);
+        bind_jobs_table_actions(table_elem);
+    }
+    return false;
+}
+
+function get_update_row_data(table){
+    return {
+        column_fields: $(table).data('column-fields'),
+        show_status: $(table).data('show-status'),
+        show_actions: $(table).data('show-actions'),
+        actions: $(table).data('actions'),
+    };
+}
+
 function update_row(table_elem){
     var table = $(table_elem).closest('table');
-    var show_status = $(table).data('show-status');
-    var show_actions = $(table).data('show-actions');
-    var actions = $(table).data('actions');
-    var column_fields = $(table).data('column-fields');
     var refresh_interval = $(table).data('refresh-interval');
     var job_id = $(table_elem).data('job-id');
     var update_url = base_ajax_url + job_id + '/update-row';
-    var active_statuses = $(table).data('active-statuses');
 
-    var data = {
-        column_fields: column_fields,
-        show_status: show_status,
-        show_actions: show_actions,
-        actions: actions,
-    };
     $.ajax({
         method: 'POST',
         url: update_url,
-        data: data
+        data: get_update_row_data(table)
     }).done(function(json){
-        if(json.success){
-            var current_status = $('#jobs-table-status-'+job_id).children('div').attr('title') || 'None';
-            if(current_status != json.status) {
-                $(table_elem).html(json.html);
-                bind_jobs_table_actions(table_elem);
-                status = json.status;
-            }
-
-            if(active_statuses.includes(status)) {
-                active_counter++;
-                setTimeout(function(){
-                    update_row(table_elem);
-                }, refresh_interval);
-            }
-        } else {
-            $(table_elem).html(json.html);
-            bind_jobs_table_actions(table_elem);
+        if(update_row_html(table_elem, json) && !is_live(table)) {
+            setTimeout(function(){
+                update_row(table_elem);
+            }, refresh_interval);
         }
         $('[data-bs-toggle="tooltip"]').tooltip();
     });
@@ -335,6 +410,169 @@ function update_row(table_elem){
     }
 }
 
+function update_rows(table, rows){
+    // Update the rows of a table with one request, then keep updating the rows of active jobs
+    rows = $(rows).filter(function(){
+        return $.contains(document, this);
+    }).get();
+    if(rows.length == 0){
+        return;
+    }
+
+    var refresh_interval = $(table).data('refresh-interval');
+    var data = get_update_row_data(table);
+    data.job_ids = rows.map(function(row){
+        return $(row).data('job-id');
+    }).join(',');
+
+    $.ajax({
+        method: 'POST',
+        url: base_ajax_url + 'update-rows',
+        data: data
+    }).done(function(json){
+        var active_rows = rows.filter(function(table_elem){
+            var row = json.rows[$(table_elem).data('job-id')];
+            return row !== undefined && update_row_html(table_elem, row);
+        });
+        $('[data-bs-toggle="tooltip"]').tooltip();
+
+        if(active_rows.length > 0 && !is_live(table)){
+            setTimeout(function(){
+                update_rows(table, active_rows);
+            }, refresh_interval);
+        }
+    });
+}
+
+function is_live(table){
+    // Whether the statuses of the jobs of a table are pushed by the server, so they are not polled
+    var socket = $(table).data('status-socket');
+    return socket !== undefined && socket !== null && socket.readyState === WebSocket.OPEN;
+}
+
+function subscribe_rows(table, rows){
+    // Receive the status changes of the jobs of the rows, including the jobs of other users
+    if(!is_live(table) || rows.length == 0){
+        return;
+    }
+    var job_ids = $(rows).map(function(){
+        return $(this).data('job-id');
+    }).get();
+    $(table).data('status-socket').send(JSON.stringify({job_ids: job_ids}));
+}
+
+function init_live_updates(table){
+    // Update the rows of the jobs whose statuses are pushed by the server as they change
+    var protocol = window.location.protocol === 'https:' ? 'wss://' : 'ws://';
+    var socket = new WebSocket(protocol + window.location.host + base_ajax_url + 'job-status/');
+    var opened = false;
+    socket.onopen = function(){
+        opened = true;
+        subscribe_rows(table, $(table).find('.job-row'));
+    };
+    socket.onmessage = function(event){
+        var job_ids = JSON.parse(event.data).jobs.map(function(job){
+            return String(job.job_id);
+        });
+        var rows = $(table).find('.job-row').filter(function(){
+            return job_ids.includes(String($(this).data('job-id')));
+        });
+        update_rows(table, rows);
+    };
+    socket.onclose = function(){
+        $(table).data('status-socket', null);
+        // Poll for the statuses instead (they are still polled if the websocket never opened)
+        if(opened){
+            update_rows(table, $(table).find('.job-row'));
+        }
+    };
+    $(table).data('status-socket', socket);
+}
+
+function get_page_data(table){
+    var data = get_update_row_data(table);
+    data.show_detailed_status = $(table).data('show-detailed-status');
+    data.label = $(table).data('label');
+    data.page_size = $(table).data('page-size');
+    data.order_by = $(table).data('order-by');
+    $(table).prevAll('.jobs-table-filters').first().find('.jobs-table-filter').each(function(){
+        data[$(this).attr('name')] = $(this).val();
+    });
+    return data;
+}
+
+function load_page(table, page){
+    // Load one page of the jobs of a table with server-side paging
+    var cursors = $(table).data('page-cursors');
+    var data = get_page_data(table);
+    // The id of the last job of the previous page
+    data.after = page > 0 ? cursors[page - 1] : '';
+
+    $.ajax({
+        method: 'POST',
+        url: base_ajax_url + 'list-rows',
+        data: data
+    }).done(function(json){
+        if(!json.success){
+            add_message(json.error_message);
+            return;
+        }
+        $(table).data('page', page);
+        cursors[page] = json.next;
+
+        var tbody = $(table).children('tbody');
+        tbody.html(json.html);
+        bind_jobs_table_actions(tbody);
+
+        // Load the statuses of the jobs of the page
+        var rows = tbody.find('.job-row');
+        update_rows(table, rows);
+        subscribe_rows(table, rows);
+        rows.next('.workflow-nodes-row').each(function(){
+            update_workflow_nodes_row(this);
+        });
+        tbody.find('.bokeh-nodes-row').first().each(function(){
+            bokeh_nodes_row(this);
+        });
+
+        var pager = $(table).prevAll('.jobs-table-filters').first().find('.jobs-table-pager');
+        pager.find('.jobs-table-previous').parent().toggleClass('disabled', page == 0);
+        pager.find('.jobs-table-next').parent().toggleClass('disabled', json.next === null);
+    });
+}
+
+function init_paged_table(table){
+    var reload = function(){
+        $(table).data('page-cursors', []);
+        load_page(table, 0);
+    };
+
+    $(table).prevAll('.jobs-table-filters').first().find('.jobs-table-filter').on('change', reload);
+
+    $(table).find('.jobs-table-sort').on('click', function(){
+        var field = $(this).data('sort-field');
+        var order_by = $(table).data('order-by') == field ? '-' + field : field;
+        $(table).data('order-by', order_by);
+        $(table).find('.jobs-table-sort').removeClass('sort-asc sort-desc');
+        $(this).addClass(order_by.startsWith('-') ? 'sort-desc' : 'sort-asc');
+        reload();
+    });
+
+    var pager = $(table).prevAll('.jobs-table-filters').first().find('.jobs-table-pager');
+    pager.find('.jobs-table-previous').on('click', function(){
+        if(!$(this).parent().hasClass('disabled')){
+            load_page(table, $(table).data('page') - 1);
+        }
+    });
+    pager.find('.jobs-table-next').on('click', function(){
+        if(!$(this).parent().hasClass('disabled')){
+            load_page(table, $(table).data('page') + 1);
+        }
+    });
+
+    reload();
+}
+
 function bind_modal_url(action){
   var job_id = $(action).data('job-id');
   var modal_url = $(action).data('modal-url');
@@ -533,8 +771,22 @@ bind_jobs_table_actions($('.jobs-table'))
 // Keep track of how many job are active. If none of the jobs are active, we won't show bokeh graph.
 var active_counter = 0;
 
-$('.job-row').each(function(){
-    update_row(this);
+$('.jobs-table').each(function(){
+    if($(this).data('live-updates')){
+        init_live_updates(this);
+    }
+
+    if($(this).data('page-size')){
+        init_paged_table(this);
+        return;
+    }
+
+    var rows = $(this).find('.job-row');
+    update_rows(this, rows);
+
+    rows.next('.workflow-nodes-row').each(function(){
+        update_workflow_nodes_row(this);
+    });
 });
 
 // Only show bokeh for the top row.
@@ -9,6 +9,7 @@
 """
 
 from django.urls import re_path, include
+from tethys_gizmos.consumers import JobLogConsumer, JobStatusConsumer
 from tethys_gizmos.views.gizmos import jobs_table as jobs_table_views
 
 ajax_urls = [
@@ -32,11 +33,31 @@ ajax_urls = [
         jobs_table_views.get_log_content,
         name="log_content",
     ),
+    re_path(
+        r"^(?P<job_id>[\d.@+-]+)/read-log/(?P<key1>[\w+_-]+)(?:/(?P<key2>.*))?",
+        jobs_table_views.read_log,
+        name="read_log",
+    ),
+    re_path(
+        r"^(?P<job_id>[\d.@+-]+)/download-log/(?P<key1>[\w+_-]+)(?:/(?P<key2>.*))?",
+        jobs_table_views.download_log,
+        name="download_log",
+    ),
     re_path(
         r"^(?P<job_id>[\d.@+-]+)/update-row",
         jobs_table_views.update_row,
         name="update_job_row",
     ),
+    re_path(
+        r"^update-rows$",
+        jobs_table_views.update_rows,
+        name="update_job_rows",
+    ),
+    re_path(
+        r"^list-rows$",
+        jobs_table_views.list_rows,
+        name="list_job_rows",
+    ),
     re_path(
         r"^(?P<job_id>[\d.@+-]+)/update-workflow-nodes-row",
         jobs_table_views.update_workflow_nodes_row,
@@ -57,3 +78,16 @@ ajax_urls = [
 urlpatterns = [
     re_path(r"^ajax/", include(ajax_urls)),
 ]
+
+websocket_urlpatterns = [
+    re_path(
+        r"^ajax/(?P<job_id>[\d.@+-]+)/follow-log/(?P<key1>[\w+_-]+)(?:/(?P<key2>.*))?$",
+        JobLogConsumer.as_asgi(),
+        name="follow_log",
+    ),
+    re_path(
+        r"^ajax/job-status/$",
+        JobStatusConsumer.as_asgi(),
+        name="job_status",
+    ),
+]
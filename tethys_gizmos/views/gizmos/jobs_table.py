@@ -8,20 +8,25 @@
 ********************************************************************************
 """
 
+import asyncio
 import inspect
 import logging
 import re
 
-from django.http import JsonResponse
+from django.conf import settings
+from django.http import Http404, JsonResponse, StreamingHttpResponse
 from django.template.loader import render_to_string
+from django.utils.dateparse import parse_date
 from channels.db import database_sync_to_async
 
 from tethys_apps.decorators import async_login_required
-from tethys_compute.models import CondorWorkflow, DaskJob, DaskScheduler
+from tethys_compute.job_logs import get_chunk_size, open_text, read_range
+from tethys_compute.job_manager import JobManager
+from tethys_compute.models import CondorWorkflow, DaskJob, DaskScheduler, TethysJob
 from tethys_gizmos.gizmo_options.jobs_table import JobsTable
 from tethys_sdk.gizmos import SelectInput
 from tethys_portal.optional_dependencies import optional_import
-from tethys_compute.views import get_job, do_job_action
+from tethys_compute.views import get_job, get_jobs, do_job_action
 
 # optional imports
 server_document = optional_import("server_document", from_module="bokeh.embed")
@@ -55,6 +60,37 @@ async def _get_log_content(job, key1, key2):
     return content
 
 
+async def _read_log(job, key1, key2=None, offset=None, length=None):
+    """
+    Read part of a log of a job.
+    """
+    if inspect.iscoroutinefunction(job.get_logs):
+        # Asynchronous logs can only be retrieved whole
+        with open_text(await _get_log_content(job, key1, key2)) as f:
+            return read_range(f, offset, length)
+
+    return await database_sync_to_async(job.read_log)(key1, key2, offset, length)
+
+
+async def _iter_log(job, key1, key2=None):
+    """
+    Read a log of a job one chunk at a time, without blocking the event loop.
+    """
+    if inspect.iscoroutinefunction(job.get_logs):
+        content = await _get_log_content(job, key1, key2)
+        yield (content or "").encode("utf-8")
+        return
+
+    chunks = job.iter_log(key1, key2)
+    next_chunk = database_sync_to_async(next)
+    try:
+        while (chunk := await next_chunk(chunks, None)) is not None:
+            yield chunk
+    finally:
+        # Close the log if the download is interrupted
+        await database_sync_to_async(chunks.close)()
+
+
 @database_sync_to_async
 def get_dask_scheduler(scheduler_id):
     return DaskScheduler.objects.get(id=scheduler_id)
@@ -163,20 +199,9 @@ async def show_log(request, job_id):
 
         html = render_to_string("tethys_gizmos/gizmos/job_logs.html", context)
 
-        def remove_callables(item):
-            if callable(item):
-                return
-            elif isinstance(item, dict):
-                for k, v in item.items():
-                    item[k] = remove_callables(v)
-                return item
-            else:
-                return item.replace("\n", "<br/>")
-
-        log_contents = remove_callables(data)
-
+        # The contents of the logs are read one chunk at a time with read_log
         return JsonResponse(
-            {"success": True, "html": html, "log_contents": log_contents}
+            {"success": True, "html": html, "chunk_size": get_chunk_size()}
         )
     except Exception as e:
         logger.exception(e)
@@ -222,85 +247,287 @@ async def get_log_content(request, job_id, key1, key2=None):
 
 
 @async_login_required
-async def update_row(request, job_id):
-    data = reconstruct_post_dict(request)
+async def read_log(request, job_id, key1, key2=None):
     try:
         job = await get_job(job_id, request.user)
-        await do_job_action(job, "update_status")
-        status = job.cached_status
-        status_msg = job.status_message
-        statuses = None
-        if status in ["Various", "Various-Complete"]:
-            # Hard code statues for the gizmo showcase
-            if job.label == "gizmo_showcase":
-                if isinstance(job, CondorWorkflow):
-                    statuses = {
-                        "Completed": 20,
-                        "Error": 20,
-                        "Running": 40,
-                        "Aborted": 0,
-                    }
-                else:
-                    statuses = {
-                        "Completed": 40,
-                        "Error": 10,
-                        "Running": 30,
-                        "Aborted": 5,
-                    }
-                    if status == "Various-Complete":
-                        statuses = {
-                            "Completed": 80,
-                            "Error": 15,
-                            "Running": 0,
-                            "Aborted": 5,
-                        }
-            elif isinstance(job, CondorWorkflow):
-                statuses, num_statuses = await get_job_statuses(job)
-
-                # Handle case with CondorWorkflows where DAG has started working,
-                # but jobs have not necessarily started yet.
-                if isinstance(job, CondorWorkflow) and not num_statuses:
-                    status = "Submitted"
-
-        if isinstance(job, DaskJob):
-            # Display results ready as running on jobs table
-            if status == "Results-Ready":
-                status = "Running"
-
-        row = JobsTable.get_row(
-            job, data["column_fields"], data.get("actions"), delay_loading_status=True
+        offset = request.GET.get("offset")
+        offset = int(offset) if offset else None
+        # Limit the size of the responses, which are read into memory
+        length = min(
+            int(request.GET.get("length") or get_chunk_size()), get_chunk_size()
+        )
+
+        chunk = await _read_log(job, key1, key2, offset, length)
+
+        return JsonResponse({"success": True, **chunk})
+    except Exception as e:
+        logger.error(
+            "The following error occurred when reading log %s of job %s: %s",
+            f"{key1} {key2 or ''}",
+            job_id,
+            str(e),
         )
-        data.update(
+        return JsonResponse(
             {
-                "job": job,
-                "row": row,
-                "job_status": status,
-                "job_statuses": statuses,
-                "delay_loading_status": False,
-                "error_message": status_msg,
-            }
+                "success": False,
+                "error_message": f"ERROR: An error occurred while retrieving log content for: {key1} {key2 or ''}",
+            },
         )
+
+
+@async_login_required
+async def download_log(request, job_id, key1, key2=None):
+    try:
+        job = await get_job(job_id, request.user)
+        chunks = _iter_log(job, key1, key2)
+        # Read the first chunk before responding, so that missing logs are reported
+        first_chunk = await chunks.__anext__()
+    except StopAsyncIteration:
+        first_chunk = b""
+    except Exception as e:
+        logger.error(
+            "The following error occurred when downloading log %s of job %s: %s",
+            f"{key1} {key2 or ''}",
+            job_id,
+            str(e),
+        )
+        raise Http404("The log does not exist.")
+
+    async def stream():
+        yield first_chunk
+        async for chunk in chunks:
+            yield chunk
+
+    filename = re.sub(r"[^\w.-]+", "_", "_".join(filter(None, [job_id, key1, key2])))
+    response = StreamingHttpResponse(stream(), content_type="text/plain")
+    response["Content-Disposition"] = f'attachment; filename="job_{filename}.log"'
+    return response
+
+
+async def _get_row_status(job):
+    """
+    Get the status to display for a job and the percentage of its sub-jobs in each status.
+    """  # noqa: E501
+    status = job.cached_status
+    statuses = None
+    if status in ["Various", "Various-Complete"]:
+        # Hard code statues for the gizmo showcase
+        if job.label == "gizmo_showcase":
+            if isinstance(job, CondorWorkflow):
+                statuses = {
+                    "Completed": 20,
+                    "Error": 20,
+                    "Running": 40,
+                    "Aborted": 0,
+                }
+            else:
+                statuses = {
+                    "Completed": 40,
+                    "Error": 10,
+                    "Running": 30,
+                    "Aborted": 5,
+                }
+                if status == "Various-Complete":
+                    statuses = {
+                        "Completed": 80,
+                        "Error": 15,
+                        "Running": 0,
+                        "Aborted": 5,
+                    }
+        elif isinstance(job, CondorWorkflow):
+            statuses, num_statuses = await get_job_statuses(job)
+
+            # Handle case with CondorWorkflows where DAG has started working,
+            # but jobs have not necessarily started yet.
+            if isinstance(job, CondorWorkflow) and not num_statuses:
+                status = "Submitted"
+
+    if isinstance(job, DaskJob):
+        # Display results ready as running on jobs table
+        if status == "Results-Ready":
+            status = "Running"
+
+    return status, statuses
+
+
+async def _render_row(job, data):
+    status, statuses = await _get_row_status(job)
+    row = JobsTable.get_row(
+        job, data["column_fields"], data.get("actions"), delay_loading_status=True
+    )
+    context = dict(data)
+    context.update(
+        {
+            "job": job,
+            "row": row,
+            "job_status": status,
+            "job_statuses": statuses,
+            "delay_loading_status": False,
+            "error_message": job.status_message,
+        }
+    )
+    return status, render_to_string("tethys_gizmos/gizmos/job_row.html", context)
+
+
+def _render_row_error(job_id, data):
+    user_friendly_error = (
+        'An unexpected error occurred while updating this row. Press the "Refresh Status" '
+        "button to update the row manually."
+    )
+    return render_to_string(
+        "tethys_gizmos/gizmos/job_row_error.html",
+        {
+            "job_id": job_id,
+            "error_msg": user_friendly_error,
+            "num_cols": len(data.get("column_fields", [1])),
+        },
+    )
+
+
+@async_login_required
+async def update_row(request, job_id):
+    data = reconstruct_post_dict(request)
+    try:
+        job = await get_job(job_id, request.user)
+        await do_job_action(job, "update_status")
+        status, html = await _render_row(job, data)
         success = True
-        html = render_to_string("tethys_gizmos/gizmos/job_row.html", data)
     except Exception as e:
         error_msg = "Updating row for job {} failed: {}".format(job_id, str(e))
         logger.warning(error_msg)
-        user_friendly_error = (
-            'An unexpected error occurred while updating this row. Press the "Refresh Status" '
-            "button to update the row manually."
-        )
         success = False
         status = None
-        html = render_to_string(
-            "tethys_gizmos/gizmos/job_row_error.html",
+        html = _render_row_error(job_id, data)
+
+    return JsonResponse({"success": success, "status": status, "html": html})
+
+
+async def _update_job_status(job, semaphore):
+    async with semaphore:
+        try:
+            # Sync status updates (e.g. condor queries over SSH) run in threads
+            # of their own so that they do not wait for each other
+            await do_job_action(job, "update_status", thread_sensitive=False)
+        except Exception as e:
+            return e
+
+
+@async_login_required
+async def update_rows(request):
+    """
+    Update the status of several jobs at once and render their rows. The statuses are updated concurrently, at most JOBS_TABLE_MAX_CONCURRENT_UPDATES at a time.
+    """  # noqa: E501
+    data = reconstruct_post_dict(request)
+    job_ids = [
+        job_id for job_id in str(data.pop("job_ids", "")).split(",") if job_id.strip()
+    ]
+    rows = {}
+    try:
+        jobs = await get_jobs(job_ids, request.user)
+    except Exception as e:
+        logger.warning(f"Updating rows for jobs {', '.join(job_ids)} failed: {e}")
+        return JsonResponse({"success": False, "rows": rows})
+
+    semaphore = asyncio.Semaphore(
+        max(1, int(getattr(settings, "JOBS_TABLE_MAX_CONCURRENT_UPDATES", 10)))
+    )
+    errors = await asyncio.gather(
+        *(_update_job_status(job, semaphore) for job in jobs.values())
+    )
+    errors = dict(zip(jobs, errors))
+
+    # Rows are rendered one at a time
+    for job_id in job_ids:
+        job = jobs.get(int(job_id)) if job_id.isdigit() else None
+        error = errors.get(job.id) if job is not None else "job not found"
+        if not error:
+            try:
+                status, html = await _render_row(job, data)
+                rows[job_id] = {"success": True, "status": status, "html": html}
+                continue
+            except Exception as e:
+                error = e
+
+        logger.warning(f"Updating row for job {job_id} failed: {error}")
+        rows[job_id] = {
+            "success": False,
+            "status": None,
+            "html": _render_row_error(job_id, data),
+        }
+
+    return JsonResponse({"success": True, "rows": rows})
+
+
+def _render_page(user, data):
+    """
+    List one page of the jobs of a jobs table, ordered and filtered by the database, and render their rows. The statuses of the jobs are loaded afterwards with update_rows.
+    """  # noqa: E501
+    jobs = TethysJob.objects.filter(label=data["label"])
+    if not (user.is_staff or user.has_perm("tethys_compute.jobs_table_actions")):
+        jobs = jobs.filter(user=user)
+    elif data.get("owner"):
+        jobs = jobs.filter(user__username=data["owner"])
+
+    if data.get("status"):
+        jobs = jobs.filter(_status=data["status"])
+    created_after = parse_date(data.get("created_after") or "")
+    if created_after:
+        jobs = jobs.filter(creation_time__date__gte=created_after)
+    created_before = parse_date(data.get("created_before") or "")
+    if created_before:
+        jobs = jobs.filter(creation_time__date__lte=created_before)
+
+    order_by = data.get("order_by") or "creation_time"
+    if JobsTable.get_sort_field(order_by.lstrip("-")) is None:
+        raise ValueError(f'The jobs cannot be sorted by "{order_by}".')
+
+    page_size = max(1, int(data["page_size"]))
+    after = int(data["after"]) if data.get("after") else None
+    page = list(JobManager.get_page(jobs, page_size, order_by, after))
+
+    context = dict(data)
+    context.update(
+        {
+            "jobs": page,
+            "rows": [
+                JobsTable.get_row(
+                    job,
+                    data["column_fields"],
+                    data.get("actions"),
+                    delay_loading_status=True,
+                )
+                for job in page
+            ],
+            "delay_loading_status": True,
+        }
+    )
+    html = render_to_string("tethys_gizmos/gizmos/jobs_table_rows.html", context)
+
+    # There may be more jobs if the page is full
+    next_after = page[-1].id if len(page) == page_size else None
+    return html, next_after
+
+
+@async_login_required
+async def list_rows(request):
+    """
+    Render the rows of one page of the jobs of a jobs table with server-side paging (see the page_size option of the JobsTable gizmo).
+    """  # noqa: E501
+    data = reconstruct_post_dict(request)
+    try:
+        html, next_after = await database_sync_to_async(_render_page)(
+            request.user, data
+        )
+    except Exception as e:
+        logger.warning(f"Listing the jobs of the jobs table failed: {e}")
+        return JsonResponse(
             {
-                "job_id": job_id,
-                "error_msg": user_friendly_error,
-                "num_cols": len(data.get("column_fields", [1])),
-            },
+                "success": False,
+                "error_message": "An unexpected error occurred while loading the jobs.",
+            }
         )
 
-    return JsonResponse({"success": success, "status": status, "html": html})
+    return JsonResponse({"success": True, "html": html, "next": next_after})
 
 
 @async_login_required
@@ -8,11 +8,13 @@ from channels.auth import AuthMiddlewareStack
 from channels.routing import ProtocolTypeRouter, URLRouter
 from django.core.asgi import get_asgi_application
 from django.urls import re_path
+from tethys_compute.tasks import BackgroundTasksMiddleware
 from tethys_portal.optional_dependencies import has_module
 
 
 def build_application(asgi_app):
     from tethys_apps.urls import app_websocket_urls, http_handler_patterns
+    from tethys_portal.urls import websocket_urlpatterns
 
     if has_module("reactpy_django"):
         from reactpy_django import REACTPY_WEBSOCKET_ROUTE
@@ -27,11 +29,13 @@ def build_application(asgi_app):
                 URLRouter(
                     [
                         *http_handler_patterns,
-                        re_path(r"", asgi_app),
+                        re_path(r"", BackgroundTasksMiddleware(asgi_app)),
                     ]
                 )
             ),
-            "websocket": AuthMiddlewareStack(URLRouter(app_websocket_urls)),
+            "websocket": AuthMiddlewareStack(
+                URLRouter([*app_websocket_urls, *websocket_urlpatterns])
+            ),
         }
     )
     return application
@@ -332,6 +332,84 @@ SUPPRESS_QUOTA_WARNINGS = portal_config_settings.pop(
     "SUPPRESS_QUOTA_WARNINGS", ["user_workspace_quota", "app_workspace_quota"]
 )
 
+TETHYS_PATH_USAGE_MAX_AGE = portal_config_settings.pop("TETHYS_PATH_USAGE_MAX_AGE", 300)
+TETHYS_PATH_USAGE_CACHE_ALIAS = portal_config_settings.pop(
+    "TETHYS_PATH_USAGE_CACHE_ALIAS", None
+)
+
+QUOTA_CACHE_TIMEOUT = portal_config_settings.pop("QUOTA_CACHE_TIMEOUT", 30)
+QUOTA_CACHE_ALIAS = portal_config_settings.pop("QUOTA_CACHE_ALIAS", "default")
+QUOTA_STORAGE_USAGE_MAX_AGE = portal_config_settings.pop(
+    "QUOTA_STORAGE_USAGE_MAX_AGE", 300
+)
+QUOTA_STORAGE_USAGE_REFRESH_INTERVAL = portal_config_settings.pop(
+    "QUOTA_STORAGE_USAGE_REFRESH_INTERVAL", 0
+)
+
+APP_SETTINGS_CACHE_TIMEOUT = portal_config_settings.pop(
+    "APP_SETTINGS_CACHE_TIMEOUT", 300
+)
+APP_SETTINGS_CACHE_ALIAS = portal_config_settings.pop("APP_SETTINGS_CACHE_ALIAS", None)
+
+APP_REGISTRY_TIMEOUT = portal_config_settings.pop("APP_REGISTRY_TIMEOUT", 30)
+APP_REGISTRY_CACHE_ALIAS = portal_config_settings.pop("APP_REGISTRY_CACHE_ALIAS", None)
+
+APP_MANIFEST_CACHE = portal_config_settings.pop("APP_MANIFEST_CACHE", False)
+APP_MANIFEST_PATH = portal_config_settings.pop("APP_MANIFEST_PATH", None)
+APP_LAZY_CONTROLLERS = portal_config_settings.pop("APP_LAZY_CONTROLLERS", False)
+APP_WARMUP = portal_config_settings.pop("APP_WARMUP", [])
+APP_WARMUP_DELAY = portal_config_settings.pop("APP_WARMUP_DELAY", 0)
+
+TETHYS_PROFILE_STARTUP = portal_config_settings.pop("TETHYS_PROFILE_STARTUP", False)
+TETHYS_PROFILE_STARTUP_PATH = portal_config_settings.pop(
+    "TETHYS_PROFILE_STARTUP_PATH", None
+)
+
+JOBS_TABLE_MAX_CONCURRENT_UPDATES = portal_config_settings.pop(
+    "JOBS_TABLE_MAX_CONCURRENT_UPDATES", 10
+)
+JOB_STATUS_POLL_INTERVAL = portal_config_settings.pop("JOB_STATUS_POLL_INTERVAL", 0)
+JOB_STATUS_POLL_BATCH_SIZE = portal_config_settings.pop(
+    "JOB_STATUS_POLL_BATCH_SIZE", 100
+)
+JOB_STATUS_POLL_CONCURRENCY = portal_config_settings.pop(
+    "JOB_STATUS_POLL_CONCURRENCY", 4
+)
+CONDOR_SSH_POOL_MAX_SESSIONS = portal_config_settings.pop(
+    "CONDOR_SSH_POOL_MAX_SESSIONS", 8
+)
+CONDOR_SSH_POOL_IDLE_TIMEOUT = portal_config_settings.pop(
+    "CONDOR_SSH_POOL_IDLE_TIMEOUT", 300
+)
+CONDOR_SSH_POOL_HEALTH_CHECK_INTERVAL = portal_config_settings.pop(
+    "CONDOR_SSH_POOL_HEALTH_CHECK_INTERVAL", 60
+)
+CONDOR_SSH_POOL_SESSION_TIMEOUT = portal_config_settings.pop(
+    "CONDOR_SSH_POOL_SESSION_TIMEOUT", 60
+)
+DASK_RESULT_STORAGE_PATH = portal_config_settings.pop("DASK_RESULT_STORAGE_PATH", "")
+DASK_RESULT_INLINE_MAX_SIZE = portal_config_settings.pop(
+    "DASK_RESULT_INLINE_MAX_SIZE", 65536
+)
+JOB_LOG_CHUNK_SIZE = portal_config_settings.pop("JOB_LOG_CHUNK_SIZE", 65536)
+JOB_LOG_FOLLOW_INTERVAL = portal_config_settings.pop("JOB_LOG_FOLLOW_INTERVAL", 2)
+JOB_STATUS_PUSH_INTERVAL = portal_config_settings.pop("JOB_STATUS_PUSH_INTERVAL", 1)
+JOB_POOL_MAX_WORKERS = portal_config_settings.pop("JOB_POOL_MAX_WORKERS", None)
+JOB_POOL_APP_MAX_WORKERS = portal_config_settings.pop("JOB_POOL_APP_MAX_WORKERS", {})
+JOB_PROCESS_POOL_START_METHOD = portal_config_settings.pop(
+    "JOB_PROCESS_POOL_START_METHOD", "spawn"
+)
+JOB_PROCESS_POOL_SETUP_DJANGO = portal_config_settings.pop(
+    "JOB_PROCESS_POOL_SETUP_DJANGO", True
+)
+JOB_SUBMIT_MAX_WORKERS = portal_config_settings.pop("JOB_SUBMIT_MAX_WORKERS", 4)
+JOB_RETENTION_DAYS = portal_config_settings.pop("JOB_RETENTION_DAYS", None)
+JOB_RETENTION_APP_DAYS = portal_config_settings.pop("JOB_RETENTION_APP_DAYS", {})
+JOB_PURGE_BATCH_SIZE = portal_config_settings.pop("JOB_PURGE_BATCH_SIZE", 1000)
+JOB_ARCHIVE_PATH = portal_config_settings.pop(
+    "JOB_ARCHIVE_PATH", relative_to_tethys_home("job_archives", as_str=True)
+)
+
 CHANNEL_LAYERS = {"default": {"BACKEND": "channels.layers.InMemoryChannelLayer"}}
 
 REST_FRAMEWORK = {
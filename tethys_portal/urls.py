@@ -23,7 +23,10 @@ from django.contrib.auth.views import (
     PasswordResetCompleteView,
 )
 
+from channels.routing import URLRouter
+
 from tethys_apps.urls import extension_urls
+from tethys_gizmos.urls import websocket_urlpatterns as gizmos_websocket_urls
 
 from tethys_portal.views import (
     accounts as tethys_portal_accounts,
@@ -300,6 +303,11 @@ handler403 = tethys_portal_error.handler_403
 handler404 = tethys_portal_error.handler_404
 handler500 = tethys_portal_error.handler_500
 
+# WebSocket URLs of the portal, which are routed by tethys_portal.asgi
+websocket_urlpatterns = [
+    re_path(r"^developer/gizmos/", URLRouter(gizmos_websocket_urls)),
+]
+
 if prefix_url is not None and prefix_url != "/":
     urlpatterns = [
         re_path(r"^$", lambda request: redirect(f"{prefix_url}/", permanent=True)),
@@ -308,6 +316,9 @@ if prefix_url is not None and prefix_url != "/":
             include((urlpatterns)),
         ),
     ]
+    websocket_urlpatterns = [
+        re_path(rf"^{prefix_url}/", URLRouter(websocket_urlpatterns)),
+    ]
 
 if (
     login_url_setting is not None
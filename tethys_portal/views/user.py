@@ -20,7 +20,9 @@ from tethys_apps.models import TethysApp
 from tethys_apps.base.paths import get_user_workspace, get_user_media
 from tethys_apps.utilities import get_app_class
 from tethys_apps.decorators import login_required
+from tethys_quotas.cache import quota_cache
 from tethys_quotas.handlers.workspace import WorkspaceQuotaHandler
+from tethys_quotas.storage import recompute_storage_usage
 from tethys_quotas.utilities import get_quota, _convert_storage_units
 from tethys_config.models import get_custom_template
 
@@ -198,6 +200,7 @@ def clear_workspace(request, root_url):
 
     # Handle form submission
     if request.method == "POST" and "clear-workspace-submit" in request.POST:
+        tethys_app = app
         app = get_app_class(app)
 
         user = request.user
@@ -212,6 +215,10 @@ def clear_workspace(request, root_url):
         media.clear()
         app.post_delete_user_media(user)
 
+        # The hooks of the app may also have changed the directories
+        recompute_storage_usage(users=[user], apps=[tethys_app], include_apps=False)
+        quota_cache.invalidate_owner(tethys_app.package, user.username)
+
         # Give feedback
         messages.success(
             request,
@@ -235,13 +242,17 @@ def manage_storage(request):
     apps = SingletonHarvester().apps
     user = request.user
 
+    rqh = WorkspaceQuotaHandler(user)
+    breakdown = rqh.get_storage_breakdown()
+
     for app in apps:
-        workspace = get_user_workspace(app, user)
-        app.current_use = _convert_storage_units("gb", workspace.get_size("gb"))
+        usage = breakdown.get(app.package, {"workspace": 0, "media": 0})
+        app.current_use = _convert_storage_units(
+            "gb", (usage["workspace"] + usage["media"]) / 1024**3
+        )
 
     codename = "user_workspace_quota"
-    rqh = WorkspaceQuotaHandler(user)
-    current_use = _convert_storage_units(rqh.units, rqh.get_current_use())
+    current_use = _convert_storage_units(rqh.units, rqh.get_current_use(breakdown))
     quota = get_quota(user, codename)
     quota = _check_quota_helper(quota)
 
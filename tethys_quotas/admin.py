@@ -13,7 +13,12 @@ from django.utils.html import format_html
 from django.contrib import admin
 from django.contrib.auth.models import User
 from tethys_apps.models import TethysApp
-from tethys_quotas.models import ResourceQuota, UserQuota, TethysAppQuota
+from tethys_quotas.models import (
+    ResourceQuota,
+    StorageUsage,
+    UserQuota,
+    TethysAppQuota,
+)
 
 
 @admin.register(ResourceQuota)
@@ -38,6 +43,27 @@ class ResourceQuotaAdmin(admin.ModelAdmin):
         return False
 
 
+@admin.register(StorageUsage)
+class StorageUsageAdmin(admin.ModelAdmin):
+    list_display = (
+        "app",
+        "user",
+        "workspace_bytes",
+        "media_bytes",
+        "file_count",
+        "last_scanned",
+    )
+    list_filter = ("app",)
+    search_fields = ("user__username", "app__package")
+    readonly_fields = list_display
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
 class TethysQuotasSettingInline(admin.TabularInline):
     template = "tethys_quotas/admin/edit_inline/tabular.html"
 
@@ -9,7 +9,11 @@
 
 import logging
 from django.apps import AppConfig
+from django.conf import settings
+from django.core.signals import request_started, request_finished
 from django.db.utils import ProgrammingError, OperationalError
+from tethys_compute.tasks import register_background_task
+from tethys_quotas.cache import quota_cache
 from tethys_quotas.utilities import sync_resource_quota_handlers
 
 log = logging.getLogger("tethys." + __name__)
@@ -20,6 +24,23 @@ class TethysQuotasConfig(AppConfig):
     verbose_name = "Tethys Quotas"
 
     def ready(self):
+        # Memoize quota decisions for the duration of each request
+        request_started.connect(
+            quota_cache.start_request, dispatch_uid="tethys_quotas_request_started"
+        )
+        request_finished.connect(
+            quota_cache.end_request, dispatch_uid="tethys_quotas_request_finished"
+        )
+
+        # Periodically recompute the materialized storage usage
+        interval = getattr(settings, "QUOTA_STORAGE_USAGE_REFRESH_INTERVAL", 0)
+        if interval:
+            from tethys_quotas.storage import refresh_storage_usage
+
+            register_background_task(
+                refresh_storage_usage, delay=interval, periodic=True
+            )
+
         try:
             sync_resource_quota_handlers()
         except (ProgrammingError, OperationalError) as e:
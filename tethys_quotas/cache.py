@@ -0,0 +1,226 @@
+"""
+********************************************************************************
+* Name: cache.py
+* Author: Tethys Platform Developers
+* Created On: October 2026
+* Copyright: (c) Tethys Geospatial Foundation 2026
+* License: BSD 2-Clause
+********************************************************************************
+"""
+
+import logging
+import threading
+import uuid
+
+from asgiref.local import Local
+from django.conf import settings
+from django.core.cache import caches
+
+log = logging.getLogger("tethys." + __name__)
+
+MISSING = object()
+GENERATION_KEY = "tethys_quotas:generation"
+
+
+def _entity_key(entity):
+    """
+    Get a hashable key for a quota entity or None if the entity cannot be cached (e.g. unsaved or anonymous users).
+    """  # noqa: E501
+    from django.contrib.auth.models import User
+    from tethys_apps.models import TethysApp
+
+    if isinstance(entity, User):
+        return f"user.{entity.pk}" if entity.pk is not None else None
+    if isinstance(entity, TethysApp):
+        return f"app.{entity.pk}" if entity.pk is not None else None
+
+    # TethysAppBase classes and instances
+    package = getattr(entity, "package", None)
+    if isinstance(package, str) and package:
+        return f"appclass.{package}"
+
+    return None
+
+
+def _owner_key(package=None, username=None):
+    """
+    Get the key of the generation of the owner of the storage that decisions depend on: a user (by username) or an app (by package).
+    """  # noqa: E501
+    owner = f"user.{username}" if username is not None else f"app.{package}"
+    return f"{GENERATION_KEY}:{owner}"
+
+
+def _entity_owner_key(entity):
+    from django.contrib.auth.models import User
+
+    if isinstance(entity, User):
+        return _owner_key(username=entity.username)
+    return _owner_key(package=entity.package)
+
+
+class QuotaDecisionCache:
+    """
+    Two-level cache for quota decisions keyed by (kind, entity, codename).
+
+    Decisions are memoized for the duration of a request (see ``start_request`` and ``end_request``) and stored in the Django cache identified by the ``QUOTA_CACHE_ALIAS`` setting for ``QUOTA_CACHE_TIMEOUT`` seconds. Invalidating the cache rotates a generation token stored in the same backend, so all processes sharing the backend drop their cached decisions at once.
+    """  # noqa: E501
+
+    def __init__(self):
+        self._local = Local()
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    @property
+    def timeout(self):
+        return getattr(settings, "QUOTA_CACHE_TIMEOUT", 30)
+
+    @property
+    def backend(self):
+        return caches[getattr(settings, "QUOTA_CACHE_ALIAS", "default")]
+
+    def _count(self, counter):
+        with self._lock:
+            self._stats[counter] += 1
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats = {"request_hits": 0, "cache_hits": 0, "misses": 0}
+
+    def stats(self):
+        """
+        Get the hit and miss counters of the cache for this process.
+
+        Returns:
+            dict: request_hits, cache_hits, misses and hit_rate (0.0 - 1.0).
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats["request_hits"] + stats["cache_hits"] + stats["misses"]
+        hits = stats["request_hits"] + stats["cache_hits"]
+        stats["hit_rate"] = hits / lookups if lookups else 0.0
+        return stats
+
+    def start_request(self, *args, **kwargs):
+        """
+        Start a request scope. Receiver for the request_started signal.
+        """
+        self._local.decisions = {}
+
+    def end_request(self, *args, **kwargs):
+        """
+        End a request scope. Receiver for the request_finished signal.
+        """
+        self._local.decisions = None
+
+    def _memo(self):
+        return getattr(self._local, "decisions", None)
+
+    def get(self, kind, entity, codename):
+        """
+        Get a cached decision.
+
+        Args:
+            kind (str): the type of decision (e.g. "passes_quota").
+            entity (User, TethysApp or TethysAppBase): the entity the decision applies to.
+            codename (str): codename of the ResourceQuota.
+
+        Returns:
+            The cached value or MISSING.
+        """  # noqa: E501
+        entity_key = _entity_key(entity)
+        if entity_key is None:
+            return MISSING
+
+        key = f"tethys_quotas:{kind}:{entity_key}:{codename}"
+        memo = self._memo()
+        if memo is not None and key in memo:
+            self._count("request_hits")
+            return memo[key]
+
+        if self.timeout:
+            generation_keys = [GENERATION_KEY, _entity_owner_key(entity)]
+            try:
+                values = self.backend.get_many([*generation_keys, key])
+            except Exception as e:
+                log.debug(f"Unable to read quota decision cache: {e}")
+                values = {}
+
+            if key in values:
+                generation, value = values[key]
+                if generation == tuple(values.get(k) for k in generation_keys):
+                    self._count("cache_hits")
+                    if memo is not None:
+                        memo[key] = value
+                    return value
+
+        self._count("misses")
+        return MISSING
+
+    def set(self, kind, entity, codename, value):
+        """
+        Cache a decision.
+
+        Args:
+            kind (str): the type of decision (e.g. "passes_quota").
+            entity (User, TethysApp or TethysAppBase): the entity the decision applies to.
+            codename (str): codename of the ResourceQuota.
+            value: the decision to cache.
+        """  # noqa: E501
+        entity_key = _entity_key(entity)
+        if entity_key is None:
+            return
+
+        key = f"tethys_quotas:{kind}:{entity_key}:{codename}"
+        memo = self._memo()
+        if memo is not None:
+            memo[key] = value
+
+        if self.timeout:
+            try:
+                backend = self.backend
+                generation_keys = [GENERATION_KEY, _entity_owner_key(entity)]
+                generations = backend.get_many(generation_keys)
+                if len(generations) < len(generation_keys):
+                    for generation_key in generation_keys:
+                        if generation_key not in generations:
+                            backend.add(generation_key, uuid.uuid4().hex, timeout=None)
+                    generations = backend.get_many(generation_keys)
+                generation = tuple(generations.get(k) for k in generation_keys)
+                backend.set(key, (generation, value), timeout=self.timeout)
+            except Exception as e:
+                log.debug(f"Unable to write quota decision cache: {e}")
+
+    def invalidate(self, *args, **kwargs):
+        """
+        Drop all cached decisions. Receiver for the save and delete signals of the quota models.
+        """  # noqa: E501
+        memo = self._memo()
+        if memo is not None:
+            memo.clear()
+
+        try:
+            self.backend.set(GENERATION_KEY, uuid.uuid4().hex, timeout=None)
+        except Exception as e:
+            log.warning(f"Unable to invalidate quota decision cache: {e}")
+
+    def invalidate_owner(self, package, username=None):
+        """
+        Drop the cached decisions of a user or an app, e.g. when files are removed from its workspace or media directories.
+
+        Args:
+            package (str): package of the app whose directories changed.
+            username (str): username of the user whose directories changed. Invalidates the app itself if None.
+        """  # noqa: E501
+        memo = self._memo()
+        if memo is not None:
+            memo.clear()
+
+        try:
+            self.backend.set(
+                _owner_key(package, username), uuid.uuid4().hex, timeout=None
+            )
+        except Exception as e:
+            log.warning(f"Unable to invalidate quota decision cache: {e}")
+
+
+quota_cache = QuotaDecisionCache()
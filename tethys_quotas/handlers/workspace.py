@@ -10,13 +10,20 @@
 from django.contrib.auth.models import User
 from tethys_apps.models import TethysApp
 from tethys_apps.base.paths import (
-    _get_user_workspace,
-    _get_app_workspace,
-    _get_user_media,
-    _get_app_media,
+    _get_user_workspace_path,
+    _get_app_workspace_path,
+    _get_user_media_path,
+    _get_app_media_path,
 )
+from tethys_apps.base.usage_index import usage_index
 from tethys_apps.harvester import SingletonHarvester
 from tethys_quotas.handlers.base import ResourceQuotaHandler
+from tethys_quotas.storage import (
+    get_scan_time,
+    get_storage_usage,
+    update_storage_usage,
+)
+from tethys_quotas.utilities import _get_storage_units
 
 
 class WorkspaceQuotaHandler(ResourceQuotaHandler):
@@ -34,39 +41,86 @@ class WorkspaceQuotaHandler(ResourceQuotaHandler):
     help = "You have exceeded your quota on storage. Please visit the storage management pages and clean workspaces."
     applies_to = ["django.contrib.auth.models.User", "tethys_apps.models.TethysApp"]
 
-    def get_current_use(self):
+    def get_storage_breakdown(self, max_workers=None, max_age=None):
         """
-        calculates/retrieves the current use of the resource
+        Gets the size of the workspace and media directories of the entity for each app. The materialized storage usage (see ``StorageUsage``) is used if it is not older than ``max_age``. Otherwise all directories are sized concurrently, without creating directories that do not exist yet, and the result is materialized.
+
+        Args:
+            max_workers (int): Maximum number of threads used to scan directories.
+            max_age (int): Maximum age in seconds of the materialized usage. Defaults to the ``QUOTA_STORAGE_USAGE_MAX_AGE`` setting.
 
         Returns:
-            Int: current use of resource
+            dict: Dictionary keyed by app package with the size in bytes of the "workspace" and "media" directories and the number of "files" of the entity for that app.
+        """  # noqa: E501
+        breakdown = get_storage_usage(self.entity, max_age=max_age)
+        if breakdown is None:
+            breakdown, scanned = self._scan_storage_breakdown(max_workers=max_workers)
+            update_storage_usage(self.entity, breakdown, scanned=scanned)
+        return breakdown
+
+    def _scan_storage_breakdown(self, max_workers=None):
         """
-        current_use = 0.0
+        Sizes the workspace and media directories of the entity for each installed app.
 
-        if isinstance(self.entity, User):
-            harvester = SingletonHarvester()
-            installed_apps = harvester.apps
+        Returns:
+            tuple(dict, datetime): the storage breakdown and the time of the oldest scan of the directories (see ``get_scan_time``).
+        """  # noqa: E501
+        installed_apps = SingletonHarvester().apps
+        paths = {}
 
+        if isinstance(self.entity, User):
+            username = self.entity.username
             for app in installed_apps:
-                workspace = _get_user_workspace(app, self.entity, bypass_quota=True)
-                media = _get_user_media(app, self.entity, bypass_quota=True)
-                current_use += float(workspace.get_size(self.units)) + float(
-                    media.get_size(self.units)
+                paths[app.package] = (
+                    _get_user_workspace_path(app, username),
+                    _get_user_media_path(app, username),
                 )
 
         elif isinstance(self.entity, TethysApp):
-            harvester = SingletonHarvester()
-            installed_apps = harvester.apps
-
             tethys_app = next(
                 (x for x in installed_apps if x.name == self.entity.name), None
             )
 
             if tethys_app is not None:
-                workspace = _get_app_workspace(tethys_app, bypass_quota=True)
-                media = _get_app_media(tethys_app, bypass_quota=True)
-                current_use = float(workspace.get_size(self.units)) + float(
-                    media.get_size(self.units)
+                paths[tethys_app.package] = (
+                    _get_app_workspace_path(tethys_app),
+                    _get_app_media_path(tethys_app),
                 )
 
-        return current_use
+        entries = usage_index.get_many(
+            [path for app_paths in paths.values() for path in app_paths],
+            max_workers=max_workers,
+        )
+
+        breakdown = {
+            package: {
+                "workspace": entries[workspace]["size"],
+                "media": entries[media]["size"],
+                "files": entries[workspace]["files"] + entries[media]["files"],
+            }
+            for package, (workspace, media) in paths.items()
+        }
+        return breakdown, get_scan_time(entries.values())
+
+    def get_current_use(self, breakdown=None):
+        """
+        calculates/retrieves the current use of the resource
+
+        Args:
+            breakdown (dict): A storage breakdown previously returned by get_storage_breakdown(). Computed if not given.
+
+        Returns:
+            Int: current use of resource
+        """  # noqa: E501
+        if breakdown is None:
+            breakdown = self.get_storage_breakdown()
+
+        total_size = sum(
+            usage["workspace"] + usage["media"] for usage in breakdown.values()
+        )
+
+        conversion_factor = [
+            item[0] for item in _get_storage_units() if self.units.upper() in item[1]
+        ][0]
+
+        return float(total_size / conversion_factor)
@@ -0,0 +1,71 @@
+# Generated by Django 4.2.30 on 2026-10-18 02:44
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tethys_apps", "0007_tethysapp_back_url"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("tethys_quotas", "0001_initial_40"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StorageUsage",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("workspace_bytes", models.BigIntegerField(default=0)),
+                ("media_bytes", models.BigIntegerField(default=0)),
+                ("file_count", models.BigIntegerField(default=0)),
+                ("last_scanned", models.DateTimeField()),
+                (
+                    "app",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="storage_usage",
+                        to="tethys_apps.tethysapp",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="storage_usage",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Storage Usage",
+                "verbose_name_plural": "Storage Usage",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="storageusage",
+            constraint=models.UniqueConstraint(
+                fields=("user", "app"), name="tethys_quotas_storage_usage_user_app"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="storageusage",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("user__isnull", True)),
+                fields=("app",),
+                name="tethys_quotas_storage_usage_app",
+            ),
+        ),
+    ]
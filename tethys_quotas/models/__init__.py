@@ -12,3 +12,4 @@ from tethys_quotas.models.resource_quota import ResourceQuota  # noqa: F401
 from tethys_quotas.models.entity_quota import EntityQuota  # noqa: F401
 from tethys_quotas.models.user_quota import UserQuota  # noqa: F401
 from tethys_quotas.models.tethys_app_quota import TethysAppQuota  # noqa: F401
+from tethys_quotas.models.storage_usage import StorageUsage  # noqa: F401
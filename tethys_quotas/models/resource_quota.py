@@ -11,9 +11,11 @@ import logging
 import inspect
 from django.contrib.auth.models import User
 from django.db import models
+from django.dispatch import receiver
 from tethys_apps.base.function_extractor import TethysFunctionExtractor
 from tethys_apps.models import TethysApp
 from tethys_quotas.handlers.base import ResourceQuotaHandler
+from tethys_quotas.cache import quota_cache
 
 
 log = logging.getLogger("tethys." + __name__)
@@ -109,3 +111,12 @@ class ResourceQuota(models.Model):
 
     def __str__(self):
         return self.name
+
+
+@receiver(models.signals.post_save, sender=ResourceQuota)
+@receiver(models.signals.post_delete, sender=ResourceQuota)
+def resource_quota_changed(sender, instance, **kwargs):
+    """
+    Invalidate cached quota decisions when a ResourceQuota is saved or deleted.
+    """
+    quota_cache.invalidate()
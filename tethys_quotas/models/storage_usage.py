@@ -0,0 +1,69 @@
+"""
+********************************************************************************
+* Name: storage_usage.py
+* Author: Tethys Platform Developers
+* Created On: October 2026
+* Copyright: (c) Tethys Geospatial Foundation 2026
+* License: BSD 2-Clause
+********************************************************************************
+"""
+
+import logging
+
+from django.contrib.auth.models import User
+from django.db import models
+
+from tethys_apps.models import TethysApp
+
+
+log = logging.getLogger("tethys." + __name__)
+
+
+class StorageUsage(models.Model):
+    """
+    Materialized storage usage of an entity (User or TethysApp) for an app. Rows with no user hold the usage of the app workspace and app media directories.
+
+    user (ForeignKey): the user the usage belongs to or None for the app itself.
+    app (ForeignKey): the app the usage belongs to.
+    workspace_bytes (BigIntegerField): size of the workspace directory in bytes.
+    media_bytes (BigIntegerField): size of the media directory in bytes.
+    file_count (BigIntegerField): number of files in the workspace and media directories.
+    last_scanned (DateTimeField): when the directories were last scanned.
+    """  # noqa: E501
+
+    class Meta:
+        verbose_name = "Storage Usage"
+        verbose_name_plural = "Storage Usage"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "app"], name="tethys_quotas_storage_usage_user_app"
+            ),
+            models.UniqueConstraint(
+                fields=["app"],
+                condition=models.Q(user__isnull=True),
+                name="tethys_quotas_storage_usage_app",
+            ),
+        ]
+
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="storage_usage",
+    )
+    app = models.ForeignKey(
+        TethysApp, on_delete=models.CASCADE, related_name="storage_usage"
+    )
+    workspace_bytes = models.BigIntegerField(default=0)
+    media_bytes = models.BigIntegerField(default=0)
+    file_count = models.BigIntegerField(default=0)
+    last_scanned = models.DateTimeField()
+
+    def __str__(self):
+        entity = self.user.username if self.user_id else "app"
+        return f"{self.app.package}: {entity}"
+
+    @property
+    def total_bytes(self):
+        return self.workspace_bytes + self.media_bytes
@@ -10,8 +10,10 @@
 import logging
 
 from django.db import models
+from django.dispatch import receiver
 from tethys_quotas.models.entity_quota import EntityQuota
 from tethys_apps.models import TethysApp
+from tethys_quotas.cache import quota_cache
 
 
 log = logging.getLogger("tethys." + __name__)
@@ -26,3 +28,12 @@ class TethysAppQuota(EntityQuota):
         verbose_name = "Tethys App Quota"
 
     entity = models.ForeignKey(TethysApp, on_delete=models.CASCADE)
+
+
+@receiver(models.signals.post_save, sender=TethysAppQuota)
+@receiver(models.signals.post_delete, sender=TethysAppQuota)
+def tethys_app_quota_changed(sender, instance, **kwargs):
+    """
+    Invalidate cached quota decisions when a TethysAppQuota is saved or deleted.
+    """
+    quota_cache.invalidate()
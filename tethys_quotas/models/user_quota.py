@@ -10,8 +10,10 @@
 import logging
 
 from django.db import models
+from django.dispatch import receiver
 from django.contrib.auth.models import User
 from tethys_quotas.models.entity_quota import EntityQuota
+from tethys_quotas.cache import quota_cache
 
 
 log = logging.getLogger("tethys." + __name__)
@@ -26,3 +28,12 @@ class UserQuota(EntityQuota):
         verbose_name = "User Quota"
 
     entity = models.ForeignKey(User, on_delete=models.CASCADE)
+
+
+@receiver(models.signals.post_save, sender=UserQuota)
+@receiver(models.signals.post_delete, sender=UserQuota)
+def user_quota_changed(sender, instance, **kwargs):
+    """
+    Invalidate cached quota decisions when a UserQuota is saved or deleted.
+    """
+    quota_cache.invalidate()
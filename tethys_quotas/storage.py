@@ -0,0 +1,399 @@
+"""
+********************************************************************************
+* Name: storage.py
+* Author: Tethys Platform Developers
+* Created On: October 2026
+* Copyright: (c) Tethys Geospatial Foundation 2026
+* License: BSD 2-Clause
+********************************************************************************
+"""
+
+import logging
+import os
+from datetime import datetime, timedelta, timezone as dt_timezone
+from pathlib import Path
+
+from channels.db import database_sync_to_async
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import F, Q, Value
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from tethys_apps.base.paths import (
+    _get_app_workspace_root,
+    _get_app_workspace_path,
+    _get_app_media_root,
+    _get_app_media_path,
+    _get_user_workspace_path,
+    _get_user_media_path,
+)
+from tethys_apps.base.usage_index import usage_index
+from tethys_apps.models import TethysApp
+from tethys_quotas.cache import quota_cache
+from tethys_quotas.models import StorageUsage
+
+log = logging.getLogger("tethys." + __name__)
+
+USAGE_FIELDS = ["workspace_bytes", "media_bytes", "file_count", "last_scanned"]
+
+
+def _get_max_age():
+    return getattr(settings, "QUOTA_STORAGE_USAGE_MAX_AGE", 300)
+
+
+def _list_directories(path):
+    """
+    List the subdirectories of the given directory by name without following symbolic links.
+    """
+    try:
+        with os.scandir(path) as entries:
+            return {
+                entry.name: Path(entry.path)
+                for entry in entries
+                if entry.is_dir(follow_symlinks=False)
+            }
+    except OSError:
+        return {}
+
+
+def _scan(targets, max_workers=None, max_age=None):
+    """
+    Size the workspace and media directories of the given targets concurrently.
+
+    Args:
+        targets (dict): (workspace path, media path) keyed by (app, user).
+        max_workers (int): Maximum number of threads used to scan directories.
+        max_age (int): Maximum age in seconds of indexed directory sizes. Use 0 to rescan every directory.
+
+    Returns:
+        dict: (workspace_bytes, media_bytes, file_count, last_scanned) keyed by (app, user).
+    """  # noqa: E501
+    entries = usage_index.get_many(
+        [path for paths in targets.values() for path in paths],
+        max_workers=max_workers,
+        max_age=max_age,
+    )
+
+    usage = {}
+    for key, (workspace, media) in targets.items():
+        workspace_entry, media_entry = entries[workspace], entries[media]
+        usage[key] = (
+            workspace_entry["size"],
+            media_entry["size"],
+            workspace_entry["files"] + media_entry["files"],
+            get_scan_time([workspace_entry, media_entry]),
+        )
+    return usage
+
+
+def get_scan_time(entries):
+    """
+    Get the time of the oldest full scan of the given disk usage index entries, so that materialized usage is not considered fresher than the index it was read from.
+
+    Args:
+        entries (iterable of dict): disk usage index entries (see ``DiskUsageIndex.get``).
+
+    Returns:
+        datetime: the time of the oldest scan or None if none of the directories were scanned (e.g. they do not exist).
+    """  # noqa: E501
+    scanned = [entry["scanned"] for entry in entries if entry["scanned"] is not None]
+    if not scanned:
+        return None
+    return datetime.fromtimestamp(min(scanned), tz=dt_timezone.utc)
+
+
+def _save_storage_usage(existing, usage):
+    """
+    Insert or update StorageUsage rows in a single transaction. Existing rows that are not part of the usage are reset to 0.
+
+    Args:
+        existing (QuerySet): the StorageUsage rows in the scope of the scan.
+        usage (dict): (workspace_bytes, media_bytes, file_count, last_scanned) keyed by (app, user). A last_scanned of None means now.
+
+    Returns:
+        int: number of rows written.
+    """  # noqa: E501
+    now = timezone.now()
+    to_create = []
+    to_update = []
+
+    with transaction.atomic():
+        rows = {(row.app_id, row.user_id): row for row in existing.select_for_update()}
+
+        for (app, user), values in usage.items():
+            workspace_bytes, media_bytes, file_count, last_scanned = values
+            row = rows.pop((app.pk, user.pk if user else None), None)
+            if row is None:
+                row = StorageUsage(app=app, user=user)
+                to_create.append(row)
+            else:
+                to_update.append(row)
+
+            row.workspace_bytes = workspace_bytes
+            row.media_bytes = media_bytes
+            row.file_count = file_count
+            row.last_scanned = last_scanned or now
+
+        # The directories of these rows no longer exist
+        for row in rows.values():
+            row.workspace_bytes = row.media_bytes = row.file_count = 0
+            row.last_scanned = now
+            to_update.append(row)
+
+        StorageUsage.objects.bulk_update(to_update, USAGE_FIELDS, batch_size=500)
+        if to_create:
+            # Rows that did not exist cannot be locked, so another process may have created them since
+            StorageUsage.objects.bulk_create(
+                to_create, batch_size=500, ignore_conflicts=True
+            )
+            _update_conflicting_rows(to_create)
+
+    return len(to_create) + len(to_update)
+
+
+def _update_conflicting_rows(created):
+    """
+    Update the rows that were created by another process instead of the given rows, which were not inserted.
+    """  # noqa: E501
+    created = {(row.app_id, row.user_id): row for row in created}
+    app_ids = {app_id for app_id, _ in created}
+    user_ids = {user_id for _, user_id in created if user_id is not None}
+
+    conflicts = []
+    rows = StorageUsage.objects.select_for_update().filter(
+        Q(user__isnull=True) | Q(user__in=user_ids), app__in=app_ids
+    )
+    for row in rows:
+        new_row = created.get((row.app_id, row.user_id))
+        if new_row is None or all(
+            getattr(row, field) == getattr(new_row, field) for field in USAGE_FIELDS
+        ):
+            continue
+        for field in USAGE_FIELDS:
+            setattr(row, field, getattr(new_row, field))
+        conflicts.append(row)
+
+    StorageUsage.objects.bulk_update(conflicts, USAGE_FIELDS, batch_size=500)
+
+
+def get_storage_usage(entity, max_age=None):
+    """
+    Get the materialized storage usage of an entity if it is fresh.
+
+    Args:
+        entity (User or TethysApp): the entity to get the storage usage of.
+        max_age (int): Maximum age in seconds of the usage. Defaults to the ``QUOTA_STORAGE_USAGE_MAX_AGE`` setting. Use 0 to ignore the materialized usage.
+
+    Returns:
+        dict: Storage breakdown keyed by app package (see ``WorkspaceQuotaHandler.get_storage_breakdown``) or None if the usage is missing or older than max_age.
+    """  # noqa: E501
+    max_age = _get_max_age() if max_age is None else max_age
+    if not max_age or entity.pk is None:
+        return None
+
+    if isinstance(entity, User):
+        rows = StorageUsage.objects.filter(user=entity)
+    elif isinstance(entity, TethysApp):
+        rows = StorageUsage.objects.filter(user__isnull=True, app=entity)
+    else:
+        return None
+
+    rows = list(rows.select_related("app"))
+    if not rows:
+        return None
+
+    if min(row.last_scanned for row in rows) < timezone.now() - timedelta(
+        seconds=max_age
+    ):
+        return None
+
+    return {
+        row.app.package: {
+            "workspace": row.workspace_bytes,
+            "media": row.media_bytes,
+            "files": row.file_count,
+        }
+        for row in rows
+    }
+
+
+def update_storage_usage(entity, breakdown, scanned=None):
+    """
+    Materialize a freshly computed storage breakdown of an entity.
+
+    Args:
+        entity (User or TethysApp): the entity the breakdown belongs to.
+        breakdown (dict): Storage breakdown keyed by app package (see ``WorkspaceQuotaHandler.get_storage_breakdown``).
+        scanned (datetime): when the directories of the breakdown were scanned (see ``get_scan_time``). Defaults to now.
+    """  # noqa: E501
+    if entity.pk is None:
+        return
+
+    if isinstance(entity, User):
+        user = entity
+        existing = StorageUsage.objects.filter(user=entity)
+        apps = TethysApp.objects.filter(package__in=list(breakdown))
+    elif isinstance(entity, TethysApp):
+        user = None
+        existing = StorageUsage.objects.filter(user__isnull=True, app=entity)
+        apps = [entity] if entity.package in breakdown else []
+    else:
+        return
+
+    usage = {
+        (app, user): (
+            breakdown[app.package]["workspace"],
+            breakdown[app.package]["media"],
+            breakdown[app.package].get("files", 0),
+            scanned,
+        )
+        for app in apps
+    }
+
+    try:
+        _save_storage_usage(existing, usage)
+    except Exception as e:
+        log.warning(f"Unable to update the storage usage of {entity}: {e}")
+
+
+def _get_path_owner(path):
+    """
+    Get the app package and username (None for the app itself) that a path under the ``TETHYS_WORKSPACES_ROOT`` or ``MEDIA_ROOT`` directories belongs to, and the StorageUsage field that holds its size.
+
+    Returns:
+        tuple(str, str, str): package, username and field or None if the path does not belong to a workspace or media directory.
+    """  # noqa: E501
+    layouts = (
+        (
+            "TETHYS_WORKSPACES_ROOT",
+            "workspace_bytes",
+            "app_workspace",
+            "user_workspaces",
+        ),
+        ("MEDIA_ROOT", "media_bytes", "app", "user"),
+    )
+    for setting, field, app_directory, users_directory in layouts:
+        root = getattr(settings, setting, None)
+        if not root:
+            continue
+        try:
+            parts = Path(path).relative_to(Path(root).resolve()).parts
+        except ValueError:
+            continue
+        if len(parts) >= 2 and parts[1] == app_directory:
+            return parts[0], None, field
+        if len(parts) >= 3 and parts[1] == users_directory:
+            return parts[0], parts[2], field
+    return None
+
+
+def adjust_storage_usage(path, size_delta, files_delta=0):
+    """
+    Incrementally update the materialized storage usage of the entity a directory belongs to, after files were removed from it (see ``TethysPath.clear`` and ``TethysPath.remove``). The update is applied in the database, so concurrent updates are not lost.
+
+    Args:
+        path (Path): Resolved path to the directory that changed.
+        size_delta (int): Change in size in bytes.
+        files_delta (int): Change in number of files.
+    """  # noqa: E501
+    if not size_delta and not files_delta:
+        return
+
+    owner = _get_path_owner(path)
+    if owner is None:
+        return
+
+    package, username, field = owner
+    rows = StorageUsage.objects.filter(app__package=package)
+    if username is None:
+        rows = rows.filter(user__isnull=True)
+    else:
+        rows = rows.filter(user__username=username)
+
+    try:
+        rows.update(
+            **{
+                field: Greatest(F(field) + size_delta, Value(0)),
+                "file_count": Greatest(F("file_count") + files_delta, Value(0)),
+            }
+        )
+    except Exception as e:
+        log.warning(f"Unable to update the storage usage of {path}: {e}")
+
+    # Cached quota decisions of the owner were made with the previous usage
+    quota_cache.invalidate_owner(package, username)
+
+
+def recompute_storage_usage(users=None, apps=None, include_apps=None, jobs=None):
+    """
+    Recompute the materialized storage usage in one pass over the ``TETHYS_WORKSPACES_ROOT`` and ``MEDIA_ROOT`` directories. User directories are discovered by listing the user workspace and media directories of each app, so users without any files are not scanned.
+
+    Args:
+        users (list of str or User): Only recompute the usage of these users. Defaults to all users.
+        apps (list of str or TethysApp): Only recompute the usage for these apps (by package). Defaults to all apps.
+        include_apps (bool): Whether to recompute the usage of the app workspace and media directories. Defaults to True if users is not given.
+        jobs (int): Maximum number of threads used to scan directories.
+
+    Returns:
+        int: number of StorageUsage rows written.
+    """  # noqa: E501
+    if include_apps is None:
+        include_apps = users is None
+
+    tethys_apps = TethysApp.objects.all()
+    if apps is not None:
+        packages = [app if isinstance(app, str) else app.package for app in apps]
+        tethys_apps = tethys_apps.filter(package__in=packages)
+    tethys_apps = list(tethys_apps)
+
+    user_objects = User.objects.only("pk", "username")
+    if users is not None:
+        usernames = [user if isinstance(user, str) else user.username for user in users]
+        user_objects = user_objects.filter(username__in=usernames)
+    user_objects = {user.username: user for user in user_objects}
+
+    targets = {}
+    for app in tethys_apps:
+        if include_apps:
+            targets[(app, None)] = (
+                _get_app_workspace_path(app),
+                _get_app_media_path(app),
+            )
+
+        usernames = set(
+            _list_directories(_get_app_workspace_root(app) / "user_workspaces")
+        )
+        usernames.update(_list_directories(_get_app_media_root(app) / "user"))
+
+        for username in sorted(usernames):
+            user = user_objects.get(username)
+            if user is None:
+                log.debug(f'Skipping directories of unknown user "{username}".')
+                continue
+            targets[(app, user)] = (
+                _get_user_workspace_path(app, username),
+                _get_user_media_path(app, username),
+            )
+
+    usage = _scan(targets, max_workers=jobs, max_age=0)
+
+    existing = StorageUsage.objects.filter(app__in=tethys_apps)
+    if users is not None:
+        scope = Q(user__in=list(user_objects.values()))
+        existing = existing.filter(
+            scope | Q(user__isnull=True) if include_apps else scope
+        )
+    elif not include_apps:
+        existing = existing.filter(user__isnull=False)
+
+    return _save_storage_usage(existing, usage)
+
+
+async def refresh_storage_usage():
+    """
+    Recompute the storage usage of all users and apps without blocking the event loop. Run periodically by a background task when the ``QUOTA_STORAGE_USAGE_REFRESH_INTERVAL`` setting is set.
+    """  # noqa: E501
+    count = await database_sync_to_async(recompute_storage_usage)()
+    log.debug(f"Refreshed {count} storage usage records.")
@@ -11,6 +11,7 @@ import logging
 from django.conf import settings
 from django.core.exceptions import PermissionDenied
 
+from tethys_quotas.cache import MISSING, quota_cache
 
 log = logging.getLogger("tethys." + __name__)
 
@@ -87,17 +88,24 @@ def passes_quota(entity, codename, raise_on_false=True):
     """
     from tethys_quotas.models import ResourceQuota
 
-    try:
-        rq = ResourceQuota.objects.get(codename=codename)
-        passes = rq.check_quota(entity)
-        if not passes and raise_on_false:
-            raise PermissionDenied(rq.help)
-        return passes
+    decision = quota_cache.get("passes_quota", entity, codename)
 
-    except ResourceQuota.DoesNotExist:
-        if codename not in settings.SUPPRESS_QUOTA_WARNINGS:
-            log.info(f"ResourceQuota with codename {codename} does not exist.")
-        return True
+    if decision is MISSING:
+        try:
+            rq = ResourceQuota.objects.get(codename=codename)
+            decision = (rq.check_quota(entity), rq.help)
+
+        except ResourceQuota.DoesNotExist:
+            if codename not in settings.SUPPRESS_QUOTA_WARNINGS:
+                log.info(f"ResourceQuota with codename {codename} does not exist.")
+            decision = (True, None)
+
+        quota_cache.set("passes_quota", entity, codename, decision)
+
+    passes, help_text = decision
+    if not passes and raise_on_false:
+        raise PermissionDenied(help_text)
+    return passes
 
 
 def get_resource_available(entity, codename):
@@ -113,6 +121,10 @@ def get_resource_available(entity, codename):
     """
     from tethys_quotas.models import ResourceQuota
 
+    cached = quota_cache.get("resource_available", entity, codename)
+    if cached is not MISSING:
+        return dict(cached) if cached is not None else None
+
     try:
         rq = ResourceQuota.objects.get(codename=codename)
         rqh = rq.handler(entity)
@@ -131,12 +143,15 @@ def get_resource_available(entity, codename):
         total_available = total_available["quota"]
         resource_available = total_available - current_use
     else:
+        quota_cache.set("resource_available", entity, codename, None)
         return None
 
     if resource_available < 0:
         resource_available = 0
 
-    return {"resource_available": resource_available, "units": rq.units}
+    result = {"resource_available": resource_available, "units": rq.units}
+    quota_cache.set("resource_available", entity, codename, dict(result))
+    return result
 
 
 def get_quota(entity, codename):
@@ -150,6 +165,16 @@ def get_quota(entity, codename):
     Returns:
         dict (quota, units): Dictionary with two keys: quota(int) - value of quota, units(str) - units of value, if applicable  # noqa: E501
     """
+    cached = quota_cache.get("quota", entity, codename)
+    if cached is not MISSING:
+        return dict(cached)
+
+    result = _get_quota(entity, codename)
+    quota_cache.set("quota", entity, codename, dict(result))
+    return result
+
+
+def _get_quota(entity, codename):
     from django.contrib.auth.models import User
     from tethys_apps.models import TethysApp
     from tethys_quotas.models import ResourceQuota, UserQuota, TethysAppQuota
@@ -9,7 +9,10 @@
 """
 
 from django.contrib import admin
+from django.utils.html import format_html_join
+from django.utils.safestring import mark_safe
 from django.utils.translation import gettext_lazy as _
+from .engines import engine_registry
 from .models import (
     DatasetService,
     SpatialDatasetService,
@@ -68,7 +71,18 @@ class WebProcessingServiceForm(ModelForm):
 class PersistentStoreServiceForm(ModelForm):
     class Meta:
         model = PersistentStoreService
-        fields = ("name", "engine", "host", "port", "username", "password")
+        fields = (
+            "name",
+            "engine",
+            "host",
+            "port",
+            "username",
+            "password",
+            "pool_size",
+            "max_overflow",
+            "pool_recycle",
+            "pool_pre_ping",
+        )
         widgets = {
             "password": PasswordInput(),
         }
@@ -123,7 +137,44 @@ class PersistentStoreServiceAdmin(admin.ModelAdmin):
     """
 
     form = PersistentStoreServiceForm
-    fields = ("name", "engine", "host", "port", "username", "password")
+    fields = (
+        "name",
+        "engine",
+        "host",
+        "port",
+        "username",
+        "password",
+        "pool_size",
+        "max_overflow",
+        "pool_recycle",
+        "pool_pre_ping",
+        "pool_statistics",
+    )
+    readonly_fields = ("pool_statistics",)
+
+    @admin.display(description=_("Pool Statistics"))
+    def pool_statistics(self, obj):
+        """
+        Connection pool statistics of the engines of this service in the process serving the request.
+        """  # noqa: E501
+        stats = engine_registry.stats(service_id=obj.pk) if obj.pk else []
+        if not stats:
+            return _("No open engines in this process.")
+
+        return format_html_join(
+            mark_safe("<br>"),
+            "{}: {} checked out, {} checked in, {} overflow (pool size {})",
+            (
+                (
+                    stat["database"] or stat["url"],
+                    stat["checked_out"],
+                    stat["checked_in"],
+                    stat["overflow"],
+                    stat["size"],
+                )
+                for stat in stats
+            ),
+        )
 
 
 admin.site.register(DatasetService, DatasetServiceAdmin)
@@ -0,0 +1,153 @@
+"""
+********************************************************************************
+* Name: engines.py
+* Author: Tethys Platform Developers
+* Created On: October 2026
+* Copyright: (c) Tethys Geospatial Foundation 2026
+* License: BSD 2-Clause
+********************************************************************************
+"""
+
+import logging
+import threading
+
+log = logging.getLogger("tethys." + __name__)
+
+
+class EngineRegistry:
+    """
+    Process-wide registry of pooled SQLAlchemy engines keyed by URL, service and engine options.
+
+    Every call to ``create_engine`` creates a new connection pool, so creating an engine each time a persistent store is requested leaks connections until the database runs out of them. Engines (and a sessionmaker bound to each engine) are instead created once per process and shared. Engines are disposed, closing their pooled connections, when the PersistentStoreService or persistent store database they connect to changes.
+    """  # noqa: E501
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    @staticmethod
+    def _key(url, service_id, options):
+        from sqlalchemy.engine.url import make_url
+
+        url = make_url(url).render_as_string(hide_password=False)
+        return url, service_id, tuple(sorted(options.items()))
+
+    def _get_entry(self, url, service_id=None, **options):
+        from sqlalchemy import create_engine
+
+        key = self._key(url, service_id, options)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                engine = create_engine(url, **options)
+                entry = {
+                    "engine": engine,
+                    "sessionmaker": None,
+                    "service_id": service_id,
+                    "database": engine.url.database,
+                }
+                self._entries[key] = entry
+                log.debug(f"Created engine for {engine.url!r}.")
+
+        return entry
+
+    def get_engine(self, url, service_id=None, **options):
+        """
+        Get the shared engine for the given URL and options, creating it on first use.
+
+        Args:
+            url (str or URL): SQLAlchemy database URL.
+            service_id (int): id of the PersistentStoreService the URL belongs to, used to dispose its engines when it changes.
+            **options: keyword arguments passed to ``sqlalchemy.create_engine`` (e.g. pool_size, max_overflow).
+
+        Returns:
+            Engine: the shared SQLAlchemy engine.
+        """  # noqa: E501
+        return self._get_entry(url, service_id=service_id, **options)["engine"]
+
+    def get_sessionmaker(self, url, service_id=None, **options):
+        """
+        Get the shared sessionmaker bound to the engine for the given URL and options. Arguments are the same as ``get_engine``.
+
+        Returns:
+            sessionmaker: the shared SQLAlchemy sessionmaker.
+        """  # noqa: E501
+        from sqlalchemy.orm import sessionmaker
+
+        entry = self._get_entry(url, service_id=service_id, **options)
+
+        with self._lock:
+            if entry["sessionmaker"] is None:
+                entry["sessionmaker"] = sessionmaker(bind=entry["engine"])
+            return entry["sessionmaker"]
+
+    def dispose(self, service_id=None, database=None):
+        """
+        Dispose and remove the engines matching all of the given criteria, closing their pooled connections. Disposes all engines if no criteria are given.
+
+        Args:
+            service_id (int): only dispose engines of the PersistentStoreService with this id.
+            database (str): only dispose engines connected to the database with this name.
+
+        Returns:
+            int: number of engines disposed.
+        """  # noqa: E501
+        with self._lock:
+            keys = [
+                key
+                for key, entry in self._entries.items()
+                if (service_id is None or entry["service_id"] == service_id)
+                and (database is None or entry["database"] == database)
+            ]
+            entries = [self._entries.pop(key) for key in keys]
+
+        for entry in entries:
+            try:
+                entry["engine"].dispose()
+            except Exception as e:
+                log.warning(
+                    f"Unable to dispose engine for {entry['engine'].url!r}: {e}"
+                )
+
+        return len(entries)
+
+    def stats(self, service_id=None):
+        """
+        Get the connection pool statistics of the engines of this process.
+
+        Args:
+            service_id (int): only include engines of the PersistentStoreService with this id.
+
+        Returns:
+            list of dict: one dictionary per engine with the url (password hidden), database, size (pool size), checked_in, checked_out and overflow connections and the status reported by the pool. Counts the pool does not support are None.
+        """  # noqa: E501
+        with self._lock:
+            entries = [
+                entry
+                for entry in self._entries.values()
+                if service_id is None or entry["service_id"] == service_id
+            ]
+
+        stats = []
+        for entry in entries:
+            pool = entry["engine"].pool
+            stat = {
+                "url": repr(entry["engine"].url),
+                "database": entry["database"],
+                "service_id": entry["service_id"],
+                "status": pool.status(),
+            }
+            for name, method in (
+                ("size", "size"),
+                ("checked_in", "checkedin"),
+                ("checked_out", "checkedout"),
+                ("overflow", "overflow"),
+            ):
+                stat[name] = getattr(pool, method)() if hasattr(pool, method) else None
+            stats.append(stat)
+
+        return stats
+
+
+engine_registry = EngineRegistry()
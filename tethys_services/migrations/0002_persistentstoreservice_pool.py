@@ -0,0 +1,45 @@
+# Generated by Django 4.2.30 on 2026-10-18 03:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tethys_services", "0001_initial_40"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="persistentstoreservice",
+            name="max_overflow",
+            field=models.IntegerField(
+                default=10,
+                help_text="Number of connections that may be opened beyond the pool size.",
+            ),
+        ),
+        migrations.AddField(
+            model_name="persistentstoreservice",
+            name="pool_pre_ping",
+            field=models.BooleanField(
+                default=False,
+                help_text="Test pooled connections for liveness before using them.",
+            ),
+        ),
+        migrations.AddField(
+            model_name="persistentstoreservice",
+            name="pool_recycle",
+            field=models.IntegerField(
+                default=-1,
+                help_text="Number of seconds after which pooled connections are replaced. Use -1 to never recycle connections.",
+            ),
+        ),
+        migrations.AddField(
+            model_name="persistentstoreservice",
+            name="pool_size",
+            field=models.PositiveIntegerField(
+                default=5,
+                help_text="Number of connections kept open in the connection pool of each engine.",
+            ),
+        ),
+    ]
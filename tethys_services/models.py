@@ -9,10 +9,12 @@
 """
 
 from django.db import models
+from django.dispatch import receiver
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from urllib.error import HTTPError, URLError
 
 from tethys_portal.optional_dependencies import optional_import, has_module
+from tethys_services.engines import engine_registry
 
 # optional imports
 VALID_ENGINES, VALID_SPATIAL_ENGINES = optional_import(
@@ -309,6 +311,22 @@ class PersistentStoreService(models.Model):
     engine = models.CharField(
         max_length=50, default="postgresql", choices=ENGINE_CHOICES
     )
+    pool_size = models.PositiveIntegerField(
+        default=5,
+        help_text="Number of connections kept open in the connection pool of each engine.",
+    )
+    max_overflow = models.IntegerField(
+        default=10,
+        help_text="Number of connections that may be opened beyond the pool size.",
+    )
+    pool_recycle = models.IntegerField(
+        default=-1,
+        help_text="Number of seconds after which pooled connections are replaced. Use -1 to never recycle connections.",
+    )
+    pool_pre_ping = models.BooleanField(
+        default=False,
+        help_text="Test pooled connections for liveness before using them.",
+    )
     database = None  #: temporary property for creating engines and URLs with database, but not persisted in database.
 
     class Meta:
@@ -318,14 +336,32 @@ class PersistentStoreService(models.Model):
     def __str__(self):
         return self.name
 
+    def get_engine_options(self):
+        """
+        Returns the keyword arguments used to create the engines of this service
+        """
+        return {
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_recycle": self.pool_recycle,
+            "pool_pre_ping": self.pool_pre_ping,
+        }
+
     def get_engine(self):
         """
-        Returns a Persistent Store engine
+        Returns the shared, pooled Persistent Store engine of this process
         """
-        from sqlalchemy import create_engine
+        return engine_registry.get_engine(
+            self.get_url(), service_id=self.pk, **self.get_engine_options()
+        )
 
-        url = self.get_url()
-        return create_engine(url)
+    def get_sessionmaker(self):
+        """
+        Returns the shared sessionmaker bound to the Persistent Store engine
+        """
+        return engine_registry.get_sessionmaker(
+            self.get_url(), service_id=self.pk, **self.get_engine_options()
+        )
 
     def get_url(self):
         """
@@ -342,3 +378,12 @@ class PersistentStoreService(models.Model):
             database=self.database,
         )
         return url
+
+
+@receiver(models.signals.post_save, sender=PersistentStoreService)
+@receiver(models.signals.post_delete, sender=PersistentStoreService)
+def persistent_store_service_changed(sender, instance, **kwargs):
+    """
+    Dispose the engines of a Persistent Store Service when it is saved or deleted so they are recreated with its current settings.
+    """  # noqa: E501
+    engine_registry.dispose(service_id=instance.pk)